@@ -7,11 +7,39 @@ Narzędzie do konwersji między różnymi formatami zarządzania pakietami w Pyt
 __version__ = "0.1.29"
 __author__ = "Tom Sapletta"
 
-from spectomate.core.base_converter import BaseConverter
-from spectomate.core.registry import ConverterRegistry
 
-# Inicjalizacja rejestru konwerterów
-registry = ConverterRegistry()
+def __getattr__(name: str) -> object:
+    """
+    Leniwie ładuje rejestr i konwertery przy pierwszym odwołaniu.
 
-# Importy dla wygodnego dostępu do API
-from spectomate.converters import *  # noqa
+    Dzięki temu import samego pakietu (np. przez klienta demona) nie
+    wczytuje konwerterów, schematów ani ich zależności.
+
+    Args:
+        name: Nazwa atrybutu pakietu
+
+    Returns:
+        Wartość atrybutu
+    """
+    import spectomate.converters as converters
+    from spectomate.core.base_converter import BaseConverter
+    from spectomate.core.registry import ConverterRegistry
+
+    # Importy dla wygodnego dostępu do API
+    namespace = {
+        key: value
+        for key, value in vars(converters).items()
+        if key.endswith("Converter")
+    }
+    namespace["BaseConverter"] = BaseConverter
+    namespace["ConverterRegistry"] = ConverterRegistry
+
+    if name not in namespace and name != "registry":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals().update(namespace)
+    if "registry" not in globals():
+        # Inicjalizacja rejestru konwerterów
+        globals()["registry"] = ConverterRegistry()
+
+    return globals()[name]
@@ -2,7 +2,7 @@
 Main entry point for the spectomate package when run as a module.
 """
 
-from spectomate.cli import main
+from spectomate.client import main
 
 if __name__ == "__main__":
     main()
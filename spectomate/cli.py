@@ -5,17 +5,23 @@ Interfejs wiersza poleceń dla Spectomate.
 import os
 import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 import click
 
 from spectomate import __version__, registry
-from spectomate.core.utils import get_available_formats
+from spectomate.core.utils import WRITE_UNCHANGED, get_available_formats
+from spectomate.daemon_cli import daemon_cli
+from spectomate.diff_cli import diff_command
+from spectomate.drift_cli import drift_command
 from spectomate.format_cli import format_cli
 from spectomate.git_cli import git_cli
+from spectomate.lock_cli import lock_command
 from spectomate.mypy_cli import mypy_cli
+from spectomate.sync_cli import sync_command, watch_command
 from spectomate.test_cli import test_cli
 from spectomate.update_cli import update_command
+from spectomate.validate_cli import echo_validation_results, validate_command
 
 
 @click.group(invoke_without_command=True)
@@ -35,53 +41,241 @@ def cli(ctx: click.Context, version: bool):
 @click.option(
     "--input-format",
     "-i",
-    help="Format wejściowy",
-    type=click.Choice(get_available_formats("input")),
-    required=True,
+    help="Format wejściowy (auto - wykrycie na podstawie pliku)",
+    type=click.Choice(sorted(get_available_formats("input")) + ["auto"]),
+    default="auto",
+    show_default=True,
 )
 @click.option(
     "--output-format",
     "-o",
-    help="Format wyjściowy",
+    "output_formats",
+    help="Format wyjściowy (można podać wielokrotnie)",
     type=click.Choice(get_available_formats("output")),
-    required=True,
+    multiple=True,
 )
 @click.option(
     "--input-file",
     "-f",
     help="Plik wejściowy",
     type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
-    required=True,
 )
 @click.option(
     "--output-file",
     "-t",
-    help="Plik wyjściowy",
+    "output_files",
+    help="Plik wyjściowy (po jednym dla każdego formatu wyjściowego)",
     type=click.Path(file_okay=True, dir_okay=False, writable=True),
-    required=True,
+    multiple=True,
+)
+@click.option(
+    "--jobs",
+    "-j",
+    help="Liczba równoległych zapisów przy kilku formatach wyjściowych "
+    "(lub równoległych konwersji w trybie --stdin-batch)",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option(
+    "--stdin-batch",
+    is_flag=True,
+    help="Czytaj żądania konwersji NDJSON ze stdin i wypisuj wyniki NDJSON na stdout",
+)
+@click.option(
+    "--pin",
+    help="Przypnij wymagania (latest - najnowsze wersje z lokalnej kopii indeksu)",
+    type=click.Choice(["none", "latest"]),
+    default="none",
+    show_default=True,
+)
+@click.option(
+    "--pin-index",
+    help="Kopia indeksu dla --pin: katalog simple API lub plik JSON "
+    "(domyślnie zmienna SPECTOMATE_PIN_INDEX)",
+    type=click.Path(exists=True),
+)
+@click.option(
+    "--pre", is_flag=True, help="Dopuszczaj wersje przedpremierowe przy --pin"
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    help="Tylko sprawdź plik i konwersję w pamięci, bez zapisu plików wyjściowych",
 )
-def convert(input_format: str, output_format: str, input_file: str, output_file: str):
-    """Konwertuje plik z jednego formatu na drugi."""
-    # Sprawdź, czy istnieje konwerter dla podanej pary formatów
-    if not registry.has_converter(input_format, output_format):
+def convert(
+    input_format: str,
+    output_formats: Tuple[str, ...],
+    input_file: Optional[str],
+    output_files: Tuple[str, ...],
+    jobs: Optional[int],
+    stdin_batch: bool,
+    pin: str,
+    pin_index: Optional[str],
+    pre: bool,
+    dry_run: bool,
+):
+    """Konwertuje plik z jednego formatu na jeden lub kilka innych.
+
+    Przy kilku parach -o/-t plik wejściowy jest parsowany tylko raz.
+
+    Z opcją --pin latest każde wymaganie, które nie wskazuje dokładnej
+    wersji, jest przypinane (==) do najnowszej wersji z lokalnej kopii
+    indeksu spełniającej jego specyfikator.
+
+    Z opcją --dry-run plik jest tylko parsowany i konwertowany w pamięci
+    (pliki wyjściowe -t nie są wymagane ani zapisywane).
+
+    W trybie --stdin-batch każdy wiersz stdin to żądanie JSON z polami
+    content, target_format oraz opcjonalnie id, source_format, filename
+    i options; dla każdego żądania na stdout wypisywany jest wiersz wyniku.
+    """
+    if stdin_batch:
+        from spectomate.core.batch import run_batch
+
+        _, failed = run_batch(sys.stdin, sys.stdout, max_workers=jobs)
+        sys.exit(1 if failed else 0)
+
+    if dry_run and input_file is not None:
+        from spectomate.core.validate import validate_file
+
+        result = validate_file(
+            input_file,
+            None if input_format == "auto" else input_format,
+            output_formats,
+        )
+        if not echo_validation_results([result]):
+            sys.exit(1)
+        return
+
+    if input_file is None or not output_formats or not output_files:
         click.echo(
-            f"Nie znaleziono konwertera z formatu {input_format} do {output_format}",
+            "Opcje --input-file, --output-format i --output-file są wymagane "
+            "(chyba że podano --stdin-batch)",
             err=True,
         )
         sys.exit(1)
 
-    # Pobierz konwerter
-    converter = registry.get_converter(input_format, output_format)
+    if len(output_formats) != len(output_files):
+        click.echo(
+            "Liczba formatów wyjściowych (-o) musi być równa "
+            "liczbie plików wyjściowych (-t)",
+            err=True,
+        )
+        sys.exit(1)
+
+    # Wykrywamy format wejściowy, jeśli nie został podany jawnie
+    if input_format == "auto":
+        detected_format = registry.detect_format(input_file)
+        if detected_format is None:
+            click.echo(
+                f"Nie udało się wykryć formatu pliku {input_file}, "
+                "podaj go jawnie opcją --input-format",
+                err=True,
+            )
+            sys.exit(1)
+        input_format = detected_format
+
+    if pin == "latest":
+        _convert_pinned(
+            input_format,
+            input_file,
+            list(zip(output_formats, output_files)),
+            pin_index,
+            pre,
+        )
+        return
+
+    # Sprawdź, czy istnieją konwertery dla podanych par formatów
+    for output_format in output_formats:
+        if not registry.has_converter(input_format, output_format):
+            click.echo(
+                f"Nie znaleziono konwertera z formatu {input_format} "
+                f"do {output_format}",
+                err=True,
+            )
+            sys.exit(1)
 
     # Konwertuj plik
     try:
-        converter.convert_file(input_file, output_file)
-        click.echo(f"Pomyślnie skonwertowano {input_file} do {output_file}")
+        converters = registry.convert_many(
+            input_format,
+            input_file,
+            list(zip(output_formats, output_files)),
+            max_workers=jobs,
+        )
+        for converter in converters:
+            for warning in converter.warnings:
+                click.echo(f"Uwaga: {warning}", err=True)
+            if converter.write_status == WRITE_UNCHANGED:
+                click.echo(f"Plik {converter.target_file} jest aktualny (bez zmian)")
+            else:
+                click.echo(
+                    f"Pomyślnie skonwertowano {input_file} do {converter.target_file}"
+                )
     except Exception as e:
         click.echo(f"Błąd podczas konwersji: {e}", err=True)
         sys.exit(1)
 
 
+def _convert_pinned(
+    input_format: str,
+    input_file: str,
+    targets: List[Tuple[str, str]],
+    pin_index: Optional[str],
+    prereleases: bool,
+) -> None:
+    """
+    Konwertuje plik, przypinając wymagania do najnowszych wersji z indeksu.
+
+    Args:
+        input_format: Format pliku wejściowego
+        input_file: Plik wejściowy
+        targets: Pary (format wyjściowy, plik wyjściowy)
+        pin_index: Kopia indeksu (None - zmienna SPECTOMATE_PIN_INDEX)
+        prereleases: Czy dopuszczać wersje przedpremierowe
+    """
+    from spectomate.core.ir import load_requirements, write_requirements
+    from spectomate.core.pinning import get_version_index, pin_latest
+
+    warnings: List[str] = []
+    try:
+        index = get_version_index(pin_index)
+        if index is None:
+            click.echo(
+                "Opcja --pin latest wymaga kopii indeksu "
+                "(--pin-index lub zmienna SPECTOMATE_PIN_INDEX)",
+                err=True,
+            )
+            sys.exit(1)
+
+        requirements = pin_latest(
+            load_requirements(input_file, input_format, warnings=warnings),
+            index,
+            prereleases=prereleases,
+            warnings=warnings,
+        )
+        statuses = [
+            (
+                output_file,
+                write_requirements(
+                    requirements, output_format, output_file, warnings=warnings
+                ),
+            )
+            for output_format, output_file in targets
+        ]
+    except Exception as e:
+        click.echo(f"Błąd podczas konwersji: {e}", err=True)
+        sys.exit(1)
+
+    for warning in warnings:
+        click.echo(f"Uwaga: {warning}", err=True)
+    for output_file, status in statuses:
+        if status == WRITE_UNCHANGED:
+            click.echo(f"Plik {output_file} jest aktualny (bez zmian)")
+        else:
+            click.echo(f"Pomyślnie skonwertowano {input_file} do {output_file}")
+
+
 @cli.command()
 @click.option(
     "--input-format",
@@ -130,6 +324,13 @@ cli.add_command(test_cli)
 cli.add_command(mypy_cli)
 cli.add_command(git_cli)
 cli.add_command(format_cli)
+cli.add_command(sync_command)
+cli.add_command(watch_command)
+cli.add_command(daemon_cli)
+cli.add_command(lock_command)
+cli.add_command(drift_command)
+cli.add_command(diff_command)
+cli.add_command(validate_command)
 
 
 def main():
@@ -0,0 +1,25 @@
+"""
+Punkt wejścia CLI przekazujący polecenia do demona, jeśli ten działa.
+
+Moduł nie importuje click ani konwerterów, dzięki czemu przekazanie polecenia
+do demona kosztuje tylko uruchomienie interpretera i jedno połączenie z gniazdem.
+"""
+
+import os
+import sys
+
+
+def main() -> None:
+    """Entry point for the CLI."""
+    from spectomate.core.daemon import forward_command
+
+    response = forward_command(sys.argv[1:], os.getcwd())
+    if response is not None:
+        sys.stdout.write(response["stdout"])
+        sys.stderr.write(response["stderr"])
+        sys.exit(response["exit_code"])
+
+    # Demon nie działa - wykonujemy polecenie w tym procesie
+    from spectomate.cli import main as cli_main
+
+    sys.exit(cli_main())
@@ -3,15 +3,19 @@ Moduł zawierający implementacje konwerterów dla różnych formatów pakietów
 """
 
 from spectomate.converters.conda_to_pip import CondaToPipConverter
+from spectomate.converters.ir_to_pip import IrToPipConverter
 
 # Importujemy wszystkie konwertery, aby zarejestrowały się w ConverterRegistry
 from spectomate.converters.pip_to_conda import PipToCondaConverter
+from spectomate.converters.pip_to_ir import PipToIrConverter
 from spectomate.converters.pip_to_poetry import PipToPoetryConverter
+from spectomate.converters.poetry_to_pip import PoetryToPipConverter
 
 # Tymczasowo usunięto import nieistniejących konwerterów
 # from spectomate.converters.pip_to_pipenv import PipToPipenvConverter
 # from spectomate.converters.pip_to_pdm import PipToPdmConverter
-# from spectomate.converters.poetry_to_pip import PoetryToPipConverter
+# Konwersja poetry -> conda jest realizowana przez trasę poetry -> pip -> conda
+# wyznaczaną w ConverterRegistry
 # from spectomate.converters.poetry_to_conda import PoetryToCondaConverter
 
 # Importujemy zewnętrzne konwertery
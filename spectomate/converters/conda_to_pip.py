@@ -3,14 +3,48 @@ Konwerter z formatu conda (environment.yml) do formatu pip (requirements.txt).
 """
 
 import os
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from spectomate.core.base_converter import BaseConverter
+from spectomate.core.match_spec import match_spec_to_pep508, parse_match_spec
+from spectomate.core.name_mapping import get_name_mapper, normalize_pip_name
+from spectomate.core.registry import register_converter
+from spectomate.core.versions import try_version_key
 from spectomate.schemas.conda_schema import CondaSchema
 from spectomate.schemas.pip_schema import PipSchema
 
+# Nazwa pakietu i pierwsza wersja w specyfikatorze wymagania pip
+_REQUIREMENT_RE = re.compile(
+    r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)[^<>=!~]*(?:[<>=!~]=?=?\s*([^,;\s*]+))?"
+)
 
+
+def _requirement_sort_key(requirement: str) -> Tuple[Any, ...]:
+    """
+    Zwraca klucz sortowania wymagania pip.
+
+    Wymagania są sortowane według znormalizowanej nazwy pakietu, a wymagania
+    tego samego pakietu - według wersji PEP 440 (np. "1.9" przed "1.10").
+
+    Args:
+        requirement: Wymaganie pip
+
+    Returns:
+        Klucz sortowania
+    """
+    match = _REQUIREMENT_RE.match(requirement)
+    if match is None:
+        return (requirement.lower(), (), requirement)
+
+    # Gwiazdkę usuwa wyrażenie regularne, a kropkę przed nią usuwamy tutaj
+    version = (match.group(2) or "").rstrip(".")
+    key = try_version_key(version) if version else None
+    return (normalize_pip_name(match.group(1)), (key,) if key else (), requirement)
+
+
+@register_converter
 class CondaToPipConverter(BaseConverter):
     """
     Konwerter z formatu conda (environment.yml) do formatu pip (requirements.txt).
@@ -58,6 +92,18 @@ class CondaToPipConverter(BaseConverter):
 
         return CondaSchema.parse_file(self.source_file)
 
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku environment.yml.
+
+        Args:
+            content: Zawartość pliku environment.yml
+
+        Returns:
+            Słownik z informacjami o środowisku conda
+        """
+        return CondaSchema.parse_string(content)
+
     def convert(self, source_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Konwertuje dane z formatu conda do formatu pip.
@@ -80,20 +126,35 @@ class CondaToPipConverter(BaseConverter):
         # Pobieramy zależności pip
         pip_deps = CondaSchema.extract_pip_dependencies(source_data)
 
+        mapper = get_name_mapper() if self.options.get("map_names", True) else None
+        self.warnings = []
+
         # Konwertujemy zależności conda na format pip
         for dep in conda_deps:
-            # Usuwamy specyfikację kanału, jeśli istnieje
-            if "::" in dep:
-                _, dep = dep.split("::", 1)
+            # Tłumaczymy specyfikację conda (kanał, "=wersja", build) na PEP 508
+            try:
+                name, specifier = match_spec_to_pep508(dep)
+            except ValueError as e:
+                try:
+                    name, specifier = parse_match_spec(dep)[0], ""
+                except ValueError:
+                    name, specifier = dep.strip(), ""
+                self.warnings.append(
+                    f"Pominięto ograniczenie wersji pakietu {name}: {e}"
+                )
+
+            # Zamieniamy nazwę pakietu conda na nazwę pip (np. pytorch -> torch)
+            if mapper is not None:
+                name = mapper.to_pip(name)
 
             # Dodajemy zależność do listy
-            target_data["requirements"].append(dep)
+            target_data["requirements"].append(name + specifier)
 
         # Dodajemy zależności pip
         target_data["requirements"].extend(pip_deps)
 
-        # Sortujemy zależności
-        target_data["requirements"].sort()
+        # Sortujemy zależności według nazwy pakietu i wersji
+        target_data["requirements"].sort(key=_requirement_sort_key)
 
         return target_data
 
@@ -117,7 +178,23 @@ class CondaToPipConverter(BaseConverter):
             source_path = Path(self.source_file)
             self.target_file = source_path.parent / "requirements.txt"
 
-        return PipSchema.write_requirements_txt(target_data, self.target_file)
+        self.write_status = PipSchema.update_requirements_txt(
+            target_data, self.target_file
+        )
+
+        return self.target_file
+
+    def render_target(self, target_data: Dict[str, Any]) -> str:
+        """
+        Serializuje dane do postaci pliku requirements.txt.
+
+        Args:
+            target_data: Dane w formacie pip
+
+        Returns:
+            Zawartość pliku requirements.txt
+        """
+        return PipSchema.generate_requirements_txt(target_data)
 
     def execute(self) -> Path:
         """
@@ -0,0 +1,121 @@
+"""
+Konwerter z formatu ir do formatu pip (requirements.txt).
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from spectomate.core.base_converter import BaseConverter
+from spectomate.core.registry import register_converter
+from spectomate.core.utils import get_default_output_file
+from spectomate.schemas.ir_schema import IrSchema
+from spectomate.schemas.pip_schema import PipSchema
+
+
+@register_converter
+class IrToPipConverter(BaseConverter):
+    """
+    Konwerter z formatu ir do formatu pip (requirements.txt).
+
+    Pozostałe formaty docelowe są osiągalne przez trasy wieloetapowe
+    (np. ir -> pip -> conda).
+    """
+
+    @staticmethod
+    def get_source_format() -> str:
+        """Zwraca identyfikator formatu źródłowego."""
+        return "ir"
+
+    @staticmethod
+    def get_target_format() -> str:
+        """Zwraca identyfikator formatu docelowego."""
+        return "pip"
+
+    def read_source(self) -> Dict[str, Any]:
+        """
+        Odczytuje plik ir (JSON lub msgpack).
+
+        Returns:
+            Dane w formacie ir
+        """
+        if self.source_file is None:
+            raise ValueError("Nie podano ścieżki do pliku źródłowego")
+
+        return IrSchema.parse_file(self.source_file)
+
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku ir w formacie JSON.
+
+        Args:
+            content: Zawartość pliku ir
+
+        Returns:
+            Dane w formacie ir
+        """
+        return IrSchema.parse_string(content)
+
+    def convert(self, source_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Konwertuje dane z formatu ir do formatu pip.
+
+        Args:
+            source_data: Dane w formacie ir
+
+        Returns:
+            Dane w formacie pip
+        """
+        if source_data is None:
+            if self.source_data is None:
+                raise ValueError("Brak danych źródłowych do konwersji")
+            source_data = self.source_data
+
+        if source_data.get("format") != "ir":
+            raise ValueError("Dane źródłowe nie są w formacie ir")
+
+        self.warnings = []
+        return {
+            "format": "pip",
+            "requirements": [req.to_pip() for req in source_data["requirements"]],
+        }
+
+    def write_target(self, target_data: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Zapisuje dane do pliku requirements.txt.
+
+        Args:
+            target_data: Dane w formacie pip
+
+        Returns:
+            Ścieżka do zapisanego pliku
+        """
+        if target_data is None:
+            if self.target_data is None:
+                raise ValueError("Brak danych docelowych do zapisu")
+            target_data = self.target_data
+
+        if self.target_file is None:
+            if self.source_file is None:
+                raise ValueError(
+                    "Nie podano ścieżki do pliku docelowego ani źródłowego"
+                )
+
+            self.target_file = get_default_output_file(self.source_file, "pip")
+
+        self.write_status = PipSchema.update_requirements_txt(
+            target_data, self.target_file
+        )
+
+        return self.target_file
+
+    def render_target(self, target_data: Dict[str, Any]) -> str:
+        """
+        Serializuje dane do postaci pliku requirements.txt.
+
+        Args:
+            target_data: Dane w formacie pip
+
+        Returns:
+            Zawartość pliku requirements.txt
+        """
+        return PipSchema.generate_requirements_txt(target_data)
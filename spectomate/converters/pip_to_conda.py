@@ -2,15 +2,20 @@
 Konwerter z formatu pip (requirements.txt) do formatu conda (environment.yml).
 """
 
+import locale
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-import yaml
+from typing import Any, Dict, Iterable, List, Optional, Union
 
+from spectomate.core import conda_lookup
 from spectomate.core.base_converter import BaseConverter
+from spectomate.core.channel_index import get_channel_index
+from spectomate.core.conda_lookup import LookupResult
+from spectomate.core.name_mapping import get_name_mapper
 from spectomate.core.registry import register_converter
-from spectomate.core.utils import check_package_in_conda, get_default_output_file
+from spectomate.core.utils import get_default_output_file, map_file
+from spectomate.schemas.conda_schema import CondaSchema
+from spectomate.schemas.pip_schema import PipSchema
 
 
 @register_converter
@@ -19,6 +24,9 @@ class PipToCondaConverter(BaseConverter):
     Konwerter z formatu pip (requirements.txt) do formatu conda (environment.yml).
     """
 
+    # Sprawdzanie dostępności pakietów w conda jest kosztowne
+    conversion_cost = 5
+
     @staticmethod
     def get_source_format() -> str:
         """Zwraca identyfikator formatu źródłowego."""
@@ -39,26 +47,69 @@ class PipToCondaConverter(BaseConverter):
         if not self.source_file or not self.source_file.exists():
             raise FileNotFoundError(f"Plik źródłowy nie istnieje: {self.source_file}")
 
-        dependencies = []
-        with open(self.source_file, "r") as f:
-            for line in f:
-                line = line.strip()
+        with map_file(self.source_file) as buffer:
+            return self._parse_buffer(buffer)
+
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku requirements.txt.
+
+        Args:
+            content: Zawartość pliku requirements.txt
+
+        Returns:
+            Słownik z listą zależności
+        """
+        return self._parse_lines(content.splitlines())
+
+    @staticmethod
+    def _parse_buffer(buffer: Any, encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Wyodrębnia zależności z zawartości pliku requirements.txt podanej jako bajty.
 
-                # Pomijamy komentarze i puste linie
-                if not line or line.startswith("#"):
-                    continue
+        Daje ten sam wynik co _parse_lines() dla pliku otwartego w trybie
+        tekstowym, ale cały bufor jest dekodowany jednym wywołaniem (bez
+        kopiowania zmapowanego pliku do obiektu bytes) i dzielony na linie
+        bez warstwy TextIOWrapper.
 
-                # Pomijamy linie opcji (np. --find-links)
-                if line.startswith("-"):
-                    continue
+        Args:
+            buffer: Zawartość pliku (bytes lub mmap)
+            encoding: Kodowanie pliku (None - domyślne, jak dla open())
 
-                # Usuwamy komentarze na końcu linii
-                if "#" in line:
-                    line = line.split("#")[0].strip()
+        Returns:
+            Słownik z listą zależności
+        """
+        text = str(buffer, encoding or locale.getpreferredencoding(False))
+        if "\r" in text:
+            # Tryb tekstowy traktuje "\r\n" i "\r" jako koniec linii
+            text = text.replace("\r\n", "\n").replace("\r", "\n")
+        return PipToCondaConverter._parse_lines(text.split("\n"))
 
-                dependencies.append(line)
+    @staticmethod
+    def _parse_lines(lines: Iterable[str]) -> Dict[str, Any]:
+        """
+        Wyodrębnia zależności z linii pliku requirements.txt.
 
-        return {"dependencies": dependencies}
+        Args:
+            lines: Linie pliku requirements.txt
+
+        Returns:
+            Słownik z listą zależności
+        """
+        dependencies: List[str] = []
+        append = dependencies.append
+        for line in map(str.strip, lines):
+            # Pomijamy puste linie, komentarze i linie opcji (np. --find-links)
+            if not line or line[0] in "#-":
+                continue
+
+            # Usuwamy komentarze na końcu linii
+            if "#" in line:
+                line = line.split("#", 1)[0].strip()
+
+            append(line)
+
+        return {"format": "pip", "dependencies": dependencies}
 
     def convert(self, source_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
@@ -75,6 +126,104 @@ class PipToCondaConverter(BaseConverter):
                 raise ValueError("Brak danych źródłowych do konwersji")
             source_data = self.source_data
 
+        dependencies = PipSchema.extract_requirements(source_data)
+        executor = conda_lookup.CondaLookupExecutor(
+            max_workers=self.options.get(
+                "conda_concurrency", conda_lookup.DEFAULT_MAX_CONCURRENCY
+            ),
+            timeout=self.options.get("conda_timeout", conda_lookup.DEFAULT_TIMEOUT),
+            channel_index=get_channel_index(self.options.get("channel_index")),
+        )
+        conda_names = self._conda_names(dependencies)
+        self.conda_lookups = executor.lookup(conda_names)
+
+        return self._build_environment(dependencies, conda_names, self.conda_lookups)
+
+    async def convert_async(
+        self, source_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Konwertuje zależności z formatu pip na format conda, sprawdzając
+        dostępność pakietów w conda równolegle.
+
+        Liczbę równoległych wyszukiwań i limit czasu pojedynczego wyszukiwania
+        można ustawić opcjami conda_concurrency i conda_timeout, a lokalny
+        indeks kanałów conda - opcją channel_index.
+
+        Args:
+            source_data: Dane w formacie źródłowym (opcjonalnie)
+
+        Returns:
+            Dane w formacie docelowym
+        """
+        if source_data is None:
+            if self.source_data is None:
+                raise ValueError("Brak danych źródłowych do konwersji")
+            source_data = self.source_data
+
+        dependencies = PipSchema.extract_requirements(source_data)
+        conda_names = self._conda_names(dependencies)
+        self.conda_lookups = await conda_lookup.check_packages_async(
+            conda_names,
+            max_concurrency=self.options.get(
+                "conda_concurrency", conda_lookup.DEFAULT_MAX_CONCURRENCY
+            ),
+            timeout=self.options.get("conda_timeout", conda_lookup.DEFAULT_TIMEOUT),
+            channel_index=get_channel_index(self.options.get("channel_index")),
+        )
+
+        return self._build_environment(dependencies, conda_names, self.conda_lookups)
+
+    @staticmethod
+    def _package_name(dependency: str) -> str:
+        """
+        Wyodrębnia nazwę pakietu ze specyfikacji zależności.
+
+        Args:
+            dependency: Specyfikacja zależności (np. "numpy>=1.22.0")
+
+        Returns:
+            Nazwa pakietu
+        """
+        return dependency.split("=")[0].split("<")[0].split(">")[0].strip()
+
+    def _conda_names(self, dependencies: List[str]) -> List[str]:
+        """
+        Wyznacza nazwy conda pakietów z listy zależności pip.
+
+        Nazwy są tłumaczone przez mapowanie nazw pip -> conda (np. torch ->
+        pytorch), chyba że opcja map_names ma wartość False.
+
+        Args:
+            dependencies: Zależności w formacie pip
+
+        Returns:
+            Nazwy conda w kolejności zależności
+        """
+        names = [self._package_name(dep) for dep in dependencies]
+        if not self.options.get("map_names", True):
+            return names
+
+        mapper = get_name_mapper()
+        return [mapper.to_conda(name) for name in names]
+
+    def _build_environment(
+        self,
+        dependencies: List[str],
+        conda_names: List[str],
+        lookups: Dict[str, LookupResult],
+    ) -> Dict[str, Any]:
+        """
+        Buduje dane pliku environment.yml z listy zależności pip.
+
+        Args:
+            dependencies: Zależności w formacie pip
+            conda_names: Nazwy conda pakietów w kolejności zależności
+            lookups: Wyniki sprawdzenia dostępności pakietów w conda
+
+        Returns:
+            Dane w formacie docelowym
+        """
         # Pobieramy nazwę środowiska z opcji lub używamy domyślnej
         env_name = self.options.get("env_name", "myenv")
 
@@ -83,26 +232,33 @@ class PipToCondaConverter(BaseConverter):
             "name": env_name,
             "channels": ["defaults", "conda-forge"],
             "dependencies": [],
-            "pip": [],
         }
+        pip_deps = []
+        self.warnings = []
 
         # Konwertujemy zależności
-        for dep in source_data["dependencies"]:
+        for dep, conda_name in zip(dependencies, conda_names):
             # Sprawdzamy, czy pakiet jest dostępny w conda
-            package_name = dep.split("=")[0].split("<")[0].split(">")[0].strip()
-
-            if check_package_in_conda(package_name):
-                conda_data["dependencies"].append(dep)
+            lookup = lookups[conda_name]
+            if lookup.available:
+                # W sekcji conda używamy nazwy pakietu conda
+                package_name = self._package_name(dep)
+                conda_data["dependencies"].append(conda_name + dep[len(package_name) :])
             else:
-                conda_data["pip"].append(dep)
+                pip_deps.append(dep)
+                if not lookup.definitive:
+                    self.warnings.append(
+                        f"Nie sprawdzono pakietu {lookup.package_name} w conda "
+                        f"({lookup.reason}: {lookup.detail}), "
+                        "umieszczono go w sekcji pip"
+                    )
 
-        # Dodajemy pakiet pip do zależności conda, jeśli mamy jakieś pakiety pip
-        if conda_data["pip"]:
+        # Dodajemy pakiet pip do zależności conda, jeśli mamy jakieś pakiety pip,
+        # a same pakiety pip umieszczamy w zagnieżdżonej sekcji "pip"
+        if pip_deps:
             if "pip" not in conda_data["dependencies"]:
                 conda_data["dependencies"].append("pip")
-        else:
-            # Usuwamy pustą sekcję pip
-            del conda_data["pip"]
+            conda_data["dependencies"].append({"pip": pip_deps})
 
         return conda_data
 
@@ -128,8 +284,21 @@ class PipToCondaConverter(BaseConverter):
             else:
                 self.target_file = get_default_output_file(self.source_file, "conda")
 
-        # Zapisujemy dane do pliku YAML
-        with open(self.target_file, "w") as f:
-            yaml.dump(target_data, f, default_flow_style=False, sort_keys=False)
+        # Zapisujemy dane do pliku YAML, pomijając zapis niezmienionej zawartości
+        self.write_status = CondaSchema.update_environment_yml(
+            target_data, self.target_file
+        )
 
         return self.target_file
+
+    def render_target(self, target_data: Dict[str, Any]) -> str:
+        """
+        Serializuje dane do postaci pliku environment.yml.
+
+        Args:
+            target_data: Dane w formacie conda
+
+        Returns:
+            Zawartość pliku environment.yml
+        """
+        return CondaSchema.generate_environment_yml(target_data)
@@ -0,0 +1,127 @@
+"""
+Konwerter z formatu pip (requirements.txt) do formatu ir.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from spectomate.core.base_converter import BaseConverter
+from spectomate.core.ir import parse_requirements_txt
+from spectomate.core.registry import register_converter
+from spectomate.core.utils import get_default_output_file
+from spectomate.schemas.ir_schema import IrSchema
+from spectomate.schemas.pip_schema import PipSchema
+
+
+@register_converter
+class PipToIrConverter(BaseConverter):
+    """
+    Konwerter z formatu pip (requirements.txt) do formatu ir.
+
+    Dzięki trasom wieloetapowym w ConverterRegistry do formatu ir można
+    zapisać także pliki conda i Poetry (przez format pip).
+    """
+
+    @staticmethod
+    def get_source_format() -> str:
+        """Zwraca identyfikator formatu źródłowego."""
+        return "pip"
+
+    @staticmethod
+    def get_target_format() -> str:
+        """Zwraca identyfikator formatu docelowego."""
+        return "ir"
+
+    def read_source(self) -> Dict[str, Any]:
+        """
+        Odczytuje plik requirements.txt.
+
+        Returns:
+            Słownik z zależnościami pip
+        """
+        if self.source_file is None:
+            raise ValueError("Nie podano ścieżki do pliku źródłowego")
+
+        return self.parse_source(self.source_file.read_text(encoding="utf-8"))
+
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku requirements.txt.
+
+        Linie są zachowywane w całości (PipSchema.parse_requirement pomija
+        extras i markery), a parsowane dopiero w convert().
+
+        Args:
+            content: Zawartość pliku requirements.txt
+
+        Returns:
+            Słownik z zależnościami pip
+        """
+        return {"format": "pip", "requirements": content.splitlines()}
+
+    def convert(self, source_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Konwertuje dane z formatu pip do formatu ir.
+
+        Args:
+            source_data: Dane w formacie pip
+
+        Returns:
+            Dane w formacie ir
+        """
+        if source_data is None:
+            if self.source_data is None:
+                raise ValueError("Brak danych źródłowych do konwersji")
+            source_data = self.source_data
+
+        self.warnings = []
+        lines = source_data.get("requirements")
+        if "dependencies" not in source_data and all(
+            isinstance(line, str) for line in lines or ()
+        ):
+            # Surowe linie z parse_source() - numery linii w ostrzeżeniach
+            # odpowiadają numerom linii pliku
+            content = "\n".join(lines or ())
+        else:
+            content = "\n".join(PipSchema.extract_requirements(source_data))
+        requirements = parse_requirements_txt(content, self.warnings)
+        return IrSchema.from_requirements(requirements)
+
+    def write_target(self, target_data: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Zapisuje dane do pliku ir.
+
+        Args:
+            target_data: Dane w formacie ir
+
+        Returns:
+            Ścieżka do zapisanego pliku
+        """
+        if target_data is None:
+            if self.target_data is None:
+                raise ValueError("Brak danych docelowych do zapisu")
+            target_data = self.target_data
+
+        if self.target_file is None:
+            if self.source_file is None:
+                raise ValueError(
+                    "Nie podano ścieżki do pliku docelowego ani źródłowego"
+                )
+
+            self.target_file = get_default_output_file(self.source_file, "ir")
+
+        self.write_status = IrSchema.update_file(target_data, self.target_file)
+
+        return self.target_file
+
+    def render_target(self, target_data: Dict[str, Any]) -> str:
+        """
+        Serializuje dane do postaci pliku ir (JSON).
+
+        Args:
+            target_data: Dane w formacie ir
+
+        Returns:
+            Zawartość pliku ir
+        """
+        return IrSchema.generate_json(target_data)
@@ -7,10 +7,12 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from spectomate.core.base_converter import BaseConverter
+from spectomate.core.registry import register_converter
 from spectomate.schemas.pip_schema import PipSchema
 from spectomate.schemas.poetry_schema import PoetrySchema
 
 
+@register_converter
 class PipToPoetryConverter(BaseConverter):
     """
     Konwerter z formatu pip (requirements.txt) do formatu poetry (pyproject.toml).
@@ -56,8 +58,31 @@ class PipToPoetryConverter(BaseConverter):
         if self.source_file is None:
             raise ValueError("Nie podano ścieżki do pliku źródłowego")
 
-        data = PipSchema.parse_file(self.source_file)
+        return self._add_dependencies(PipSchema.parse_file(self.source_file))
 
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku requirements.txt.
+
+        Args:
+            content: Zawartość pliku requirements.txt
+
+        Returns:
+            Słownik z zależnościami pip
+        """
+        return self._add_dependencies(PipSchema.parse_string(content))
+
+    @staticmethod
+    def _add_dependencies(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Uzupełnia sparsowane dane pip o listę zależności w postaci tekstowej.
+
+        Args:
+            data: Dane zwrócone przez PipSchema
+
+        Returns:
+            Dane pip z kluczem "dependencies"
+        """
         # Filtrujemy tylko rzeczywiste zależności (pakiety) i pomijamy komentarze i opcje
         if "requirements" in data:
             package_deps = [
@@ -122,7 +147,23 @@ class PipToPoetryConverter(BaseConverter):
             source_path = Path(self.source_file)
             self.target_file = source_path.parent / "pyproject.toml"
 
-        return PoetrySchema.write_pyproject_toml(target_data, self.target_file)
+        self.write_status = PoetrySchema.update_pyproject_toml(
+            target_data, self.target_file
+        )
+
+        return self.target_file
+
+    def render_target(self, target_data: Dict[str, Any]) -> str:
+        """
+        Serializuje dane do postaci pliku pyproject.toml.
+
+        Args:
+            target_data: Dane w formacie poetry
+
+        Returns:
+            Zawartość pliku pyproject.toml
+        """
+        return PoetrySchema.generate_pyproject_toml(target_data)
 
     def execute(self) -> Path:
         """
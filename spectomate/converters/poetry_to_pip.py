@@ -1,3 +1,137 @@
 """
-poetry_to_pip.py
+Konwerter z formatu poetry (pyproject.toml) do formatu pip (requirements.txt).
 """
+
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from spectomate.core.base_converter import BaseConverter
+from spectomate.core.registry import register_converter
+from spectomate.schemas.pip_schema import PipSchema
+from spectomate.schemas.poetry_schema import PoetrySchema
+
+
+@register_converter
+class PoetryToPipConverter(BaseConverter):
+    """
+    Konwerter z formatu poetry (pyproject.toml) do formatu pip (requirements.txt).
+    """
+
+    def __init__(
+        self,
+        source_file: Optional[Union[str, Path]] = None,
+        target_file: Optional[Union[str, Path]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Inicjalizuje konwerter.
+
+        Args:
+            source_file: Ścieżka do pliku pyproject.toml
+            target_file: Ścieżka do pliku requirements.txt
+            options: Opcje konwersji (include_dev - czy dołączyć zależności
+                deweloperskie)
+        """
+        super().__init__(source_file, target_file, options)
+
+    @staticmethod
+    def get_source_format() -> str:
+        """Zwraca identyfikator formatu źródłowego."""
+        return "poetry"
+
+    @staticmethod
+    def get_target_format() -> str:
+        """Zwraca identyfikator formatu docelowego."""
+        return "pip"
+
+    def read_source(self) -> Dict[str, Any]:
+        """
+        Odczytuje plik pyproject.toml.
+
+        Returns:
+            Słownik z informacjami o projekcie poetry
+        """
+        if self.source_file is None:
+            raise ValueError("Nie podano ścieżki do pliku źródłowego")
+
+        return PoetrySchema.parse_file(self.source_file)
+
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku pyproject.toml.
+
+        Args:
+            content: Zawartość pliku pyproject.toml
+
+        Returns:
+            Słownik z informacjami o projekcie poetry
+        """
+        return PoetrySchema.parse_string(content)
+
+    def convert(self, source_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Konwertuje dane z formatu poetry do formatu pip.
+
+        Args:
+            source_data: Dane w formacie poetry
+
+        Returns:
+            Dane w formacie pip
+        """
+        if source_data is None:
+            if self.source_data is None:
+                raise ValueError("Brak danych źródłowych do konwersji")
+            source_data = self.source_data
+
+        include_dev = self.options.get("include_dev", False)
+        self.warnings = []
+
+        return {
+            "format": "pip",
+            "requirements": PoetrySchema.extract_dependencies(
+                source_data, include_dev=include_dev, warnings=self.warnings
+            ),
+        }
+
+    def write_target(self, target_data: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Zapisuje dane do pliku requirements.txt.
+
+        Args:
+            target_data: Dane w formacie pip
+
+        Returns:
+            Ścieżka do zapisanego pliku
+        """
+        if target_data is None:
+            if self.target_data is None:
+                raise ValueError("Brak danych docelowych do zapisu")
+            target_data = self.target_data
+
+        if self.target_file is None:
+            # Jeśli nie podano ścieżki do pliku docelowego, tworzymy ją na podstawie
+            # pliku źródłowego
+            if self.source_file is None:
+                raise ValueError(
+                    "Nie podano ścieżki do pliku docelowego ani źródłowego"
+                )
+
+            self.target_file = Path(self.source_file).parent / "requirements.txt"
+
+        self.write_status = PipSchema.update_requirements_txt(
+            target_data, self.target_file
+        )
+
+        return self.target_file
+
+    def render_target(self, target_data: Dict[str, Any]) -> str:
+        """
+        Serializuje dane do postaci pliku requirements.txt.
+
+        Args:
+            target_data: Dane w formacie pip
+
+        Returns:
+            Zawartość pliku requirements.txt
+        """
+        return PipSchema.generate_requirements_txt(target_data)
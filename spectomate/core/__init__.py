@@ -2,5 +2,26 @@
 Moduł core zawiera podstawowe klasy i funkcje dla Spectomate.
 """
 
-from spectomate.core.base_converter import BaseConverter
-from spectomate.core.registry import ConverterRegistry
+
+def __getattr__(name: str) -> object:
+    """
+    Leniwie importuje BaseConverter i ConverterRegistry.
+
+    Dzięki temu moduły core niezależne od rejestru (np. klient demona)
+    można importować bez ładowania konwerterów.
+
+    Args:
+        name: Nazwa atrybutu modułu
+
+    Returns:
+        Wartość atrybutu
+    """
+    if name == "BaseConverter":
+        from spectomate.core.base_converter import BaseConverter
+
+        return BaseConverter
+    if name == "ConverterRegistry":
+        from spectomate.core.registry import ConverterRegistry
+
+        return ConverterRegistry
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
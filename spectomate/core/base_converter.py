@@ -2,18 +2,27 @@
 Moduł bazowy konwertera definiujący interfejs dla wszystkich konwerterów.
 """
 
+import asyncio
+import tempfile
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Type, Union
 
+from spectomate.core.utils import get_default_output_file
+
 
 class BaseConverter(ABC):
     """
     Klasa bazowa dla wszystkich konwerterów formatów pakietów.
 
     Każdy konwerter musi implementować metody read_source, convert, i write_target.
+    Metody parse_source i render_target (konwersja w pamięci) są opcjonalne -
+    domyślnie korzystają z read_source i write_target przez pliki tymczasowe.
     """
 
+    # Względny koszt konwersji używany przy wyznaczaniu tras wieloetapowych
+    conversion_cost: int = 1
+
     def __init__(
         self,
         source_file: Optional[Union[str, Path]] = None,
@@ -33,6 +42,10 @@ class BaseConverter(ABC):
         self.options = options or {}
         self.source_data = None
         self.target_data = None
+        # Status ostatniego zapisu: "updated" lub "unchanged" (None przed zapisem)
+        self.write_status: Optional[str] = None
+        # Ostrzeżenia z ostatniej konwersji (np. niesprawdzone pakiety)
+        self.warnings: List[str] = []
 
     @property
     def source_format(self) -> str:
@@ -102,3 +115,120 @@ class BaseConverter(ABC):
         self.source_data = self.read_source()
         self.target_data = self.convert(self.source_data)
         return self.write_target(self.target_data)
+
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku źródłowego przekazaną w pamięci.
+
+        Domyślnie zapisuje zawartość do pliku tymczasowego (o nazwie pliku
+        źródłowego lub domyślnej nazwie formatu) i odczytuje go przez
+        read_source(). Konwertery, które potrafią parsować tekst bezpośrednio,
+        powinny nadpisać tę metodę.
+
+        Args:
+            content: Zawartość pliku w formacie źródłowym
+
+        Returns:
+            Odczytane dane w ustandaryzowanym formacie słownikowym
+        """
+        source_file = self.source_file
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.source_file = Path(temp_dir) / self._file_name(
+                source_file, self.source_format
+            )
+            self.source_file.write_text(content, encoding="utf-8")
+            try:
+                return self.read_source()
+            finally:
+                self.source_file = source_file
+
+    def render_target(self, target_data: Dict[str, Any]) -> str:
+        """
+        Serializuje dane w formacie docelowym do tekstu zamiast do pliku.
+
+        Domyślnie zapisuje dane przez write_target() do pliku tymczasowego
+        i zwraca jego zawartość. Konwertery, które potrafią serializować dane
+        bezpośrednio, powinny nadpisać tę metodę.
+
+        Args:
+            target_data: Dane w formacie docelowym
+
+        Returns:
+            Zawartość pliku w formacie docelowym
+        """
+        target_file, write_status = self.target_file, self.write_status
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.target_file = Path(temp_dir) / self._file_name(
+                target_file, self.target_format
+            )
+            try:
+                return self.write_target(target_data).read_text(encoding="utf-8")
+            finally:
+                self.target_file, self.write_status = target_file, write_status
+
+    @staticmethod
+    def _file_name(path: Optional[Path], format_name: str) -> str:
+        """
+        Zwraca nazwę pliku tymczasowego używanego przy konwersji w pamięci.
+
+        Args:
+            path: Ścieżka pliku konwertera (None - nieznana)
+            format_name: Format pliku
+
+        Returns:
+            Nazwa pliku (schematy rozpoznają niektóre formaty po nazwie)
+        """
+        if path is not None:
+            return path.name
+        try:
+            return get_default_output_file(Path(), format_name).name
+        except ValueError:
+            return f"{format_name}.txt"
+
+    def convert_content(self, content: str) -> str:
+        """
+        Wykonuje pełny proces konwersji w pamięci, bez odczytu i zapisu plików.
+
+        Args:
+            content: Zawartość pliku w formacie źródłowym
+
+        Returns:
+            Zawartość pliku w formacie docelowym
+        """
+        self.source_data = self.parse_source(content)
+        self.target_data = self.convert(self.source_data)
+        return self.render_target(self.target_data)
+
+    async def convert_async(
+        self, source_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Asynchroniczna wersja metody convert.
+
+        Domyślnie wykonuje convert w puli wątków pętli zdarzeń, więc nie
+        blokuje jej. Konwertery wykonujące operacje wejścia-wyjścia (np.
+        wyszukiwanie pakietów w conda) mogą ją nadpisać własną implementacją.
+
+        Args:
+            source_data: Dane w formacie źródłowym (opcjonalnie, jeśli nie podano
+                używa self.source_data)
+
+        Returns:
+            Przekonwertowane dane w formacie docelowym
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.convert, source_data)
+
+    async def execute_async(self) -> Path:
+        """
+        Asynchroniczna wersja metody execute.
+
+        Odczyt i zapis plików są wykonywane w puli wątków pętli zdarzeń.
+
+        Returns:
+            Ścieżka do zapisanego pliku docelowego
+        """
+        loop = asyncio.get_running_loop()
+        self.source_data = await loop.run_in_executor(None, self.read_source)
+        self.target_data = await self.convert_async(self.source_data)
+        return await loop.run_in_executor(None, self.write_target, self.target_data)
@@ -0,0 +1,151 @@
+"""
+Moduł wsadowej konwersji w pamięci w formacie NDJSON.
+
+Każdy wiersz wejścia to jedno żądanie JSON, np.:
+
+    {"id": "a1", "source_format": "pip", "target_format": "conda",
+     "content": "numpy>=1.22.0\\n", "options": {"env_name": "app"}}
+
+Pole source_format można pominąć (lub podać "auto") - format jest wtedy
+wykrywany z zawartości i opcjonalnego pola filename. Dla każdego żądania
+wypisywany jest jeden wiersz wyniku, w kolejności zakończenia konwersji:
+
+    {"id": "a1", "ok": true, "source_format": "pip", "target_format": "conda",
+     "content": "name: app\\n..."}
+    {"id": "a2", "ok": false, "error": "..."}
+
+Żądania bez pola id są identyfikowane numerem wiersza wejścia.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, TextIO, Tuple
+
+from spectomate.core.registry import ConverterRegistry
+
+
+def convert_request(request: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Wykonuje jedno żądanie konwersji w pamięci.
+
+    Args:
+        request: Żądanie z polami content, target_format oraz opcjonalnie
+            source_format, filename i options
+
+    Returns:
+        Słownik z formatami i zawartością pliku docelowego (oraz listą
+        ostrzeżeń, jeśli konwersja je zgłosiła)
+    """
+    content = request.get("content")
+    if not isinstance(content, str):
+        raise ValueError("Pole content musi zawierać zawartość pliku")
+
+    target_format = request.get("target_format")
+    if not target_format:
+        raise ValueError("Nie podano pola target_format")
+
+    options = request.get("options") or {}
+    if not isinstance(options, dict):
+        raise ValueError("Pole options musi być obiektem JSON")
+
+    source_format = request.get("source_format") or "auto"
+    if source_format == "auto":
+        source_format = ConverterRegistry.detect_format(
+            request.get("filename"), content
+        )
+        if source_format is None:
+            raise ValueError("Nie udało się wykryć formatu źródłowego")
+
+    converter_class = ConverterRegistry.get_converter(source_format, target_format)
+    if converter_class is None:
+        raise ValueError(
+            f"Nie znaleziono konwertera z formatu {source_format} do {target_format}"
+        )
+
+    converter = converter_class(options=options)
+
+    result = {
+        "source_format": source_format,
+        "target_format": target_format,
+        "content": converter.convert_content(content),
+    }
+    if converter.warnings:
+        result["warnings"] = converter.warnings
+    return result
+
+
+def _process_line(line_number: int, line: str) -> Dict[str, Any]:
+    """
+    Przetwarza jeden wiersz wejścia.
+
+    Args:
+        line_number: Numer wiersza (od 1)
+        line: Wiersz z żądaniem JSON
+
+    Returns:
+        Wynik do wypisania
+    """
+    try:
+        request = json.loads(line)
+    except ValueError as e:
+        return {"id": line_number, "ok": False, "error": f"Błędny JSON: {e}"}
+
+    if not isinstance(request, dict):
+        return {"id": line_number, "ok": False, "error": "Żądanie musi być obiektem"}
+
+    request_id = request.get("id", line_number)
+    try:
+        return {"id": request_id, "ok": True, **convert_request(request)}
+    except Exception as e:
+        return {"id": request_id, "ok": False, "error": str(e)}
+
+
+def run_batch(
+    input_stream: TextIO,
+    output_stream: TextIO,
+    max_workers: Optional[int] = None,
+    max_in_flight: Optional[int] = None,
+) -> Tuple[int, int]:
+    """
+    Konwertuje żądania NDJSON z input_stream i wypisuje wyniki do output_stream.
+
+    Żądania są przetwarzane równolegle, ale liczba żądań odczytanych i jeszcze
+    niezakończonych jest ograniczona, więc pamięć nie rośnie z długością wejścia.
+    Każdy wynik jest wypisywany i opróżniany zaraz po zakończeniu konwersji.
+
+    Args:
+        input_stream: Strumień z żądaniami (jeden obiekt JSON w wierszu)
+        output_stream: Strumień wyników (jeden obiekt JSON w wierszu)
+        max_workers: Liczba wątków wykonujących konwersje
+        max_in_flight: Maksymalna liczba jednocześnie przetwarzanych żądań
+            (domyślnie dwukrotność liczby wątków)
+
+    Returns:
+        Krotka (liczba udanych konwersji, liczba błędów)
+    """
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    in_flight = threading.BoundedSemaphore(max_in_flight or 2 * workers)
+    output_lock = threading.Lock()
+    counts = {True: 0, False: 0}
+
+    def process(line_number: int, line: str) -> None:
+        try:
+            result = _process_line(line_number, line)
+            output = json.dumps(result, ensure_ascii=False) + "\n"
+            with output_lock:
+                output_stream.write(output)
+                output_stream.flush()
+                counts[result["ok"]] += 1
+        finally:
+            in_flight.release()
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for line_number, line in enumerate(input_stream, 1):
+            if not line.strip():
+                continue
+            in_flight.acquire()
+            executor.submit(process, line_number, line)
+
+    return counts[True], counts[False]
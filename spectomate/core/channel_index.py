@@ -0,0 +1,484 @@
+"""
+Moduł lokalnego indeksu kanałów conda z filtrem Blooma.
+
+Indeks jest budowany z plików repodata.json (np. z pamięci podręcznej conda
+w <prefix>/pkgs/cache) i zapisywany w katalogu ~/.cache/spectomate jako:
+
+- filtr Blooma nazw pakietów (kilka bitów na nazwę), który pozwala od razu
+  odrzucić pakiety na pewno nieobecne w kanałach,
+- posortowana lista nazw (jedna w wierszu), przeszukiwana binarnie przez
+  mmap tylko dla nazw, które filtr uznał za możliwie obecne.
+
+Nazwy plików indeksu zawierają odcisk plików repodata (ścieżki, rozmiary
+i czasy modyfikacji), więc zmiana indeksu kanałów powoduje automatyczne
+przebudowanie filtra przy następnym użyciu. Plik .source z listą plików
+repodata pozwala usunąć tylko nieaktualne indeksy tego samego zestawu plików.
+
+Indeks jest włączany zmienną SPECTOMATE_CHANNEL_INDEX (lub opcją konwertera
+channel_index) zawierającą ścieżki plików repodata.json lub katalogów z nimi,
+oddzielone separatorem ścieżek systemu, albo wartość "auto" - wtedy używana
+jest pamięć podręczna conda.
+"""
+
+import glob
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+# Zmienna środowiskowa z lokalizacją plików repodata.json
+CHANNEL_INDEX_ENV_VAR = "SPECTOMATE_CHANNEL_INDEX"
+
+# Docelowy odsetek fałszywie pozytywnych odpowiedzi filtra Blooma
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+
+BLOOM_MAGIC = b"SPBF"
+BLOOM_VERSION = 1
+
+_BLOOM_HEADER = struct.Struct("<4sHHQQ")
+
+
+class BloomFilter:
+    """
+    Filtr Blooma dla nazw pakietów.
+
+    Pozycje bitów są wyznaczane metodą podwójnego haszowania z jednego
+    skrótu BLAKE2b.
+    """
+
+    def __init__(self, bit_count: int, hash_count: int, bits: Optional[bytes] = None):
+        """
+        Inicjalizacja filtra.
+
+        Args:
+            bit_count: Liczba bitów filtra
+            hash_count: Liczba funkcji haszujących
+            bits: Zawartość tablicy bitów (None - pusty filtr)
+        """
+        self.bit_count = max(bit_count, 8)
+        self.hash_count = max(hash_count, 1)
+        self.bits = bytearray(bits) if bits else bytearray((self.bit_count + 7) // 8)
+
+    @classmethod
+    def for_capacity(
+        cls, capacity: int, false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE
+    ) -> "BloomFilter":
+        """
+        Tworzy pusty filtr o rozmiarze dobranym do liczby elementów.
+
+        Args:
+            capacity: Spodziewana liczba elementów
+            false_positive_rate: Docelowy odsetek fałszywie pozytywnych odpowiedzi
+
+        Returns:
+            Pusty filtr Blooma
+        """
+        capacity = max(capacity, 1)
+        bit_count = math.ceil(
+            -capacity * math.log(false_positive_rate) / (math.log(2) ** 2)
+        )
+        hash_count = round(bit_count / capacity * math.log(2))
+        return cls(bit_count, hash_count)
+
+    def _positions(self, name: str) -> Iterable[int]:
+        """
+        Wyznacza pozycje bitów dla nazwy.
+
+        Args:
+            name: Nazwa pakietu
+
+        Returns:
+            Pozycje bitów
+        """
+        digest = hashlib.blake2b(name.encode("utf-8"), digest_size=16).digest()
+        first, second = struct.unpack("<QQ", digest)
+        second |= 1
+        return (
+            (first + index * second) % self.bit_count
+            for index in range(self.hash_count)
+        )
+
+    def add(self, name: str) -> None:
+        """
+        Dodaje nazwę do filtra.
+
+        Args:
+            name: Nazwa pakietu
+        """
+        for position in self._positions(name):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, name: object) -> bool:
+        """
+        Sprawdza, czy nazwa może należeć do filtra.
+
+        Args:
+            name: Nazwa pakietu
+
+        Returns:
+            False jeśli nazwa na pewno nie należy do filtra
+        """
+        if not isinstance(name, str):
+            return False
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(name)
+        )
+
+    def to_bytes(self) -> bytes:
+        """
+        Serializuje filtr.
+
+        Returns:
+            Zawartość pliku filtra
+        """
+        header = _BLOOM_HEADER.pack(
+            BLOOM_MAGIC, BLOOM_VERSION, self.hash_count, self.bit_count, 0
+        )
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """
+        Odczytuje filtr zapisany przez to_bytes().
+
+        Args:
+            data: Zawartość pliku filtra
+
+        Returns:
+            Filtr Blooma
+
+        Raises:
+            ValueError: Jeśli dane nie zawierają poprawnego filtra
+        """
+        if len(data) < _BLOOM_HEADER.size:
+            raise ValueError("Plik filtra Blooma jest uszkodzony")
+
+        magic, version, hash_count, bit_count, _ = _BLOOM_HEADER.unpack_from(data)
+        bits = data[_BLOOM_HEADER.size :]
+        if (
+            magic != BLOOM_MAGIC
+            or version != BLOOM_VERSION
+            or len(bits) != (bit_count + 7) // 8
+        ):
+            raise ValueError("Nieobsługiwany format filtra Blooma")
+
+        return cls(bit_count, hash_count, bits)
+
+
+class ChannelIndex:
+    """
+    Indeks nazw pakietów dostępnych w lokalnych kanałach conda.
+    """
+
+    def __init__(self, bloom: BloomFilter, names_file: Path):
+        """
+        Inicjalizacja indeksu.
+
+        Args:
+            bloom: Filtr Blooma nazw pakietów
+            names_file: Plik z posortowanymi nazwami pakietów (jedna w wierszu)
+        """
+        self.bloom = bloom
+        self.names_file = names_file
+        self._names: Optional[mmap.mmap] = None
+        self._lock = threading.Lock()
+
+    def might_contain(self, name: str) -> bool:
+        """
+        Sprawdza w filtrze Blooma, czy pakiet może być dostępny.
+
+        Args:
+            name: Nazwa pakietu conda
+
+        Returns:
+            False jeśli pakietu na pewno nie ma w kanałach
+        """
+        return name.lower() in self.bloom
+
+    def contains(self, name: str) -> bool:
+        """
+        Sprawdza, czy pakiet jest dostępny w kanałach.
+
+        Posortowana lista nazw jest przeszukiwana tylko wtedy, gdy filtr
+        Blooma nie wykluczył pakietu.
+
+        Args:
+            name: Nazwa pakietu conda
+
+        Returns:
+            True jeśli pakiet jest dostępny
+
+        Raises:
+            OSError: Jeśli listy nazw nie da się odczytać (np. została usunięta
+                przez przebudowę indeksu w innym procesie)
+        """
+        name = name.lower()
+        if name not in self.bloom:
+            return False
+        return self._search(name.encode("utf-8"))
+
+    def _search(self, needle: bytes) -> bool:
+        """
+        Wyszukuje binarnie nazwę w posortowanej liście nazw.
+
+        Args:
+            needle: Nazwa pakietu (UTF-8)
+
+        Returns:
+            True jeśli nazwa występuje na liście
+        """
+        with self._lock:
+            if self._names is None:
+                with open(self.names_file, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        return False
+                    self._names = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        names = self._names
+
+        low, high = 0, len(names)
+        while low < high:
+            middle = (low + high) // 2
+            start = names.rfind(b"\n", 0, middle) + 1
+            end = names.find(b"\n", start)
+            line = names[start:end]
+            if line == needle:
+                return True
+            if line < needle:
+                low = end + 1
+            else:
+                high = start
+        return False
+
+
+def find_repodata_files(spec: str) -> List[Path]:
+    """
+    Wyszukuje pliki repodata.json wskazane przez specyfikację indeksu.
+
+    Args:
+        spec: Ścieżki plików lub katalogów oddzielone os.pathsep albo "auto"
+
+    Returns:
+        Posortowana lista plików repodata
+    """
+    if spec.strip() == "auto":
+        locations = [str(path) for path in _conda_cache_dirs()]
+    else:
+        locations = [part for part in spec.split(os.pathsep) if part.strip()]
+
+    files: Set[Path] = set()
+    for location in locations:
+        path = Path(location).expanduser()
+        if path.is_dir():
+            for candidate in glob.glob(str(path / "*.json")):
+                # Pliki stanu conda (*.info.json, *.state.json) nie są indeksami
+                if not candidate.endswith((".info.json", ".state.json")):
+                    files.add(Path(candidate))
+        elif path.is_file():
+            files.add(path)
+
+    return sorted(files)
+
+
+def _conda_cache_dirs() -> List[Path]:
+    """
+    Zwraca katalogi pamięci podręcznej indeksów conda.
+
+    Returns:
+        Istniejące katalogi <pkgs_dir>/cache
+    """
+    pkgs_dirs = [
+        part for part in os.environ.get("CONDA_PKGS_DIRS", "").split(",") if part
+    ]
+    for variable in ("CONDA_PREFIX", "CONDA_ROOT", "MAMBA_ROOT_PREFIX"):
+        prefix = os.environ.get(variable)
+        if prefix:
+            pkgs_dirs.append(os.path.join(prefix, "pkgs"))
+    home = os.path.expanduser("~")
+    for name in (".conda", "miniconda3", "miniconda", "anaconda3", "miniforge3"):
+        pkgs_dirs.append(os.path.join(home, name, "pkgs"))
+
+    directories = []
+    for pkgs_dir in dict.fromkeys(pkgs_dirs):
+        cache_dir = Path(pkgs_dir) / "cache"
+        if cache_dir.is_dir():
+            directories.append(cache_dir)
+    return directories
+
+
+def _fingerprint(files: Sequence[Path]) -> str:
+    """
+    Oblicza odcisk zestawu plików repodata.
+
+    Args:
+        files: Pliki repodata
+
+    Returns:
+        Odcisk zależny od ścieżek, rozmiarów i czasów modyfikacji plików
+    """
+    digest = hashlib.sha256()
+    for path in files:
+        stat = path.stat()
+        digest.update(
+            f"{path.resolve()}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode()
+        )
+    return digest.hexdigest()[:16]
+
+
+def _read_package_names(files: Iterable[Path]) -> Set[str]:
+    """
+    Odczytuje nazwy pakietów z plików repodata.
+
+    Args:
+        files: Pliki repodata.json
+
+    Returns:
+        Zbiór nazw pakietów (małymi literami)
+    """
+    names: Set[str] = set()
+    for path in files:
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                repodata = json.load(f)
+        except (OSError, ValueError):
+            # Uszkodzony lub niepełny plik pamięci podręcznej conda
+            continue
+        if not isinstance(repodata, dict):
+            continue
+
+        for key in ("packages", "packages.conda"):
+            packages = repodata.get(key)
+            if isinstance(packages, dict):
+                for record in packages.values():
+                    if isinstance(record, dict) and record.get("name"):
+                        names.add(str(record["name"]).lower())
+    return names
+
+
+def get_cache_dir() -> Path:
+    """
+    Zwraca katalog, w którym zapisywane są zbudowane indeksy kanałów.
+
+    Returns:
+        Ścieżka katalogu
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "spectomate" / "channel-index"
+
+
+def build_channel_index(
+    files: Sequence[Path],
+    cache_dir: Optional[Path] = None,
+    false_positive_rate: float = DEFAULT_FALSE_POSITIVE_RATE,
+) -> ChannelIndex:
+    """
+    Buduje indeks kanałów z plików repodata lub wczytuje już zbudowany.
+
+    Args:
+        files: Pliki repodata.json
+        cache_dir: Katalog na pliki indeksu (None - domyślny)
+        false_positive_rate: Docelowy odsetek fałszywie pozytywnych odpowiedzi
+
+    Returns:
+        Indeks kanałów
+    """
+    cache_dir = cache_dir or get_cache_dir()
+    fingerprint = _fingerprint(files)
+    bloom_file = cache_dir / f"{fingerprint}.bloom"
+    names_file = cache_dir / f"{fingerprint}.names"
+
+    if bloom_file.exists() and names_file.exists():
+        try:
+            return ChannelIndex(
+                BloomFilter.from_bytes(bloom_file.read_bytes()), names_file
+            )
+        except ValueError:
+            pass
+
+    names = sorted(_read_package_names(files))
+    bloom = BloomFilter.for_capacity(len(names), false_positive_rate)
+    for name in names:
+        bloom.add(name)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Usuwamy indeksy zbudowane z poprzednich wersji tych samych plików
+    # repodata (indeksy innych zestawów plików mogą być nadal używane)
+    source = "\n".join(str(path.resolve()) for path in files)
+    source_file = cache_dir / f"{fingerprint}.source"
+    for old_file in cache_dir.glob("*.source"):
+        try:
+            stale = old_file.stem != fingerprint and old_file.read_text() == source
+        except OSError:
+            continue
+        if stale:
+            for suffix in (".bloom", ".names", ".source"):
+                try:
+                    old_file.with_suffix(suffix).unlink()
+                except FileNotFoundError:
+                    pass
+
+    # Lista nazw jest zapisywana przed filtrem, który oznacza kompletny indeks
+    _write_atomic(names_file, "".join(f"{name}\n" for name in names).encode("utf-8"))
+    _write_atomic(bloom_file, bloom.to_bytes())
+    _write_atomic(source_file, source.encode("utf-8"))
+
+    return ChannelIndex(bloom, names_file)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Zapisuje plik atomowo (przez plik tymczasowy i zmianę nazwy).
+
+    Args:
+        path: Ścieżka pliku
+        data: Zawartość pliku
+    """
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    temp_path.write_bytes(data)
+    os.replace(temp_path, path)
+
+
+_indexes: Dict[Tuple[str, str], ChannelIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_channel_index(
+    spec: Optional[Union[str, Sequence[str]]] = None,
+) -> Optional[ChannelIndex]:
+    """
+    Zwraca indeks kanałów dla specyfikacji, budując go w razie potrzeby.
+
+    Args:
+        spec: Ścieżki plików repodata lub katalogów (napis z separatorem
+            os.pathsep albo lista), "auto" lub None - wartość zmiennej
+            SPECTOMATE_CHANNEL_INDEX
+
+    Returns:
+        Indeks kanałów lub None, jeśli indeks nie jest skonfigurowany
+        albo nie znaleziono plików repodata
+    """
+    if spec is None:
+        spec = os.environ.get(CHANNEL_INDEX_ENV_VAR, "")
+    if not isinstance(spec, str):
+        spec = os.pathsep.join(str(part) for part in spec)
+    if not spec.strip():
+        return None
+
+    files = find_repodata_files(spec)
+    if not files:
+        return None
+
+    key = (str(get_cache_dir()), _fingerprint(files))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = build_channel_index(files)
+            _indexes[key] = index
+        return index
@@ -0,0 +1,596 @@
+"""
+Moduł sprawdzający dostępność pakietów w repozytoriach conda.
+
+Wyniki wyszukiwania są zapamiętywane na czas życia procesu (wspólnie dla
+wywołań synchronicznych i asynchronicznych), a błędy wyszukiwania nie są
+zapamiętywane, więc kolejne wywołanie spróbuje ponownie.
+
+Każde wyszukiwanie ma limit czasu, a wyłącznik (circuit breaker) wspólny dla
+całego procesu przestaje uruchamiać conda po kilku kolejnych błędach - pakiety
+są wtedy od razu klasyfikowane jako dostępne tylko przez pip, a przyczyna jest
+podawana w wyniku wyszukiwania.
+"""
+
+import asyncio
+import json
+import os
+import signal
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from spectomate.core.channel_index import ChannelIndex
+
+# Polecenie conda używane do wyszukiwania pakietów
+CONDA_EXECUTABLE = "conda"
+
+# Domyślna maksymalna liczba równoległych wyszukiwań
+DEFAULT_MAX_CONCURRENCY = 8
+
+# Domyślny limit czasu (w sekundach) pojedynczego wyszukiwania
+DEFAULT_TIMEOUT = 60.0
+
+# Liczba kolejnych błędów conda, po której wyłącznik przestaje ją uruchamiać
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Czas (w sekundach), po którym otwarty wyłącznik dopuszcza próbne wyszukiwanie
+DEFAULT_RESET_TIMEOUT = 60.0
+
+# Przyczyny wyniku wyszukiwania pakietu
+LOOKUP_FOUND = "found"
+LOOKUP_NOT_FOUND = "not_found"
+LOOKUP_TIMEOUT = "timeout"
+LOOKUP_ERROR = "error"
+LOOKUP_CIRCUIT_OPEN = "circuit_open"
+
+# Zapamiętane wyniki wyszukiwania: nazwa pakietu -> dostępność
+_cache: Dict[str, bool] = {}
+_cache_lock = threading.Lock()
+
+
+def clear_cache() -> None:
+    """Czyści zapamiętane wyniki wyszukiwania pakietów i zamyka wyłącznik."""
+    with _cache_lock:
+        _cache.clear()
+    _circuit_breaker.reset()
+
+
+def _get_cached(package_name: str) -> Optional[bool]:
+    """
+    Zwraca zapamiętany wynik wyszukiwania pakietu.
+
+    Args:
+        package_name: Nazwa pakietu
+
+    Returns:
+        Zapamiętana dostępność lub None, jeśli pakietu jeszcze nie sprawdzano
+    """
+    with _cache_lock:
+        return _cache.get(package_name)
+
+
+def _store(package_name: str, available: bool) -> bool:
+    """
+    Zapamiętuje wynik wyszukiwania pakietu.
+
+    Args:
+        package_name: Nazwa pakietu
+        available: Czy pakiet jest dostępny
+
+    Returns:
+        Zapamiętana dostępność
+    """
+    with _cache_lock:
+        _cache[package_name] = available
+    return available
+
+
+def _search_command(package_name: str) -> List[str]:
+    """
+    Zwraca polecenie wyszukujące pakiet w conda.
+
+    Args:
+        package_name: Nazwa pakietu
+
+    Returns:
+        Lista elementów polecenia
+    """
+    return [CONDA_EXECUTABLE, "search", package_name, "--json"]
+
+
+def _parse_search_result(package_name: str, returncode: int, stdout: str) -> bool:
+    """
+    Interpretuje wynik polecenia conda search.
+
+    Args:
+        package_name: Nazwa wyszukiwanego pakietu
+        returncode: Kod wyjścia polecenia
+        stdout: Wyjście polecenia w formacie JSON
+
+    Returns:
+        True jeśli pakiet jest dostępny, False jeśli conda go nie znalazła
+
+    Raises:
+        RuntimeError: Jeśli wyszukiwanie się nie powiodło (np. brak sieci)
+    """
+    try:
+        data = json.loads(stdout or "{}")
+    except ValueError:
+        raise RuntimeError(f"Nieprawidłowy wynik wyszukiwania pakietu {package_name}")
+
+    if returncode != 0:
+        if data.get("exception_name") == "PackagesNotFoundError":
+            return False
+        raise RuntimeError(
+            f"Wyszukiwanie pakietu {package_name} w conda nie powiodło się "
+            f"({data.get('exception_name') or f'kod wyjścia {returncode}'})"
+        )
+
+    # Jeśli pakiet istnieje, dane będą zawierały klucz z nazwą pakietu
+    return package_name in data
+
+
+class LookupResult:
+    """
+    Wynik sprawdzenia dostępności pakietu w conda.
+    """
+
+    def __init__(self, package_name: str, reason: str, detail: str = ""):
+        """
+        Inicjalizacja wyniku.
+
+        Args:
+            package_name: Nazwa pakietu
+            reason: Przyczyna wyniku (jedna ze stałych LOOKUP_*)
+            detail: Dodatkowy opis (np. komunikat błędu)
+        """
+        self.package_name = package_name
+        self.reason = reason
+        self.detail = detail
+
+    @property
+    def available(self) -> bool:
+        """Czy pakiet jest dostępny w conda."""
+        return self.reason == LOOKUP_FOUND
+
+    @property
+    def definitive(self) -> bool:
+        """Czy conda udzieliła odpowiedzi (a nie np. upłynął limit czasu)."""
+        return self.reason in (LOOKUP_FOUND, LOOKUP_NOT_FOUND)
+
+    def __repr__(self) -> str:
+        return f"LookupResult({self.package_name!r}, {self.reason!r})"
+
+
+class CircuitBreaker:
+    """
+    Wyłącznik przerywający wyszukiwania po serii błędów conda.
+
+    Po failure_threshold kolejnych błędach wyłącznik się otwiera i przez
+    reset_timeout sekund odrzuca wyszukiwania. Potem dopuszcza jedno próbne
+    wyszukiwanie: jego powodzenie zamyka wyłącznik, a błąd otwiera go ponownie.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+    ):
+        """
+        Inicjalizacja wyłącznika.
+
+        Args:
+            failure_threshold: Liczba kolejnych błędów otwierająca wyłącznik
+            reset_timeout: Czas w sekundach do próbnego wyszukiwania
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self.last_error = ""
+
+    @property
+    def is_open(self) -> bool:
+        """Czy wyłącznik odrzuca wyszukiwania."""
+        with self._lock:
+            return self._opened_at is not None
+
+    def allow(self) -> bool:
+        """
+        Sprawdza, czy można uruchomić wyszukiwanie.
+
+        Returns:
+            True jeśli wyszukiwanie może zostać wykonane
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return True
+            if self._trial_running:
+                return False
+            if time.monotonic() - self._opened_at < self.reset_timeout:
+                return False
+            self._trial_running = True
+            return True
+
+    def record_success(self) -> None:
+        """Rejestruje wyszukiwanie, na które conda udzieliła odpowiedzi."""
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self, error: str) -> None:
+        """
+        Rejestruje nieudane wyszukiwanie.
+
+        Args:
+            error: Opis błędu
+        """
+        with self._lock:
+            self._failures += 1
+            self.last_error = error
+            if self._trial_running or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+            self._trial_running = False
+
+    def reset(self) -> None:
+        """Zamyka wyłącznik i zeruje licznik błędów."""
+        self.record_success()
+        self.last_error = ""
+
+
+# Wyłącznik wspólny dla wszystkich wyszukiwań w procesie
+_circuit_breaker = CircuitBreaker()
+
+
+def search_package(package_name: str, timeout: Optional[float] = None) -> bool:
+    """
+    Wyszukuje pakiet w repozytoriach conda.
+
+    Proces conda, który nie zakończy się w podanym czasie, jest zabijany.
+
+    Args:
+        package_name: Nazwa pakietu bez specyfikacji wersji
+        timeout: Limit czasu w sekundach (None - bez limitu)
+
+    Returns:
+        True jeśli pakiet jest dostępny, False jeśli conda go nie znalazła
+
+    Raises:
+        RuntimeError: Jeśli wyszukiwanie się nie powiodło
+        subprocess.TimeoutExpired: Jeśli upłynął limit czasu
+    """
+    cached = _get_cached(package_name)
+    if cached is not None:
+        return cached
+
+    process = subprocess.Popen(
+        _search_command(package_name),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        # Osobna grupa procesów pozwala zabić również procesy potomne conda
+        start_new_session=os.name == "posix",
+    )
+    with process:
+        try:
+            stdout, _ = process.communicate(timeout=timeout)
+        except BaseException:
+            _kill(process)
+            process.wait()
+            raise
+
+    return _store(
+        package_name, _parse_search_result(package_name, process.returncode, stdout)
+    )
+
+
+async def search_package_async(
+    package_name: str, timeout: Optional[float] = DEFAULT_TIMEOUT
+) -> bool:
+    """
+    Asynchronicznie wyszukuje pakiet w repozytoriach conda.
+
+    Proces conda, który nie zakończy się w podanym czasie, jest zabijany.
+
+    Args:
+        package_name: Nazwa pakietu bez specyfikacji wersji
+        timeout: Limit czasu w sekundach (None - bez limitu)
+
+    Returns:
+        True jeśli pakiet jest dostępny, False jeśli conda go nie znalazła
+
+    Raises:
+        RuntimeError: Jeśli wyszukiwanie się nie powiodło
+        asyncio.TimeoutError: Jeśli upłynął limit czasu
+    """
+    cached = _get_cached(package_name)
+    if cached is not None:
+        return cached
+
+    process = await asyncio.create_subprocess_exec(
+        *_search_command(package_name),
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.DEVNULL,
+        start_new_session=os.name == "posix",
+    )
+    try:
+        stdout, _ = await asyncio.wait_for(process.communicate(), timeout)
+    except BaseException:
+        # Nie zostawiamy zawieszonego procesu conda (limit czasu lub anulowanie)
+        if process.returncode is None:
+            _kill(process)
+            await process.wait()
+        raise
+
+    return _store(
+        package_name,
+        _parse_search_result(
+            package_name, process.returncode or 0, stdout.decode("utf-8", "replace")
+        ),
+    )
+
+
+def _kill(process: Any) -> None:
+    """
+    Zabija proces conda wraz z jego procesami potomnymi.
+
+    Args:
+        process: Proces do zabicia (subprocess.Popen lub asyncio.subprocess.Process)
+    """
+    try:
+        if os.name == "posix":
+            os.killpg(process.pid, signal.SIGKILL)
+        else:
+            process.kill()
+    except ProcessLookupError:
+        pass
+
+
+def _resolve_locally(
+    package_name: str, channel_index: Optional["ChannelIndex"] = None
+) -> Optional[LookupResult]:
+    """
+    Zwraca wynik, który można ustalić bez uruchamiania conda.
+
+    Pakiety, których filtr Blooma indeksu kanałów na pewno nie zawiera, są od
+    razu uznawane za niedostępne; pozostałe są sprawdzane w dokładnym indeksie.
+
+    Args:
+        package_name: Nazwa pakietu
+        channel_index: Lokalny indeks kanałów conda (None - brak indeksu)
+
+    Returns:
+        Wynik z pamięci podręcznej lub z indeksu kanałów albo None
+    """
+    cached = _get_cached(package_name)
+    if cached is not None:
+        return LookupResult(package_name, LOOKUP_FOUND if cached else LOOKUP_NOT_FOUND)
+
+    if channel_index is not None:
+        try:
+            found = channel_index.contains(package_name)
+        except OSError:
+            # Lista nazw zniknęła - indeks jest niedostępny, pytamy conda
+            return None
+        return LookupResult(
+            package_name,
+            LOOKUP_FOUND if found else LOOKUP_NOT_FOUND,
+            "indeks kanałów",
+        )
+
+    return None
+
+
+def _before_search(
+    package_name: str,
+    breaker: CircuitBreaker,
+    channel_index: Optional["ChannelIndex"] = None,
+) -> Optional[LookupResult]:
+    """
+    Zwraca wynik, którego nie trzeba ustalać przez uruchomienie conda.
+
+    Args:
+        package_name: Nazwa pakietu
+        breaker: Wyłącznik wyszukiwań
+        channel_index: Lokalny indeks kanałów conda (None - brak indeksu)
+
+    Returns:
+        Wynik z pamięci podręcznej lub indeksu kanałów, wynik dla otwartego
+        wyłącznika lub None
+    """
+    result = _resolve_locally(package_name, channel_index)
+    if result is not None:
+        return result
+
+    if not breaker.allow():
+        return LookupResult(package_name, LOOKUP_CIRCUIT_OPEN, breaker.last_error)
+
+    return None
+
+
+def _after_search(
+    package_name: str,
+    breaker: CircuitBreaker,
+    available: Optional[bool],
+    reason: str = LOOKUP_ERROR,
+    detail: str = "",
+) -> LookupResult:
+    """
+    Rejestruje wynik wyszukiwania w wyłączniku i zamienia go na LookupResult.
+
+    Args:
+        package_name: Nazwa pakietu
+        breaker: Wyłącznik wyszukiwań
+        available: Dostępność pakietu lub None, jeśli wyszukiwanie się nie powiodło
+        reason: Przyczyna niepowodzenia
+        detail: Opis niepowodzenia
+
+    Returns:
+        Wynik wyszukiwania
+    """
+    if available is None:
+        breaker.record_failure(f"{package_name}: {detail or reason}")
+        return LookupResult(package_name, reason, detail)
+
+    breaker.record_success()
+    return LookupResult(package_name, LOOKUP_FOUND if available else LOOKUP_NOT_FOUND)
+
+
+def lookup_package(
+    package_name: str,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    breaker: Optional[CircuitBreaker] = None,
+    channel_index: Optional["ChannelIndex"] = None,
+) -> LookupResult:
+    """
+    Sprawdza dostępność pakietu w conda z limitem czasu i wyłącznikiem.
+
+    Args:
+        package_name: Nazwa pakietu bez specyfikacji wersji
+        timeout: Limit czasu wyszukiwania w sekundach (None - bez limitu)
+        breaker: Wyłącznik wyszukiwań (None - wspólny dla procesu)
+        channel_index: Lokalny indeks kanałów conda, sprawdzany zamiast
+            uruchamiania conda (None - brak indeksu)
+
+    Returns:
+        Wynik wyszukiwania z przyczyną
+    """
+    breaker = breaker or _circuit_breaker
+    result = _before_search(package_name, breaker, channel_index)
+    if result is not None:
+        return result
+
+    try:
+        available = search_package(package_name, timeout)
+    except subprocess.TimeoutExpired:
+        return _after_search(
+            package_name, breaker, None, LOOKUP_TIMEOUT, f"przekroczono {timeout} s"
+        )
+    except (RuntimeError, OSError) as e:
+        return _after_search(package_name, breaker, None, LOOKUP_ERROR, str(e))
+
+    return _after_search(package_name, breaker, available)
+
+
+class CondaLookupExecutor:
+    """
+    Sprawdza dostępność wielu pakietów w conda w ograniczonej puli wątków.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_CONCURRENCY,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+        breaker: Optional[CircuitBreaker] = None,
+        channel_index: Optional["ChannelIndex"] = None,
+    ):
+        """
+        Inicjalizacja wykonawcy wyszukiwań.
+
+        Args:
+            max_workers: Maksymalna liczba jednocześnie działających procesów conda
+            timeout: Limit czasu pojedynczego wyszukiwania w sekundach
+            breaker: Wyłącznik wyszukiwań (None - wspólny dla procesu)
+            channel_index: Lokalny indeks kanałów conda (None - brak indeksu)
+        """
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.breaker = breaker or _circuit_breaker
+        self.channel_index = channel_index
+
+    def lookup(self, package_names: Iterable[str]) -> Dict[str, LookupResult]:
+        """
+        Sprawdza dostępność pakietów.
+
+        Pakiety zapamiętane wcześniej lub rozstrzygnięte przez indeks kanałów
+        nie uruchamiają conda. Po otwarciu
+        wyłącznika pozostałe pakiety dostają od razu wynik LOOKUP_CIRCUIT_OPEN.
+
+        Args:
+            package_names: Nazwy pakietów bez specyfikacji wersji
+
+        Returns:
+            Słownik: nazwa pakietu -> wynik wyszukiwania (w kolejności nazw)
+        """
+        names = list(dict.fromkeys(package_names))
+        local = {name: _resolve_locally(name, self.channel_index) for name in names}
+        pending = [name for name in names if local[name] is None]
+
+        results: Dict[str, LookupResult] = {}
+        if len(pending) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_workers, len(pending))
+            ) as executor:
+                results.update(zip(pending, executor.map(self._lookup_one, pending)))
+
+        return {
+            name: local[name] or results.get(name) or self._lookup_one(name)
+            for name in names
+        }
+
+    def _lookup_one(self, package_name: str) -> LookupResult:
+        """
+        Sprawdza dostępność jednego pakietu z ustawieniami wykonawcy.
+
+        Args:
+            package_name: Nazwa pakietu
+
+        Returns:
+            Wynik wyszukiwania
+        """
+        return lookup_package(
+            package_name, self.timeout, self.breaker, self.channel_index
+        )
+
+
+async def check_packages_async(
+    package_names: Iterable[str],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: Optional[float] = DEFAULT_TIMEOUT,
+    breaker: Optional[CircuitBreaker] = None,
+    channel_index: Optional["ChannelIndex"] = None,
+) -> Dict[str, LookupResult]:
+    """
+    Sprawdza równolegle dostępność kilku pakietów w conda.
+
+    Args:
+        package_names: Nazwy pakietów bez specyfikacji wersji
+        max_concurrency: Maksymalna liczba jednocześnie działających procesów conda
+        timeout: Limit czasu pojedynczego wyszukiwania w sekundach
+        breaker: Wyłącznik wyszukiwań (None - wspólny dla procesu)
+        channel_index: Lokalny indeks kanałów conda (None - brak indeksu)
+
+    Returns:
+        Słownik: nazwa pakietu -> wynik wyszukiwania
+    """
+    breaker = breaker or _circuit_breaker
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def check(package_name: str) -> LookupResult:
+        async with semaphore:
+            result = _before_search(package_name, breaker, channel_index)
+            if result is not None:
+                return result
+            try:
+                available = await search_package_async(package_name, timeout)
+            except asyncio.TimeoutError:
+                return _after_search(
+                    package_name,
+                    breaker,
+                    None,
+                    LOOKUP_TIMEOUT,
+                    f"przekroczono {timeout} s",
+                )
+            except (RuntimeError, OSError) as e:
+                return _after_search(package_name, breaker, None, LOOKUP_ERROR, str(e))
+            return _after_search(package_name, breaker, available)
+
+    names = list(dict.fromkeys(package_names))
+    results = await asyncio.gather(*(check(name) for name in names))
+    return dict(zip(names, results))
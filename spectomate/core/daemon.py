@@ -0,0 +1,503 @@
+"""
+Moduł demona konwersji działającego w tle i jego lekkiego klienta.
+
+Demon trzyma w pamięci załadowany rejestr, schematy i wyniki wyszukiwania
+pakietów w conda, a polecenia CLI otrzymuje przez gniazdo UNIX. Protokół jest
+prosty: klient wysyła jeden wiersz JSON z żądaniem, a demon odpowiada jednym
+wierszem JSON.
+
+Ten moduł jest importowany przez klienta przy każdym uruchomieniu CLI, więc
+na poziomie modułu importuje wyłącznie moduły biblioteki standardowej.
+"""
+
+import contextlib
+import io
+import json
+import os
+import socket
+import stat
+import sys
+import threading
+import time
+import traceback
+from typing import Any, Dict, List, Optional
+
+from spectomate import __version__
+
+# Zmienna środowiskowa z alternatywną ścieżką gniazda demona
+SOCKET_ENV_VAR = "SPECTOMATE_DAEMON_SOCKET"
+
+# Zmienna środowiskowa wyłączająca przekazywanie poleceń do demona
+NO_DAEMON_ENV_VAR = "SPECTOMATE_NO_DAEMON"
+
+# Domyślny czas bezczynności (w sekundach), po którym demon kończy działanie
+DEFAULT_IDLE_TIMEOUT = 900.0
+
+# Polecenia CLI, które klient przekazuje do działającego demona
+FORWARDED_COMMANDS = {"convert", "list-converters"}
+
+# Zmienne środowiskowe klienta ustawiane w demonie na czas wykonania polecenia
+FORWARDED_ENV_VARS = (
+    "SPECTOMATE_PARSE_CACHE",
+    "SPECTOMATE_PIN_INDEX",
+    "SPECTOMATE_CHANNEL_INDEX",
+    "SPECTOMATE_NAME_MAPPING",
+    "XDG_CACHE_HOME",
+    "XDG_CONFIG_HOME",
+)
+
+# Przekazywane zmienne, których wartości są ścieżkami; względne ścieżki są
+# rozwiązywane względem katalogu roboczego klienta
+_PATH_ENV_VARS = frozenset(
+    {
+        "SPECTOMATE_PIN_INDEX",
+        "SPECTOMATE_NAME_MAPPING",
+        "XDG_CACHE_HOME",
+        "XDG_CONFIG_HOME",
+    }
+)
+
+# Przekazywane zmienne z listą ścieżek oddzielonych os.pathsep (lub "auto")
+_PATH_LIST_ENV_VARS = frozenset({"SPECTOMATE_CHANNEL_INDEX"})
+
+# Maksymalny czas (w sekundach) nawiązywania połączenia z demonem
+_CONNECT_TIMEOUT = 1.0
+
+# Maksymalny czas (w sekundach) oczekiwania na wynik przekazanego polecenia;
+# po jego upływie klient wykonuje polecenie lokalnie
+_RESPONSE_TIMEOUT = 300.0
+
+
+def get_socket_path() -> str:
+    """
+    Zwraca ścieżkę gniazda demona dla bieżącego użytkownika.
+
+    Returns:
+        Ścieżka do gniazda UNIX
+    """
+    path = os.environ.get(SOCKET_ENV_VAR)
+    if path:
+        return path
+
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return os.path.join(runtime_dir, "spectomate", "daemon.sock")
+
+    import tempfile
+
+    return os.path.join(
+        tempfile.gettempdir(), f"spectomate-{os.getuid()}", "daemon.sock"
+    )
+
+
+def is_private_directory(directory: str) -> bool:
+    """
+    Sprawdza, czy katalog gniazda należy do bieżącego użytkownika i jest prywatny.
+
+    Katalog w tymczasowym katalogu systemowym mógł zostać utworzony wcześniej
+    przez innego użytkownika, który podszywałby się pod demona.
+
+    Args:
+        directory: Ścieżka do katalogu
+
+    Returns:
+        True jeśli katalog istnieje, nie jest dowiązaniem symbolicznym, należy
+        do bieżącego użytkownika i nie ma uprawnień dla grupy ani innych
+    """
+    try:
+        status = os.lstat(directory)
+    except OSError:
+        return False
+    if not stat.S_ISDIR(status.st_mode) or status.st_uid != os.getuid():
+        return False
+    return status.st_mode & 0o077 == 0
+
+
+def send_request(
+    request: Dict[str, Any],
+    socket_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Optional[Dict[str, Any]]:
+    """
+    Wysyła żądanie do demona i zwraca jego odpowiedź.
+
+    Args:
+        request: Żądanie do wysłania
+        socket_path: Ścieżka gniazda (None - domyślna)
+        timeout: Maksymalny czas oczekiwania na odpowiedź (None - bez limitu)
+
+    Returns:
+        Odpowiedź demona lub None, jeśli demon nie działa, nie odpowiedział
+        w czasie, odpowiedź jest nieczytelna lub katalog gniazda nie jest
+        prywatnym katalogiem bieżącego użytkownika
+    """
+    socket_path = socket_path or get_socket_path()
+    if not os.path.exists(socket_path):
+        return None
+    if not is_private_directory(os.path.dirname(os.path.abspath(socket_path))):
+        return None
+
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        client.settimeout(_CONNECT_TIMEOUT)
+        try:
+            client.connect(socket_path)
+        except OSError:
+            # Pozostałość po demonie, który nie zakończył się poprawnie
+            return None
+
+        client.settimeout(timeout)
+        client.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with client.makefile("rb") as stream:
+            line = stream.readline()
+    except OSError:
+        return None
+    finally:
+        client.close()
+
+    if not line:
+        return None
+    try:
+        response = json.loads(line)
+    except ValueError:
+        return None
+    return response if isinstance(response, dict) else None
+
+
+def forward_command(
+    argv: List[str], cwd: str, socket_path: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Przekazuje polecenie CLI do działającego demona.
+
+    Args:
+        argv: Argumenty CLI (bez nazwy programu)
+        cwd: Katalog roboczy, względem którego rozwiązywane są ścieżki
+        socket_path: Ścieżka gniazda (None - domyślna)
+
+    Returns:
+        Odpowiedź z kluczami exit_code, stdout i stderr lub None, jeśli
+        polecenie trzeba wykonać lokalnie (brak demona, inna wersja itp.)
+    """
+    if not argv or argv[0] not in FORWARDED_COMMANDS:
+        return None
+    if "--stdin-batch" in argv:
+        # Demon nie ma dostępu do stdin klienta
+        return None
+    if os.environ.get(NO_DAEMON_ENV_VAR):
+        return None
+
+    response = send_request(
+        {
+            "command": "run",
+            "version": __version__,
+            "argv": argv,
+            "cwd": cwd,
+            "env": get_client_environment(cwd),
+        },
+        socket_path,
+        _RESPONSE_TIMEOUT,
+    )
+    if response is None or not response.get("ok"):
+        return None
+    return response
+
+
+def get_client_environment(cwd: str) -> Dict[str, str]:
+    """
+    Zwraca zmienne FORWARDED_ENV_VARS ustawione u klienta.
+
+    Demon nie widzi środowiska klienta, więc wartości są przesyłane w żądaniu.
+    Ścieżki względne są zamieniane na bezwzględne względem katalogu roboczego
+    klienta, aby demon nie pomylił ich z plikami z innych katalogów.
+
+    Args:
+        cwd: Katalog roboczy klienta
+
+    Returns:
+        Słownik nazwa zmiennej -> wartość
+    """
+    env = {}
+    for name in FORWARDED_ENV_VARS:
+        value = os.environ.get(name)
+        if value is None:
+            continue
+        if name in _PATH_ENV_VARS and value.strip():
+            value = os.path.join(cwd, os.path.expanduser(value))
+        elif name in _PATH_LIST_ENV_VARS and value.strip() not in ("", "auto"):
+            value = os.pathsep.join(
+                os.path.join(cwd, os.path.expanduser(part)) if part.strip() else part
+                for part in value.split(os.pathsep)
+            )
+        env[name] = value
+    return env
+
+
+class ConversionDaemon:
+    """
+    Demon wykonujący polecenia CLI w długo działającym procesie.
+    """
+
+    def __init__(
+        self,
+        socket_path: Optional[str] = None,
+        idle_timeout: float = DEFAULT_IDLE_TIMEOUT,
+    ):
+        """
+        Inicjalizacja demona.
+
+        Args:
+            socket_path: Ścieżka gniazda (None - domyślna)
+            idle_timeout: Czas bezczynności w sekundach, po którym demon się kończy
+        """
+        self.socket_path = socket_path or get_socket_path()
+        self.idle_timeout = idle_timeout
+        self._stop_event = threading.Event()
+        self._state_lock = threading.Lock()
+        # Polecenia CLI zmieniają katalog roboczy i strumienie wyjścia procesu,
+        # więc są wykonywane pojedynczo
+        self._run_lock = threading.Lock()
+        self._active = 0
+        self._last_activity = time.monotonic()
+
+    def serve(self) -> None:
+        """
+        Obsługuje żądania, dopóki demon nie zostanie zatrzymany lub nie minie
+        czas bezczynności.
+        """
+        # Ładujemy CLI, rejestr i schematy przed przyjęciem pierwszego żądania
+        import spectomate.cli  # noqa: F401
+
+        server = self._bind()
+        try:
+            server.settimeout(min(1.0, self.idle_timeout))
+            while not self._stop_event.is_set():
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    if self._is_idle():
+                        break
+                    continue
+
+                with self._state_lock:
+                    self._active += 1
+                    self._last_activity = time.monotonic()
+                threading.Thread(
+                    target=self._handle_connection, args=(connection,), daemon=True
+                ).start()
+        finally:
+            server.close()
+            with contextlib.suppress(OSError):
+                os.unlink(self.socket_path)
+
+    def stop(self) -> None:
+        """Zatrzymuje demona po obsłużeniu bieżących żądań."""
+        self._stop_event.set()
+
+    def _is_idle(self) -> bool:
+        """
+        Sprawdza, czy demon jest bezczynny dłużej niż idle_timeout.
+
+        Returns:
+            True jeśli demon powinien się zakończyć
+        """
+        with self._state_lock:
+            return (
+                self._active == 0
+                and time.monotonic() - self._last_activity >= self.idle_timeout
+            )
+
+    def _bind(self) -> socket.socket:
+        """
+        Tworzy gniazdo nasłuchujące demona.
+
+        Returns:
+            Gniazdo nasłuchujące
+
+        Raises:
+            RuntimeError: Jeśli demon już działa lub katalog gniazda nie jest
+                prywatnym katalogiem bieżącego użytkownika
+        """
+        directory = os.path.dirname(os.path.abspath(self.socket_path))
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not is_private_directory(directory):
+            raise RuntimeError(
+                f"Katalog gniazda {directory} musi należeć do bieżącego "
+                "użytkownika i mieć uprawnienia 0700"
+            )
+
+        if os.path.exists(self.socket_path):
+            if send_request({"command": "ping"}, self.socket_path, 1.0) is not None:
+                raise RuntimeError(f"Demon już działa ({self.socket_path})")
+            # Gniazdo pozostało po demonie, który nie zakończył się poprawnie
+            os.unlink(self.socket_path)
+
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            server.bind(self.socket_path)
+            os.chmod(self.socket_path, 0o600)
+            server.listen()
+        except BaseException:
+            server.close()
+            raise
+        return server
+
+    def _handle_connection(self, connection: socket.socket) -> None:
+        """
+        Obsługuje jedno połączenie klienta.
+
+        Args:
+            connection: Gniazdo połączenia z klientem
+        """
+        try:
+            with connection, connection.makefile("rb") as stream:
+                line = stream.readline()
+                try:
+                    response = self._handle_request(json.loads(line))
+                except ValueError as e:
+                    response = {"ok": False, "error": f"Błędne żądanie: {e}"}
+                except Exception as e:
+                    # Odpowiedź z błędem zamiast zerwanego połączenia, po którym
+                    # klient wykonałby polecenie ponownie
+                    response = {
+                        "ok": True,
+                        "exit_code": 1,
+                        "stdout": "",
+                        "stderr": f"Błąd demona: {e}\n",
+                    }
+                connection.sendall(json.dumps(response).encode("utf-8") + b"\n")
+        except OSError:
+            pass
+        finally:
+            with self._state_lock:
+                self._active -= 1
+                self._last_activity = time.monotonic()
+
+    def _handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Wykonuje żądanie klienta.
+
+        Args:
+            request: Żądanie klienta
+
+        Returns:
+            Odpowiedź dla klienta
+        """
+        command = request.get("command")
+
+        if command == "ping":
+            return {"ok": True, "version": __version__, "pid": os.getpid()}
+
+        if command == "shutdown":
+            self.stop()
+            return {"ok": True}
+
+        if command == "run":
+            # Klient w innej wersji mógłby oczekiwać innych opcji i wyników
+            if request.get("version") != __version__:
+                return {
+                    "ok": False,
+                    "error": "Niezgodna wersja klienta i demona",
+                    "version": __version__,
+                }
+            return self._run_cli(
+                request.get("argv", []),
+                request.get("cwd", "."),
+                request.get("env") or {},
+            )
+
+        return {"ok": False, "error": f"Nieznane polecenie: {command}"}
+
+    def _run_cli(
+        self, argv: List[str], cwd: str, env: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Wykonuje polecenie CLI w procesie demona.
+
+        Args:
+            argv: Argumenty CLI (bez nazwy programu)
+            cwd: Katalog roboczy klienta
+            env: Wartości zmiennych FORWARDED_ENV_VARS u klienta (brak zmiennej
+                oznacza, że klient jej nie ustawił)
+
+        Returns:
+            Odpowiedź z kodem wyjścia i przechwyconym wyjściem polecenia
+        """
+        import click
+
+        from spectomate.cli import cli
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+
+        env = env or {}
+        with self._run_lock:
+            previous_cwd = os.getcwd()
+            previous_env = {name: os.environ.get(name) for name in FORWARDED_ENV_VARS}
+            try:
+                _set_environment({name: env.get(name) for name in FORWARDED_ENV_VARS})
+                os.chdir(cwd)
+                with contextlib.redirect_stdout(stdout), contextlib.redirect_stderr(
+                    stderr
+                ):
+                    try:
+                        result = cli.main(
+                            args=argv, prog_name="spectomate", standalone_mode=False
+                        )
+                        exit_code = result if isinstance(result, int) else 0
+                    except click.ClickException as e:
+                        e.show()
+                        exit_code = e.exit_code
+                    except click.Abort:
+                        click.echo("Aborted!", err=True)
+                        exit_code = 1
+                    except SystemExit as e:
+                        exit_code = _exit_code(e.code)
+                    except Exception:
+                        # Polecenie mogło już zapisać część plików, więc klient
+                        # nie może wykonać go ponownie lokalnie
+                        traceback.print_exc()
+                        exit_code = 1
+            except OSError as e:
+                return {"ok": False, "error": str(e)}
+            finally:
+                os.chdir(previous_cwd)
+                _set_environment(previous_env)
+
+        return {
+            "ok": True,
+            "exit_code": exit_code,
+            "stdout": stdout.getvalue(),
+            "stderr": stderr.getvalue(),
+        }
+
+
+def _set_environment(values: Dict[str, Optional[str]]) -> None:
+    """
+    Ustawia lub usuwa zmienne środowiskowe procesu.
+
+    Args:
+        values: Nazwy zmiennych i ich wartości (None - usunięcie zmiennej)
+    """
+    for name, value in values.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+def _exit_code(code: Any) -> int:
+    """
+    Zamienia argument sys.exit() na kod wyjścia procesu.
+
+    Args:
+        code: Argument przekazany do sys.exit()
+
+    Returns:
+        Kod wyjścia
+    """
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    sys.stderr.write(f"{code}\n")
+    return 1
@@ -0,0 +1,147 @@
+"""
+Moduł wykrywający format pliku z zależnościami bez pełnego parsowania.
+
+Detektor analizuje nazwę pliku oraz pierwsze kilka KB zawartości i na tej
+podstawie wybiera identyfikator formatu (np. "pip", "conda", "poetry").
+"""
+
+import re
+from pathlib import Path
+from typing import Optional, Union
+
+# Liczba bajtów analizowanych z początku pliku
+SNIFF_SIZE = 4096
+
+# Wzorce nazw plików jednoznacznie wskazujące format
+_FILENAME_PATTERNS = (
+    (re.compile(r"^requirements.*\.(txt|in)$", re.IGNORECASE), "pip"),
+    (re.compile(r".*requirements\.(txt|in)$", re.IGNORECASE), "pip"),
+    (re.compile(r"^(environment|conda).*\.ya?ml$", re.IGNORECASE), "conda"),
+    (re.compile(r"^Pipfile$"), "pipenv"),
+    (re.compile(r".*\.ir\.(json|msgpack|mpk)$", re.IGNORECASE), "ir"),
+)
+
+# Nagłówek pliku ir (JSON lub msgpack) w pierwszych bajtach zawartości
+_IR_HEADER = re.compile(r"\A[^\n]{0,32}spectomate-ir")
+
+# Wzorce zawartości plików TOML
+_TOML_POETRY = re.compile(r"^\s*\[tool\.poetry[\].]", re.MULTILINE)
+_TOML_PDM = re.compile(r"^\s*\[tool\.pdm[\].]", re.MULTILINE)
+_TOML_PIPENV = re.compile(r"^\s*\[(packages|dev-packages|requires)\]", re.MULTILINE)
+
+# Wzorce zawartości plików YAML
+_YAML_DEPENDENCIES = re.compile(r"^dependencies\s*:", re.MULTILINE)
+_YAML_CHANNELS = re.compile(r"^channels\s*:", re.MULTILINE)
+
+# Gramatyka pojedynczej linii requirements.txt
+_REQUIREMENT_LINE = re.compile(
+    r"""^(
+        [A-Za-z0-9][A-Za-z0-9._-]*           # nazwa pakietu
+        (\[[A-Za-z0-9._,\s-]*\])?            # extras
+        \s*(
+            ((===|==|!=|~=|<=|>=|<|>)\s*[A-Za-z0-9.*+!_-]+\s*,?\s*)*  # specyfikatory
+            |@\s*\S+                          # odwołanie bezpośrednie
+        )
+        (\s*;.*)?                            # markery środowiskowe
+        |-.*                                 # opcje (-r, -e, --index-url, ...)
+        |(git\+|hg\+|svn\+|bzr\+|https?://|file:).*  # adresy URL
+    )\s*(\#.*)?$""",
+    re.VERBOSE,
+)
+
+
+def _detect_from_filename(name: str) -> Optional[str]:
+    """
+    Wykrywa format na podstawie samej nazwy pliku.
+
+    Args:
+        name: Nazwa pliku (bez katalogu)
+
+    Returns:
+        Identyfikator formatu lub None, jeśli nazwa nie jest jednoznaczna
+    """
+    for pattern, format_name in _FILENAME_PATTERNS:
+        if pattern.match(name):
+            return format_name
+    return None
+
+
+def _detect_from_content(head: str) -> Optional[str]:
+    """
+    Wykrywa format na podstawie początku zawartości pliku.
+
+    Args:
+        head: Początkowy fragment zawartości pliku
+
+    Returns:
+        Identyfikator formatu lub None, jeśli nie udało się go rozpoznać
+    """
+    if _IR_HEADER.match(head):
+        return "ir"
+
+    # Nagłówki sekcji TOML
+    if _TOML_POETRY.search(head):
+        return "poetry"
+    if _TOML_PDM.search(head):
+        return "pdm"
+    if _TOML_PIPENV.search(head):
+        return "pipenv"
+
+    # Klucze najwyższego poziomu YAML
+    if _YAML_DEPENDENCIES.search(head) or _YAML_CHANNELS.search(head):
+        return "conda"
+
+    # Sprawdzamy gramatykę requirements.txt; ostatnia linia może być ucięta
+    lines = head.splitlines()
+    if len(head) >= SNIFF_SIZE and lines:
+        lines = lines[:-1]
+
+    found = False
+    for line in lines:
+        line = line.strip()
+        if not line or line.startswith("#"):
+            continue
+        if not _REQUIREMENT_LINE.match(line):
+            return None
+        found = True
+
+    return "pip" if found else None
+
+
+def detect_format(
+    file_path: Optional[Union[str, Path]] = None,
+    content: Optional[Union[str, bytes]] = None,
+) -> Optional[str]:
+    """
+    Wykrywa format pliku z zależnościami.
+
+    Najpierw sprawdzana jest nazwa pliku, a jeśli nie jest jednoznaczna,
+    analizowane jest pierwsze SNIFF_SIZE bajtów zawartości. Plik nie jest
+    w pełni parsowany.
+
+    Args:
+        file_path: Ścieżka do pliku (opcjonalnie)
+        content: Zawartość pliku (opcjonalnie, jeśli nie podano, odczytujemy
+            początek pliku spod file_path)
+
+    Returns:
+        Identyfikator formatu lub None, jeśli nie udało się go rozpoznać
+    """
+    if file_path is None and content is None:
+        raise ValueError("Nie podano ścieżki do pliku ani jego zawartości")
+
+    if file_path is not None:
+        format_name = _detect_from_filename(Path(file_path).name)
+        if format_name is not None:
+            return format_name
+
+    if content is None:
+        with open(file_path, "rb") as f:  # type: ignore[arg-type]
+            content = f.read(SNIFF_SIZE)
+
+    if isinstance(content, bytes):
+        head = content[:SNIFF_SIZE].decode("utf-8", errors="replace")
+    else:
+        head = content[:SNIFF_SIZE]
+
+    return _detect_from_content(head)
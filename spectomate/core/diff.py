@@ -0,0 +1,271 @@
+"""
+Moduł porównujący zależności z dwóch plików, także w różnych formatach.
+
+Oba pliki są wczytywane do wspólnej reprezentacji (spectomate.core.ir), więc
+można np. porównać requirements.txt z environment.yml. Wymagania są łączone
+po znormalizowanej nazwie pakietu przez słownik (złączenie haszujące), a nie
+w zagnieżdżonych pętlach, dzięki czemu porównanie jest liniowe względem
+liczby wymagań.
+
+Specyfikatory są porównywane semantycznie: "<2,>=1.0" i ">=1,<2.0" są równe.
+"""
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from spectomate.core.ir import Requirement, load_requirements
+from spectomate.core.versions import parse_specifier
+
+# Rodzaje zmian
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+class RequirementChange:
+    """
+    Zmiana wymagań jednego pakietu.
+    """
+
+    __slots__ = ("name", "old", "new")
+
+    def __init__(
+        self,
+        name: str,
+        old: Tuple[Requirement, ...],
+        new: Tuple[Requirement, ...],
+    ):
+        """
+        Inicjalizuje zmianę.
+
+        Args:
+            name: Znormalizowana nazwa pakietu
+            old: Wymagania pakietu w pierwszym pliku (puste - pakiet dodany)
+            new: Wymagania pakietu w drugim pliku (puste - pakiet usunięty)
+        """
+        self.name = name
+        self.old = old
+        self.new = new
+
+    @property
+    def kind(self) -> str:
+        """Rodzaj zmiany: ADDED, REMOVED lub CHANGED."""
+        if not self.old:
+            return ADDED
+        if not self.new:
+            return REMOVED
+        return CHANGED
+
+    @property
+    def fields(self) -> List[str]:
+        """Zmienione części wymagania (specifier, extras, marker, url)."""
+        if len(self.old) != 1 or len(self.new) != 1:
+            # Pakiet występuje kilka razy (np. z różnymi markerami)
+            return ["requirements"]
+        old, new = self.old[0], self.new[0]
+        changed = []
+        if not _same_specifier(old.specifier, new.specifier):
+            changed.append("specifier")
+        for field in ("extras", "marker", "url"):
+            if getattr(old, field) != getattr(new, field):
+                changed.append(field)
+        return changed
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Zwraca zmianę w postaci słownika (np. do zapisu JSON).
+
+        Returns:
+            Słownik z nazwą, rodzajem zmiany i wymaganiami przed i po zmianie
+        """
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind,
+            "old": [req.to_pip() for req in self.old],
+            "new": [req.to_pip() for req in self.new],
+        }
+        if self.kind == CHANGED:
+            data["fields"] = self.fields
+        return data
+
+    def __str__(self) -> str:
+        old = " | ".join(req.to_pip() for req in self.old)
+        new = " | ".join(req.to_pip() for req in self.new)
+        if self.kind == ADDED:
+            return f"+ {new}"
+        if self.kind == REMOVED:
+            return f"- {old}"
+        return f"~ {old} -> {new}"
+
+
+class RequirementDiff:
+    """
+    Wynik porównania dwóch list wymagań.
+    """
+
+    def __init__(self, changes: List[RequirementChange], unchanged: int):
+        """
+        Inicjalizuje wynik porównania.
+
+        Args:
+            changes: Zmiany posortowane według nazwy pakietu
+            unchanged: Liczba pakietów bez zmian
+        """
+        self.changes = changes
+        self.unchanged = unchanged
+
+    def _of_kind(self, kind: str) -> List[RequirementChange]:
+        return [change for change in self.changes if change.kind == kind]
+
+    @property
+    def added(self) -> List[RequirementChange]:
+        """Pakiety obecne tylko w drugim pliku."""
+        return self._of_kind(ADDED)
+
+    @property
+    def removed(self) -> List[RequirementChange]:
+        """Pakiety obecne tylko w pierwszym pliku."""
+        return self._of_kind(REMOVED)
+
+    @property
+    def changed(self) -> List[RequirementChange]:
+        """Pakiety, których wymagania się różnią."""
+        return self._of_kind(CHANGED)
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Zwraca wynik porównania w postaci słownika (np. do zapisu JSON).
+
+        Returns:
+            Słownik z listami zmian i podsumowaniem
+        """
+        return {
+            "added": [change.to_dict() for change in self.added],
+            "removed": [change.to_dict() for change in self.removed],
+            "changed": [change.to_dict() for change in self.changed],
+            "summary": {
+                ADDED: len(self.added),
+                REMOVED: len(self.removed),
+                CHANGED: len(self.changed),
+                "unchanged": self.unchanged,
+            },
+        }
+
+
+def _same_specifier(old: str, new: str) -> bool:
+    """
+    Sprawdza, czy specyfikatory są równoważne.
+
+    Args:
+        old: Pierwszy specyfikator
+        new: Drugi specyfikator
+
+    Returns:
+        True, jeśli specyfikatory mają te same warunki (z dokładnością do
+        kolejności i zer na końcu wersji)
+    """
+    if old == new:
+        return True
+    try:
+        return parse_specifier(old) == parse_specifier(new)
+    except ValueError:
+        return False
+
+
+def _same_requirement(old: Requirement, new: Requirement) -> bool:
+    """
+    Sprawdza, czy wymagania są równoważne.
+
+    Args:
+        old: Pierwsze wymaganie
+        new: Drugie wymaganie
+
+    Returns:
+        True, jeśli wymagania różnią się najwyżej zapisem
+    """
+    return (
+        (old.extras, old.marker, old.url) == (new.extras, new.marker, new.url)
+    ) and _same_specifier(old.specifier, new.specifier)
+
+
+def _index(
+    requirements: Iterable[Requirement],
+) -> Dict[str, Tuple[Requirement, ...]]:
+    """
+    Grupuje wymagania według znormalizowanej nazwy pakietu.
+
+    Args:
+        requirements: Wymagania
+
+    Returns:
+        Słownik nazwa -> wymagania pakietu w kolejności wystąpienia
+    """
+    index: Dict[str, List[Requirement]] = {}
+    for requirement in requirements:
+        index.setdefault(requirement.key, []).append(requirement)
+    return {key: tuple(items) for key, items in index.items()}
+
+
+def diff_requirements(
+    old: Iterable[Requirement], new: Iterable[Requirement]
+) -> RequirementDiff:
+    """
+    Porównuje dwie listy wymagań.
+
+    Args:
+        old: Wymagania z pierwszego pliku
+        new: Wymagania z drugiego pliku
+
+    Returns:
+        Wynik porównania
+    """
+    old_index = _index(old)
+    new_index = _index(new)
+
+    changes = []
+    unchanged = 0
+    for key in sorted(old_index.keys() | new_index.keys()):
+        before = old_index.get(key, ())
+        after = new_index.get(key, ())
+        if len(before) == len(after) and all(
+            any(_same_requirement(item, other) for other in after) for item in before
+        ):
+            unchanged += 1
+        else:
+            changes.append(RequirementChange(key, before, after))
+
+    return RequirementDiff(changes, unchanged)
+
+
+def diff_files(
+    old_file: Union[str, Path],
+    new_file: Union[str, Path],
+    old_format: Optional[str] = None,
+    new_format: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+    warnings: Optional[List[str]] = None,
+) -> RequirementDiff:
+    """
+    Porównuje zależności z dwóch plików w dowolnych obsługiwanych formatach.
+
+    Args:
+        old_file: Pierwszy plik
+        new_file: Drugi plik
+        old_format: Format pierwszego pliku (None - wykrycie automatyczne)
+        new_format: Format drugiego pliku (None - wykrycie automatyczne)
+        options: Opcje konwerterów (np. {"include_dev": True})
+        warnings: Lista, do której dopisywane są ostrzeżenia
+
+    Returns:
+        Wynik porównania
+
+    Raises:
+        ValueError: Jeśli nie udało się wykryć formatu lub wczytać pliku
+    """
+    return diff_requirements(
+        load_requirements(old_file, old_format, options, warnings),
+        load_requirements(new_file, new_format, options, warnings),
+    )
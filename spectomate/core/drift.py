@@ -0,0 +1,467 @@
+"""
+Moduł wykrywający rozbieżności zależności między projektami w jednym drzewie.
+
+Wszystkie pliki z zależnościami znalezione w drzewie katalogów (requirements*.txt,
+environment*.yml, pyproject.toml, ...) są wczytywane równolegle do wspólnej
+reprezentacji (spectomate.core.ir), a następnie w jednym przejściu budowany jest
+indeks odwrotny: znormalizowana nazwa pakietu -> (projekt, plik, wymaganie).
+
+Na podstawie indeksu raport wskazuje:
+
+- pakiety przypięte (==) do różnych wersji w różnych projektach,
+- pakiety, których ograniczeń wersji nie da się spełnić jednocześnie,
+- najczęściej przypinaną wersję każdego pakietu.
+
+Użycia z różnymi markerami środowiskowymi (np. python_version < "3.8" i
+python_version >= "3.8") są traktowane jako dotyczące różnych środowisk, więc
+nie są ze sobą porównywane; użycia bez markera dotyczą wszystkich środowisk.
+
+Projektem jest katalog zawierający plik z zależnościami (względem korzenia).
+"""
+
+import functools
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from spectomate.core.ir import Requirement, load_requirements
+from spectomate.core.versions import (
+    intersect_specifiers,
+    is_satisfiable,
+    parse_specifier,
+    try_version_key,
+)
+
+# Katalogi pomijane przy wyszukiwaniu plików z zależnościami
+SKIPPED_DIRECTORIES = {
+    "node_modules",
+    "site-packages",
+    "__pycache__",
+    "venv",
+    "build",
+    "dist",
+}
+
+# Nazwy plików, które mogą zawierać zależności (format jest potwierdzany
+# wykrywaniem na podstawie zawartości)
+_MANIFEST_PREFIXES = ("requirements", "environment", "conda")
+_MANIFEST_NAMES = {"pyproject.toml", "Pipfile"}
+
+
+class PackageUsage:
+    """
+    Użycie pakietu w jednym pliku z zależnościami.
+    """
+
+    __slots__ = ("project", "file", "requirement")
+
+    def __init__(self, project: str, file: str, requirement: Requirement):
+        """
+        Inicjalizuje użycie pakietu.
+
+        Args:
+            project: Katalog projektu względem korzenia drzewa
+            file: Ścieżka pliku z zależnościami względem korzenia drzewa
+            requirement: Wymaganie z pliku
+        """
+        self.project = project
+        self.file = file
+        self.requirement = requirement
+
+    @property
+    def pinned_version(self) -> Optional[str]:
+        """Wersja przypięta operatorem == lub === (None, jeśli brak)."""
+        return _pinned_version(self.requirement.specifier)
+
+
+class PackageDrift:
+    """
+    Wszystkie użycia jednego pakietu w drzewie.
+    """
+
+    def __init__(self, name: str):
+        """
+        Inicjalizuje zestawienie pakietu.
+
+        Args:
+            name: Znormalizowana nazwa pakietu
+        """
+        self.name = name
+        self.usages: List[PackageUsage] = []
+
+    @property
+    def pins(self) -> Dict[str, int]:
+        """
+        Liczba projektów dla każdej przypiętej wersji.
+
+        Wersje równoważne według PEP 440 (np. 1.0 i 1.0.0) są liczone razem
+        pod pierwszą napotkaną postacią. Słownik jest uporządkowany od
+        najczęstszej wersji, a przy równej liczbie od najnowszej.
+        """
+        return _count_pins(self.usages)
+
+    @property
+    def most_common_version(self) -> Optional[str]:
+        """Najczęściej przypinana wersja (None, jeśli pakiet nie jest przypięty)."""
+        return next(iter(self.pins), None)
+
+    @property
+    def is_divergent(self) -> bool:
+        """Czy pakiet jest przypięty do różnych wersji w tym samym środowisku."""
+        return any(len(_count_pins(group)) > 1 for group in self.environments())
+
+    def environments(self) -> List[List[PackageUsage]]:
+        """
+        Dzieli użycia na grupy dotyczące tego samego środowiska.
+
+        Każdy marker tworzy osobną grupę, do której należą także wszystkie
+        użycia bez markera.
+
+        Returns:
+            Lista grup użyć (w kolejności pierwszego wystąpienia markera)
+        """
+        common: List[PackageUsage] = []
+        by_marker: Dict[str, List[PackageUsage]] = {}
+        for usage in self.usages:
+            marker = usage.requirement.marker
+            if marker:
+                by_marker.setdefault(marker, []).append(usage)
+            else:
+                common.append(usage)
+        if not by_marker:
+            return [common]
+        return [common + group for group in by_marker.values()]
+
+    def outliers(self) -> List[PackageUsage]:
+        """
+        Zwraca użycia przypięte do innej wersji niż najczęstsza w ich środowisku.
+
+        Returns:
+            Lista użyć w kolejności plików
+        """
+        outliers = set()
+        for group in self.environments():
+            common = next(iter(_count_pins(group)), None)
+            if common is None:
+                continue
+            common_key = try_version_key(common) or common
+            outliers.update(
+                id(usage)
+                for usage in group
+                if usage.pinned_version is not None
+                and (try_version_key(usage.pinned_version) or usage.pinned_version)
+                != common_key
+            )
+        return [usage for usage in self.usages if id(usage) in outliers]
+
+    @property
+    def specifier(self) -> Optional[str]:
+        """
+        Koniunkcja ograniczeń wspólnych dla wszystkich środowisk (bez markera).
+
+        None oznacza, że ograniczeń w którymś środowisku nie da się spełnić
+        jednocześnie (lub któreś jest nieprawidłowe).
+        """
+        try:
+            for group in self.environments():
+                if not is_satisfiable(
+                    intersect_specifiers(usage.requirement.specifier for usage in group)
+                ):
+                    return None
+            return intersect_specifiers(
+                usage.requirement.specifier
+                for usage in self.usages
+                if not usage.requirement.marker
+            )
+        except ValueError:
+            return None
+
+    @property
+    def is_conflicting(self) -> bool:
+        """Czy ograniczeń wersji nie da się spełnić jednocześnie."""
+        return self.specifier is None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Zwraca zestawienie w postaci słownika (np. do zapisu JSON).
+
+        Returns:
+            Słownik z użyciami, przypiętymi wersjami i wykrytymi problemami
+        """
+        return {
+            "name": self.name,
+            "usages": [
+                {
+                    "project": usage.project,
+                    "file": usage.file,
+                    "requirement": usage.requirement.to_pip(),
+                }
+                for usage in self.usages
+            ],
+            "pins": self.pins,
+            "most_common_version": self.most_common_version,
+            "divergent": self.is_divergent,
+            "conflicting": self.is_conflicting,
+        }
+
+
+class DriftReport:
+    """
+    Raport rozbieżności zależności w drzewie projektów.
+    """
+
+    def __init__(self, root: Path):
+        """
+        Inicjalizuje pusty raport.
+
+        Args:
+            root: Korzeń przeszukiwanego drzewa
+        """
+        self.root = root
+        self.manifests: List[str] = []
+        self.projects: List[str] = []
+        self.errors: Dict[str, str] = {}
+        self.warnings: List[str] = []
+        self.packages: Dict[str, PackageDrift] = {}
+
+    def divergent(self) -> List[PackageDrift]:
+        """Zwraca pakiety przypięte do różnych wersji (alfabetycznie)."""
+        return [
+            self.packages[name]
+            for name in sorted(self.packages)
+            if self.packages[name].is_divergent
+        ]
+
+    def conflicting(self) -> List[PackageDrift]:
+        """
+        Zwraca pakiety ze sprzecznymi ograniczeniami (alfabetycznie).
+
+        Pakiety przypięte do różnych wersji mają zwykle także sprzeczne
+        ograniczenia, więc mogą występować również w divergent().
+        """
+        return [
+            self.packages[name]
+            for name in sorted(self.packages)
+            if self.packages[name].is_conflicting
+        ]
+
+    def has_drift(self) -> bool:
+        """Czy wykryto rozbieżne wersje lub sprzeczne ograniczenia."""
+        return any(
+            package.is_divergent or package.is_conflicting
+            for package in self.packages.values()
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Zwraca raport w postaci słownika (np. do zapisu JSON).
+
+        Returns:
+            Słownik z podsumowaniem i zestawieniami pakietów
+        """
+        return {
+            "root": str(self.root),
+            "projects": self.projects,
+            "manifests": self.manifests,
+            "errors": self.errors,
+            "warnings": self.warnings,
+            "divergent": [package.name for package in self.divergent()],
+            "conflicting": [package.name for package in self.conflicting()],
+            "most_common_versions": {
+                name: self.packages[name].most_common_version
+                for name in sorted(self.packages)
+                if self.packages[name].most_common_version is not None
+            },
+            "packages": {
+                name: self.packages[name].to_dict() for name in sorted(self.packages)
+            },
+        }
+
+
+def _count_pins(usages: List[PackageUsage]) -> Dict[str, int]:
+    """
+    Liczy użycia przypięte do każdej wersji (zob. PackageDrift.pins).
+
+    Args:
+        usages: Użycia pakietu
+
+    Returns:
+        Słownik wersja -> liczba użyć, od najczęstszej i najnowszej wersji
+    """
+    counts: Counter = Counter()
+    spellings: Dict[Any, str] = {}
+    for usage in usages:
+        version = usage.pinned_version
+        if version is None:
+            continue
+        key = try_version_key(version) or version
+        counts[spellings.setdefault(key, version)] += 1
+
+    return dict(
+        sorted(
+            counts.items(),
+            key=lambda item: (item[1], try_version_key(item[0]) or ()),
+            reverse=True,
+        )
+    )
+
+
+def _pinned_version(specifier: str) -> Optional[str]:
+    """
+    Zwraca wersję przypiętą w specyfikatorze.
+
+    Args:
+        specifier: Specyfikator PEP 440
+
+    Returns:
+        Wersja z warunku == (bez *) lub ===, albo None
+    """
+    if "=" not in specifier:
+        return None
+    try:
+        clauses = parse_specifier(specifier)
+    except ValueError:
+        return None
+    for clause in clauses:
+        if clause.operator == "===" or (
+            clause.operator == "==" and not clause.version.endswith(".*")
+        ):
+            return clause.version
+    return None
+
+
+def find_manifests(root: Union[str, Path]) -> List[Tuple[Path, str]]:
+    """
+    Wyszukuje pliki z zależnościami w drzewie katalogów.
+
+    Pomijane są katalogi ukryte (np. .git, .venv) oraz katalogi z
+    SKIPPED_DIRECTORIES.
+
+    Args:
+        root: Korzeń drzewa
+
+    Returns:
+        Lista par (ścieżka pliku, format) w kolejności alfabetycznej
+    """
+    from spectomate.core.registry import ConverterRegistry
+
+    manifests = []
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = sorted(
+            name
+            for name in subdirectories
+            if not name.startswith(".") and name not in SKIPPED_DIRECTORIES
+        )
+        for name in sorted(files):
+            if name not in _MANIFEST_NAMES and not name.lower().startswith(
+                _MANIFEST_PREFIXES
+            ):
+                continue
+            path = Path(directory) / name
+            format_name = ConverterRegistry.detect_format(path)
+            if format_name is not None:
+                manifests.append((path, format_name))
+    return manifests
+
+
+@functools.lru_cache(maxsize=4096)
+def _load_manifest(
+    path: str, format_name: str, size: int, mtime_ns: int
+) -> Tuple[Tuple[Requirement, ...], Tuple[str, ...]]:
+    """
+    Wczytuje plik z zależnościami (wyniki są zapamiętywane).
+
+    Rozmiar i czas modyfikacji są częścią klucza, więc zmieniony plik jest
+    wczytywany ponownie.
+
+    Args:
+        path: Ścieżka pliku
+        format_name: Format pliku
+        size: Rozmiar pliku
+        mtime_ns: Czas modyfikacji pliku
+
+    Returns:
+        Krotka (wymagania, ostrzeżenia)
+    """
+    warnings: List[str] = []
+    requirements = load_requirements(path, format_name, warnings=warnings)
+    return tuple(requirements), tuple(warnings)
+
+
+def load_manifest(path: Path, format_name: str) -> Tuple[List[Requirement], List[str]]:
+    """
+    Wczytuje plik z zależnościami, korzystając z zapamiętanych wyników.
+
+    Args:
+        path: Ścieżka pliku
+        format_name: Format pliku
+
+    Returns:
+        Krotka (wymagania, ostrzeżenia)
+    """
+    stat = path.stat()
+    requirements, warnings = _load_manifest(
+        str(path.resolve()), format_name, stat.st_size, stat.st_mtime_ns
+    )
+    return list(requirements), list(warnings)
+
+
+def collect_drift(
+    root: Union[str, Path], max_workers: Optional[int] = None
+) -> DriftReport:
+    """
+    Buduje raport rozbieżności zależności dla wszystkich projektów w drzewie.
+
+    Args:
+        root: Korzeń drzewa
+        max_workers: Liczba wątków wczytujących pliki (None - domyślna)
+
+    Returns:
+        Raport rozbieżności
+    """
+    root = Path(root)
+    report = DriftReport(root)
+    manifests = find_manifests(root)
+
+    def load(
+        manifest: Tuple[Path, str],
+    ) -> Tuple[List[Requirement], List[str], Optional[str]]:
+        try:
+            return (*load_manifest(*manifest), None)
+        except Exception as e:
+            return [], [], str(e)
+
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = executor.map(load, manifests)
+
+        # Indeks odwrotny jest budowany w jednym przejściu, w kolejności plików
+        projects: Dict[str, None] = {}
+        for (path, _), (requirements, warnings, error) in zip(manifests, results):
+            file = path.relative_to(root).as_posix()
+            if error is not None:
+                report.errors[file] = error
+                continue
+
+            project = path.parent.relative_to(root).as_posix()
+            projects[project] = None
+            report.manifests.append(file)
+            report.warnings.extend(f"{file}: {warning}" for warning in warnings)
+
+            for requirement in requirements:
+                package = report.packages.get(requirement.key)
+                if package is None:
+                    package = report.packages[requirement.key] = PackageDrift(
+                        requirement.key
+                    )
+                package.usages.append(PackageUsage(project, file, requirement))
+
+    report.projects = list(projects)
+    return report
+
+
+def clear_cache() -> None:
+    """Czyści zapamiętane wyniki wczytywania plików."""
+    _load_manifest.cache_clear()
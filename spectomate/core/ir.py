@@ -0,0 +1,285 @@
+"""
+Kanoniczna reprezentacja wymagań (IR) niezależna od formatu pliku.
+
+Każdy obsługiwany plik z zależnościami (requirements.txt, environment.yml,
+pyproject.toml, ...) można wczytać jako listę obiektów Requirement z nazwą
+pakietu pip, specyfikatorem PEP 440, dodatkami (extras), markerem środowiskowym
+i opcjonalnym adresem URL. Na tej reprezentacji działają narzędzia, które nie
+powinny zależeć od formatu źródłowego, np. rozwiązywanie zależności.
+"""
+
+import functools
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from packaging.requirements import InvalidRequirement
+from packaging.requirements import Requirement as PackagingRequirement
+
+from spectomate.core.name_mapping import normalize_pip_name
+
+# Pakiety opisujące samo środowisko conda, a nie zależności projektu
+_CONDA_ENVIRONMENT_PACKAGES = ("python", "pip")
+
+
+class Requirement:
+    """
+    Pojedyncze wymaganie w postaci kanonicznej.
+    """
+
+    __slots__ = ("name", "key", "specifier", "extras", "marker", "url")
+
+    def __init__(
+        self,
+        name: str,
+        specifier: str = "",
+        extras: Iterable[str] = (),
+        marker: str = "",
+        url: str = "",
+    ):
+        """
+        Inicjalizuje wymaganie.
+
+        Args:
+            name: Nazwa pakietu pip
+            specifier: Specyfikator wersji PEP 440 (pusty - dowolna wersja)
+            extras: Dodatki pakietu (np. ("socks",))
+            marker: Marker środowiskowy (np. 'python_version < "3.9"')
+            url: Adres, z którego instalowany jest pakiet (zamiast indeksu)
+        """
+        self.name = name
+        # Znormalizowana nazwa pakietu (PEP 503) używana do porównań
+        self.key = normalize_pip_name(name)
+        self.specifier = specifier
+        self.extras: Tuple[str, ...] = tuple(sorted(set(extras)))
+        self.marker = marker
+        self.url = url
+
+    def to_pip(self) -> str:
+        """
+        Zwraca wymaganie w składni requirements.txt.
+
+        Returns:
+            Wymaganie pip (np. "requests[socks]>=2.27; python_version < '4'")
+        """
+        line = self.name
+        if self.extras:
+            line += f"[{','.join(self.extras)}]"
+        if self.url:
+            line += f" @ {self.url}"
+        else:
+            line += self.specifier
+        if self.marker:
+            line += f"; {self.marker}"
+        return line
+
+    def __str__(self) -> str:
+        return self.to_pip()
+
+    def __repr__(self) -> str:
+        return f"Requirement({self.to_pip()!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Requirement):
+            return NotImplemented
+        return (self.key, self.specifier, self.extras, self.marker, self.url) == (
+            other.key,
+            other.specifier,
+            other.extras,
+            other.marker,
+            other.url,
+        )
+
+    def __hash__(self) -> int:
+        return hash((self.key, self.specifier, self.extras, self.marker, self.url))
+
+
+@functools.lru_cache(maxsize=16384)
+def parse_requirement(line: str) -> Requirement:
+    """
+    Parsuje wymaganie pip (PEP 508) do postaci kanonicznej.
+
+    Obsługuje też adresy VCS w postaci "git+https://...#egg=nazwa".
+
+    Args:
+        line: Wymaganie pip
+
+    Returns:
+        Wymaganie w postaci kanonicznej
+
+    Raises:
+        ValueError: Jeśli wymaganie jest nieprawidłowe
+    """
+    line = line.strip()
+
+    if "://" in line.split("@", 1)[0] and "#egg=" in line:
+        # Adres VCS lub URL bez nazwy pakietu przed nim
+        url, egg = line.split("#egg=", 1)
+        return Requirement(egg.split("&", 1)[0].strip(), url=url.strip())
+
+    try:
+        parsed = PackagingRequirement(line)
+    except InvalidRequirement as e:
+        raise ValueError(f"Nieprawidłowe wymaganie {line!r}: {e}")
+
+    return Requirement(
+        parsed.name,
+        specifier=str(parsed.specifier),
+        extras=parsed.extras,
+        marker=str(parsed.marker) if parsed.marker is not None else "",
+        url=parsed.url or "",
+    )
+
+
+def parse_requirements_txt(
+    content: str, warnings: Optional[List[str]] = None
+) -> List[Requirement]:
+    """
+    Parsuje zawartość pliku requirements.txt.
+
+    Komentarze, puste linie i opcje pip (-r, -e, --index-url, ...) są pomijane.
+
+    Args:
+        content: Zawartość pliku requirements.txt
+        warnings: Lista, do której dopisywane są ostrzeżenia o pominiętych liniach
+
+    Returns:
+        Lista wymagań
+    """
+    requirements = []
+
+    for number, line in enumerate(content.splitlines(), 1):
+        # Komentarz zaczyna się od "#" poprzedzonego białym znakiem
+        line = line.split(" #", 1)[0].strip()
+        if not line or line.startswith(("#", "-")):
+            continue
+
+        try:
+            requirements.append(parse_requirement(line))
+        except ValueError as e:
+            if warnings is not None:
+                warnings.append(f"Pominięto linię {number}: {e}")
+
+    return requirements
+
+
+def load_requirements(
+    file_path: Union[str, Path],
+    source_format: Optional[str] = None,
+    options: Optional[Dict[str, Any]] = None,
+    warnings: Optional[List[str]] = None,
+) -> List[Requirement]:
+    """
+    Wczytuje wymagania z pliku w dowolnym obsługiwanym formacie.
+
+    Pliki requirements.txt i ir są wczytywane bezpośrednio, a pozostałe formaty
+    są najpierw konwertowane do formatu pip zarejestrowanymi konwerterami (dzięki
+    temu np. specyfikacje conda i ograniczenia Poetry są tłumaczone na PEP 440).
+
+    Args:
+        file_path: Ścieżka do pliku z zależnościami
+        source_format: Format pliku (None - wykrycie automatyczne)
+        options: Opcje przekazywane konwerterowi (np. {"include_dev": True})
+        warnings: Lista, do której dopisywane są ostrzeżenia
+
+    Returns:
+        Lista wymagań
+
+    Raises:
+        ValueError: Jeśli nie udało się wykryć formatu lub brak konwertera
+    """
+    from spectomate.core.registry import ConverterRegistry
+    from spectomate.schemas.pip_schema import PipSchema
+
+    file_path = Path(file_path)
+
+    if source_format is None:
+        source_format = ConverterRegistry.detect_format(file_path)
+        if source_format is None:
+            raise ValueError(f"Nie udało się wykryć formatu pliku {file_path}")
+
+    if source_format == "pip":
+        content = file_path.read_text(encoding="utf-8")
+        return parse_requirements_txt(content, warnings)
+
+    if source_format == "ir":
+        from spectomate.schemas.ir_schema import IrSchema
+
+        return IrSchema.parse_file(file_path)["requirements"]
+
+    converter_class = ConverterRegistry.get_converter(source_format, "pip")
+    if converter_class is None:
+        raise ValueError(f"Brak konwertera z formatu {source_format} do pip")
+
+    converter = converter_class(source_file=file_path, options=dict(options or {}))
+    pip_data = converter.convert(converter.read_source())
+    if warnings is not None:
+        warnings.extend(converter.warnings)
+
+    requirements = parse_requirements_txt(
+        "\n".join(PipSchema.extract_requirements(pip_data)), warnings
+    )
+
+    if source_format == "conda":
+        requirements = [
+            req for req in requirements if req.key not in _CONDA_ENVIRONMENT_PACKAGES
+        ]
+
+    return requirements
+
+
+def write_requirements(
+    requirements: Iterable[Requirement],
+    target_format: str,
+    target_file: Union[str, Path],
+    options: Optional[Dict[str, Any]] = None,
+    warnings: Optional[List[str]] = None,
+) -> str:
+    """
+    Zapisuje wymagania do pliku w dowolnym obsługiwanym formacie.
+
+    Pliki requirements.txt i ir są zapisywane bezpośrednio, a pozostałe formaty
+    przez zarejestrowane konwertery z formatu pip.
+
+    Args:
+        requirements: Wymagania
+        target_format: Format pliku wynikowego
+        target_file: Ścieżka do pliku wynikowego
+        options: Opcje konwertera z formatu pip do formatu docelowego
+        warnings: Lista, do której dopisywane są ostrzeżenia konwertera
+
+    Returns:
+        Status zapisu (WRITE_UPDATED lub WRITE_UNCHANGED)
+
+    Raises:
+        ValueError: Jeśli brak konwertera do formatu docelowego
+    """
+    from spectomate.core.registry import ConverterRegistry
+    from spectomate.schemas.pip_schema import PipSchema
+
+    if target_format == "ir":
+        from spectomate.schemas.ir_schema import IrSchema
+
+        return IrSchema.update_file(
+            IrSchema.from_requirements(requirements), target_file
+        )
+
+    pip_data = {
+        "format": "pip",
+        "requirements": [req.to_pip() for req in requirements],
+    }
+
+    if target_format == "pip":
+        return PipSchema.update_requirements_txt(pip_data, target_file)
+
+    converter_class = ConverterRegistry.get_converter("pip", target_format)
+    if converter_class is None:
+        raise ValueError(f"Brak konwertera z formatu pip do {target_format}")
+
+    converter = converter_class(
+        target_file=Path(target_file), options=dict(options or {})
+    )
+    content = PipSchema.generate_requirements_txt(pip_data)
+    converter.write_target(converter.convert(converter.parse_source(content)))
+    if warnings is not None:
+        warnings.extend(converter.warnings)
+    return converter.write_status
@@ -0,0 +1,210 @@
+"""
+Moduł tłumaczący specyfikacje pakietów conda (match spec) na PEP 508/440.
+
+Obsługiwane postacie specyfikacji conda:
+
+    numpy                       -> numpy
+    conda-forge::numpy>=1.22    -> numpy>=1.22
+    numpy=1.22                  -> numpy==1.22.*
+    numpy==1.22.0               -> numpy==1.22.0
+    numpy 1.22.*                -> numpy==1.22.*
+    scipy>=1.7,<2               -> scipy>=1.7,<2
+    foo=1.0=py39h_0             -> foo==1.0
+    foo 1.0 py39h_0             -> foo==1.0
+    foo[version='>=1.0,<2']     -> foo>=1.0,<2
+
+Alternatywy ("1.7|1.8") nie mają odpowiednika w PEP 440 i powodują ValueError.
+Wyniki są zapamiętywane (LRU), bo pliki z `conda env export` zawierają tysiące
+powtarzających się specyfikacji.
+"""
+
+import functools
+import re
+from typing import Tuple
+
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+
+# Maksymalna liczba zapamiętanych tłumaczeń
+CACHE_SIZE = 16384
+
+_NAME_RE = re.compile(r"\s*([A-Za-z0-9_][A-Za-z0-9_.\-]*)\s*(.*)$", re.DOTALL)
+_BRACKET_RE = re.compile(r"^(.*?)\[(.*)\]\s*$", re.DOTALL)
+_BRACKET_ITEM_RE = re.compile(r"""(\w+)\s*=\s*(?:'([^']*)'|"([^"]*)"|([^,\]]+))""")
+_CLAUSE_RE = re.compile(r"^(==|!=|>=|<=|~=|>|<|=)?\s*(\S+)$")
+_COMMA_SPACE_RE = re.compile(r"\s*,\s*")
+_OPERATOR_SPACE_RE = re.compile(r"(==|!=|>=|<=|~=|>|<)\s+")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse_match_spec(spec: str) -> Tuple[str, str, str]:
+    """
+    Dzieli specyfikację conda na nazwę, specyfikację wersji i build.
+
+    Args:
+        spec: Specyfikacja pakietu conda
+
+    Returns:
+        Krotka (nazwa, specyfikacja wersji conda, build); brakujące części
+        są pustymi napisami
+
+    Raises:
+        ValueError: Jeśli specyfikacja nie zawiera nazwy pakietu
+    """
+    spec = spec.split("#", 1)[0].strip()
+
+    # Usuwamy kanał (np. "conda-forge::numpy" lub "conda-forge/linux-64::numpy")
+    if "::" in spec:
+        spec = spec.split("::", 1)[1]
+
+    version, build = "", ""
+
+    # Składnia z nawiasami: numpy[version='>=1.22',build=py39*]
+    bracket = _BRACKET_RE.match(spec)
+    if bracket:
+        spec = bracket.group(1)
+        for key, *values in _BRACKET_ITEM_RE.findall(bracket.group(2)):
+            value = next((v for v in values if v), "").strip()
+            if key == "version":
+                version = value
+            elif key == "build":
+                build = value
+
+    match = _NAME_RE.match(spec)
+    if not match or not match.group(1):
+        raise ValueError(f"Brak nazwy pakietu w specyfikacji conda: {spec!r}")
+    name, rest = match.group(1), match.group(2).strip()
+
+    if rest:
+        # Ujednolicamy odstępy (">= 1.7, <2" -> ">=1.7,<2")
+        rest = _OPERATOR_SPACE_RE.sub(r"\1", _COMMA_SPACE_RE.sub(",", rest))
+
+        if rest.startswith("=") and not rest.startswith("=="):
+            # Postać nazwa=wersja[=build]: bez buildu wersja jest rozmyta
+            parts = rest[1:].split("=", 1)
+            version = parts[0]
+            if len(parts) == 2:
+                build = parts[1]
+            elif version and not version.endswith("*"):
+                version = f"{version}.*"
+        else:
+            # Postać "nazwa wersja [build]" lub "nazwa>=wersja"
+            parts = rest.split()
+            version = parts[0]
+            if len(parts) > 1:
+                build = parts[1]
+
+    return name, version, build
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def conda_version_to_pep440(version: str) -> str:
+    """
+    Tłumaczy specyfikację wersji conda na specyfikator PEP 440.
+
+    Args:
+        version: Specyfikacja wersji conda (np. "1.22.*", ">=1.7,<2", "=1.2")
+
+    Returns:
+        Specyfikator PEP 440 (pusty napis, jeśli wersja jest dowolna)
+
+    Raises:
+        ValueError: Jeśli specyfikacji nie da się wyrazić w PEP 440
+    """
+    version = version.strip()
+    if "|" in version:
+        raise ValueError(f"Alternatywy wersji nie są obsługiwane w PEP 440: {version}")
+
+    clauses = []
+    for clause in version.split(","):
+        clause = clause.strip()
+        if clause in ("", "*"):
+            continue
+
+        match = _CLAUSE_RE.match(clause)
+        if not match:
+            raise ValueError(f"Nieprawidłowa specyfikacja wersji conda: {clause}")
+        operator, value = match.group(1) or "", match.group(2)
+
+        wildcard = value.endswith("*")
+        value = value.rstrip("*").rstrip(".")
+        if not value:
+            raise ValueError(f"Nieprawidłowa specyfikacja wersji conda: {clause}")
+
+        if operator in ("", "==", "="):
+            # "=1.2" oznacza w conda 1.2.*, a wersja bez operatora - dokładną wersję
+            wildcard = wildcard or operator == "="
+            clauses.append(f"=={value}.*" if wildcard else f"=={value}")
+        elif operator == "!=":
+            clauses.append(f"!={value}.*" if wildcard else f"!={value}")
+        else:
+            # PEP 440 nie dopuszcza gwiazdki przy operatorach porównania
+            clauses.append(f"{operator}{value}")
+
+    specifier = ",".join(clauses)
+    try:
+        SpecifierSet(specifier)
+    except InvalidSpecifier:
+        raise ValueError(f"Wersji conda {version!r} nie da się wyrazić w PEP 440")
+
+    return specifier
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def match_spec_to_pep508(spec: str) -> Tuple[str, str]:
+    """
+    Tłumaczy specyfikację pakietu conda na nazwę i specyfikator PEP 440.
+
+    Build (np. "py39h_0") nie ma odpowiednika w pip i jest pomijany.
+
+    Args:
+        spec: Specyfikacja pakietu conda
+
+    Returns:
+        Krotka (nazwa pakietu conda, specyfikator PEP 440)
+
+    Raises:
+        ValueError: Jeśli specyfikacji nie da się przetłumaczyć
+    """
+    name, version, _ = parse_match_spec(spec)
+    return name, conda_version_to_pep440(version) if version else ""
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def pep440_to_conda_version(specifier: str) -> str:
+    """
+    Tłumaczy specyfikator PEP 440 na specyfikację wersji conda.
+
+    Args:
+        specifier: Specyfikator PEP 440 (np. ">=1.21,==1.22.*")
+
+    Returns:
+        Specyfikacja wersji conda (np. ">=1.21,1.22.*"; pusty napis, jeśli
+        wersja jest dowolna)
+
+    Raises:
+        ValueError: Jeśli specyfikatora nie da się wyrazić w conda
+    """
+    clauses = []
+    for clause in _COMMA_SPACE_RE.split(specifier.strip()):
+        if not clause:
+            continue
+        match = _CLAUSE_RE.match(clause)
+        if not match or match.group(1) in (None, "=") or clause.startswith("==="):
+            raise ValueError(f"Nieprawidłowy specyfikator PEP 440: {clause}")
+        operator, value = match.group(1), match.group(2)
+        if operator == "==" and value.endswith(".*"):
+            clauses.append(value)
+        else:
+            clauses.append(f"{operator}{value}")
+
+    # Warunek bez operatora na początku zostałby odczytany jako część nazwy
+    clauses.sort(key=lambda clause: clause[0].isalnum())
+    return ",".join(clauses)
+
+
+def clear_cache() -> None:
+    """Czyści zapamiętane tłumaczenia specyfikacji."""
+    parse_match_spec.cache_clear()
+    conda_version_to_pep440.cache_clear()
+    match_spec_to_pep508.cache_clear()
+    pep440_to_conda_version.cache_clear()
@@ -0,0 +1,432 @@
+"""
+Moduł mapujący nazwy pakietów między pip (PyPI) a conda.
+
+Wbudowany zbiór mapowań (spectomate/data/name_mapping.txt) jest kompilowany
+do binarnego indeksu (name_mapping.idx) zawierającego dwie posortowane tablice
+napisów z przesunięciami: pip -> conda i conda -> pip. Indeks jest mapowany
+do pamięci (mmap), więc jego wczytanie nie wymaga parsowania, a wyszukiwanie
+to wyszukiwanie binarne w O(log n).
+
+Format indeksu (liczby little-endian):
+
+    nagłówek: magic "SPNM", wersja (u16), zarezerwowane (u16),
+              liczba wpisów pip -> conda (u32), liczba wpisów conda -> pip (u32),
+              pozycja tablicy przesunięć pip -> conda (u32),
+              pozycja tablicy przesunięć conda -> pip (u32),
+              pozycja puli napisów (u32)
+    tablice przesunięć: przesunięcia wpisów w puli napisów (u32),
+              w kolejności posortowanych kluczy
+    pula napisów: wpisy "klucz\\0wartość\\0" (UTF-8)
+
+Własne mapowania użytkownika (w tym samym formacie tekstowym co wbudowany
+zbiór) są wczytywane z pliku wskazanego zmienną SPECTOMATE_NAME_MAPPING lub
+z ~/.config/spectomate/name_mapping.txt i mają pierwszeństwo przed indeksem.
+"""
+
+import mmap
+import os
+import re
+import struct
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# Wbudowany zbiór mapowań i jego skompilowany indeks
+DATA_DIR = Path(__file__).resolve().parent.parent / "data"
+DEFAULT_SOURCE_FILE = DATA_DIR / "name_mapping.txt"
+DEFAULT_INDEX_FILE = DATA_DIR / "name_mapping.idx"
+
+# Zmienna środowiskowa ze ścieżką pliku z własnymi mapowaniami
+OVERRIDES_ENV_VAR = "SPECTOMATE_NAME_MAPPING"
+
+INDEX_MAGIC = b"SPNM"
+INDEX_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHIIIII")
+_OFFSET = struct.Struct("<I")
+
+_NORMALIZE_RE = re.compile(r"[-_.]+")
+
+
+def normalize_pip_name(name: str) -> str:
+    """
+    Normalizuje nazwę pakietu pip zgodnie z PEP 503.
+
+    Args:
+        name: Nazwa pakietu
+
+    Returns:
+        Znormalizowana nazwa (np. "Typing_Extensions" -> "typing-extensions")
+    """
+    return _NORMALIZE_RE.sub("-", name).lower()
+
+
+def parse_mapping(lines: Iterable[str]) -> List[Tuple[str, str]]:
+    """
+    Parsuje mapowania w formacie tekstowym ("nazwa_pip nazwa_conda" w wierszu).
+
+    Args:
+        lines: Wiersze pliku z mapowaniami
+
+    Returns:
+        Lista par (nazwa pip, nazwa conda) w kolejności z pliku
+
+    Raises:
+        ValueError: Jeśli wiersz nie zawiera dokładnie dwóch nazw
+    """
+    pairs = []
+    for line_number, line in enumerate(lines, 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+
+        fields = line.split()
+        if len(fields) != 2:
+            raise ValueError(
+                f"Wiersz {line_number}: oczekiwano nazwy pip i nazwy conda: {line}"
+            )
+        pairs.append((fields[0], fields[1]))
+
+    return pairs
+
+
+def _mapping_tables(
+    pairs: Iterable[Tuple[str, str]],
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Buduje słowniki mapowań w obu kierunkach.
+
+    Args:
+        pairs: Pary (nazwa pip, nazwa conda)
+
+    Returns:
+        Krotka (znormalizowana nazwa pip -> nazwa conda,
+        nazwa conda -> nazwa pip); w mapowaniu odwrotnym wygrywa pierwszy wpis
+    """
+    forward: Dict[str, str] = {}
+    reverse: Dict[str, str] = {}
+    for pip_name, conda_name in pairs:
+        conda_name = conda_name.lower()
+        forward[normalize_pip_name(pip_name)] = conda_name
+        reverse.setdefault(conda_name, pip_name)
+    return forward, reverse
+
+
+def compile_mapping(pairs: Iterable[Tuple[str, str]]) -> bytes:
+    """
+    Kompiluje mapowania do binarnego indeksu.
+
+    Args:
+        pairs: Pary (nazwa pip, nazwa conda)
+
+    Returns:
+        Zawartość pliku indeksu
+    """
+    forward, reverse = _mapping_tables(pairs)
+
+    pool = bytearray()
+    tables = []
+    for table in (forward, reverse):
+        offsets = []
+        for key in sorted(table, key=lambda k: k.encode("utf-8")):
+            offsets.append(len(pool))
+            pool += key.encode("utf-8") + b"\0" + table[key].encode("utf-8") + b"\0"
+        tables.append(offsets)
+
+    forward_offsets = _HEADER.size
+    reverse_offsets = forward_offsets + _OFFSET.size * len(tables[0])
+    pool_start = reverse_offsets + _OFFSET.size * len(tables[1])
+
+    header = _HEADER.pack(
+        INDEX_MAGIC,
+        INDEX_VERSION,
+        0,
+        len(tables[0]),
+        len(tables[1]),
+        forward_offsets,
+        reverse_offsets,
+        pool_start,
+    )
+    offsets_data = b"".join(
+        _OFFSET.pack(offset) for offsets in tables for offset in offsets
+    )
+    return header + offsets_data + bytes(pool)
+
+
+def build_index(
+    source_file: Union[str, Path] = DEFAULT_SOURCE_FILE,
+    index_file: Union[str, Path] = DEFAULT_INDEX_FILE,
+) -> Path:
+    """
+    Kompiluje plik tekstowy z mapowaniami do pliku indeksu.
+
+    Args:
+        source_file: Plik tekstowy z mapowaniami
+        index_file: Ścieżka pliku indeksu
+
+    Returns:
+        Ścieżka do zapisanego pliku indeksu
+    """
+    with open(source_file, "r", encoding="utf-8") as f:
+        data = compile_mapping(parse_mapping(f))
+
+    index_file = Path(index_file)
+    index_file.write_bytes(data)
+    return index_file
+
+
+class MappingIndex:
+    """
+    Skompilowany indeks mapowań nazw pakietów.
+    """
+
+    def __init__(self, buffer: Any):
+        """
+        Inicjalizacja indeksu.
+
+        Args:
+            buffer: Zawartość indeksu (bytes lub mmap)
+
+        Raises:
+            ValueError: Jeśli bufor nie zawiera poprawnego indeksu
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Plik indeksu mapowań jest uszkodzony")
+
+        (
+            magic,
+            version,
+            _,
+            self._forward_count,
+            self._reverse_count,
+            self._forward_offsets,
+            self._reverse_offsets,
+            self._pool,
+        ) = _HEADER.unpack_from(buffer, 0)
+        if magic != INDEX_MAGIC or version != INDEX_VERSION:
+            raise ValueError("Nieobsługiwany format indeksu mapowań")
+
+        self._buffer = buffer
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "MappingIndex":
+        """
+        Otwiera plik indeksu, mapując go do pamięci.
+
+        Args:
+            path: Ścieżka do pliku indeksu
+
+        Returns:
+            Indeks mapowań
+        """
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                raise ValueError(f"Plik indeksu mapowań jest pusty: {path}")
+            # Mapowanie pozostaje ważne po zamknięciu pliku
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        """Liczba mapowań pip -> conda."""
+        return int(self._forward_count)
+
+    def _entry(self, table: int, position: int) -> Tuple[bytes, int]:
+        """
+        Zwraca klucz wpisu i pozycję jego wartości w buforze.
+
+        Args:
+            table: Pozycja tablicy przesunięć
+            position: Numer wpisu w tablicy
+
+        Returns:
+            Krotka (klucz, pozycja początku wartości)
+        """
+        (offset,) = _OFFSET.unpack_from(self._buffer, table + _OFFSET.size * position)
+        start = self._pool + offset
+        end = self._buffer.find(b"\0", start)
+        return self._buffer[start:end], end + 1
+
+    def _find(self, table: int, count: int, key: str) -> Optional[str]:
+        """
+        Wyszukuje binarnie klucz w tablicy.
+
+        Args:
+            table: Pozycja tablicy przesunięć
+            count: Liczba wpisów w tablicy
+            key: Szukany klucz
+
+        Returns:
+            Wartość dla klucza lub None
+        """
+        needle = key.encode("utf-8")
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            entry_key, value_start = self._entry(table, middle)
+            if entry_key < needle:
+                low = middle + 1
+            elif entry_key > needle:
+                high = middle
+            else:
+                value_end = self._buffer.find(b"\0", value_start)
+                return bytes(self._buffer[value_start:value_end]).decode("utf-8")
+        return None
+
+    def to_conda(self, pip_name: str) -> Optional[str]:
+        """
+        Zwraca nazwę conda dla nazwy pip.
+
+        Args:
+            pip_name: Nazwa pakietu pip
+
+        Returns:
+            Nazwa conda lub None, jeśli indeks jej nie zawiera
+        """
+        return self._find(
+            self._forward_offsets, self._forward_count, normalize_pip_name(pip_name)
+        )
+
+    def to_pip(self, conda_name: str) -> Optional[str]:
+        """
+        Zwraca nazwę pip dla nazwy conda.
+
+        Args:
+            conda_name: Nazwa pakietu conda
+
+        Returns:
+            Nazwa pip lub None, jeśli indeks jej nie zawiera
+        """
+        return self._find(
+            self._reverse_offsets, self._reverse_count, conda_name.lower()
+        )
+
+
+class NameMapper:
+    """
+    Mapowanie nazw pakietów: własne mapowania użytkownika nałożone na indeks.
+    """
+
+    def __init__(
+        self,
+        index: Optional[MappingIndex] = None,
+        overrides: Optional[Iterable[Tuple[str, str]]] = None,
+    ):
+        """
+        Inicjalizacja mapowania.
+
+        Args:
+            index: Skompilowany indeks (None - tylko własne mapowania)
+            overrides: Własne pary (nazwa pip, nazwa conda)
+        """
+        self.index = index
+        self._forward, self._reverse = _mapping_tables(overrides or [])
+
+    def to_conda(self, pip_name: str) -> str:
+        """
+        Zwraca nazwę conda dla nazwy pakietu pip.
+
+        Args:
+            pip_name: Nazwa pakietu pip
+
+        Returns:
+            Nazwa conda (dla pakietów bez mapowania - nazwa małymi literami)
+        """
+        mapped = self._forward.get(normalize_pip_name(pip_name))
+        if mapped is None and self.index is not None:
+            mapped = self.index.to_conda(pip_name)
+        # Nazwy pakietów conda zawsze składają się z małych liter
+        return mapped or pip_name.lower()
+
+    def to_pip(self, conda_name: str) -> str:
+        """
+        Zwraca nazwę pip dla nazwy pakietu conda.
+
+        Args:
+            conda_name: Nazwa pakietu conda
+
+        Returns:
+            Nazwa pip (dla pakietów bez mapowania - nazwa bez zmian)
+        """
+        mapped = self._reverse.get(conda_name.lower())
+        if mapped is None and self.index is not None:
+            mapped = self.index.to_pip(conda_name)
+        return mapped or conda_name
+
+
+def get_overrides_file() -> Path:
+    """
+    Zwraca ścieżkę pliku z własnymi mapowaniami użytkownika.
+
+    Returns:
+        Ścieżka pliku (plik nie musi istnieć)
+    """
+    path = os.environ.get(OVERRIDES_ENV_VAR)
+    if path:
+        return Path(path)
+
+    config_dir = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+        os.path.expanduser("~"), ".config"
+    )
+    return Path(config_dir) / "spectomate" / "name_mapping.txt"
+
+
+def _load_default_index() -> Optional[MappingIndex]:
+    """
+    Wczytuje wbudowany indeks mapowań.
+
+    Returns:
+        Indeks lub None, jeśli nie ma ani indeksu, ani zbioru źródłowego
+    """
+    if DEFAULT_INDEX_FILE.exists():
+        return MappingIndex.open(DEFAULT_INDEX_FILE)
+
+    # Brak skompilowanego indeksu (np. w kopii roboczej) - kompilujemy w pamięci
+    if DEFAULT_SOURCE_FILE.exists():
+        with open(DEFAULT_SOURCE_FILE, "r", encoding="utf-8") as f:
+            return MappingIndex(compile_mapping(parse_mapping(f)))
+
+    return None
+
+
+_default_index: Optional[MappingIndex] = None
+_mapper: Optional[NameMapper] = None
+_mapper_key: Optional[Tuple[str, Optional[int]]] = None
+_mapper_lock = threading.Lock()
+
+
+def get_name_mapper() -> NameMapper:
+    """
+    Zwraca mapowanie nazw z wbudowanym indeksem i własnymi mapowaniami.
+
+    Indeks jest wczytywany przy pierwszym użyciu, a plik z własnymi
+    mapowaniami jest wczytywany ponownie tylko wtedy, gdy się zmienił.
+
+    Returns:
+        Mapowanie nazw pakietów
+    """
+    global _default_index, _mapper, _mapper_key
+
+    overrides_file = get_overrides_file()
+    try:
+        mtime: Optional[int] = overrides_file.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    key = (str(overrides_file), mtime)
+
+    with _mapper_lock:
+        if _mapper is None or _mapper_key != key:
+            if _default_index is None:
+                _default_index = _load_default_index()
+
+            overrides: List[Tuple[str, str]] = []
+            if mtime is not None:
+                with open(overrides_file, "r", encoding="utf-8") as f:
+                    overrides = parse_mapping(f)
+
+            _mapper = NameMapper(_default_index, overrides)
+            _mapper_key = key
+
+        return _mapper
+
+
+if __name__ == "__main__":
+    print(f"Zapisano indeks mapowań: {build_index()}")
@@ -0,0 +1,273 @@
+"""
+Moduł pamięci podręcznej sparsowanych plików z zależnościami.
+
+Gdy te same pliki są parsowane wielokrotnie (skanowanie projektów, konwersje
+wsadowe, potok aktualizacji), większość czasu zajmuje parsowanie YAML/TOML.
+Pamięć podręczna zapisuje wynik parse_file() schematów PipSchema, CondaSchema
+i PoetrySchema jako zwarty blob (moduł marshal) w katalogu
+~/.cache/spectomate/parse-cache.
+
+Wpis jest kluczowany ścieżką pliku i nazwą schematu, a w nagłówku bloba
+zapisane są rozmiar pliku, czas modyfikacji (st_mtime_ns), wersja parsera
+oraz wersje Pythona i formatu marshal. Przed użyciem wpisu wystarczy więc
+jedno stat() pliku źródłowego i porównanie nagłówka - bez czytania pliku.
+
+Pamięć podręczna jest wyłączona domyślnie. Włącza ją zmienna
+SPECTOMATE_PARSE_CACHE o wartości "1" (katalog domyślny) lub ścieżce
+katalogu na wpisy.
+"""
+
+import hashlib
+import marshal
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Union
+
+# Zmienna środowiskowa włączająca pamięć podręczną
+PARSE_CACHE_ENV_VAR = "SPECTOMATE_PARSE_CACHE"
+
+CACHE_MAGIC = b"SPPC"
+CACHE_VERSION = 1
+
+# magic, wersja wpisu, wersja parsera, wersja marshal, wersja Pythona,
+# rozmiar pliku, st_mtime_ns, długość ścieżki
+_HEADER = struct.Struct("<4sHHHHQqI")
+
+# Wersja Pythona zapisywana w nagłówku (format marshal może się zmieniać)
+_PYTHON_VERSION = sys.version_info[0] * 100 + sys.version_info[1]
+
+# Pliki zmienione przed chwilą nie są zapisywane: kolejna zmiana w tym samym
+# takcie zegara systemu plików mogłaby nie zmienić rozmiaru ani mtime
+_RACY_WINDOW_NS = 2_000_000_000
+
+_ENABLED_VALUES = ("1", "true", "yes", "on")
+_DISABLED_VALUES = ("", "0", "false", "no", "off")
+
+
+def get_cache_dir() -> Path:
+    """
+    Zwraca domyślny katalog na wpisy pamięci podręcznej.
+
+    Returns:
+        Ścieżka katalogu
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "spectomate" / "parse-cache"
+
+
+def get_configured_cache_dir() -> Optional[Path]:
+    """
+    Zwraca katalog pamięci podręcznej wskazany zmienną SPECTOMATE_PARSE_CACHE.
+
+    Returns:
+        Ścieżka katalogu lub None, jeśli pamięć podręczna jest wyłączona
+    """
+    value = os.environ.get(PARSE_CACHE_ENV_VAR, "").strip()
+    if value.lower() in _DISABLED_VALUES:
+        return None
+    if value.lower() in _ENABLED_VALUES:
+        return get_cache_dir()
+    return Path(value).expanduser()
+
+
+def _entry_path(cache_dir: Path, source: str, schema: str) -> Path:
+    """
+    Zwraca ścieżkę wpisu dla pliku źródłowego.
+
+    Args:
+        cache_dir: Katalog pamięci podręcznej
+        source: Bezwzględna ścieżka pliku źródłowego
+        schema: Nazwa schematu (pip, conda, poetry)
+
+    Returns:
+        Ścieżka pliku wpisu
+    """
+    digest = hashlib.sha256(f"{schema}\0{source}".encode("utf-8")).hexdigest()
+    return cache_dir / f"{schema}-{digest[:24]}.bin"
+
+
+def load_entry(
+    entry_path: Path,
+    source: str,
+    stat: os.stat_result,
+    parser_version: int,
+) -> Optional[Dict[str, Any]]:
+    """
+    Wczytuje wpis, jeśli pasuje do aktualnego stanu pliku źródłowego.
+
+    Args:
+        entry_path: Ścieżka pliku wpisu
+        source: Bezwzględna ścieżka pliku źródłowego
+        stat: Wynik stat() pliku źródłowego
+        parser_version: Wersja parsera schematu
+
+    Returns:
+        Sparsowane dane lub None, jeśli wpisu nie ma albo jest nieaktualny
+    """
+    try:
+        with open(entry_path, "rb") as f:
+            blob = f.read()
+    except OSError:
+        return None
+
+    if len(blob) < _HEADER.size:
+        return None
+    (
+        magic,
+        version,
+        entry_parser_version,
+        marshal_version,
+        python_version,
+        size,
+        mtime_ns,
+        path_length,
+    ) = _HEADER.unpack_from(blob)
+    if (
+        magic != CACHE_MAGIC
+        or version != CACHE_VERSION
+        or entry_parser_version != parser_version
+        or marshal_version != marshal.version
+        or python_version != _PYTHON_VERSION
+        or size != stat.st_size
+        or mtime_ns != stat.st_mtime_ns
+    ):
+        return None
+
+    offset = _HEADER.size + path_length
+    if blob[_HEADER.size : offset] != source.encode("utf-8"):
+        # Kolizja skrótu ścieżki
+        return None
+
+    try:
+        data = marshal.loads(blob[offset:])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def store_entry(
+    entry_path: Path,
+    source: str,
+    stat: os.stat_result,
+    parser_version: int,
+    data: Dict[str, Any],
+) -> bool:
+    """
+    Zapisuje wpis atomowo (przez plik tymczasowy i zmianę nazwy).
+
+    Args:
+        entry_path: Ścieżka pliku wpisu
+        source: Bezwzględna ścieżka pliku źródłowego
+        stat: Wynik stat() pliku źródłowego sprzed parsowania
+        parser_version: Wersja parsera schematu
+        data: Sparsowane dane
+
+    Returns:
+        True, jeśli wpis został zapisany
+    """
+    if time.time_ns() - stat.st_mtime_ns < _RACY_WINDOW_NS:
+        return False
+
+    try:
+        payload = marshal.dumps(data)
+    except ValueError:
+        # Dane zawierają typy nieobsługiwane przez marshal (np. daty z YAML)
+        return False
+
+    path_bytes = source.encode("utf-8")
+    header = _HEADER.pack(
+        CACHE_MAGIC,
+        CACHE_VERSION,
+        parser_version,
+        marshal.version,
+        _PYTHON_VERSION,
+        stat.st_size,
+        stat.st_mtime_ns,
+        len(path_bytes),
+    )
+
+    temp_path = entry_path.with_name(f".{entry_path.name}.{os.getpid()}.tmp")
+    try:
+        entry_path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path.write_bytes(header + path_bytes + payload)
+        os.replace(temp_path, entry_path)
+    except OSError:
+        # Pamięć podręczna jest tylko optymalizacją
+        try:
+            temp_path.unlink()
+        except OSError:
+            pass
+        return False
+    return True
+
+
+def cached_parse(
+    file_path: Union[str, Path],
+    schema: str,
+    parser_version: int,
+    parse: Callable[[], Dict[str, Any]],
+    cache_dir: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Zwraca wynik parsowania pliku z pamięci podręcznej lub parsuje go.
+
+    Gdy pamięć podręczna jest wyłączona, wywoływane jest tylko parse().
+    Każde trafienie zwraca nową kopię danych, więc wywołujący może je
+    modyfikować.
+
+    Args:
+        file_path: Ścieżka pliku źródłowego
+        schema: Nazwa schematu (pip, conda, poetry)
+        parser_version: Wersja parsera schematu
+        parse: Funkcja parsująca plik
+        cache_dir: Katalog pamięci podręcznej (None - zmienna
+            SPECTOMATE_PARSE_CACHE)
+
+    Returns:
+        Sparsowane dane
+    """
+    cache_dir = cache_dir or get_configured_cache_dir()
+    if cache_dir is None:
+        return parse()
+
+    try:
+        source = os.path.abspath(file_path)
+        stat = os.stat(source)
+    except OSError:
+        return parse()
+
+    entry_path = _entry_path(cache_dir, source, schema)
+    data = load_entry(entry_path, source, stat, parser_version)
+    if data is not None:
+        return data
+
+    data = parse()
+    store_entry(entry_path, source, stat, parser_version, data)
+    return data
+
+
+def clear_cache(cache_dir: Optional[Path] = None) -> int:
+    """
+    Usuwa wszystkie wpisy pamięci podręcznej.
+
+    Args:
+        cache_dir: Katalog pamięci podręcznej (None - zmienna
+            SPECTOMATE_PARSE_CACHE lub katalog domyślny)
+
+    Returns:
+        Liczba usuniętych wpisów
+    """
+    cache_dir = cache_dir or get_configured_cache_dir() or get_cache_dir()
+    removed = 0
+    for entry_path in cache_dir.glob("*.bin"):
+        try:
+            entry_path.unlink()
+            removed += 1
+        except FileNotFoundError:
+            pass
+    return removed
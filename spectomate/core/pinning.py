@@ -0,0 +1,426 @@
+"""
+Przypinanie wymagań do najnowszych wersji z lokalnej kopii indeksu.
+
+Z kopii indeksu (katalog simple API lub plik JSON z metadanymi, jak dla
+spectomate lock) budowany jest jednorazowo indeks wersji: nazwa pakietu ->
+posortowana lista wersji (bez wycofanych). Indeks jest zapisywany w katalogu
+~/.cache/spectomate/version-index pod nazwą zawierającą odcisk plików kopii,
+więc zmiana kopii powoduje jego przebudowanie przy następnym użyciu.
+
+W odróżnieniu od spectomate lock zależności przechodnie nie są rozwiązywane:
+każde wymaganie jest przypinane niezależnie do najnowszej wersji spełniającej
+jego specyfikator.
+
+Kopia indeksu jest wskazywana opcją --pin-index lub zmienną
+SPECTOMATE_PIN_INDEX.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from spectomate.core.channel_index import _write_atomic
+from spectomate.core.ir import Requirement
+from spectomate.core.name_mapping import normalize_pip_name
+from spectomate.core.versions import parse_specifier, parse_version, sort_versions
+
+# Zmienna środowiskowa z lokalizacją kopii indeksu
+PIN_INDEX_ENV_VAR = "SPECTOMATE_PIN_INDEX"
+
+# Wersja formatu zapisanego indeksu wersji
+VERSION_INDEX_FORMAT = 1
+
+
+class VersionIndex:
+    """
+    Indeks wersji: znormalizowana nazwa pakietu -> wersje od najstarszej.
+    """
+
+    def __init__(self, versions: Dict[str, Sequence[str]]):
+        """
+        Inicjalizuje indeks.
+
+        Args:
+            versions: Wersje pakietów posortowane rosnąco według PEP 440
+        """
+        self._versions: Dict[str, Tuple[str, ...]] = {
+            normalize_pip_name(name): tuple(items) for name, items in versions.items()
+        }
+        self._latest: Dict[Tuple[str, str, bool], Optional[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._versions)
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and normalize_pip_name(name) in self._versions
+
+    def versions(self, name: str) -> Tuple[str, ...]:
+        """
+        Zwraca wersje pakietu od najstarszej.
+
+        Args:
+            name: Nazwa pakietu
+
+        Returns:
+            Krotka wersji (pusta, jeśli pakietu nie ma w indeksie)
+        """
+        return self._versions.get(normalize_pip_name(name), ())
+
+    def latest(
+        self, name: str, specifier: str = "", prereleases: bool = False
+    ) -> Optional[str]:
+        """
+        Zwraca najnowszą wersję pakietu spełniającą specyfikator.
+
+        Wyniki są zapamiętywane, więc powtarzające się wymagania (np. w wielu
+        plikach) są sprawdzane tylko raz.
+
+        Args:
+            name: Nazwa pakietu
+            specifier: Specyfikator PEP 440
+            prereleases: Czy dopuszczać wersje przedpremierowe (bez tego są
+                wybierane tylko wtedy, gdy specyfikator wprost ich dotyczy)
+
+        Returns:
+            Najnowsza pasująca wersja lub None
+
+        Raises:
+            ValueError: Jeśli specyfikator jest nieprawidłowy
+        """
+        key = (normalize_pip_name(name), specifier, prereleases)
+        if key not in self._latest:
+            self._latest[key] = _newest_matching(
+                self._versions.get(key[0], ()), specifier, prereleases
+            )
+        return self._latest[key]
+
+    def latest_many(
+        self, requirements: Iterable[Tuple[str, str]], prereleases: bool = False
+    ) -> Dict[Tuple[str, str], Optional[str]]:
+        """
+        Zwraca najnowsze wersje dla wielu par (nazwa, specyfikator) naraz.
+
+        Args:
+            requirements: Pary (nazwa, specyfikator)
+            prereleases: Czy dopuszczać wersje przedpremierowe
+
+        Returns:
+            Słownik (nazwa, specyfikator) -> wersja lub None
+        """
+        return {
+            pair: self.latest(pair[0], pair[1], prereleases)
+            for pair in dict.fromkeys(requirements)
+        }
+
+    def to_json(self) -> str:
+        """
+        Serializuje indeks do JSON.
+
+        Returns:
+            Dokument JSON
+        """
+        return json.dumps(
+            {"format": VERSION_INDEX_FORMAT, "versions": self._versions},
+            sort_keys=True,
+        )
+
+    @classmethod
+    def from_json(cls, content: str) -> "VersionIndex":
+        """
+        Wczytuje indeks z dokumentu JSON.
+
+        Args:
+            content: Dokument JSON zapisany przez to_json()
+
+        Returns:
+            Indeks wersji
+
+        Raises:
+            ValueError: Jeśli dokument ma nieprawidłowy format
+        """
+        data = json.loads(content)
+        if not isinstance(data, dict) or data.get("format") != VERSION_INDEX_FORMAT:
+            raise ValueError("Nieobsługiwany format indeksu wersji")
+        return cls(data["versions"])
+
+    @classmethod
+    def from_package_index(cls, path: Union[str, Path]) -> "VersionIndex":
+        """
+        Buduje indeks wersji z kopii indeksu pakietów.
+
+        Args:
+            path: Katalog simple API lub plik JSON z metadanymi
+
+        Returns:
+            Indeks wersji
+        """
+        from spectomate.core.resolver import PackageIndex
+
+        package_index = PackageIndex.open(path)
+        versions = {}
+        for name in package_index.project_names():
+            project = package_index.get_project(name) or {}
+            available = [
+                version for version, release in project.items() if not release.yanked
+            ]
+            if available:
+                versions[name] = sort_versions(available)
+        return cls(versions)
+
+
+def _newest_matching(
+    versions: Sequence[str], specifier: str, prereleases: bool
+) -> Optional[str]:
+    """
+    Zwraca najnowszą wersję spełniającą specyfikator.
+
+    Wersje są przeglądane od najnowszej, więc zwykle wystarcza sprawdzenie
+    kilku z nich. Wersje przedpremierowe są wybierane tak jak w pip: gdy są
+    dopuszczone, specyfikator wprost ich dotyczy lub żadna inna wersja nie
+    pasuje.
+
+    Args:
+        versions: Wersje posortowane rosnąco
+        specifier: Specyfikator PEP 440
+        prereleases: Czy dopuszczać wersje przedpremierowe
+
+    Returns:
+        Najnowsza pasująca wersja lub None
+
+    Raises:
+        ValueError: Jeśli specyfikator jest nieprawidłowy
+    """
+    spec = parse_specifier(specifier)
+    allow_prereleases = prereleases or bool(spec.prereleases)
+    fallback = None
+    for version in reversed(versions):
+        try:
+            parsed = parse_version(version)
+        except ValueError:
+            continue
+        if not spec.contains(parsed, prereleases=True):
+            continue
+        if parsed.is_prerelease and not allow_prereleases:
+            fallback = fallback or version
+            continue
+        return version
+    return fallback
+
+
+def get_cache_dir() -> Path:
+    """
+    Zwraca katalog, w którym zapisywane są zbudowane indeksy wersji.
+
+    Returns:
+        Ścieżka katalogu
+    """
+    cache_home = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return Path(cache_home) / "spectomate" / "version-index"
+
+
+def _mirror_files(mirror: Path) -> List[Path]:
+    """
+    Zwraca pliki kopii indeksu, od których zależy indeks wersji.
+
+    Args:
+        mirror: Katalog simple API lub plik JSON
+
+    Returns:
+        Lista plików
+    """
+    if mirror.is_dir():
+        return sorted(mirror.glob("*/index.html"))
+    return [mirror]
+
+
+def _fingerprint(mirror: Path) -> str:
+    """
+    Oblicza odcisk kopii indeksu.
+
+    Args:
+        mirror: Katalog simple API lub plik JSON
+
+    Returns:
+        Odcisk zależny od ścieżek, rozmiarów i czasów modyfikacji plików
+    """
+    digest = hashlib.sha256(f"{mirror.resolve()}\n".encode())
+    for path in _mirror_files(mirror):
+        stat = path.stat()
+        digest.update(f"{path.name}\0{path.parent.name}\0".encode())
+        digest.update(f"{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.hexdigest()[:16]
+
+
+def build_version_index(
+    mirror: Union[str, Path], cache_dir: Optional[Path] = None
+) -> VersionIndex:
+    """
+    Buduje indeks wersji z kopii indeksu lub wczytuje już zbudowany.
+
+    Args:
+        mirror: Katalog simple API lub plik JSON z metadanymi
+        cache_dir: Katalog na pliki indeksu (None - domyślny)
+
+    Returns:
+        Indeks wersji
+
+    Raises:
+        FileNotFoundError: Jeśli kopia indeksu nie istnieje
+    """
+    mirror = Path(mirror)
+    if not mirror.exists():
+        raise FileNotFoundError(f"Indeks nie istnieje: {mirror}")
+
+    cache_dir = cache_dir or get_cache_dir()
+    fingerprint = _fingerprint(mirror)
+    index_file = cache_dir / f"{fingerprint}.json"
+
+    if index_file.exists():
+        try:
+            return VersionIndex.from_json(index_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError, KeyError):
+            pass
+
+    index = VersionIndex.from_package_index(mirror)
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    # Usuwamy indeksy zbudowane z poprzednich wersji tej samej kopii
+    source_file = cache_dir / f"{fingerprint}.source"
+    for old_file in cache_dir.glob("*.source"):
+        if old_file.stem != fingerprint and old_file.read_text() == str(
+            mirror.resolve()
+        ):
+            for suffix in (".json", ".source"):
+                try:
+                    old_file.with_suffix(suffix).unlink()
+                except FileNotFoundError:
+                    pass
+
+    _write_atomic(index_file, index.to_json().encode("utf-8"))
+    _write_atomic(source_file, str(mirror.resolve()).encode("utf-8"))
+
+    return index
+
+
+_indexes: Dict[Tuple[str, str], VersionIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_version_index(
+    mirror: Optional[Union[str, Path]] = None,
+) -> Optional[VersionIndex]:
+    """
+    Zwraca indeks wersji dla kopii indeksu, budując go w razie potrzeby.
+
+    Args:
+        mirror: Katalog simple API lub plik JSON (None - wartość zmiennej
+            SPECTOMATE_PIN_INDEX)
+
+    Returns:
+        Indeks wersji lub None, jeśli kopia indeksu nie jest skonfigurowana
+
+    Raises:
+        FileNotFoundError: Jeśli kopia indeksu nie istnieje
+    """
+    if mirror is None:
+        mirror = os.environ.get(PIN_INDEX_ENV_VAR, "")
+    if not str(mirror).strip():
+        return None
+
+    mirror = Path(mirror)
+    if not mirror.exists():
+        raise FileNotFoundError(f"Indeks nie istnieje: {mirror}")
+
+    key = (str(get_cache_dir()), _fingerprint(mirror))
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = build_version_index(mirror)
+            _indexes[key] = index
+        return index
+
+
+def _is_pinned(requirement: Requirement) -> bool:
+    """
+    Sprawdza, czy wymaganie wskazuje już dokładnie jedną wersję.
+
+    Args:
+        requirement: Wymaganie
+
+    Returns:
+        True dla wymagań z adresem URL lub specyfikatorem == / === bez *
+    """
+    if requirement.url:
+        return True
+    clauses = [clause.strip() for clause in requirement.specifier.split(",")]
+    return any(
+        (clause.startswith("==") and not clause.endswith("*"))
+        for clause in clauses
+        if clause
+    )
+
+
+def pin_latest(
+    requirements: Iterable[Requirement],
+    index: VersionIndex,
+    prereleases: bool = False,
+    warnings: Optional[List[str]] = None,
+) -> List[Requirement]:
+    """
+    Przypina wymagania do najnowszych wersji spełniających ich specyfikatory.
+
+    Wymagania już przypięte (==, ===, adres URL) są pozostawiane bez zmian,
+    podobnie jak pakiety nieobecne w indeksie i takie, dla których żadna
+    wersja nie spełnia specyfikatora (te są zgłaszane w ostrzeżeniach).
+
+    Args:
+        requirements: Wymagania
+        index: Indeks wersji
+        prereleases: Czy dopuszczać wersje przedpremierowe
+        warnings: Lista, do której dopisywane są ostrzeżenia
+
+    Returns:
+        Lista wymagań w tej samej kolejności
+    """
+    requirements = list(requirements)
+    latest = index.latest_many(
+        ((req.key, req.specifier) for req in requirements if not _is_pinned(req)),
+        prereleases,
+    )
+
+    pinned = []
+    for req in requirements:
+        if _is_pinned(req):
+            pinned.append(req)
+            continue
+
+        version = latest[(req.key, req.specifier)]
+        if version is None:
+            if warnings is not None:
+                if req.key in index:
+                    warnings.append(
+                        f"Brak wersji pakietu {req.name} spełniającej "
+                        f"'{req.specifier}' w indeksie, pozostawiono bez zmian"
+                    )
+                else:
+                    warnings.append(
+                        f"Pakietu {req.name} nie ma w indeksie, "
+                        "pozostawiono bez zmian"
+                    )
+            pinned.append(req)
+            continue
+
+        pinned.append(Requirement(req.name, f"=={version}", req.extras, req.marker))
+
+    return pinned
+
+
+def clear_cache() -> None:
+    """Czyści indeksy wersji zapamiętane w procesie."""
+    with _indexes_lock:
+        _indexes.clear()
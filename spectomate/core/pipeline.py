@@ -0,0 +1,339 @@
+"""
+Moduł łączący kilka konwerterów w jeden wieloetapowy konwerter.
+
+Dane pośrednie (słowniki zwracane przez convert()) są przekazywane między
+etapami w pamięci, bez zapisu plików pośrednich i ponownej serializacji.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type, Union
+
+from spectomate.core.base_converter import BaseConverter
+
+
+class ConverterPipeline(BaseConverter):
+    """
+    Konwerter wieloetapowy składający się z sekwencji konwerterów.
+
+    Klasy konkretnych tras są tworzone przez compile_pipeline(), dzięki czemu
+    mają ten sam interfejs co zwykłe konwertery zwracane przez rejestr.
+    """
+
+    # Klasy konwerterów tworzących kolejne etapy trasy
+    stages: Tuple[Type[BaseConverter], ...] = ()
+
+    def __init__(
+        self,
+        source_file: Optional[Union[str, Path]] = None,
+        target_file: Optional[Union[str, Path]] = None,
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Inicjalizacja konwertera wieloetapowego.
+
+        Args:
+            source_file: Ścieżka do pliku źródłowego
+            target_file: Ścieżka do pliku docelowego
+            options: Opcje przekazywane do wszystkich etapów
+        """
+        super().__init__(source_file, target_file, options)
+
+        if not self.stages:
+            raise ValueError("Trasa konwersji nie zawiera żadnych etapów")
+
+        last = len(self.stages) - 1
+        self.converters: List[BaseConverter] = [
+            stage(
+                source_file=self.source_file if index == 0 else None,
+                target_file=self.target_file if index == last else None,
+                options=self.options,
+            )
+            for index, stage in enumerate(self.stages)
+        ]
+
+    @classmethod
+    def get_source_format(cls) -> str:
+        """
+        Zwraca identyfikator formatu źródłowego (format pierwszego etapu).
+
+        Raises:
+            ValueError: Jeśli potok nie zawiera żadnych etapów
+        """
+        if not cls.stages:
+            raise ValueError("Trasa konwersji nie zawiera żadnych etapów")
+        return cls.stages[0].get_source_format()
+
+    @classmethod
+    def get_target_format(cls) -> str:
+        """
+        Zwraca identyfikator formatu docelowego (format ostatniego etapu).
+
+        Raises:
+            ValueError: Jeśli potok nie zawiera żadnych etapów
+        """
+        if not cls.stages:
+            raise ValueError("Trasa konwersji nie zawiera żadnych etapów")
+        return cls.stages[-1].get_target_format()
+
+    def read_source(self) -> Dict[str, Any]:
+        """
+        Odczytuje plik źródłowy za pomocą pierwszego etapu.
+
+        Returns:
+            Odczytane dane w formacie źródłowym
+        """
+        return self.converters[0].read_source()
+
+    def parse_source(self, content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku źródłowego za pomocą pierwszego etapu.
+
+        Args:
+            content: Zawartość pliku w formacie źródłowym
+
+        Returns:
+            Odczytane dane w formacie źródłowym
+        """
+        return self.converters[0].parse_source(content)
+
+    def convert(self, source_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Przepuszcza dane przez wszystkie etapy trasy.
+
+        Args:
+            source_data: Dane w formacie źródłowym
+
+        Returns:
+            Dane w formacie docelowym
+        """
+        if source_data is None:
+            if self.source_data is None:
+                raise ValueError("Brak danych źródłowych do konwersji")
+            source_data = self.source_data
+
+        data = source_data
+        for converter in self.converters:
+            converter.source_data = data
+            data = converter.convert(data)
+            converter.target_data = data
+
+        self.warnings = [w for converter in self.converters for w in converter.warnings]
+        return data
+
+    async def convert_async(
+        self, source_data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Przepuszcza dane przez wszystkie etapy trasy, używając asynchronicznych
+        wersji konwersji poszczególnych etapów.
+
+        Args:
+            source_data: Dane w formacie źródłowym
+
+        Returns:
+            Dane w formacie docelowym
+        """
+        if source_data is None:
+            if self.source_data is None:
+                raise ValueError("Brak danych źródłowych do konwersji")
+            source_data = self.source_data
+
+        data = source_data
+        for converter in self.converters:
+            converter.source_data = data
+            data = await converter.convert_async(data)
+            converter.target_data = data
+
+        self.warnings = [w for converter in self.converters for w in converter.warnings]
+        return data
+
+    def write_target(self, target_data: Optional[Dict[str, Any]] = None) -> Path:
+        """
+        Zapisuje dane za pomocą ostatniego etapu.
+
+        Args:
+            target_data: Dane w formacie docelowym
+
+        Returns:
+            Ścieżka do zapisanego pliku
+        """
+        if target_data is None:
+            if self.target_data is None:
+                raise ValueError("Brak danych docelowych do zapisu")
+            target_data = self.target_data
+
+        last_converter = self.converters[-1]
+
+        # Ostatni etap nie zna pliku źródłowego, więc domyślną ścieżkę
+        # wyznaczamy względem pliku źródłowego całej trasy
+        if last_converter.target_file is None and last_converter.source_file is None:
+            last_converter.source_file = self.source_file
+
+        self.target_file = last_converter.write_target(target_data)
+        self.write_status = last_converter.write_status
+        return self.target_file
+
+    def render_target(self, target_data: Dict[str, Any]) -> str:
+        """
+        Serializuje dane za pomocą ostatniego etapu.
+
+        Args:
+            target_data: Dane w formacie docelowym
+
+        Returns:
+            Zawartość pliku w formacie docelowym
+        """
+        return self.converters[-1].render_target(target_data)
+
+
+def compile_pipeline(
+    stages: Sequence[Type[BaseConverter]],
+) -> Type[ConverterPipeline]:
+    """
+    Tworzy klasę konwertera wieloetapowego dla podanej trasy.
+
+    Args:
+        stages: Klasy konwerterów w kolejności wykonywania
+
+    Returns:
+        Klasa konwertera realizująca całą trasę
+    """
+    if not stages:
+        raise ValueError("Trasa konwersji nie zawiera żadnych etapów")
+
+    source_format = stages[0].get_source_format()
+    target_format = stages[-1].get_target_format()
+    name = f"{source_format.capitalize()}To{target_format.capitalize()}Pipeline"
+
+    return type(
+        name,
+        (ConverterPipeline,),
+        {
+            "__module__": __name__,
+            "stages": tuple(stages),
+            "conversion_cost": sum(stage.conversion_cost for stage in stages),
+            "__doc__": (
+                f"Konwerter wieloetapowy {source_format} -> {target_format} "
+                f"({' -> '.join(stage.__name__ for stage in stages)})."
+            ),
+        },
+    )
+
+
+def get_stage_converters(converter: BaseConverter) -> List[BaseConverter]:
+    """
+    Zwraca instancje konwerterów tworzących kolejne etapy konwertera.
+
+    Args:
+        converter: Konwerter zwykły lub wieloetapowy
+
+    Returns:
+        Lista etapów (dla zwykłego konwertera - jednoelementowa)
+    """
+    if isinstance(converter, ConverterPipeline):
+        return converter.converters
+    return [converter]
+
+
+def run_fan_out(
+    converters: Sequence[BaseConverter], max_workers: Optional[int] = None
+) -> List[Path]:
+    """
+    Wykonuje kilka konwersji tego samego pliku źródłowego.
+
+    Plik źródłowy jest odczytywany raz dla każdej implementacji read_source()
+    pierwszych etapów tras (konwertery mogą potrzebować różnych reprezentacji
+    źródła, np. PipToIrConverter zachowuje całe linie requirements.txt),
+    a wyniki etapów wspólnych dla kilku tras (np. poetry -> pip dla celów pip
+    i conda) są obliczane tylko raz.
+    Pozostałe etapy i zapis plików docelowych są wykonywane równolegle.
+
+    Args:
+        converters: Konwertery z tym samym plikiem źródłowym i różnymi
+            plikami docelowymi
+        max_workers: Maksymalna liczba równoległych wątków
+
+    Returns:
+        Ścieżki do zapisanych plików, w kolejności konwerterów
+    """
+    if not converters:
+        return []
+
+    source_formats = {converter.source_format for converter in converters}
+    if len(source_formats) != 1:
+        raise ValueError("Wszystkie konwertery muszą mieć ten sam format źródłowy")
+
+    target_files = [converter.target_file for converter in converters]
+    if None in target_files:
+        raise ValueError("Każda konwersja musi mieć podany plik docelowy")
+    resolved_targets = [Path(target).resolve() for target in target_files]
+    if len(set(resolved_targets)) != len(resolved_targets):
+        raise ValueError("Pliki docelowe konwersji muszą być różne")
+
+    routes = [get_stage_converters(converter) for converter in converters]
+    keys = [tuple(type(stage) for stage in route) for route in routes]
+
+    # Odczytujemy i parsujemy plik źródłowy tylko raz dla każdej reprezentacji
+    # danych źródłowych, której oczekują pierwsze etapy tras
+    sources: Dict[Any, Dict[str, Any]] = {}
+    route_sources = []
+    for route in routes:
+        read_source = type(route[0]).read_source
+        if read_source not in sources:
+            sources[read_source] = route[0].read_source()
+        route_sources.append(sources[read_source])
+
+    # Obliczamy wyniki prefiksów tras wspólnych dla co najmniej dwóch celów
+    prefix_counts: Dict[Tuple[type, ...], int] = {}
+    for key in keys:
+        for length in range(1, len(key) + 1):
+            prefix = key[:length]
+            prefix_counts[prefix] = prefix_counts.get(prefix, 0) + 1
+
+    shared: Dict[Tuple[type, ...], Dict[str, Any]] = {}
+    shared_warnings: Dict[Tuple[type, ...], List[str]] = {}
+    for route, key, source_data in zip(routes, keys, route_sources):
+        # Trasy o wspólnym prefiksie mają ten sam pierwszy etap, a więc
+        # i te same dane źródłowe
+        data = source_data
+        for length in range(1, len(key) + 1):
+            prefix = key[:length]
+            if prefix_counts[prefix] < 2:
+                break
+            stage = route[length - 1]
+            if prefix not in shared:
+                shared[prefix] = stage.convert(data)
+                shared_warnings[prefix] = stage.warnings
+            # Ostrzeżenia wspólnego etapu dotyczą wszystkich tras, które go używają
+            stage.warnings = list(shared_warnings[prefix])
+            data = shared[prefix]
+
+    def finish(index: int) -> Path:
+        converter, route, key = converters[index], routes[index], keys[index]
+        source_data = route_sources[index]
+
+        # Zaczynamy od najdłuższego wspólnego prefiksu tej trasy
+        data, start = source_data, 0
+        for length in range(len(key), 0, -1):
+            if key[:length] in shared:
+                data, start = shared[key[:length]], length
+                break
+
+        for stage in route[start:]:
+            data = stage.convert(data)
+
+        converter.source_data = source_data
+        converter.target_data = data
+        result_path = converter.write_target(data)
+
+        # Konwerter wieloetapowy przejmuje status zapisu ostatniego etapu
+        if route[-1] is not converter:
+            converter.target_file = result_path
+            converter.write_status = route[-1].write_status
+            converter.warnings = [w for stage in route for w in stage.warnings]
+
+        return result_path
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(finish, range(len(converters))))
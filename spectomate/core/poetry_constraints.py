@@ -0,0 +1,211 @@
+"""
+Moduł tłumaczący ograniczenia wersji Poetry na specyfikatory PEP 440 i odwrotnie.
+
+Obsługiwane postacie ograniczeń Poetry:
+
+    *                 -> (dowolna wersja)
+    1.2.3             -> ==1.2.3
+    1.2.*             -> ==1.2.*
+    ^1.2.3            -> >=1.2.3,<2.0.0
+    ^0.2.3            -> >=0.2.3,<0.3.0
+    ~1.2.3            -> >=1.2.3,<1.3.0
+    >=1.2 <1.5        -> >=1.2,<1.5
+    >= 1.2, < 1.5     -> >=1.2,<1.5
+
+Alternatywy ("^1.0 || ^2.0") nie mają odpowiednika w PEP 440 i powodują
+ValueError. W drugą stronę specyfikator "~=" jest zamieniany na "^" lub "~",
+gdy oznacza ten sam zakres wersji, a pozostałe operatory PEP 440 Poetry
+rozumie bez zmian.
+
+Wyniki są zapamiętywane (LRU) i internowane, bo te same ograniczenia powtarzają
+się w wielu projektach.
+"""
+
+import functools
+import re
+import sys
+from typing import List, Tuple
+
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+# Maksymalna liczba zapamiętanych tłumaczeń
+CACHE_SIZE = 4096
+
+_OPERATOR_SPACE_RE = re.compile(r"(===|==|!=|>=|<=|~=|>|<|\^|~|=)\s+")
+_SEPARATOR_RE = re.compile(r"\s*,\s*|\s+")
+_CLAUSE_RE = re.compile(r"^(===|==|!=|>=|<=|~=|>|<|\^|~|=)?(.+)$")
+
+
+def _release(version: str) -> Tuple[int, ...]:
+    """
+    Zwraca część "release" wersji (np. (1, 2, 3) dla "1.2.3rc1").
+
+    Args:
+        version: Wersja
+
+    Returns:
+        Krotka z numerami wersji
+
+    Raises:
+        ValueError: Jeśli wersja jest nieprawidłowa
+    """
+    try:
+        return Version(version).release
+    except InvalidVersion:
+        raise ValueError(f"Nieprawidłowa wersja: {version}")
+
+
+def _upper_bound(release: Tuple[int, ...], index: int) -> str:
+    """
+    Zwraca górną granicę zakresu, zwiększając składnik wersji o podanym indeksie.
+
+    Granica ma tyle składników, ile podana wersja (np. "2.0.0" dla "1.2.3").
+
+    Args:
+        release: Numery wersji
+        index: Indeks zwiększanego składnika
+
+    Returns:
+        Górna granica zakresu (bez operatora)
+    """
+    bumped = list(release[:index]) + [release[index] + 1]
+    bumped += [0] * (len(release) - len(bumped))
+    return ".".join(str(part) for part in bumped)
+
+
+def _split_clauses(constraint: str) -> List[str]:
+    """
+    Dzieli ograniczenie na klauzule połączone koniunkcją (przecinkiem lub spacją).
+
+    Args:
+        constraint: Ograniczenie wersji
+
+    Returns:
+        Lista klauzul bez odstępów
+    """
+    constraint = _OPERATOR_SPACE_RE.sub(r"\1", constraint.strip())
+    return [clause for clause in _SEPARATOR_RE.split(constraint) if clause]
+
+
+def _validate(specifier: str, constraint: str) -> None:
+    """
+    Sprawdza, czy wynik tłumaczenia jest poprawnym specyfikatorem PEP 440.
+
+    Args:
+        specifier: Specyfikator PEP 440
+        constraint: Tłumaczone ograniczenie (do komunikatu błędu)
+
+    Raises:
+        ValueError: Jeśli specyfikator jest nieprawidłowy
+    """
+    try:
+        SpecifierSet(specifier)
+    except InvalidSpecifier:
+        raise ValueError(f"Nieprawidłowe ograniczenie wersji: {constraint!r}")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def poetry_to_pep440(constraint: str) -> str:
+    """
+    Tłumaczy ograniczenie wersji Poetry na specyfikator PEP 440.
+
+    Args:
+        constraint: Ograniczenie Poetry (np. "^1.2", "~1.2.3", ">=1.0 <2.0")
+
+    Returns:
+        Specyfikator PEP 440 (pusty napis, jeśli wersja jest dowolna)
+
+    Raises:
+        ValueError: Jeśli ograniczenia nie da się wyrazić w PEP 440
+    """
+    if "|" in constraint:
+        raise ValueError(
+            f"Alternatywy wersji nie są obsługiwane w PEP 440: {constraint}"
+        )
+
+    clauses = []
+    for clause in _split_clauses(constraint):
+        if clause == "*":
+            continue
+
+        match = _CLAUSE_RE.match(clause)
+        if not match:
+            raise ValueError(f"Nieprawidłowe ograniczenie wersji: {clause}")
+        operator, version = match.group(1) or "", match.group(2)
+
+        if operator == "^":
+            release = _release(version)
+            # Zwiększamy pierwszy niezerowy składnik (lub ostatni, jeśli wszystkie
+            # są zerami): ^1.2.3 -> <2.0.0, ^0.2.3 -> <0.3.0, ^0.0 -> <0.1
+            index = next(
+                (i for i, part in enumerate(release) if part),
+                len(release) - 1,
+            )
+            clauses.append(f">={version}")
+            clauses.append(f"<{_upper_bound(release, index)}")
+        elif operator == "~":
+            release = _release(version)
+            # ~1.2.3 i ~1.2 pozwalają na zmiany poprawek, ~1 - na zmiany drugorzędne
+            index = 1 if len(release) > 1 else 0
+            clauses.append(f">={version}")
+            clauses.append(f"<{_upper_bound(release, index)}")
+        elif operator in ("", "="):
+            clauses.append(f"=={version}")
+        else:
+            clauses.append(f"{operator}{version}")
+
+    specifier = ",".join(clauses)
+    _validate(specifier, constraint)
+
+    return sys.intern(specifier)
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def pep440_to_poetry(specifier: str) -> str:
+    """
+    Tłumaczy specyfikator PEP 440 na ograniczenie wersji Poetry.
+
+    Args:
+        specifier: Specyfikator PEP 440 (np. "~=1.2", ">=1.0,<2.0")
+
+    Returns:
+        Ograniczenie Poetry ("*", jeśli wersja jest dowolna)
+
+    Raises:
+        ValueError: Jeśli specyfikator jest nieprawidłowy
+    """
+    clauses = []
+    for clause in _split_clauses(specifier):
+        match = _CLAUSE_RE.match(clause)
+        operator, version = match.group(1) or "", match.group(2)
+
+        if operator == "~=":
+            release = _release(version)
+            pre_release = Version(version).is_prerelease
+            if len(release) == 3 and not pre_release:
+                # ~=1.2.3 oznacza >=1.2.3,<1.3.0, czyli ~1.2.3
+                clause = f"~{version}"
+            elif len(release) == 2 and release[0] and not pre_release:
+                # ~=1.2 oznacza >=1.2,<2.0, czyli ^1.2
+                clause = f"^{version}"
+        elif operator == "===":
+            clause = f"=={version}"
+        elif operator in ("^", "~", "="):
+            raise ValueError(f"Nieprawidłowy specyfikator PEP 440: {specifier!r}")
+
+        clauses.append(clause)
+
+    if not clauses:
+        return "*"
+
+    # Sprawdzamy całość w składni PEP 440 przed tłumaczeniem
+    _validate(",".join(_split_clauses(specifier)), specifier)
+
+    return sys.intern(",".join(clauses))
+
+
+def clear_cache() -> None:
+    """Czyści zapamiętane tłumaczenia ograniczeń."""
+    poetry_to_pep440.cache_clear()
+    pep440_to_poetry.cache_clear()
@@ -2,9 +2,14 @@
 Rejestr konwerterów umożliwiający dynamiczne rejestrowanie i odnajdywanie dostępnych konwerterów.
 """
 
-from typing import Dict, List, Optional, Set, Tuple, Type
+import heapq
+import itertools
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, Tuple, Type, Union
 
 from spectomate.core.base_converter import BaseConverter
+from spectomate.core.detect import detect_format
+from spectomate.core.pipeline import compile_pipeline, run_fan_out
 
 
 class ConverterRegistry:
@@ -14,6 +19,20 @@ class ConverterRegistry:
 
     _converters: Dict[Tuple[str, str], Type[BaseConverter]] = {}
 
+    # Pamięć podręczna skompilowanych tras wieloetapowych (również nieudanych)
+    _pipelines: Dict[Tuple[str, str], Optional[Type[BaseConverter]]] = {}
+
+    @staticmethod
+    def _load_builtin_converters() -> None:
+        """
+        Importuje wbudowane konwertery, które rejestrują się przy imporcie.
+
+        Pakiet spectomate nie importuje konwerterów przy starcie (aby lekki
+        klient demona uruchamiał się szybko), więc rejestr ładuje je przy
+        pierwszym użyciu. Kolejne wywołania kosztują tylko sprawdzenie sys.modules.
+        """
+        import spectomate.converters  # noqa: F401
+
     @classmethod
     def register(cls, converter_class: Type[BaseConverter]) -> None:
         """
@@ -28,6 +47,9 @@ class ConverterRegistry:
 
         cls._converters[key] = converter_class
 
+        # Nowy konwerter może zmienić najtańsze trasy
+        cls._pipelines.clear()
+
     @classmethod
     def get_converter(
         cls, source_format: str, target_format: str
@@ -35,6 +57,9 @@ class ConverterRegistry:
         """
         Zwraca klasę konwertera dla podanej pary formatów.
 
+        Jeśli nie istnieje konwerter bezpośredni, zwracana jest klasa konwertera
+        wieloetapowego realizującego najtańszą trasę między formatami.
+
         Args:
             source_format: Format źródłowy
             target_format: Format docelowy
@@ -42,8 +67,79 @@ class ConverterRegistry:
         Returns:
             Klasa konwertera lub None jeśli nie znaleziono
         """
+        cls._load_builtin_converters()
+
         key = (source_format, target_format)
-        return cls._converters.get(key)
+
+        converter_class = cls._converters.get(key)
+        if converter_class is not None:
+            return converter_class
+
+        if key not in cls._pipelines:
+            route = cls.find_route(source_format, target_format)
+            cls._pipelines[key] = compile_pipeline(route) if route else None
+
+        return cls._pipelines[key]
+
+    @classmethod
+    def find_route(
+        cls, source_format: str, target_format: str
+    ) -> Optional[List[Type[BaseConverter]]]:
+        """
+        Wyznacza najtańszą trasę konwersji w grafie formatów.
+
+        Formaty są wierzchołkami grafu, a zarejestrowane konwertery krawędziami
+        o wadze równej ich atrybutowi conversion_cost (algorytm Dijkstry).
+
+        Args:
+            source_format: Format źródłowy
+            target_format: Format docelowy
+
+        Returns:
+            Lista klas konwerterów w kolejności wykonywania lub None,
+            jeśli trasa nie istnieje
+        """
+        cls._load_builtin_converters()
+
+        if source_format == target_format:
+            return None
+
+        edges: Dict[str, List[Type[BaseConverter]]] = {}
+        for (source, _), converter_class in cls._converters.items():
+            edges.setdefault(source, []).append(converter_class)
+
+        # Kolejka: (koszt, liczba etapów, format, kolejność dodania, trasa);
+        # kolejność dodania rozstrzyga remisy, zanim heapq porówna trasy
+        # (klas konwerterów nie da się porównywać)
+        order = itertools.count()
+        queue: List[Tuple[int, int, str, int, List[Type[BaseConverter]]]] = [
+            (0, 0, source_format, next(order), [])
+        ]
+        visited: Set[str] = set()
+
+        while queue:
+            cost, hops, current, _, route = heapq.heappop(queue)
+            if current == target_format:
+                return route
+            if current in visited:
+                continue
+            visited.add(current)
+
+            for converter_class in edges.get(current, []):
+                next_format = converter_class.get_target_format()
+                if next_format not in visited:
+                    heapq.heappush(
+                        queue,
+                        (
+                            cost + converter_class.conversion_cost,
+                            hops + 1,
+                            next_format,
+                            next(order),
+                            route + [converter_class],
+                        ),
+                    )
+
+        return None
 
     @classmethod
     def get_converters(
@@ -59,6 +155,8 @@ class ConverterRegistry:
         Returns:
             Lista konwerterów spełniających kryteria
         """
+        cls._load_builtin_converters()
+
         converters = []
 
         for (source, target), converter_class in cls._converters.items():
@@ -78,6 +176,8 @@ class ConverterRegistry:
         Returns:
             Zbiór nazw formatów źródłowych
         """
+        cls._load_builtin_converters()
+
         return {source for source, _ in cls._converters.keys()}
 
     @classmethod
@@ -88,6 +188,8 @@ class ConverterRegistry:
         Returns:
             Zbiór nazw formatów docelowych
         """
+        cls._load_builtin_converters()
+
         return {target for _, target in cls._converters.keys()}
 
     @classmethod
@@ -140,6 +242,75 @@ class ConverterRegistry:
         """
         return cls.get_converter(source_format, target_format) is not None
 
+    @classmethod
+    def convert_many(
+        cls,
+        source_format: str,
+        source_file: Union[str, Path],
+        targets: Sequence[Tuple[str, Union[str, Path]]],
+        options: Optional[Dict[str, Any]] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[BaseConverter]:
+        """
+        Konwertuje jeden plik źródłowy do kilku formatów docelowych.
+
+        Plik źródłowy jest parsowany tylko raz, a pliki docelowe są zapisywane
+        równolegle.
+
+        Args:
+            source_format: Format źródłowy
+            source_file: Ścieżka do pliku źródłowego
+            targets: Lista par (format docelowy, ścieżka do pliku docelowego)
+            options: Opcje przekazywane do wszystkich konwerterów
+            max_workers: Maksymalna liczba równoległych wątków
+
+        Returns:
+            Wykonane konwertery, w kolejności celów (ścieżka zapisanego pliku
+            w target_file, a status zapisu w write_status)
+        """
+        converters = []
+
+        for target_format, target_file in targets:
+            converter_class = cls.get_converter(source_format, target_format)
+            if converter_class is None:
+                raise ValueError(
+                    f"Nie znaleziono konwertera z formatu {source_format} "
+                    f"do {target_format}"
+                )
+            converters.append(
+                converter_class(
+                    source_file=source_file, target_file=target_file, options=options
+                )
+            )
+
+        run_fan_out(converters, max_workers=max_workers)
+
+        return converters
+
+    @classmethod
+    def detect_format(
+        cls,
+        file_path: Optional[Union[str, Path]] = None,
+        content: Optional[Union[str, bytes]] = None,
+    ) -> Optional[str]:
+        """
+        Wykrywa format pliku na podstawie nazwy i początku zawartości.
+
+        Zwracane są tylko formaty, dla których istnieje konwerter źródłowy,
+        dzięki czemu wynik można od razu przekazać do get_converter().
+
+        Args:
+            file_path: Ścieżka do pliku (opcjonalnie)
+            content: Zawartość pliku (opcjonalnie)
+
+        Returns:
+            Identyfikator formatu lub None, jeśli nie udało się go rozpoznać
+        """
+        format_name = detect_format(file_path, content)
+        if format_name is None or format_name not in cls.get_source_formats():
+            return None
+        return format_name
+
 
 def register_converter(converter_class: Type[BaseConverter]) -> Type[BaseConverter]:
     """
@@ -0,0 +1,854 @@
+"""
+Moduł rozwiązujący zależności bez dostępu do sieci, na podstawie lokalnej kopii indeksu.
+
+Obsługiwane są dwa rodzaje kopii indeksu:
+
+* katalog w układzie "simple API" (PEP 503): <katalog>/<projekt>/index.html
+  z odnośnikami do plików dystrybucji. Zależności są czytane z plików
+  <plik>.metadata (PEP 658) lub z pliku METADATA wewnątrz lokalnego pliku wheel.
+* plik JSON z metadanymi w postaci:
+
+      {"packages": {"requests": {"2.31.0": {"requires_dist": ["idna<4,>=2.5"],
+                                             "requires_python": ">=3.7",
+                                             "yanked": false}}}}
+
+Resolver wybiera najnowsze wersje spełniające wszystkie ograniczenia
+i wycofuje się (backtracking), gdy wybór prowadzi do konfliktu. Jako kolejny
+rozwiązywany jest zawsze pakiet o najmniejszej liczbie kandydatów, a listy
+kandydatów, przecięcia specyfikatorów i wyniki markerów są zapamiętywane.
+Po konflikcie resolver wraca od razu do decyzji, która się do niego
+przyczyniła (backjumping), a pakiety biorące udział w konfliktach rozwiązuje
+w dalszej kolejności przed pozostałymi.
+"""
+
+import functools
+import html.parser
+import json
+import zipfile
+from email.message import Message
+from email.parser import HeaderParser
+from pathlib import Path
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
+from urllib.parse import unquote, urlparse
+
+from packaging.markers import Marker, default_environment
+from packaging.requirements import InvalidRequirement
+from packaging.requirements import Requirement as PackagingRequirement
+
+from spectomate.core.ir import Requirement
+from spectomate.core.name_mapping import normalize_pip_name
+from spectomate.core.versions import (
+    parse_specifier,
+    parse_version,
+    sort_versions,
+    try_version_key,
+)
+
+# Domyślny limit prób przypięcia wersji, po którym resolver się poddaje
+DEFAULT_MAX_ROUNDS = 200000
+
+# Rozszerzenia plików dystrybucji źródłowych
+_SDIST_EXTENSIONS = (".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".zip")
+
+# Rodzic wymagań pochodzących bezpośrednio z pliku projektu
+_ROOT = "<projekt>"
+
+
+class ResolutionError(Exception):
+    """
+    Błąd zgłaszany, gdy nie istnieje zestaw wersji spełniający wymagania.
+    """
+
+
+class Release:
+    """
+    Pojedyncza wersja projektu w kopii indeksu.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        requires_dist: Optional[List[str]] = None,
+        requires_python: str = "",
+        yanked: bool = False,
+        metadata_files: Tuple[Path, ...] = (),
+    ):
+        """
+        Inicjalizuje wersję projektu.
+
+        Args:
+            version: Wersja
+            requires_dist: Zależności (wiersze Requires-Dist); None oznacza, że
+                zostaną wczytane z metadata_files przy pierwszym użyciu
+            requires_python: Specyfikator obsługiwanych wersji Pythona
+            yanked: Czy wersja została wycofana
+            metadata_files: Pliki .metadata lub .whl z metadanymi wersji
+        """
+        self.version = version
+        self.requires_python = requires_python
+        self.yanked = yanked
+        self._requires_dist = requires_dist
+        self._metadata_files = metadata_files
+
+    @property
+    def requires_dist(self) -> List[str]:
+        """Zależności wersji, wczytywane leniwie z plików metadanych."""
+        if self._requires_dist is None:
+            self._requires_dist = []
+            for path in self._metadata_files:
+                metadata = _read_metadata(path)
+                if metadata is not None:
+                    self._requires_dist = metadata.get_all("Requires-Dist") or []
+                    break
+        return self._requires_dist
+
+    @property
+    def has_metadata(self) -> bool:
+        """Czy znane są zależności wersji."""
+        return self._requires_dist is not None or bool(self._metadata_files)
+
+
+def _read_metadata(path: Path) -> Optional[Message]:
+    """
+    Czyta metadane pakietu z pliku .metadata lub z pliku wheel.
+
+    Args:
+        path: Ścieżka do pliku .metadata lub .whl
+
+    Returns:
+        Nagłówki metadanych lub None w razie błędu
+    """
+    try:
+        if path.suffix == ".whl":
+            with zipfile.ZipFile(path) as wheel:
+                name = next(
+                    item
+                    for item in wheel.namelist()
+                    if item.endswith(".dist-info/METADATA") and item.count("/") == 1
+                )
+                text = wheel.read(name).decode("utf-8", errors="replace")
+        else:
+            text = path.read_text(encoding="utf-8", errors="replace")
+    except (OSError, StopIteration, zipfile.BadZipFile):
+        return None
+
+    return HeaderParser().parsestr(text)
+
+
+def _version_from_filename(filename: str) -> Optional[str]:
+    """
+    Odczytuje wersję z nazwy pliku wheel lub dystrybucji źródłowej.
+
+    Args:
+        filename: Nazwa pliku (np. "requests-2.31.0-py3-none-any.whl")
+
+    Returns:
+        Wersja lub None, jeśli nazwa nie jest nazwą pliku dystrybucji
+    """
+    if filename.endswith(".whl"):
+        parts = filename[:-4].split("-")
+        return parts[1] if len(parts) >= 5 else None
+
+    for extension in _SDIST_EXTENSIONS:
+        if filename.endswith(extension):
+            stem = filename[: -len(extension)]
+            if "-" in stem:
+                return stem.rsplit("-", 1)[1]
+    return None
+
+
+class _SimpleIndexParser(html.parser.HTMLParser):
+    """
+    Parser strony projektu w formacie simple API (PEP 503).
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.links: List[Dict[str, Optional[str]]] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]):
+        if tag == "a":
+            self.links.append(dict(attrs))
+
+
+class PackageIndex:
+    """
+    Lokalna kopia indeksu pakietów (tylko do odczytu).
+    """
+
+    def __init__(
+        self,
+        projects: Optional[Dict[str, Dict[str, Release]]] = None,
+        simple_dir: Optional[Path] = None,
+    ):
+        """
+        Inicjalizuje indeks.
+
+        Args:
+            projects: Wersje projektów: znormalizowana nazwa -> wersja -> Release
+            simple_dir: Katalog simple API, z którego projekty są wczytywane
+                przy pierwszym użyciu
+        """
+        self._projects: Dict[str, Optional[Dict[str, Release]]] = dict(projects or {})
+        self._simple_dir = simple_dir
+        self._versions: Dict[str, List[str]] = {}
+
+    @classmethod
+    def from_json(cls, path: Union[str, Path]) -> "PackageIndex":
+        """
+        Wczytuje indeks z pliku JSON z metadanymi.
+
+        Args:
+            path: Ścieżka do pliku JSON
+
+        Returns:
+            Indeks pakietów
+
+        Raises:
+            ValueError: Jeśli plik ma nieprawidłowy format
+        """
+        try:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Błąd parsowania indeksu {path}: {e}")
+
+        packages = data.get("packages", data) if isinstance(data, dict) else None
+        if not isinstance(packages, dict):
+            raise ValueError(f"Nieprawidłowy format indeksu {path}")
+
+        projects: Dict[str, Dict[str, Release]] = {}
+        for name, releases in packages.items():
+            project = projects.setdefault(normalize_pip_name(name), {})
+            for version, info in releases.items():
+                info = info or {}
+                project[version] = Release(
+                    version,
+                    requires_dist=list(info.get("requires_dist") or []),
+                    requires_python=info.get("requires_python") or "",
+                    yanked=bool(info.get("yanked", False)),
+                )
+
+        return cls(projects)
+
+    @classmethod
+    def from_simple_directory(cls, path: Union[str, Path]) -> "PackageIndex":
+        """
+        Otwiera katalog w układzie simple API (projekty są wczytywane leniwie).
+
+        Args:
+            path: Katalog z podkatalogami projektów
+
+        Returns:
+            Indeks pakietów
+        """
+        return cls(simple_dir=Path(path))
+
+    @classmethod
+    def open(cls, path: Union[str, Path]) -> "PackageIndex":
+        """
+        Otwiera kopię indeksu: katalog simple API lub plik JSON.
+
+        Args:
+            path: Ścieżka do katalogu lub pliku JSON
+
+        Returns:
+            Indeks pakietów
+
+        Raises:
+            FileNotFoundError: Jeśli ścieżka nie istnieje
+        """
+        path = Path(path)
+        if path.is_dir():
+            return cls.from_simple_directory(path)
+        if not path.exists():
+            raise FileNotFoundError(f"Indeks nie istnieje: {path}")
+        return cls.from_json(path)
+
+    def _load_simple_project(self, key: str) -> Optional[Dict[str, Release]]:
+        """
+        Wczytuje wersje projektu ze strony simple API.
+
+        Args:
+            key: Znormalizowana nazwa projektu
+
+        Returns:
+            Wersje projektu lub None, jeśli projekt nie istnieje
+        """
+        if self._simple_dir is None:
+            return None
+
+        page = self._simple_dir / key / "index.html"
+        try:
+            content = page.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            return None
+
+        parser = _SimpleIndexParser()
+        parser.feed(content)
+
+        files: Dict[str, List[Dict[str, Optional[str]]]] = {}
+        for link in parser.links:
+            href = link.get("href")
+            if not href:
+                continue
+            filename = unquote(urlparse(href).path.rsplit("/", 1)[-1])
+            version = _version_from_filename(filename)
+            if version is not None and try_version_key(version) is not None:
+                files.setdefault(version, []).append(link)
+
+        project = {}
+        for version, links in files.items():
+            metadata_files = []
+            for link in links:
+                target = urlparse(link["href"] or "")
+                if target.scheme not in ("", "file"):
+                    continue
+                local = (page.parent / unquote(target.path)).resolve()
+                if (
+                    link.get("data-core-metadata") is not None
+                    or link.get("data-dist-info-metadata") is not None
+                    or local.with_name(local.name + ".metadata").exists()
+                ):
+                    metadata_files.append(local.with_name(local.name + ".metadata"))
+                if local.suffix == ".whl" and local.exists():
+                    metadata_files.append(local)
+
+            project[version] = Release(
+                version,
+                requires_python=links[0].get("data-requires-python") or "",
+                yanked=all(link.get("data-yanked") is not None for link in links),
+                metadata_files=tuple(metadata_files),
+            )
+
+        return project
+
+    def project_names(self) -> List[str]:
+        """
+        Zwraca znormalizowane nazwy wszystkich projektów w indeksie.
+
+        Returns:
+            Posortowana lista nazw
+        """
+        names = {key for key, project in self._projects.items() if project}
+        if self._simple_dir is not None:
+            names.update(
+                page.parent.name for page in self._simple_dir.glob("*/index.html")
+            )
+        return sorted(names)
+
+    def get_project(self, name: str) -> Optional[Dict[str, Release]]:
+        """
+        Zwraca wersje projektu.
+
+        Args:
+            name: Nazwa projektu
+
+        Returns:
+            Słownik wersja -> Release lub None, jeśli projektu nie ma w indeksie
+        """
+        key = normalize_pip_name(name)
+        if key not in self._projects:
+            self._projects[key] = self._load_simple_project(key)
+        return self._projects[key]
+
+    def versions(self, name: str) -> List[str]:
+        """
+        Zwraca wersje projektu od najnowszej (lista jest zapamiętywana).
+
+        Args:
+            name: Nazwa projektu
+
+        Returns:
+            Lista wersji (pusta, jeśli projektu nie ma w indeksie)
+        """
+        key = normalize_pip_name(name)
+        if key not in self._versions:
+            project = self.get_project(key) or {}
+            self._versions[key] = sort_versions(project, reverse=True)
+        return self._versions[key]
+
+    def release(self, name: str, version: str) -> Release:
+        """
+        Zwraca wersję projektu.
+
+        Args:
+            name: Nazwa projektu
+            version: Wersja
+
+        Returns:
+            Obiekt Release
+        """
+        return (self.get_project(name) or {})[version]
+
+
+@functools.lru_cache(maxsize=65536)
+def _parse_dependency(line: str) -> Optional[PackagingRequirement]:
+    """
+    Parsuje wiersz Requires-Dist (wyniki są zapamiętywane).
+
+    Args:
+        line: Wiersz Requires-Dist
+
+    Returns:
+        Sparsowane wymaganie lub None, jeśli wiersz jest nieprawidłowy
+    """
+    try:
+        return PackagingRequirement(line)
+    except InvalidRequirement:
+        return None
+
+
+@functools.lru_cache(maxsize=65536)
+def _intersect(specifiers: FrozenSet[str]) -> str:
+    """
+    Łączy specyfikatory w jeden kanoniczny specyfikator (wyniki są zapamiętywane).
+
+    Args:
+        specifiers: Specyfikatory PEP 440
+
+    Returns:
+        Specyfikator będący koniunkcją wszystkich podanych
+    """
+    return str(parse_specifier(",".join(spec for spec in specifiers if spec)))
+
+
+@functools.lru_cache(maxsize=65536)
+def _satisfies(version: str, specifier: str) -> bool:
+    """
+    Sprawdza, czy wersja spełnia specyfikator (wyniki są zapamiętywane).
+
+    Wersje przedpremierowe są dopuszczane, bo sprawdzane są wersje już wybrane.
+
+    Args:
+        version: Wersja
+        specifier: Specyfikator PEP 440
+
+    Returns:
+        True, jeśli wersja spełnia specyfikator
+    """
+    return parse_specifier(specifier).contains(parse_version(version), prereleases=True)
+
+
+class _State:
+    """
+    Stan rozwiązywania: przypięte wersje i zebrane ograniczenia.
+    """
+
+    __slots__ = ("pins", "constraints", "specifiers", "extras", "pending")
+
+    def __init__(self) -> None:
+        # Znormalizowana nazwa -> przypięta wersja
+        self.pins: Dict[str, str] = {}
+        # Znormalizowana nazwa -> krotka (nazwa wymagającego pakietu, specyfikator)
+        self.constraints: Dict[str, Tuple[Tuple[str, str], ...]] = {}
+        # Znormalizowana nazwa -> przecięcie wszystkich ograniczeń
+        self.specifiers: Dict[str, str] = {}
+        # Znormalizowana nazwa -> wymagane dodatki
+        self.extras: Dict[str, FrozenSet[str]] = {}
+        # Pakiety wymagane, ale jeszcze nieprzypięte
+        self.pending: Set[str] = set()
+
+    def copy(self) -> "_State":
+        """Zwraca płytką kopię stanu."""
+        state = _State()
+        state.pins = dict(self.pins)
+        state.constraints = dict(self.constraints)
+        state.specifiers = dict(self.specifiers)
+        state.extras = dict(self.extras)
+        state.pending = set(self.pending)
+        return state
+
+
+class Resolver:
+    """
+    Resolver zależności działający na lokalnej kopii indeksu.
+    """
+
+    def __init__(
+        self,
+        index: PackageIndex,
+        python_version: Optional[str] = None,
+        prereleases: bool = False,
+        max_rounds: int = DEFAULT_MAX_ROUNDS,
+    ):
+        """
+        Inicjalizuje resolver.
+
+        Args:
+            index: Kopia indeksu pakietów
+            python_version: Docelowa wersja Pythona (domyślnie bieżąca)
+            prereleases: Czy dopuszczać wersje przedpremierowe
+            max_rounds: Limit prób przypięcia wersji
+        """
+        self.index = index
+        self.prereleases = prereleases
+        self.max_rounds = max_rounds
+        self.warnings: List[str] = []
+
+        self.environment = default_environment()
+        if python_version:
+            self.environment["python_full_version"] = python_version
+            self.environment["python_version"] = ".".join(python_version.split(".")[:2])
+        self.python_version = self.environment["python_full_version"]
+
+        self._candidates: Dict[Tuple[str, str], Tuple[str, ...]] = {}
+        self._dependencies: Dict[
+            Tuple[str, str, FrozenSet[str]], Tuple[Requirement, ...]
+        ] = {}
+        self._markers: Dict[Tuple[str, str], bool] = {}
+
+        # Opis ostatniego konfliktu i pakiety, których wybór do niego doprowadził
+        self._conflict = ""
+        self._culprits: Set[str] = set()
+
+    def _marker_matches(self, marker: str, extra: str = "") -> bool:
+        """
+        Sprawdza marker środowiskowy w docelowym środowisku (wyniki są zapamiętywane).
+
+        Args:
+            marker: Marker środowiskowy
+            extra: Wartość zmiennej "extra"
+
+        Returns:
+            True, jeśli marker jest spełniony
+        """
+        key = (marker, extra)
+        if key not in self._markers:
+            environment = dict(self.environment, extra=extra)
+            self._markers[key] = Marker(marker).evaluate(environment)
+        return self._markers[key]
+
+    def candidates(self, key: str, specifier: str) -> Tuple[str, ...]:
+        """
+        Zwraca wersje pakietu spełniające specyfikator, od najnowszej.
+
+        Pomijane są wersje wycofane (chyba że przypięte operatorem "==")
+        i wymagające innej wersji Pythona. Listy są zapamiętywane.
+
+        Args:
+            key: Znormalizowana nazwa pakietu
+            specifier: Specyfikator PEP 440
+
+        Returns:
+            Krotka wersji
+        """
+        cache_key = (key, specifier)
+        if cache_key in self._candidates:
+            return self._candidates[cache_key]
+
+        spec = parse_specifier(specifier)
+        project = self.index.get_project(key) or {}
+        versions = [
+            version
+            for version in self.index.versions(key)
+            if (not project[version].yanked or "==" in specifier)
+            and (
+                not project[version].requires_python
+                or _satisfies(self.python_version, project[version].requires_python)
+            )
+        ]
+
+        allowed = {
+            str(version)
+            for version in spec.filter(
+                [parse_version(version) for version in versions],
+                prereleases=self.prereleases or None,
+            )
+        }
+        result = tuple(
+            version for version in versions if str(parse_version(version)) in allowed
+        )
+
+        self._candidates[cache_key] = result
+        return result
+
+    def dependencies(
+        self, key: str, version: str, extras: FrozenSet[str]
+    ) -> Tuple[Requirement, ...]:
+        """
+        Zwraca zależności wersji pakietu w docelowym środowisku.
+
+        Args:
+            key: Znormalizowana nazwa pakietu
+            version: Wersja
+            extras: Wymagane dodatki pakietu
+
+        Returns:
+            Krotka wymagań
+        """
+        cache_key = (key, version, extras)
+        if cache_key in self._dependencies:
+            return self._dependencies[cache_key]
+
+        release = self.index.release(key, version)
+        if not release.has_metadata:
+            self.warnings.append(
+                f"Brak metadanych pakietu {key}=={version}, "
+                "jego zależności nie zostały uwzględnione"
+            )
+
+        requirements = []
+        for line in release.requires_dist:
+            parsed = _parse_dependency(line)
+            if parsed is None:
+                continue
+            if parsed.marker is not None and not any(
+                self._marker_matches(str(parsed.marker), extra)
+                for extra in ("",) + tuple(sorted(extras))
+            ):
+                continue
+            requirements.append(
+                Requirement(
+                    parsed.name,
+                    specifier=str(parsed.specifier),
+                    extras=parsed.extras,
+                    url=parsed.url or "",
+                )
+            )
+
+        result = tuple(requirements)
+        self._dependencies[cache_key] = result
+        return result
+
+    def _add(self, state: _State, requirement: Requirement, parent: str) -> bool:
+        """
+        Dodaje wymaganie do stanu i sprawdza zgodność z przypiętymi wersjami.
+
+        Args:
+            state: Stan rozwiązywania (modyfikowany)
+            requirement: Wymaganie
+            parent: Znormalizowana nazwa pakietu, który zgłosił wymaganie
+
+        Returns:
+            False, jeśli wymaganie jest sprzeczne z przypiętą wersją
+        """
+        key = requirement.key
+        state.constraints[key] = state.constraints.get(key, ()) + (
+            (parent, requirement.specifier),
+        )
+        state.specifiers[key] = _intersect(
+            frozenset((state.specifiers.get(key, ""), requirement.specifier))
+        )
+
+        known_extras = state.extras.get(key, frozenset())
+        new_extras = frozenset(requirement.extras) - known_extras
+        if new_extras:
+            state.extras[key] = known_extras | new_extras
+
+        if key not in state.pins:
+            state.pending.add(key)
+            return True
+
+        version = state.pins[key]
+        if not _satisfies(version, state.specifiers[key]):
+            self._conflict = self._describe(state, key, f"przypięto {version}")
+            self._culprits = {key, parent} | self._restricting_parents(
+                state, key, requirement.specifier
+            )
+            return False
+
+        if new_extras:
+            # Nowe dodatki już przypiętego pakietu wnoszą nowe zależności
+            known = set(self.dependencies(key, version, known_extras))
+            for dependency in self.dependencies(key, version, state.extras[key]):
+                if dependency not in known and not self._add(state, dependency, key):
+                    return False
+
+        return True
+
+    def _pin(self, state: _State, key: str, version: str) -> Optional[_State]:
+        """
+        Przypina wersję pakietu i dodaje jej zależności.
+
+        Args:
+            state: Stan rozwiązywania (niemodyfikowany)
+            key: Znormalizowana nazwa pakietu
+            version: Wersja
+
+        Returns:
+            Nowy stan lub None, jeśli wersja prowadzi do konfliktu
+        """
+        new_state = state.copy()
+        new_state.pins[key] = version
+        new_state.pending.discard(key)
+
+        extras = new_state.extras.get(key, frozenset())
+        for dependency in self.dependencies(key, version, extras):
+            if not self._add(new_state, dependency, key):
+                return None
+
+        return new_state
+
+    def _restricting_parents(self, state: _State, key: str, specifier: str) -> Set[str]:
+        """
+        Zwraca pakiety, których ograniczenia są sprzeczne z nowym specyfikatorem.
+
+        Zmiana pozostałych pakietów nie usunie konfliktu, więc nie muszą być
+        brane pod uwagę przy wycofywaniu się.
+
+        Args:
+            state: Stan rozwiązywania
+            key: Znormalizowana nazwa pakietu
+            specifier: Nowe ograniczenie sprzeczne z dotychczasowymi
+
+        Returns:
+            Zbiór znormalizowanych nazw pakietów
+        """
+        parents = set()
+        for parent, spec in state.constraints.get(key, ()):
+            if not spec or parent in parents:
+                continue
+            if not self.candidates(key, _intersect(frozenset((spec, specifier)))):
+                parents.add(parent)
+
+        if not parents:
+            # Konflikt wynika dopiero z połączenia kilku ograniczeń
+            specs = frozenset(spec for _, spec in state.constraints.get(key, ()))
+            if not self.candidates(key, _intersect(specs | {specifier})):
+                parents = {parent for parent, spec in state.constraints[key] if spec}
+        return parents
+
+    def _describe(self, state: _State, key: str, reason: str) -> str:
+        """
+        Opisuje konflikt ograniczeń pakietu.
+
+        Args:
+            state: Stan rozwiązywania
+            key: Znormalizowana nazwa pakietu
+            reason: Przyczyna konfliktu
+
+        Returns:
+            Opis konfliktu
+        """
+        required = ", ".join(
+            f"{parent if parent == _ROOT else f'{parent}=={state.pins.get(parent)}'}"
+            f" wymaga {spec or 'dowolnej wersji'}"
+            for parent, spec in state.constraints.get(key, ())
+        )
+        return f"{key}: {reason} ({required})"
+
+    def resolve(self, requirements: List[Requirement]) -> Dict[str, str]:
+        """
+        Wyznacza wersje wszystkich pakietów potrzebnych do spełnienia wymagań.
+
+        Args:
+            requirements: Wymagania projektu
+
+        Returns:
+            Słownik znormalizowana nazwa pakietu -> wersja, posortowany po nazwie
+
+        Raises:
+            ResolutionError: Jeśli wymagań nie da się spełnić
+        """
+        state = _State()
+        for requirement in requirements:
+            if requirement.marker and not self._marker_matches(requirement.marker):
+                continue
+            if requirement.url:
+                self.warnings.append(
+                    f"Pakiet {requirement.name} instalowany z adresu "
+                    f"{requirement.url} nie został rozwiązany"
+                )
+                continue
+            self._add(state, requirement, _ROOT)
+
+        # Ramki decyzji: stan przed decyzją, pakiet, pozostałe wersje i pakiety,
+        # których wybór doprowadził do odrzucenia dotychczasowych wersji
+        stack: List[Tuple[_State, str, Iterator[str], Set[str]]] = []
+        rounds = 0
+        conflicted: Set[str] = set()
+
+        while state.pending:
+            # Najpierw pakiety, które brały udział w konfliktach (dzięki temu
+            # ograniczenia górne są uwzględniane przed przypięciem pakietu),
+            # a spośród pozostałych - pakiet o najmniejszej liczbie kandydatów
+            key = min(
+                state.pending,
+                key=lambda name: (
+                    name not in conflicted,
+                    len(self.candidates(name, state.specifiers[name])),
+                    name,
+                ),
+            )
+            candidates = self.candidates(key, state.specifiers[key])
+            if not candidates:
+                reason = (
+                    "brak wersji spełniających wymagania"
+                    if self.index.versions(key)
+                    else "pakietu nie ma w indeksie"
+                )
+                self._conflict = self._describe(state, key, reason)
+            stack.append((state, key, iter(candidates), set()))
+
+            # Szukamy pierwszej wersji bez konfliktu, w razie potrzeby cofając się
+            # do wcześniejszych decyzji
+            while stack:
+                base, key, versions, culprits = stack[-1]
+                for version in versions:
+                    rounds += 1
+                    if rounds > self.max_rounds:
+                        raise ResolutionError(
+                            f"Przekroczono limit {self.max_rounds} prób; "
+                            f"ostatni konflikt: {self._conflict}"
+                        )
+                    new_state = self._pin(base, key, version)
+                    if new_state is not None:
+                        state = new_state
+                        break
+                    culprits |= self._culprits
+                    conflicted.update(self._culprits)
+                else:
+                    # Żadna wersja nie pasuje: wracamy od razu do ostatniej decyzji,
+                    # która przyczyniła się do konfliktu (backjumping), pomijając
+                    # decyzje niezwiązane z nim. Do przyczyn należą wszystkie
+                    # pakiety wymagające tego pakietu - od nich zależy, czy jest
+                    # w ogóle potrzebny, jakie ma wersje i z jakimi dodatkami
+                    stack.pop()
+                    culprits.update(
+                        parent for parent, _ in base.constraints.get(key, ())
+                    )
+                    culprits.discard(key)
+                    while stack and stack[-1][1] not in culprits:
+                        stack.pop()
+                    if stack:
+                        stack[-1][3].update(culprits)
+                    continue
+                break
+            else:
+                raise ResolutionError(
+                    f"Nie udało się rozwiązać zależności: {self._conflict}"
+                )
+
+        return dict(sorted(state.pins.items()))
+
+
+def resolve(
+    requirements: List[Requirement],
+    index: PackageIndex,
+    python_version: Optional[str] = None,
+    prereleases: bool = False,
+    warnings: Optional[List[str]] = None,
+) -> Dict[str, str]:
+    """
+    Wyznacza przypięte wersje pakietów dla wymagań projektu.
+
+    Args:
+        requirements: Wymagania projektu
+        index: Kopia indeksu pakietów
+        python_version: Docelowa wersja Pythona (domyślnie bieżąca)
+        prereleases: Czy dopuszczać wersje przedpremierowe
+        warnings: Lista, do której dopisywane są ostrzeżenia
+
+    Returns:
+        Słownik znormalizowana nazwa pakietu -> wersja
+
+    Raises:
+        ResolutionError: Jeśli wymagań nie da się spełnić
+    """
+    resolver = Resolver(index, python_version=python_version, prereleases=prereleases)
+    try:
+        return resolver.resolve(requirements)
+    finally:
+        if warnings is not None:
+            warnings.extend(resolver.warnings)
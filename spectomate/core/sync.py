@@ -0,0 +1,358 @@
+"""
+Moduł synchronizujący pliki zależności wyprowadzane z jednego pliku głównego.
+
+Konfiguracja znajduje się w sekcji [tool.spectomate.sync] pliku pyproject.toml:
+
+    [tool.spectomate.sync]
+    source = "pyproject.toml"
+    source-format = "poetry"        # opcjonalnie, domyślnie wykrywany
+    state-file = ".spectomate-sync.json"  # opcjonalnie
+
+    [[tool.spectomate.sync.targets]]
+    file = "requirements.txt"
+    format = "pip"
+    options = { include_dev = true }
+
+Stan ostatniej synchronizacji (skróty plików i opcji) jest zapisywany w pliku
+stanu, dzięki czemu ponownie uruchamiane są tylko konwersje, których wejście
+lub wynik się zmienił.
+"""
+
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import toml
+
+from spectomate.core.utils import WRITE_UNCHANGED, write_text_if_changed
+
+# Wersja formatu pliku stanu
+SYNC_STATE_VERSION = 1
+
+# Domyślna nazwa pliku stanu (względem katalogu pliku konfiguracyjnego)
+DEFAULT_STATE_FILE = ".spectomate-sync.json"
+
+# Zapamiętany skrót pliku zmienionego tuż przed jego obliczeniem nie jest
+# używany: kolejna zmiana w tym samym takcie zegara systemu plików mogłaby nie
+# zmienić rozmiaru ani mtime
+_RACY_WINDOW_NS = 2_000_000_000
+
+
+class SyncTarget:
+    """
+    Plik wyprowadzany z pliku głównego.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        file: Path,
+        format: str,
+        options: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Inicjalizacja celu synchronizacji.
+
+        Args:
+            name: Ścieżka pliku w postaci z konfiguracji (klucz w pliku stanu)
+            file: Ścieżka do pliku docelowego
+            format: Format pliku docelowego
+            options: Opcje konwertera
+        """
+        self.name = name
+        self.file = file
+        self.format = format
+        self.options = options or {}
+
+
+class SyncConfig:
+    """
+    Konfiguracja synchronizacji odczytana z sekcji [tool.spectomate.sync].
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        source: Path,
+        targets: List[SyncTarget],
+        source_format: Optional[str] = None,
+        state_file: Optional[Path] = None,
+    ):
+        """
+        Inicjalizacja konfiguracji.
+
+        Args:
+            root: Katalog, względem którego rozwiązywane są ścieżki
+            source: Ścieżka do pliku głównego
+            targets: Pliki wyprowadzane z pliku głównego
+            source_format: Format pliku głównego (None - wykrywany automatycznie)
+            state_file: Ścieżka do pliku stanu
+        """
+        self.root = root
+        self.source = source
+        self.source_name = Path(os.path.relpath(source, root)).as_posix()
+        self.targets = targets
+        self.source_format = source_format
+        self.state_file = state_file or root / DEFAULT_STATE_FILE
+
+
+class SyncResult:
+    """
+    Wynik synchronizacji.
+    """
+
+    def __init__(self) -> None:
+        self.stale: List[SyncTarget] = []
+        self.updated: List[SyncTarget] = []
+        self.unchanged: List[SyncTarget] = []
+        self.fresh: List[SyncTarget] = []
+
+
+def load_sync_config(config_file: Union[str, Path]) -> SyncConfig:
+    """
+    Odczytuje konfigurację synchronizacji z pliku pyproject.toml.
+
+    Args:
+        config_file: Ścieżka do pliku pyproject.toml
+
+    Returns:
+        Konfiguracja synchronizacji
+    """
+    config_file = Path(config_file)
+
+    if not config_file.exists():
+        raise FileNotFoundError(f"Plik nie istnieje: {config_file}")
+
+    try:
+        pyproject_data = toml.load(config_file)
+    except Exception as e:
+        raise ValueError(f"Błąd parsowania pliku TOML: {e}")
+
+    sync_data = pyproject_data.get("tool", {}).get("spectomate", {}).get("sync")
+    if not isinstance(sync_data, dict):
+        raise ValueError(
+            f"Plik {config_file} nie zawiera sekcji [tool.spectomate.sync]"
+        )
+
+    if "source" not in sync_data:
+        raise ValueError("Sekcja [tool.spectomate.sync] musi zawierać klucz source")
+
+    root = config_file.parent
+    targets = []
+
+    for target_data in sync_data.get("targets", []):
+        if "file" not in target_data or "format" not in target_data:
+            raise ValueError("Każdy cel synchronizacji musi mieć klucze file i format")
+        targets.append(
+            SyncTarget(
+                target_data["file"],
+                root / target_data["file"],
+                target_data["format"],
+                target_data.get("options"),
+            )
+        )
+
+    if not targets:
+        raise ValueError("Sekcja [tool.spectomate.sync] nie zawiera żadnych celów")
+
+    state_file = sync_data.get("state-file")
+
+    return SyncConfig(
+        root=root,
+        source=root / sync_data["source"],
+        targets=targets,
+        source_format=sync_data.get("source-format"),
+        state_file=root / state_file if state_file else None,
+    )
+
+
+def _load_state(state_file: Path) -> Dict[str, Any]:
+    """
+    Odczytuje plik stanu synchronizacji.
+
+    Args:
+        state_file: Ścieżka do pliku stanu
+
+    Returns:
+        Stan synchronizacji (pusty, jeśli plik nie istnieje lub jest nieaktualny)
+    """
+    try:
+        with open(state_file, "r") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {"version": SYNC_STATE_VERSION, "files": {}, "targets": {}}
+
+    if not isinstance(state, dict) or state.get("version") != SYNC_STATE_VERSION:
+        return {"version": SYNC_STATE_VERSION, "files": {}, "targets": {}}
+
+    state.setdefault("files", {})
+    state.setdefault("targets", {})
+    return state
+
+
+def _save_state(state_file: Path, state: Dict[str, Any]) -> None:
+    """
+    Zapisuje plik stanu synchronizacji, jeśli jego zawartość się zmieniła.
+
+    Args:
+        state_file: Ścieżka do pliku stanu
+        state: Stan synchronizacji
+    """
+    write_text_if_changed(
+        state_file, json.dumps(state, indent=2, sort_keys=True) + "\n"
+    )
+
+
+def _file_hash(path: Path, key: str, files: Dict[str, Any]) -> Optional[str]:
+    """
+    Zwraca skrót SHA-256 zawartości pliku.
+
+    Jeśli rozmiar i czas modyfikacji pliku nie zmieniły się od ostatniej
+    synchronizacji, używany jest zapamiętany skrót bez ponownego odczytu pliku
+    (chyba że skrót obliczono mniej niż _RACY_WINDOW_NS po modyfikacji).
+
+    Args:
+        path: Ścieżka do pliku
+        key: Klucz pliku w pliku stanu
+        files: Zapamiętane informacje o plikach (aktualizowane w miejscu)
+
+    Returns:
+        Skrót zawartości lub None, jeśli plik nie istnieje
+    """
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        files.pop(key, None)
+        return None
+
+    entry = files.get(key)
+    if (
+        entry is not None
+        and entry.get("size") == stat.st_size
+        and entry.get("mtime_ns") == stat.st_mtime_ns
+        and entry.get("hashed_ns", 0) - stat.st_mtime_ns >= _RACY_WINDOW_NS
+    ):
+        return entry["sha256"]
+
+    hashed_ns = time.time_ns()
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+
+    files[key] = {
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "hashed_ns": hashed_ns,
+        "sha256": digest,
+    }
+    return digest
+
+
+def _options_hash(source_format: Optional[str], target: SyncTarget) -> str:
+    """
+    Zwraca skrót ustawień konwersji danego celu.
+
+    Args:
+        source_format: Format pliku głównego
+        target: Cel synchronizacji
+
+    Returns:
+        Skrót formatu i opcji konwersji
+    """
+    settings = json.dumps(
+        [source_format, target.format, target.options], sort_keys=True, default=str
+    )
+    return hashlib.sha256(settings.encode("utf-8")).hexdigest()
+
+
+def run_sync(
+    config: SyncConfig, force: bool = False, check_only: bool = False
+) -> SyncResult:
+    """
+    Regeneruje nieaktualne pliki wyprowadzane z pliku głównego.
+
+    Cel jest nieaktualny, jeśli zmienił się plik główny, ustawienia konwersji
+    lub sam plik docelowy (np. został usunięty albo ręcznie zmieniony).
+
+    Args:
+        config: Konfiguracja synchronizacji
+        force: Czy regenerować wszystkie cele
+        check_only: Czy tylko sprawdzić, które cele są nieaktualne
+
+    Returns:
+        Wynik synchronizacji
+    """
+    result = SyncResult()
+    state = _load_state(config.state_file)
+    files = state["files"]
+
+    source_hash = _file_hash(config.source, config.source_name, files)
+    if source_hash is None:
+        raise FileNotFoundError(f"Plik nie istnieje: {config.source}")
+
+    for target in config.targets:
+        recorded = state["targets"].get(target.name, {})
+        is_fresh = (
+            not force
+            and recorded.get("source_sha256") == source_hash
+            and recorded.get("options_sha256")
+            == _options_hash(config.source_format, target)
+            and recorded.get("target_sha256") is not None
+            and recorded.get("target_sha256")
+            == _file_hash(target.file, target.name, files)
+        )
+        (result.fresh if is_fresh else result.stale).append(target)
+
+    if check_only:
+        return result
+
+    if not result.stale:
+        # Zapamiętujemy ewentualnie odświeżone czasy modyfikacji plików
+        _save_state(config.state_file, state)
+        return result
+
+    # Rejestr i konwertery ładujemy dopiero, gdy jest coś do zrobienia
+    from spectomate.core.pipeline import run_fan_out
+    from spectomate.core.registry import ConverterRegistry
+
+    source_format = config.source_format or ConverterRegistry.detect_format(
+        config.source
+    )
+    if source_format is None:
+        raise ValueError(f"Nie udało się wykryć formatu pliku {config.source}")
+
+    converters = []
+    for target in result.stale:
+        converter_class = ConverterRegistry.get_converter(source_format, target.format)
+        if converter_class is None:
+            raise ValueError(
+                f"Nie znaleziono konwertera z formatu {source_format} "
+                f"do {target.format}"
+            )
+        converters.append(
+            converter_class(
+                source_file=config.source,
+                target_file=target.file,
+                options=target.options,
+            )
+        )
+
+    run_fan_out(converters)
+
+    for target, converter in zip(result.stale, converters):
+        if converter.write_status == WRITE_UNCHANGED:
+            result.unchanged.append(target)
+        else:
+            result.updated.append(target)
+
+        state["targets"][target.name] = {
+            "source_sha256": source_hash,
+            "options_sha256": _options_hash(config.source_format, target),
+            "target_sha256": _file_hash(target.file, target.name, files),
+        }
+
+    _save_state(config.state_file, state)
+
+    return result
@@ -2,11 +2,27 @@
 Moduł zawierający funkcje pomocnicze dla Spectomate.
 """
 
+import contextlib
+import hashlib
+import io
+import mmap
 import os
 import subprocess
 import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Tuple
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 # Importujemy ConverterRegistry dopiero w funkcji get_available_formats,
 # aby uniknąć cyklicznych importów
@@ -54,6 +70,7 @@ def get_default_output_file(source_file: Path, target_format: str) -> Path:
         "poetry": "pyproject.toml",
         "pipenv": "Pipfile",
         "pdm": "pyproject.toml",
+        "ir": "requirements.ir.json",
     }
 
     if target_format not in format_extensions:
@@ -62,45 +79,319 @@ def get_default_output_file(source_file: Path, target_format: str) -> Path:
     return source_file.parent / format_extensions[target_format]
 
 
-def check_package_in_conda(package_name: str) -> bool:
+# Statusy zwracane przez write_text_if_changed()
+WRITE_UPDATED = "updated"
+WRITE_UNCHANGED = "unchanged"
+
+# Rozmiar bloku używanego przy haszowaniu istniejących plików
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+# Domyślne uprawnienia nowych plików (wyznaczane raz, przy pierwszym zapisie)
+_default_file_mode: Optional[int] = None
+
+
+def _get_default_file_mode() -> int:
     """
-    Sprawdza, czy pakiet jest dostępny w repozytoriach conda.
+    Zwraca uprawnienia, jakie miałby nowy plik utworzony przez open().
+
+    Returns:
+        Uprawnienia pliku z uwzględnieniem umask procesu
+    """
+    global _default_file_mode
+
+    if _default_file_mode is None:
+        umask = os.umask(0)
+        os.umask(umask)
+        _default_file_mode = 0o666 & ~umask
+
+    return _default_file_mode
+
+
+def _file_digest_matches(path: Union[str, Path], size: int, digest: bytes) -> bool:
+    """
+    Sprawdza, czy plik ma podany rozmiar i skrót SHA-256.
 
     Args:
-        package_name: Nazwa pakietu do sprawdzenia
+        path: Ścieżka do pliku
+        size: Oczekiwany rozmiar w bajtach
+        digest: Oczekiwany skrót SHA-256
 
     Returns:
-        True jeśli pakiet jest dostępny, False w przeciwnym wypadku
+        True jeśli plik istnieje i ma taką samą zawartość, False w przeciwnym wypadku
     """
     try:
-        # Usuwamy specyfikację wersji, jeśli istnieje
-        if "==" in package_name:
-            package_name = package_name.split("==")[0]
-        elif ">=" in package_name:
-            package_name = package_name.split(">=")[0]
-        elif "<=" in package_name:
-            package_name = package_name.split("<=")[0]
-
-        # Sprawdzamy dostępność pakietu w conda
-        result = subprocess.run(
-            ["conda", "search", package_name, "--json"],
-            capture_output=True,
-            text=True,
-            check=False,
+        # Porównanie rozmiaru jest tanie i odrzuca większość zmian
+        if os.stat(path).st_size != size:
+            return False
+
+        file_hash = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK_SIZE), b""):
+                file_hash.update(chunk)
+    except OSError:
+        return False
+
+    return file_hash.digest() == digest
+
+
+def file_content_matches(path: Union[str, Path], data: bytes) -> bool:
+    """
+    Sprawdza, czy plik ma dokładnie podaną zawartość.
+
+    Najpierw porównywany jest rozmiar pliku, a dopiero przy zgodnym rozmiarze
+    skrót SHA-256 zawartości.
+
+    Args:
+        path: Ścieżka do pliku
+        data: Oczekiwana zawartość pliku
+
+    Returns:
+        True jeśli plik istnieje i ma taką samą zawartość, False w przeciwnym wypadku
+    """
+    return _file_digest_matches(path, len(data), hashlib.sha256(data).digest())
+
+
+def _replace_file(temp_name: str, path: Path) -> None:
+    """
+    Zastępuje plik docelowy plikiem tymczasowym, zachowując uprawnienia.
+
+    Args:
+        temp_name: Ścieżka do pliku tymczasowego
+        path: Ścieżka do pliku docelowego
+    """
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = _get_default_file_mode()
+
+    os.chmod(temp_name, mode)
+    os.replace(temp_name, path)
+
+
+def _remove_temp_file(temp_name: str) -> None:
+    """
+    Usuwa plik tymczasowy, jeśli jeszcze istnieje.
+
+    Args:
+        temp_name: Ścieżka do pliku tymczasowego
+    """
+    try:
+        os.unlink(temp_name)
+    except FileNotFoundError:
+        pass
+
+
+class _HashingWriter(io.RawIOBase):
+    """
+    Strumień binarny liczący rozmiar i skrót SHA-256 zapisywanych danych.
+    """
+
+    def __init__(self, raw: BinaryIO):
+        self.raw = raw
+        self.hash = hashlib.sha256()
+        self.size = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: Any) -> int:
+        self.hash.update(data)
+        self.size += len(data)
+        return self.raw.write(data)
+
+    def close(self) -> None:
+        if not self.closed:
+            self.raw.close()
+        super().close()
+
+
+class AtomicFileWriter:
+    """
+    Kontekst zapisujący plik strumieniowo i atomowo.
+
+    Dane są zapisywane do pliku tymczasowego w katalogu docelowym, a po
+    zamknięciu kontekstu porównywane (rozmiar i SHA-256) z istniejącym plikiem.
+    Niezmieniony plik nie jest dotykany, a zmieniony jest zastępowany plikiem
+    tymczasowym przez os.replace(). Wynik trafia do atrybutu status.
+
+    Przykład:
+        writer = AtomicFileWriter("environment.yml")
+        with writer as stream:
+            stream.write("name: myenv\n")
+        print(writer.status)
+    """
+
+    def __init__(self, path: Union[str, Path], encoding: str = "utf-8"):
+        """
+        Inicjalizacja zapisu.
+
+        Args:
+            path: Ścieżka do pliku docelowego
+            encoding: Kodowanie znaków
+        """
+        self.path = Path(path)
+        self.encoding = encoding
+        # Status zapisu ustawiany po zamknięciu kontekstu
+        self.status = ""
+        self._temp_name: Optional[str] = None
+        self._hashing: Optional[_HashingWriter] = None
+        self._stream: Optional[TextIO] = None
+
+    def __enter__(self) -> TextIO:
+        # Tworzymy katalogi, jeśli nie istnieją
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        fd, self._temp_name = tempfile.mkstemp(
+            dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+        )
+        self._hashing = _HashingWriter(os.fdopen(fd, "wb"))
+        self._stream = io.TextIOWrapper(
+            io.BufferedWriter(self._hashing), encoding=self.encoding
         )
+        return self._stream
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        assert self._stream is not None and self._hashing is not None
+        assert self._temp_name is not None
+
+        try:
+            self._stream.close()
+        except BaseException:
+            _remove_temp_file(self._temp_name)
+            raise
+
+        if exc_type is not None:
+            _remove_temp_file(self._temp_name)
+            return
+
+        digest = self._hashing.hash.digest()
+        if _file_digest_matches(self.path, self._hashing.size, digest):
+            _remove_temp_file(self._temp_name)
+            self.status = WRITE_UNCHANGED
+            return
+
+        try:
+            _replace_file(self._temp_name, self.path)
+        except BaseException:
+            _remove_temp_file(self._temp_name)
+            raise
+        self.status = WRITE_UPDATED
+
+
+def write_text_if_changed(
+    path: Union[str, Path], content: str, encoding: str = "utf-8"
+) -> str:
+    """
+    Zapisuje tekst do pliku tylko wtedy, gdy zawartość się zmieniła.
 
-        if result.returncode != 0:
-            return False
+    Niezmieniony plik nie jest dotykany (zachowuje mtime), a zmieniony jest
+    zapisywany atomowo: do pliku tymczasowego w tym samym katalogu, który
+    następnie zastępuje plik docelowy.
 
-        import json
+    Args:
+        path: Ścieżka do pliku docelowego
+        content: Zawartość do zapisania
+        encoding: Kodowanie znaków
 
-        data = json.loads(result.stdout)
+    Returns:
+        WRITE_UNCHANGED jeśli plik miał już taką zawartość, WRITE_UPDATED
+        jeśli został zapisany
+    """
+    return write_bytes_if_changed(path, content.encode(encoding))
 
-        # Jeśli pakiet istnieje, dane będą zawierały klucz z nazwą pakietu
-        return package_name in data
-    except Exception:
-        # W przypadku błędu zakładamy, że pakiet nie jest dostępny
-        return False
+
+def write_bytes_if_changed(path: Union[str, Path], data: bytes) -> str:
+    """
+    Zapisuje dane binarne do pliku tylko wtedy, gdy zawartość się zmieniła.
+
+    Działa tak samo jak write_text_if_changed(), ale dla gotowych bajtów.
+
+    Args:
+        path: Ścieżka do pliku docelowego
+        data: Zawartość do zapisania
+
+    Returns:
+        WRITE_UNCHANGED jeśli plik miał już taką zawartość, WRITE_UPDATED
+        jeśli został zapisany
+    """
+    path = Path(path)
+
+    if file_content_matches(path, data):
+        return WRITE_UNCHANGED
+
+    # Tworzymy katalogi, jeśli nie istnieją
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, temp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        _replace_file(temp_name, path)
+    except BaseException:
+        # Usuwamy plik tymczasowy, aby nie zostawiać śmieci po błędzie
+        _remove_temp_file(temp_name)
+        raise
+
+    return WRITE_UPDATED
+
+
+# Pliki mniejsze niż ten rozmiar są czytane w całości zamiast mapowania
+MMAP_MIN_SIZE = 256 * 1024
+
+
+@contextlib.contextmanager
+def map_file(path: Union[str, Path]) -> Iterator[Union[bytes, mmap.mmap]]:
+    """
+    Udostępnia zawartość pliku jako bufor bajtów.
+
+    Duże pliki są mapowane do pamięci (mmap) tylko do odczytu, więc wyrażenia
+    regularne mogą przeszukiwać je bez kopiowania całej zawartości; małe są
+    po prostu wczytywane. Bufor jest ważny tylko wewnątrz bloku with.
+
+    Args:
+        path: Ścieżka do pliku
+
+    Yields:
+        Zawartość pliku (bytes lub mmap)
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < MMAP_MIN_SIZE:
+            yield f.read()
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield buffer
+
+
+def check_package_in_conda(package_name: str) -> bool:
+    """
+    Sprawdza, czy pakiet jest dostępny w repozytoriach conda.
+
+    Wyniki są zapamiętywane na czas życia procesu, więc długo działające
+    procesy (np. spectomate watch) nie odpytują conda ponownie o te same pakiety.
+    Wyszukiwanie ma limit czasu, a po serii błędów conda przestaje być
+    uruchamiana (zob. spectomate.core.conda_lookup).
+
+    Args:
+        package_name: Nazwa pakietu do sprawdzenia
+
+    Returns:
+        True jeśli pakiet jest dostępny, False w przeciwnym wypadku
+        (również gdy nie udało się tego sprawdzić)
+    """
+    # Usuwamy specyfikację wersji, jeśli istnieje
+    if "==" in package_name:
+        package_name = package_name.split("==")[0]
+    elif ">=" in package_name:
+        package_name = package_name.split(">=")[0]
+    elif "<=" in package_name:
+        package_name = package_name.split("<=")[0]
+
+    from spectomate.core.conda_lookup import lookup_package
+
+    return lookup_package(package_name).available
 
 
 def run_subprocess(cmd: List[str], capture_output: bool = True) -> Tuple[int, str, str]:
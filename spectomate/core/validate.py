@@ -0,0 +1,496 @@
+"""
+Moduł sprawdzający pliki z zależnościami bez zapisywania wyników.
+
+Plik jest parsowany parserem swojego schematu (PipSchema, CondaSchema,
+PoetrySchema), a każde wymaganie jest sprawdzane osobno, dzięki czemu błędy
+są zgłaszane z numerami linii. Opcjonalnie wykonywana jest też konwersja do
+wskazanych formatów - wyłącznie w pamięci, bez serializacji i zapisu plików.
+
+Wiele plików jest sprawdzanych równolegle.
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+import yaml
+
+from spectomate.core.ir import parse_requirement
+from spectomate.core.match_spec import conda_version_to_pep440, parse_match_spec
+from spectomate.core.poetry_constraints import poetry_to_pep440
+
+# Poziomy ważności problemów
+ERROR = "error"
+WARNING = "warning"
+
+# Początek tabeli TOML, np. [tool.poetry.group.dev.dependencies]
+_TOML_TABLE_RE = re.compile(r"^\s*\[+\s*([^\]]+?)\s*\]+")
+# Klucz TOML na początku linii, np. requests = "^2.0" lub "my.pkg" = {...}
+_TOML_KEY_RE = re.compile(r"""^\s*(?:"([^"]+)"|'([^']+)'|([A-Za-z0-9_.\-]+))\s*=""")
+# Numer linii w komunikacie błędu parsera
+_LINE_IN_MESSAGE_RE = re.compile(r"line (\d+)")
+
+
+class ValidationIssue:
+    """
+    Problem wykryty w pliku z zależnościami.
+    """
+
+    __slots__ = ("line", "message", "severity")
+
+    def __init__(self, message: str, line: Optional[int] = None, severity: str = ERROR):
+        """
+        Inicjalizuje problem.
+
+        Args:
+            message: Opis problemu
+            line: Numer linii (od 1) lub None, jeśli problem dotyczy całego pliku
+            severity: ERROR lub WARNING
+        """
+        self.line = line
+        self.message = message
+        self.severity = severity
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Zwraca problem w postaci słownika (np. do zapisu JSON)."""
+        return {"line": self.line, "severity": self.severity, "message": self.message}
+
+
+class ValidationResult:
+    """
+    Wynik sprawdzenia jednego pliku.
+    """
+
+    def __init__(self, file: Path, source_format: Optional[str]):
+        """
+        Inicjalizuje pusty wynik.
+
+        Args:
+            file: Sprawdzany plik
+            source_format: Format pliku (None, jeśli nie udało się go wykryć)
+        """
+        self.file = file
+        self.source_format = source_format
+        self.issues: List[ValidationIssue] = []
+        self.checked_formats: List[str] = []
+
+    def add(self, message: str, line: Optional[int] = None, severity: str = ERROR):
+        """
+        Dodaje problem do wyniku.
+
+        Args:
+            message: Opis problemu
+            line: Numer linii (od 1)
+            severity: ERROR lub WARNING
+        """
+        self.issues.append(ValidationIssue(message, line, severity))
+
+    @property
+    def errors(self) -> List[ValidationIssue]:
+        """Błędy (problemy uniemożliwiające konwersję)."""
+        return [issue for issue in self.issues if issue.severity == ERROR]
+
+    @property
+    def ok(self) -> bool:
+        """Czy plik nie zawiera błędów."""
+        return not self.errors
+
+    def format_issues(self) -> List[str]:
+        """
+        Zwraca problemy w postaci "plik:linia: poziom: opis".
+
+        Returns:
+            Lista napisów posortowana według numerów linii
+        """
+        lines = []
+        for issue in sorted(self.issues, key=lambda issue: issue.line or 0):
+            location = f"{self.file}:{issue.line}" if issue.line else str(self.file)
+            lines.append(f"{location}: {issue.severity}: {issue.message}")
+        return lines
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Zwraca wynik w postaci słownika (np. do zapisu JSON)."""
+        return {
+            "file": str(self.file),
+            "format": self.source_format,
+            "ok": self.ok,
+            "checked_formats": self.checked_formats,
+            "issues": [issue.to_dict() for issue in self.issues],
+        }
+
+
+def _error_line(error: BaseException) -> Optional[int]:
+    """
+    Odczytuje numer linii z błędu parsera YAML lub TOML.
+
+    Schematy opakowują błędy parserów w ValueError, więc sprawdzany jest
+    również błąd pierwotny.
+
+    Args:
+        error: Błąd parsowania
+
+    Returns:
+        Numer linii (od 1) lub None
+    """
+    for current in (error, error.__cause__, error.__context__):
+        if current is None:
+            continue
+        mark = getattr(current, "problem_mark", None)
+        if mark is not None:
+            return mark.line + 1
+        lineno = getattr(current, "lineno", None)
+        if isinstance(lineno, int):
+            return lineno
+    match = _LINE_IN_MESSAGE_RE.search(str(error))
+    return int(match.group(1)) if match else None
+
+
+def _check_requirement(
+    result: ValidationResult, line: str, number: Optional[int], seen: Dict[str, int]
+) -> None:
+    """
+    Sprawdza wymaganie pip i powtórzenia nazw pakietów.
+
+    Args:
+        result: Wynik, do którego dopisywane są problemy
+        line: Wymaganie pip
+        number: Numer linii wymagania
+        seen: Znormalizowane nazwy już sprawdzonych pakietów -> numer linii
+    """
+    try:
+        requirement = parse_requirement(line)
+    except ValueError as e:
+        result.add(str(e), number)
+        return
+
+    key = requirement.key
+    if requirement.marker:
+        # Ten sam pakiet z różnymi markerami jest dozwolony
+        key = f"{key}; {requirement.marker}"
+    if key in seen:
+        location = f" w linii {seen[key]}" if seen[key] else ""
+        result.add(
+            f"Pakiet {requirement.name} występuje już wcześniej{location}",
+            number,
+            WARNING,
+        )
+    else:
+        seen[key] = number or 0
+
+
+def _check_pip(result: ValidationResult, content: str) -> Dict[str, Any]:
+    """
+    Sprawdza plik requirements.txt.
+
+    Args:
+        result: Wynik, do którego dopisywane są problemy
+        content: Zawartość pliku
+
+    Returns:
+        Dane sparsowane przez PipSchema
+    """
+    from spectomate.schemas.pip_schema import PipSchema
+
+    data = PipSchema.parse_string(content)
+
+    seen: Dict[str, int] = {}
+    for number, raw_line in enumerate(content.splitlines(), 1):
+        line = raw_line.split(" #", 1)[0].strip()
+        if not line or line.startswith(("#", "-")):
+            continue
+        _check_requirement(result, line, number, seen)
+
+    return data
+
+
+def _check_conda(result: ValidationResult, content: str) -> Dict[str, Any]:
+    """
+    Sprawdza plik environment.yml.
+
+    Args:
+        result: Wynik, do którego dopisywane są problemy
+        content: Zawartość pliku
+
+    Returns:
+        Dane sparsowane przez CondaSchema
+    """
+    from spectomate.schemas.conda_schema import CondaSchema
+
+    data = CondaSchema.parse_string(content)
+
+    # Numery linii są dostępne tylko w drzewie węzłów YAML
+    root = yaml.compose(content)
+    dependencies = None
+    for key, value in getattr(root, "value", []):
+        if getattr(key, "value", None) == "dependencies":
+            dependencies = value
+    if not isinstance(dependencies, yaml.SequenceNode):
+        if "dependencies" in data and not isinstance(data["dependencies"], list):
+            result.add("Pole dependencies musi być listą", _node_line(dependencies))
+        return data
+
+    seen: Dict[str, int] = {}
+    for node in dependencies.value:
+        if isinstance(node, yaml.ScalarNode):
+            _check_match_spec(result, str(node.value), _node_line(node))
+        elif isinstance(node, yaml.MappingNode):
+            for key, value in node.value:
+                if key.value != "pip":
+                    result.add(
+                        f"Nieznana sekcja zależności: {key.value}",
+                        _node_line(key),
+                        WARNING,
+                    )
+                    continue
+                if not isinstance(value, yaml.SequenceNode):
+                    result.add("Sekcja pip musi być listą", _node_line(value))
+                    continue
+                for item in value.value:
+                    line = str(getattr(item, "value", ""))
+                    if line.startswith("-"):
+                        continue
+                    _check_requirement(result, line, _node_line(item), seen)
+        else:
+            result.add("Nieprawidłowy element listy dependencies", _node_line(node))
+
+    return data
+
+
+def _node_line(node: Any) -> Optional[int]:
+    """
+    Zwraca numer linii węzła YAML.
+
+    Args:
+        node: Węzeł YAML
+
+    Returns:
+        Numer linii (od 1) lub None
+    """
+    mark = getattr(node, "start_mark", None)
+    return mark.line + 1 if mark is not None else None
+
+
+def _check_match_spec(result: ValidationResult, spec: str, number: Optional[int]):
+    """
+    Sprawdza specyfikację pakietu conda.
+
+    Args:
+        result: Wynik, do którego dopisywane są problemy
+        spec: Specyfikacja pakietu conda
+        number: Numer linii specyfikacji
+    """
+    try:
+        _, version, _ = parse_match_spec(spec)
+    except ValueError as e:
+        result.add(str(e), number)
+        return
+    if not version:
+        return
+    try:
+        conda_version_to_pep440(version)
+    except ValueError as e:
+        # Np. alternatywy "1.7|1.8" są poprawne w conda, ale nie w PEP 440
+        severity = WARNING if "|" in version else ERROR
+        result.add(f"{spec}: {e}", number, severity)
+
+
+def _poetry_key_lines(content: str) -> Dict[str, Dict[str, int]]:
+    """
+    Wyznacza numery linii kluczy w tabelach pliku TOML.
+
+    Args:
+        content: Zawartość pliku TOML
+
+    Returns:
+        Słownik tabela -> (klucz -> numer linii)
+    """
+    tables: Dict[str, Dict[str, int]] = {}
+    table = ""
+    for number, line in enumerate(content.splitlines(), 1):
+        header = _TOML_TABLE_RE.match(line)
+        if header:
+            table = header.group(1).replace(" ", "")
+            continue
+        key = _TOML_KEY_RE.match(line)
+        if key:
+            name = next(group for group in key.groups() if group)
+            tables.setdefault(table, {}).setdefault(name, number)
+    return tables
+
+
+def _check_poetry(result: ValidationResult, content: str) -> Dict[str, Any]:
+    """
+    Sprawdza plik pyproject.toml projektu Poetry.
+
+    Args:
+        result: Wynik, do którego dopisywane są problemy
+        content: Zawartość pliku
+
+    Returns:
+        Dane sparsowane przez PoetrySchema
+    """
+    from spectomate.schemas.poetry_schema import PoetrySchema
+
+    data = PoetrySchema.parse_string(content)
+    key_lines = _poetry_key_lines(content)
+
+    sections = {"tool.poetry.dependencies": data.get("dependencies")}
+    sections["tool.poetry.dev-dependencies"] = data.get("dev-dependencies")
+    for group, group_data in (data.get("group") or {}).items():
+        if isinstance(group_data, dict):
+            sections[f"tool.poetry.group.{group}.dependencies"] = group_data.get(
+                "dependencies"
+            )
+
+    for table, dependencies in sections.items():
+        if not dependencies:
+            continue
+        lines = key_lines.get(table, {})
+        if not isinstance(dependencies, dict):
+            result.add(f"Sekcja [{table}] musi być tabelą")
+            continue
+        for name, constraint in dependencies.items():
+            number = lines.get(name)
+            if isinstance(constraint, dict):
+                constraint = constraint.get("version")
+            elif isinstance(constraint, list):
+                # Wiele ograniczeń zależnych od markerów
+                constraint = None
+            if constraint is None or name.lower() == "python":
+                continue
+            if not isinstance(constraint, str):
+                result.add(f"Nieprawidłowe ograniczenie pakietu {name}", number)
+                continue
+            try:
+                poetry_to_pep440(constraint)
+            except ValueError as e:
+                severity = WARNING if "|" in constraint else ERROR
+                result.add(f"{name} = {constraint!r}: {e}", number, severity)
+
+    return data
+
+
+def _check_ir(result: ValidationResult, content: str) -> Dict[str, Any]:
+    """
+    Sprawdza plik ir w formacie JSON.
+
+    Args:
+        result: Wynik, do którego dopisywane są problemy
+        content: Zawartość pliku
+
+    Returns:
+        Dane sparsowane przez IrSchema
+    """
+    from spectomate.schemas.ir_schema import IrSchema
+
+    return IrSchema.parse_string(content)
+
+
+# Funkcje sprawdzające dla formatów z własnym schematem
+_CHECKERS: Dict[str, Callable[[ValidationResult, str], Dict[str, Any]]] = {
+    "pip": _check_pip,
+    "conda": _check_conda,
+    "poetry": _check_poetry,
+    "ir": _check_ir,
+}
+
+
+def validate_file(
+    file_path: Union[str, Path],
+    source_format: Optional[str] = None,
+    target_formats: Sequence[str] = (),
+    options: Optional[Dict[str, Any]] = None,
+) -> ValidationResult:
+    """
+    Sprawdza plik z zależnościami i jego konwersję bez zapisywania wyników.
+
+    Args:
+        file_path: Ścieżka do pliku
+        source_format: Format pliku (None - wykrycie automatyczne)
+        target_formats: Formaty, do których sprawdzana jest konwersja
+            (wykonywana w pamięci, bez serializacji)
+        options: Opcje przekazywane konwerterom
+
+    Returns:
+        Wynik sprawdzenia
+    """
+    from spectomate.core.registry import ConverterRegistry
+
+    file_path = Path(file_path)
+    if source_format is None:
+        source_format = ConverterRegistry.detect_format(file_path)
+    result = ValidationResult(file_path, source_format)
+
+    try:
+        content = file_path.read_text(encoding="utf-8")
+    except (OSError, UnicodeDecodeError) as e:
+        result.add(f"Nie można odczytać pliku: {e}")
+        return result
+
+    if source_format is None:
+        result.add("Nie udało się wykryć formatu pliku")
+        return result
+
+    checker = _CHECKERS.get(source_format)
+    if checker is not None:
+        try:
+            checker(result, content)
+        except Exception as e:
+            result.add(str(e), _error_line(e))
+            return result
+
+    for target_format in target_formats:
+        converter_class = ConverterRegistry.get_converter(source_format, target_format)
+        if converter_class is None:
+            result.add(
+                f"Nie znaleziono konwertera z formatu {source_format} "
+                f"do {target_format}"
+            )
+            continue
+        converter = converter_class(source_file=file_path, options=dict(options or {}))
+        try:
+            converter.convert(converter.parse_source(content))
+        except Exception as e:
+            result.add(
+                f"Konwersja do {target_format} nie powiodła się: {e}", _error_line(e)
+            )
+            continue
+        for warning in converter.warnings:
+            result.add(f"{target_format}: {warning}", severity=WARNING)
+        result.checked_formats.append(target_format)
+
+    return result
+
+
+def validate_files(
+    file_paths: Sequence[Union[str, Path]],
+    source_format: Optional[str] = None,
+    target_formats: Sequence[str] = (),
+    options: Optional[Dict[str, Any]] = None,
+    max_workers: Optional[int] = None,
+) -> List[ValidationResult]:
+    """
+    Sprawdza równolegle wiele plików z zależnościami.
+
+    Args:
+        file_paths: Ścieżki do plików
+        source_format: Format wszystkich plików (None - wykrycie dla każdego)
+        target_formats: Formaty, do których sprawdzana jest konwersja
+        options: Opcje przekazywane konwerterom
+        max_workers: Liczba wątków (None - domyślna)
+
+    Returns:
+        Wyniki w kolejności plików
+    """
+    workers = max_workers or min(32, (os.cpu_count() or 1) + 4)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                lambda path: validate_file(
+                    path, source_format, target_formats, options
+                ),
+                file_paths,
+            )
+        )
@@ -0,0 +1,433 @@
+"""
+Moduł porównywania i wybierania wersji zgodnie z PEP 440.
+
+Wersje są zamieniane na klucze sortowania - krotki liczb i napisów, które
+porównują się tak samo jak wersje PEP 440 (np. "1.10" > "1.9", "1.0rc1" < "1.0",
+"1.0" == "1.0.0"). Klucze i sparsowane wersje są zapamiętywane, więc sortowanie
+i filtrowanie tysięcy wersji z indeksu parsuje każdy napis tylko raz, a nie przy
+każdym porównaniu.
+
+Przykład:
+
+    >>> sort_versions(["1.10", "1.9", "1.10rc1"])
+    ['1.9', '1.10rc1', '1.10']
+    >>> max_satisfying(["1.9", "1.10", "2.0"], "<2")
+    '1.10'
+"""
+
+import functools
+import sys
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from packaging.specifiers import InvalidSpecifier, SpecifierSet
+from packaging.version import InvalidVersion, Version
+
+# Maksymalna liczba zapamiętanych wersji i specyfikatorów
+CACHE_SIZE = 65536
+
+# Kolejność oznaczeń wersji przedpremierowych
+_PRE_RANKS = {"a": 0, "b": 1, "rc": 2}
+
+# Składnik klucza dla wersji deweloperskich bez oznaczenia przedpremierowego
+# (1.0.dev1 < 1.0a1) i dla wersji bez oznaczenia przedpremierowego (1.0a1 < 1.0)
+_DEV_ONLY = (-1, 0)
+_NO_PRE = (len(_PRE_RANKS), 0)
+
+# Składnik klucza dla wersji bez części "dev" (1.0.dev1 < 1.0)
+_NO_DEV = sys.maxsize
+
+VersionKey = Tuple[int, Tuple[int, ...], Tuple[int, int], int, int, Tuple]
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse_version(version: str) -> Version:
+    """
+    Parsuje wersję PEP 440.
+
+    Args:
+        version: Wersja (np. "1.2.3", "2.0rc1", "1!1.0.post1")
+
+    Returns:
+        Obiekt Version; dla tego samego napisu zwracany jest ten sam obiekt
+
+    Raises:
+        ValueError: Jeśli wersja jest nieprawidłowa
+    """
+    try:
+        return Version(version)
+    except InvalidVersion:
+        raise ValueError(f"Nieprawidłowa wersja: {version}")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def version_key(version: str) -> VersionKey:
+    """
+    Zwraca klucz sortowania wersji PEP 440.
+
+    Klucz to krotka (epoka, wydanie, przedpremierowa, po wydaniu, deweloperska,
+    lokalna) złożona wyłącznie z liczb i napisów. Wydanie nie zawiera końcowych
+    zer, więc równoważne wersje ("1.0" i "1.0.0") mają równe klucze.
+
+    Args:
+        version: Wersja
+
+    Returns:
+        Klucz sortowania; dla tego samego napisu zwracany jest ten sam obiekt
+
+    Raises:
+        ValueError: Jeśli wersja jest nieprawidłowa
+    """
+    parsed = parse_version(version)
+
+    release = parsed.release
+    while len(release) > 1 and release[-1] == 0:
+        release = release[:-1]
+
+    if parsed.pre is not None:
+        pre = (_PRE_RANKS[parsed.pre[0]], parsed.pre[1])
+    elif parsed.dev is not None and parsed.post is None:
+        pre = _DEV_ONLY
+    else:
+        pre = _NO_PRE
+
+    post = -1 if parsed.post is None else parsed.post
+    dev = _NO_DEV if parsed.dev is None else parsed.dev
+
+    # Segmenty numeryczne wersji lokalnej są "większe" niż alfanumeryczne
+    local: Tuple = ()
+    if parsed.local is not None:
+        local = tuple(
+            (1, int(part), "") if part.isdigit() else (0, 0, part)
+            for part in parsed.local.split(".")
+        )
+
+    return (parsed.epoch, release, pre, post, dev, local)
+
+
+def try_version_key(version: str) -> Optional[VersionKey]:
+    """
+    Zwraca klucz sortowania wersji lub None, jeśli wersja jest nieprawidłowa.
+
+    Args:
+        version: Wersja
+
+    Returns:
+        Klucz sortowania lub None
+    """
+    try:
+        return version_key(version)
+    except ValueError:
+        return None
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def parse_specifier(specifier: str) -> SpecifierSet:
+    """
+    Parsuje specyfikator PEP 440.
+
+    Args:
+        specifier: Specyfikator (np. ">=1.2,<2"); pusty napis oznacza dowolną wersję
+
+    Returns:
+        Obiekt SpecifierSet; dla tego samego napisu zwracany jest ten sam obiekt
+
+    Raises:
+        ValueError: Jeśli specyfikator jest nieprawidłowy
+    """
+    try:
+        return SpecifierSet(specifier)
+    except InvalidSpecifier:
+        raise ValueError(f"Nieprawidłowy specyfikator wersji: {specifier}")
+
+
+def _parse_valid(versions: Iterable[str]) -> List[Tuple[str, Version]]:
+    """
+    Parsuje wersje, pomijając nieprawidłowe.
+
+    Args:
+        versions: Wersje
+
+    Returns:
+        Lista par (wersja, obiekt Version)
+    """
+    parsed = []
+    for version in versions:
+        try:
+            parsed.append((version, parse_version(version)))
+        except ValueError:
+            continue
+    return parsed
+
+
+def sort_versions(versions: Iterable[str], reverse: bool = False) -> List[str]:
+    """
+    Sortuje wersje zgodnie z PEP 440.
+
+    Nieprawidłowe wersje są pomijane.
+
+    Args:
+        versions: Wersje
+        reverse: Czy sortować od najnowszej wersji
+
+    Returns:
+        Posortowana lista wersji
+    """
+    keyed = []
+    for version in versions:
+        key = try_version_key(version)
+        if key is not None:
+            keyed.append((key, version))
+
+    keyed.sort(key=lambda item: item[0], reverse=reverse)
+    return [version for _, version in keyed]
+
+
+def filter_versions(
+    versions: Iterable[str],
+    specifier: str = "",
+    prereleases: Optional[bool] = None,
+) -> List[str]:
+    """
+    Wybiera wersje spełniające specyfikator, zachowując ich kolejność.
+
+    Wersje przedpremierowe są pomijane, chyba że specyfikator wprost ich
+    dotyczy, żadna inna wersja go nie spełnia lub podano prereleases=True.
+    Nieprawidłowe wersje są pomijane.
+
+    Args:
+        versions: Wersje
+        specifier: Specyfikator PEP 440
+        prereleases: Czy dopuszczać wersje przedpremierowe (None - jak w pip)
+
+    Returns:
+        Lista wersji spełniających specyfikator
+
+    Raises:
+        ValueError: Jeśli specyfikator jest nieprawidłowy
+    """
+    spec = parse_specifier(specifier)
+    parsed = _parse_valid(versions)
+
+    # SpecifierSet.filter nie parsuje ponownie obiektów Version, a ta sama
+    # wersja jest zawsze reprezentowana przez ten sam obiekt
+    allowed = {
+        id(version)
+        for version in spec.filter(
+            [version for _, version in parsed], prereleases=prereleases
+        )
+    }
+    return [version for version, obj in parsed if id(obj) in allowed]
+
+
+def max_satisfying(
+    versions: Iterable[str],
+    specifier: str = "",
+    prereleases: Optional[bool] = None,
+) -> Optional[str]:
+    """
+    Zwraca najnowszą wersję spełniającą specyfikator.
+
+    Args:
+        versions: Wersje
+        specifier: Specyfikator PEP 440
+        prereleases: Czy dopuszczać wersje przedpremierowe (None - jak w pip)
+
+    Returns:
+        Najnowsza pasująca wersja lub None, jeśli żadna nie pasuje
+
+    Raises:
+        ValueError: Jeśli specyfikator jest nieprawidłowy
+    """
+    matching = filter_versions(versions, specifier, prereleases)
+    if not matching:
+        return None
+    return max(matching, key=version_key)
+
+
+def intersect_specifiers(specifiers: Iterable[str]) -> str:
+    """
+    Łączy specyfikatory w jeden (koniunkcja).
+
+    Powtórzone warunki są usuwane, a z warunków >, >= oraz <, <= zostaje
+    tylko najsilniejsze dolne i górne ograniczenie. Pomijane są też warunki
+    wynikające z innych: spełnione przez wersję dokładną (np. ==1.7.* obok
+    ==1.7) i szersze warunki z gwiazdką (==1.* obok ==1.7.*).
+
+    Args:
+        specifiers: Specyfikatory PEP 440
+
+    Returns:
+        Specyfikator spełniany przez wersje spełniające wszystkie podane
+
+    Raises:
+        ValueError: Jeśli któryś specyfikator jest nieprawidłowy
+    """
+    clauses: Dict[str, None] = {}
+    # Najsilniejsze ograniczenia: (wersja, czy wyłączna, warunek)
+    lower: Optional[Tuple[Version, bool, str]] = None
+    upper: Optional[Tuple[Version, bool, str]] = None
+
+    for specifier in specifiers:
+        for clause in parse_specifier(specifier):
+            operator = clause.operator
+            if operator in (">=", ">"):
+                bound = (Version(clause.version), operator == ">", str(clause))
+                if lower is None or bound[:2] > lower[:2]:
+                    lower = bound
+            elif operator in ("<=", "<"):
+                bound = (Version(clause.version), operator == "<", str(clause))
+                if upper is None or (bound[0], not bound[1]) < (upper[0], not upper[1]):
+                    upper = bound
+            else:
+                clauses[str(clause)] = None
+
+    for bound in (lower, upper):
+        if bound is not None:
+            clauses[bound[2]] = None
+    return ",".join(sorted(_drop_implied(list(clauses))))
+
+
+def _drop_implied(clauses: List[str]) -> List[str]:
+    """
+    Usuwa warunki wynikające z pozostałych warunków koniunkcji.
+
+    Args:
+        clauses: Różne warunki specyfikatora PEP 440
+
+    Returns:
+        Warunki bez tych, które wynikają z pozostałych
+    """
+    exact = [
+        clause
+        for clause in clauses
+        if clause.startswith("==")
+        and not clause.startswith("===")
+        and not clause.endswith(".*")
+    ]
+    if exact:
+        pin = Version(exact[0][2:])
+        if any(Version(clause[2:]) != pin for clause in exact):
+            # Sprzeczne wersje dokładne - zostawiamy wszystko do is_satisfiable
+            return clauses
+        # Pozostałe warunki spełnione przez wersję dokładną są zbędne
+        return [exact[0]] + [
+            clause
+            for clause in clauses
+            if clause not in exact
+            and not SpecifierSet(clause).contains(pin, prereleases=True)
+        ]
+
+    prefixes = [
+        (clause, Version(clause[2:-2]))
+        for clause in clauses
+        if clause.startswith("==") and clause.endswith(".*")
+    ]
+
+    def is_wider(prefix: Version, other: Version) -> bool:
+        length = len(prefix.release)
+        return (
+            prefix.epoch == other.epoch
+            and len(other.release) > length
+            and other.release[:length] == prefix.release
+        )
+
+    wider = {
+        clause
+        for clause, prefix in prefixes
+        if any(is_wider(prefix, other) for _, other in prefixes)
+    }
+    return [clause for clause in clauses if clause not in wider]
+
+
+def _next_release(version: Version, length: int) -> Version:
+    """
+    Zwraca pierwszą wersję po wszystkich wersjach o danym prefiksie wydania.
+
+    Args:
+        version: Wersja z prefiksem (np. 1.4 dla prefiksu o długości 2)
+        length: Długość prefiksu
+
+    Returns:
+        Wersja (np. 1.5 dla 1.4 i długości 2)
+    """
+    release = (version.release + (0,) * length)[:length]
+    bumped = ".".join(str(part) for part in release[:-1] + (release[-1] + 1,))
+    return Version(f"{version.epoch}!{bumped}")
+
+
+@functools.lru_cache(maxsize=CACHE_SIZE)
+def is_satisfiable(specifier: str) -> bool:
+    """
+    Sprawdza, czy jakakolwiek wersja może spełnić specyfikator.
+
+    Warunki porównania są sprowadzane do przedziału wersji; specyfikator jest
+    uznawany za niespełnialny, gdy przedział jest pusty albo żadna z wersji
+    wskazanych przez == / === go nie spełnia. Wykluczenia != zawężają tylko
+    wersje dokładne, więc wynik True nie gwarantuje istnienia takiej wersji
+    w indeksie.
+
+    Args:
+        specifier: Specyfikator PEP 440
+
+    Returns:
+        True, jeśli specyfikator może zostać spełniony
+
+    Raises:
+        ValueError: Jeśli specyfikator jest nieprawidłowy
+    """
+    spec = parse_specifier(specifier)
+    # Granice przedziału: (wersja, czy granica należy do przedziału)
+    lower: Optional[Tuple[Version, bool]] = None
+    upper: Optional[Tuple[Version, bool]] = None
+    exact: List[str] = []
+
+    def tighten_lower(version: Version, inclusive: bool) -> None:
+        nonlocal lower
+        if lower is None or (version, not inclusive) > (lower[0], not lower[1]):
+            lower = (version, inclusive)
+
+    def tighten_upper(version: Version, inclusive: bool) -> None:
+        nonlocal upper
+        if upper is None or (version, inclusive) < upper:
+            upper = (version, inclusive)
+
+    for clause in spec:
+        operator, value = clause.operator, clause.version
+        if operator == "===" or (operator == "==" and not value.endswith(".*")):
+            exact.append(value)
+        elif operator == "==":
+            prefix = Version(value[:-2])
+            tighten_lower(prefix, True)
+            tighten_upper(_next_release(prefix, len(prefix.release)), False)
+        elif operator == "~=":
+            base = Version(value)
+            tighten_lower(base, True)
+            tighten_upper(_next_release(base, len(base.release) - 1), False)
+        elif operator in (">=", ">"):
+            tighten_lower(Version(value), operator == ">=")
+        elif operator in ("<=", "<"):
+            tighten_upper(Version(value), operator == "<=")
+
+    if exact:
+        for value in exact:
+            try:
+                if spec.contains(value, prereleases=True):
+                    return True
+            except InvalidVersion:
+                # Dowolny napis (===) - nie da się go porównać z przedziałem
+                return True
+        return False
+
+    if lower is None or upper is None:
+        return True
+    if lower[0] != upper[0]:
+        return lower[0] < upper[0]
+    return lower[1] and upper[1] and spec.contains(lower[0], prereleases=True)
+
+
+def clear_cache() -> None:
+    """Czyści zapamiętane wersje i specyfikatory."""
+    parse_version.cache_clear()
+    version_key.cache_clear()
+    parse_specifier.cache_clear()
+    is_satisfiable.cache_clear()
@@ -0,0 +1,391 @@
+"""
+Moduł obserwujący pliki i ponownie uruchamiający konwersje po ich zmianie.
+
+Na Linuksie zmiany są odbierane przez inotify (przez ctypes, bez zależności
+zewnętrznych), a na pozostałych systemach przez okresowe sprawdzanie plików.
+Obserwowane są katalogi plików, a nie same pliki, ponieważ edytory często
+zapisują plik tymczasowy i podmieniają go przez rename().
+"""
+
+import ctypes
+import ctypes.util
+import errno
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple
+
+# Zdarzenia inotify, które mogą oznaczać zmianę zawartości pliku
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+
+_INOTIFY_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+)
+
+# Nagłówek struct inotify_event: wd, mask, cookie, len
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Rozmiar bufora odczytu zdarzeń inotify
+_READ_SIZE = 64 * 1024
+
+# Domyślny czas (w sekundach) bez nowych zdarzeń, po którym uruchamiana jest konwersja
+DEFAULT_DEBOUNCE = 0.2
+
+# Domyślny odstęp (w sekundach) między sprawdzeniami plików w trybie odpytywania
+DEFAULT_POLL_INTERVAL = 0.5
+
+
+class FileWatcher:
+    """
+    Bazowa klasa obserwatora plików.
+    """
+
+    def __init__(self, paths: Iterable[Path]):
+        """
+        Inicjalizacja obserwatora.
+
+        Args:
+            paths: Ścieżki do obserwowanych plików
+        """
+        self.paths = {Path(os.path.abspath(path)) for path in paths}
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Czeka na zmianę obserwowanych plików.
+
+        Args:
+            timeout: Maksymalny czas oczekiwania w sekundach (None - bez limitu)
+
+        Returns:
+            Zbiór zmienionych plików (pusty, jeśli upłynął czas oczekiwania)
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """Zwalnia zasoby obserwatora."""
+
+    def __enter__(self) -> "FileWatcher":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+
+
+class InotifyWatcher(FileWatcher):
+    """
+    Obserwator plików korzystający z Linux inotify.
+    """
+
+    def __init__(self, paths: Iterable[Path]):
+        """
+        Inicjalizacja obserwatora.
+
+        Args:
+            paths: Ścieżki do obserwowanych plików
+
+        Raises:
+            OSError: Jeśli inotify nie jest dostępne
+        """
+        super().__init__(paths)
+
+        libc = _load_libc()
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self._fd < 0:
+            error = ctypes.get_errno()
+            raise OSError(error, os.strerror(error))
+
+        # Deskryptor obserwacji katalogu -> (nazwa pliku -> ścieżka pliku)
+        self._watches: Dict[int, Dict[str, Path]] = {}
+        directories: Dict[Path, Dict[str, Path]] = {}
+        for path in self.paths:
+            directories.setdefault(path.parent, {})[path.name] = path
+
+        try:
+            for directory, names in directories.items():
+                wd = libc.inotify_add_watch(
+                    self._fd, os.fsencode(directory), _INOTIFY_MASK
+                )
+                if wd < 0:
+                    error = ctypes.get_errno()
+                    raise OSError(error, os.strerror(error), str(directory))
+                self._watches[wd] = names
+        except BaseException:
+            os.close(self._fd)
+            raise
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Czeka na zmianę obserwowanych plików.
+
+        Args:
+            timeout: Maksymalny czas oczekiwania w sekundach (None - bez limitu)
+
+        Returns:
+            Zbiór zmienionych plików (pusty, jeśli upłynął czas oczekiwania)
+        """
+        readable, _, _ = select.select([self._fd], [], [], timeout)
+        if not readable:
+            return set()
+
+        changed: Set[Path] = set()
+        while True:
+            try:
+                buffer = os.read(self._fd, _READ_SIZE)
+            except OSError as e:
+                if e.errno in (errno.EAGAIN, errno.EWOULDBLOCK):
+                    break
+                raise
+
+            offset = 0
+            while offset < len(buffer):
+                wd, mask, _, length = _EVENT_HEADER.unpack_from(buffer, offset)
+                offset += _EVENT_HEADER.size
+                name = buffer[offset : offset + length].rstrip(b"\0")
+                offset += length
+
+                if mask & IN_Q_OVERFLOW:
+                    # Utracono zdarzenia - zakładamy, że zmieniło się wszystko
+                    changed.update(self.paths)
+                    continue
+
+                path = self._watches.get(wd, {}).get(os.fsdecode(name))
+                if path is not None:
+                    changed.add(path)
+
+        return changed
+
+    def close(self) -> None:
+        """Zamyka deskryptor inotify."""
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+class PollingWatcher(FileWatcher):
+    """
+    Obserwator plików okresowo sprawdzający ich rozmiar i czas modyfikacji.
+    """
+
+    def __init__(self, paths: Iterable[Path], interval: float = DEFAULT_POLL_INTERVAL):
+        """
+        Inicjalizacja obserwatora.
+
+        Args:
+            paths: Ścieżki do obserwowanych plików
+            interval: Odstęp między sprawdzeniami w sekundach
+        """
+        super().__init__(paths)
+        self.interval = interval
+        self._snapshot = {path: self._stat(path) for path in self.paths}
+
+    @staticmethod
+    def _stat(path: Path) -> Optional[Tuple[int, int, int]]:
+        """
+        Zwraca informacje o pliku pozwalające wykryć jego zmianę.
+
+        Args:
+            path: Ścieżka do pliku
+
+        Returns:
+            Krotka (i-węzeł, rozmiar, czas modyfikacji) lub None, jeśli plik
+            nie istnieje
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def wait(self, timeout: Optional[float] = None) -> Set[Path]:
+        """
+        Czeka na zmianę obserwowanych plików.
+
+        Args:
+            timeout: Maksymalny czas oczekiwania w sekundach (None - bez limitu)
+
+        Returns:
+            Zbiór zmienionych plików (pusty, jeśli upłynął czas oczekiwania)
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            changed = set()
+            for path, previous in self._snapshot.items():
+                current = self._stat(path)
+                if current != previous:
+                    self._snapshot[path] = current
+                    changed.add(path)
+
+            if changed:
+                return changed
+
+            if deadline is None:
+                delay = self.interval
+            else:
+                delay = min(self.interval, deadline - time.monotonic())
+                if delay <= 0:
+                    return set()
+            time.sleep(delay)
+
+
+def _load_libc() -> Any:
+    """
+    Ładuje bibliotekę C z funkcjami inotify.
+
+    Returns:
+        Biblioteka C załadowana przez ctypes
+
+    Raises:
+        OSError: Jeśli system nie udostępnia inotify
+    """
+    if not sys.platform.startswith("linux"):
+        raise OSError(errno.ENOSYS, "inotify jest dostępne tylko na Linuksie")
+
+    libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    if not hasattr(libc, "inotify_init1"):
+        raise OSError(errno.ENOSYS, "Biblioteka C nie udostępnia inotify")
+
+    libc.inotify_init1.argtypes = [ctypes.c_int]
+    libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    return libc
+
+
+def create_watcher(
+    paths: Iterable[Path],
+    polling: bool = False,
+    interval: float = DEFAULT_POLL_INTERVAL,
+) -> FileWatcher:
+    """
+    Tworzy obserwatora plików, preferując inotify.
+
+    Args:
+        paths: Ścieżki do obserwowanych plików
+        polling: Czy wymusić okresowe sprawdzanie plików
+        interval: Odstęp między sprawdzeniami w trybie odpytywania
+
+    Returns:
+        Obserwator plików
+    """
+    paths = list(paths)
+    if not polling:
+        try:
+            return InotifyWatcher(paths)
+        except OSError:
+            pass
+    return PollingWatcher(paths, interval)
+
+
+def watch(
+    watcher: FileWatcher,
+    callback: Callable[[Set[Path]], Optional[bool]],
+    debounce: float = DEFAULT_DEBOUNCE,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """
+    Wywołuje callback po każdej serii zmian obserwowanych plików.
+
+    Zdarzenia następujące po sobie w odstępach krótszych niż debounce
+    (np. kilka zapisów wykonywanych przez edytor) są łączone w jedno wywołanie.
+
+    Args:
+        watcher: Obserwator plików
+        callback: Funkcja wywoływana ze zbiorem zmienionych plików;
+            zwrócenie False kończy obserwację
+        debounce: Czas ciszy w sekundach, po którym wywoływany jest callback
+        stop_event: Zdarzenie kończące obserwację (None - do przerwania procesu)
+    """
+    while stop_event is None or not stop_event.is_set():
+        # Krótki limit czasu pozwala reagować na stop_event
+        changed = watcher.wait(timeout=0.5 if stop_event is not None else None)
+        if not changed:
+            continue
+
+        while True:
+            more = watcher.wait(timeout=debounce)
+            if not more:
+                break
+            changed |= more
+
+        if callback(changed) is False:
+            return
+
+
+def watch_sync(
+    config_file: Path,
+    on_result: Callable[[Any], None],
+    on_error: Callable[[Exception], None],
+    debounce: float = DEFAULT_DEBOUNCE,
+    polling: bool = False,
+    stop_event: Optional[threading.Event] = None,
+) -> None:
+    """
+    Obserwuje plik główny synchronizacji i regeneruje pliki wyprowadzane.
+
+    Proces działa długo, więc rejestr konwerterów, skompilowane trasy
+    i wyniki wyszukiwania pakietów w conda pozostają w pamięci między
+    kolejnymi zapisami pliku.
+
+    Args:
+        config_file: Plik pyproject.toml z sekcją [tool.spectomate.sync]
+        on_result: Funkcja wywoływana z wynikiem każdej synchronizacji
+        on_error: Funkcja wywoływana z błędem konfiguracji lub konwersji
+        debounce: Czas ciszy w sekundach, po którym uruchamiana jest konwersja
+        polling: Czy wymusić okresowe sprawdzanie plików zamiast inotify
+        stop_event: Zdarzenie kończące obserwację
+    """
+    from spectomate.core.registry import ConverterRegistry
+    from spectomate.core.sync import load_sync_config, run_sync
+
+    config_file = Path(os.path.abspath(config_file))
+
+    while stop_event is None or not stop_event.is_set():
+        try:
+            config = load_sync_config(config_file)
+        except Exception as e:
+            # Błędna konfiguracja (np. w trakcie edycji) - czekamy na jej zmianę
+            on_error(e)
+            with create_watcher({config_file}, polling=polling) as watcher:
+                watch(watcher, lambda changed: False, debounce, stop_event)
+            continue
+
+        # Rozgrzewamy trasy konwersji przed pierwszą zmianą pliku
+        if config.source_format is not None:
+            for target in config.targets:
+                ConverterRegistry.get_converter(config.source_format, target.format)
+
+        def on_change(changed: Set[Path]) -> bool:
+            if config_file in changed:
+                # Zmiana konfiguracji może zmienić plik główny - obserwujemy od nowa
+                return False
+            try:
+                on_result(run_sync(config))
+            except Exception as e:
+                on_error(e)
+            return True
+
+        # Obserwator jest tworzony przed pierwszą synchronizacją, aby nie
+        # przegapić zmian dokonanych w jej trakcie
+        watched = {config_file, config.source}
+        with create_watcher(watched, polling=polling) as watcher:
+            try:
+                on_result(run_sync(config))
+            except Exception as e:
+                on_error(e)
+            watch(watcher, on_change, debounce, stop_event)
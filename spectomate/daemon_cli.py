@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Komendy CLI zarządzające demonem konwersji.
+"""
+
+import os
+import subprocess
+import sys
+import time
+from typing import Optional
+
+import click
+
+from spectomate.core.daemon import (
+    DEFAULT_IDLE_TIMEOUT,
+    ConversionDaemon,
+    get_socket_path,
+    send_request,
+)
+
+
+@click.group("daemon")
+def daemon_cli():
+    """Demon utrzymujący załadowane konwertery między wywołaniami CLI.
+
+    Gdy demon działa, polecenia convert i list-converters są do niego
+    przekazywane automatycznie (SPECTOMATE_NO_DAEMON=1 wyłącza przekazywanie).
+    """
+    pass
+
+
+@daemon_cli.command("start")
+@click.option(
+    "--idle-timeout",
+    help="Czas bezczynności (w sekundach), po którym demon kończy działanie",
+    type=float,
+    default=DEFAULT_IDLE_TIMEOUT,
+    show_default=True,
+)
+@click.option(
+    "--socket", "socket_path", help="Ścieżka gniazda UNIX demona", default=None
+)
+@click.option("--background", "-b", is_flag=True, help="Uruchom demona w tle")
+def start_command(idle_timeout: float, socket_path: Optional[str], background: bool):
+    """Uruchamia demona konwersji.
+
+    Examples:
+        spectomate daemon start --background
+        spectomate daemon start --idle-timeout 60
+    """
+    socket_path = socket_path or get_socket_path()
+
+    if background:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "spectomate",
+                "daemon",
+                "start",
+                "--idle-timeout",
+                str(idle_timeout),
+                "--socket",
+                socket_path,
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+
+        # Czekamy, aż demon zacznie przyjmować połączenia
+        deadline = time.monotonic() + 10
+        while time.monotonic() < deadline:
+            response = send_request({"command": "ping"}, socket_path, 1.0)
+            if response is not None:
+                click.echo(f"Demon działa (PID {response['pid']}, {socket_path})")
+                return
+            time.sleep(0.05)
+
+        click.echo("Nie udało się uruchomić demona", err=True)
+        sys.exit(1)
+
+    daemon = ConversionDaemon(socket_path, idle_timeout)
+    click.echo(f"Demon nasłuchuje na {socket_path} (PID {os.getpid()})")
+    try:
+        daemon.serve()
+    except RuntimeError as e:
+        click.echo(str(e), err=True)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon_cli.command("stop")
+@click.option(
+    "--socket", "socket_path", help="Ścieżka gniazda UNIX demona", default=None
+)
+def stop_command(socket_path: Optional[str]):
+    """Zatrzymuje demona konwersji."""
+    if send_request({"command": "shutdown"}, socket_path, 5.0) is None:
+        click.echo("Demon nie działa")
+        return
+    click.echo("Demon został zatrzymany")
+
+
+@daemon_cli.command("status")
+@click.option(
+    "--socket", "socket_path", help="Ścieżka gniazda UNIX demona", default=None
+)
+def status_command(socket_path: Optional[str]):
+    """Wyświetla stan demona konwersji (kod wyjścia 1, jeśli nie działa)."""
+    response = send_request({"command": "ping"}, socket_path, 5.0)
+    if response is None:
+        click.echo("Demon nie działa")
+        sys.exit(1)
+    click.echo(f"Demon działa (PID {response['pid']}, wersja {response['version']})")
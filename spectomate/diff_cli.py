@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Komenda CLI porównująca zależności z dwóch plików (także w różnych formatach).
+"""
+
+import json
+import sys
+from typing import List
+
+import click
+
+from spectomate.core.utils import get_available_formats
+
+
+@click.command("diff")
+@click.argument(
+    "old_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+)
+@click.argument(
+    "new_file",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+)
+@click.option(
+    "--old-format",
+    help="Format pierwszego pliku (auto - wykrycie na podstawie pliku)",
+    type=click.Choice(sorted(get_available_formats("input")) + ["auto"]),
+    default="auto",
+    show_default=True,
+)
+@click.option(
+    "--new-format",
+    help="Format drugiego pliku (auto - wykrycie na podstawie pliku)",
+    type=click.Choice(sorted(get_available_formats("input")) + ["auto"]),
+    default="auto",
+    show_default=True,
+)
+@click.option("--dev", is_flag=True, help="Uwzględnij zależności deweloperskie")
+@click.option("--json", "as_json", is_flag=True, help="Wypisz wynik w formacie JSON")
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Zakończ z kodem 1, jeśli pliki się różnią (np. w CI)",
+)
+def diff_command(
+    old_file: str,
+    new_file: str,
+    old_format: str,
+    new_format: str,
+    dev: bool,
+    as_json: bool,
+    check: bool,
+):
+    """Porównuje pakiety i ograniczenia wersji z dwóch plików zależności.
+
+    Examples:
+        spectomate diff requirements.txt environment.yml
+        spectomate diff old.lock new.lock --json --check
+    """
+    from spectomate.core.diff import diff_files
+
+    warnings: List[str] = []
+    try:
+        result = diff_files(
+            old_file,
+            new_file,
+            None if old_format == "auto" else old_format,
+            None if new_format == "auto" else new_format,
+            options={"include_dev": dev},
+            warnings=warnings,
+        )
+    except Exception as e:
+        click.echo(f"Błąd podczas porównywania plików: {e}", err=True)
+        sys.exit(1)
+
+    for warning in warnings:
+        click.echo(f"Uwaga: {warning}", err=True)
+
+    if as_json:
+        data = {"old": old_file, "new": new_file, **result.to_dict()}
+        click.echo(json.dumps(data, indent=2, ensure_ascii=False))
+    elif result:
+        for change in result.changes:
+            click.echo(str(change))
+    else:
+        click.echo("Pliki mają te same zależności")
+
+    if check and result:
+        sys.exit(1)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Komenda CLI raportująca rozbieżności zależności między projektami w drzewie.
+"""
+
+import json
+import sys
+from typing import Optional
+
+import click
+
+
+@click.command("drift")
+@click.argument(
+    "root",
+    type=click.Path(exists=True, file_okay=False, dir_okay=True),
+    default=".",
+)
+@click.option(
+    "--jobs",
+    "-j",
+    help="Liczba równolegle wczytywanych plików",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option("--json", "as_json", is_flag=True, help="Wypisz raport w formacie JSON")
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Zakończ z kodem 1, jeśli wykryto rozbieżności (np. w CI)",
+)
+def drift_command(root: str, jobs: Optional[int], as_json: bool, check: bool):
+    """Raportuje rozbieżne wersje pakietów w projektach w drzewie katalogów.
+
+    Examples:
+        spectomate drift                 # Przeszukaj bieżący katalog
+        spectomate drift ./services --json
+        spectomate drift --check         # Kod wyjścia 1 przy rozbieżnościach
+    """
+    from spectomate.core.drift import collect_drift
+
+    try:
+        report = collect_drift(root, max_workers=jobs)
+    except Exception as e:
+        click.echo(f"Błąd podczas analizy zależności: {e}", err=True)
+        sys.exit(1)
+
+    for file, error in report.errors.items():
+        click.echo(f"Uwaga: pominięto {file}: {error}", err=True)
+    for warning in report.warnings:
+        click.echo(f"Uwaga: {warning}", err=True)
+
+    if as_json:
+        click.echo(json.dumps(report.to_dict(), indent=2, ensure_ascii=False))
+    else:
+        click.echo(
+            f"Przeanalizowano {len(report.manifests)} plików "
+            f"w {len(report.projects)} projektach, "
+            f"{len(report.packages)} pakietów"
+        )
+
+        divergent = report.divergent()
+        if divergent:
+            click.echo(f"\nRozbieżne wersje ({len(divergent)}):")
+            for package in divergent:
+                pins = ", ".join(
+                    f"{version} ({count})" for version, count in package.pins.items()
+                )
+                click.echo(
+                    f"  {package.name}: {pins}; "
+                    f"najczęstsza {package.most_common_version}"
+                )
+                for usage in package.outliers():
+                    click.echo(f"    {usage.file}: {usage.requirement}")
+
+        conflicting = report.conflicting()
+        if conflicting:
+            click.echo(f"\nSprzeczne ograniczenia ({len(conflicting)}):")
+            for package in conflicting:
+                click.echo(f"  {package.name}:")
+                for usage in package.usages:
+                    if usage.requirement.specifier:
+                        click.echo(f"    {usage.file}: {usage.requirement}")
+
+        if not divergent and not conflicting:
+            click.echo("Nie wykryto rozbieżności")
+
+    if check and report.has_drift():
+        sys.exit(1)
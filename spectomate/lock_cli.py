@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""
+Komenda CLI tworząca plik z przypiętymi wersjami zależności (lock) bez dostępu do sieci.
+"""
+
+import sys
+from pathlib import Path
+from typing import List, Optional
+
+import click
+
+from spectomate.core.utils import WRITE_UNCHANGED, get_available_formats
+
+
+@click.command("lock")
+@click.option(
+    "--input-file",
+    "-f",
+    help="Plik z zależnościami projektu",
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+    required=True,
+)
+@click.option(
+    "--input-format",
+    "-i",
+    help="Format wejściowy (auto - wykrycie na podstawie pliku)",
+    type=click.Choice(sorted(get_available_formats("input")) + ["auto"]),
+    default="auto",
+    show_default=True,
+)
+@click.option(
+    "--index",
+    "index_path",
+    help="Kopia indeksu: katalog simple API lub plik JSON z metadanymi",
+    type=click.Path(exists=True),
+    required=True,
+)
+@click.option(
+    "--output-format",
+    "-o",
+    help="Format pliku wynikowego",
+    type=click.Choice(sorted(get_available_formats("output") | {"pip"})),
+    default="pip",
+    show_default=True,
+)
+@click.option(
+    "--output-file",
+    "-t",
+    help="Plik wynikowy z przypiętymi wersjami",
+    type=click.Path(file_okay=True, dir_okay=False, writable=True),
+    required=True,
+)
+@click.option(
+    "--python-version",
+    help="Docelowa wersja Pythona (domyślnie bieżąca)",
+)
+@click.option("--pre", is_flag=True, help="Dopuszczaj wersje przedpremierowe")
+@click.option("--dev", is_flag=True, help="Uwzględnij zależności deweloperskie")
+def lock_command(
+    input_file: str,
+    input_format: str,
+    index_path: str,
+    output_format: str,
+    output_file: str,
+    python_version: Optional[str],
+    pre: bool,
+    dev: bool,
+):
+    """Przypina wersje wszystkich zależności na podstawie lokalnej kopii indeksu.
+
+    Examples:
+        spectomate lock -f pyproject.toml --index ./simple -t requirements.lock
+        spectomate lock -f environment.yml --index index.json -o conda -t env.lock.yml
+    """
+    from spectomate.core.ir import Requirement, load_requirements, write_requirements
+    from spectomate.core.resolver import PackageIndex, ResolutionError, resolve
+
+    warnings: List[str] = []
+    try:
+        requirements = load_requirements(
+            input_file,
+            None if input_format == "auto" else input_format,
+            options={"include_dev": dev},
+            warnings=warnings,
+        )
+        index = PackageIndex.open(index_path)
+        pins = resolve(
+            requirements,
+            index,
+            python_version=python_version,
+            prereleases=pre,
+            warnings=warnings,
+        )
+        status = write_requirements(
+            [Requirement(name, f"=={version}") for name, version in pins.items()],
+            output_format,
+            Path(output_file),
+            warnings=warnings,
+        )
+    except ResolutionError as e:
+        for warning in warnings:
+            click.echo(f"Uwaga: {warning}", err=True)
+        click.echo(f"Błąd: {e}", err=True)
+        sys.exit(1)
+    except Exception as e:
+        click.echo(f"Błąd podczas tworzenia pliku lock: {e}", err=True)
+        sys.exit(1)
+
+    for warning in warnings:
+        click.echo(f"Uwaga: {warning}", err=True)
+
+    if status == WRITE_UNCHANGED:
+        click.echo(f"Plik {output_file} jest aktualny (bez zmian)")
+    else:
+        click.echo(f"Przypięto {len(pins)} pakietów w pliku {output_file}")
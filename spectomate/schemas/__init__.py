@@ -3,6 +3,7 @@ Moduł zawierający definicje schematów dla różnych formatów pakietów.
 """
 
 from spectomate.schemas.conda_schema import CondaSchema
+from spectomate.schemas.ir_schema import IrSchema
 from spectomate.schemas.pip_schema import PipSchema
 from spectomate.schemas.poetry_schema import PoetrySchema
 
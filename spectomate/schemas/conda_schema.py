@@ -2,22 +2,57 @@
 Schemat dla formatu conda (environment.yml).
 """
 
+import io
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple, Union
 
 import yaml
 
+from spectomate.core.ir import Requirement, parse_requirement
+from spectomate.core.match_spec import (
+    conda_version_to_pep440,
+    parse_match_spec,
+    pep440_to_conda_version,
+)
+from spectomate.core.parse_cache import cached_parse
+from spectomate.core.utils import AtomicFileWriter
+from spectomate.core.versions import intersect_specifiers, is_satisfiable
+
+# Skalary, które YAML zapisuje bez cudzysłowów i odczytuje jako ten sam string
+_PLAIN_SCALAR = re.compile(r"^[A-Za-z_][A-Za-z0-9_.\-=<>!~*+,/\[\]@:]*(?<!:)$")
+
+# Słowa, które YAML interpretuje jako wartości logiczne lub null
+_RESERVED_SCALARS = {
+    "y",
+    "n",
+    "yes",
+    "no",
+    "true",
+    "false",
+    "on",
+    "off",
+    "null",
+}
+
 
 class CondaSchema:
     """
     Klasa definiująca schemat dla formatu conda (environment.yml).
     """
 
+    # Wersja parsera; zmiana wyniku parse_string() wymaga jej zwiększenia,
+    # aby unieważnić wpisy pamięci podręcznej (spectomate.core.parse_cache)
+    PARSER_VERSION = 1
+
     @staticmethod
     def parse_file(file_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Parsuje plik environment.yml.
 
+        Przy włączonej pamięci podręcznej (SPECTOMATE_PARSE_CACHE) wynik jest
+        odczytywany z niej, jeśli plik nie zmienił się od ostatniego parsowania.
+
         Args:
             file_path: Ścieżka do pliku environment.yml
 
@@ -29,11 +64,27 @@ class CondaSchema:
         if not file_path.exists():
             raise FileNotFoundError(f"Plik nie istnieje: {file_path}")
 
-        with open(file_path, "r") as f:
-            try:
-                conda_env = yaml.safe_load(f)
-            except yaml.YAMLError as e:
-                raise ValueError(f"Błąd parsowania pliku YAML: {e}")
+        def parse() -> Dict[str, Any]:
+            with open(file_path, "r") as f:
+                return CondaSchema.parse_string(f.read())
+
+        return cached_parse(file_path, "conda", CondaSchema.PARSER_VERSION, parse)
+
+    @staticmethod
+    def parse_string(content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku environment.yml.
+
+        Args:
+            content: Zawartość pliku environment.yml
+
+        Returns:
+            Słownik z informacjami o środowisku conda
+        """
+        try:
+            conda_env = yaml.safe_load(content)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Błąd parsowania pliku YAML: {e}")
 
         # Sprawdzamy, czy plik ma wymagane pola
         if not isinstance(conda_env, dict):
@@ -97,6 +148,110 @@ class CondaSchema:
 
         return conda_deps
 
+    @staticmethod
+    def _format_list_item(item: Any, indent: str) -> str:
+        """
+        Formatuje pojedynczy element listy YAML w stylu blokowym.
+
+        Args:
+            item: Element listy
+            indent: Wcięcie elementu
+
+        Returns:
+            Sformatowany element zakończony znakiem nowej linii
+        """
+        if CondaSchema._is_plain_scalar(item):
+            return f"{indent}- {item}\n"
+
+        # Nietypowe wartości formatujemy za pomocą biblioteki yaml
+        chunk = yaml.dump([item], default_flow_style=False, sort_keys=False)
+        if not indent:
+            return chunk
+        return "".join(indent + line for line in chunk.splitlines(True))
+
+    @staticmethod
+    def _is_plain_scalar(value: Any) -> bool:
+        """
+        Sprawdza, czy wartość można zapisać w YAML bez cudzysłowów.
+
+        Args:
+            value: Sprawdzana wartość
+
+        Returns:
+            True jeśli wartość jest prostym stringiem
+        """
+        return (
+            isinstance(value, str)
+            and _PLAIN_SCALAR.match(value) is not None
+            and value.lower() not in _RESERVED_SCALARS
+        )
+
+    @staticmethod
+    def emit_environment_yml(data: Dict[str, Any], stream: TextIO) -> None:
+        """
+        Zapisuje zawartość pliku environment.yml do strumienia sekcja po sekcji.
+
+        Zależności są zapisywane pojedynczo, więc cały dokument nigdy nie jest
+        budowany w pamięci, a zapis może zacząć się od razu.
+
+        Args:
+            data: Dane w formacie schematu conda
+            stream: Strumień tekstowy, do którego zapisujemy dane
+        """
+        for key, value in data.items():
+            # Pomijamy pole format, które nie jest częścią standardowego pliku
+            if key == "format":
+                continue
+
+            if not value or not isinstance(value, list):
+                stream.write(
+                    yaml.dump({key: value}, default_flow_style=False, sort_keys=False)
+                )
+                continue
+
+            if not CondaSchema._is_plain_scalar(key):
+                # Nietypowe klucze zapisujemy w całości za pomocą biblioteki yaml
+                stream.write(
+                    yaml.dump({key: value}, default_flow_style=False, sort_keys=False)
+                )
+                continue
+
+            stream.write(f"{key}:\n")
+
+            for item in value:
+                nested = CondaSchema._get_nested_list(item)
+                if nested is None:
+                    stream.write(CondaSchema._format_list_item(item, ""))
+                    continue
+
+                # Zagnieżdżona lista, np. sekcja pip w zależnościach
+                nested_key, nested_items = nested
+                stream.write(f"- {nested_key}:\n")
+                for nested_item in nested_items:
+                    stream.write(CondaSchema._format_list_item(nested_item, "  "))
+
+    @staticmethod
+    def _get_nested_list(item: Any) -> Optional[Tuple[str, List[Any]]]:
+        """
+        Rozpoznaje element listy postaci {klucz: [elementy]}, np. {"pip": [...]}.
+
+        Args:
+            item: Element listy zależności
+
+        Returns:
+            Para (klucz, elementy) lub None dla innych elementów
+        """
+        if not isinstance(item, dict) or len(item) != 1:
+            return None
+
+        nested_key, nested_items = next(iter(item.items()))
+        if not CondaSchema._is_plain_scalar(nested_key):
+            return None
+        if not isinstance(nested_items, list) or not nested_items:
+            return None
+
+        return nested_key, nested_items
+
     @staticmethod
     def generate_environment_yml(data: Dict[str, Any]) -> str:
         """
@@ -108,15 +263,9 @@ class CondaSchema:
         Returns:
             Zawartość pliku environment.yml
         """
-        # Tworzymy kopię danych, aby nie modyfikować oryginału
-        env_data = data.copy()
-
-        # Usuwamy pole format, które nie jest częścią standardowego pliku environment.yml
-        if "format" in env_data:
-            del env_data["format"]
-
-        # Konwertujemy dane do YAML
-        return yaml.dump(env_data, default_flow_style=False, sort_keys=False)
+        stream = io.StringIO()
+        CondaSchema.emit_environment_yml(data, stream)
+        return stream.getvalue()
 
     @staticmethod
     def write_environment_yml(
@@ -134,53 +283,274 @@ class CondaSchema:
         """
         output_path = Path(output_path)
 
-        # Tworzymy katalogi, jeśli nie istnieją
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        CondaSchema.update_environment_yml(data, output_path)
 
-        content = CondaSchema.generate_environment_yml(data)
+        return output_path
 
-        with open(output_path, "w") as f:
-            f.write(content)
+    @staticmethod
+    def update_environment_yml(
+        data: Dict[str, Any], output_path: Union[str, Path]
+    ) -> str:
+        """
+        Zapisuje dane do pliku environment.yml, jeśli jego zawartość się zmieniła.
 
-        return output_path
+        Niezmieniony plik nie jest nadpisywany, a zmieniony jest zapisywany
+        atomowo (przez plik tymczasowy i zmianę nazwy).
+
+        Args:
+            data: Dane w formacie schematu conda
+            output_path: Ścieżka do pliku wyjściowego
+
+        Returns:
+            WRITE_UPDATED jeśli plik został zapisany, WRITE_UNCHANGED jeśli
+            miał już taką zawartość
+        """
+        writer = AtomicFileWriter(output_path)
+        with writer as stream:
+            CondaSchema.emit_environment_yml(data, stream)
+
+        return writer.status
 
     @staticmethod
     def merge_environments(
-        env1: Dict[str, Any], env2: Dict[str, Any]
+        *environments: Dict[str, Any], warnings: Optional[List[str]] = None
     ) -> Dict[str, Any]:
         """
-        Łączy dwa środowiska conda.
+        Łączy dowolną liczbę środowisk conda.
+
+        Środowiska są podawane w kolejności priorytetu. Nazwa i pozostałe pola
+        pochodzą z pierwszego środowiska, a kanały są łączone z zachowaniem
+        kolejności pierwszego wystąpienia (pole channels pojawia się tylko
+        wtedy, gdy miało je któreś środowisko). Zależności są grupowane według
+        znormalizowanej nazwy pakietu, a ograniczenia wersji tego samego
+        pakietu są łączone w jedno. Jeśli ograniczeń nie da się pogodzić,
+        pozostaje ograniczenie z pierwszego środowiska, a konflikt jest
+        zgłaszany w warnings. Czas działania jest liniowy względem łącznej
+        liczby zależności. Inne niż pip wpisy słownikowe w dependencies są
+        przenoszone bez zmian (powtórzone - tylko raz).
 
         Args:
-            env1: Pierwsze środowisko
-            env2: Drugie środowisko
+            *environments: Środowiska conda (np. wynik parse_file)
+            warnings: Lista, do której dopisywane są opisy konfliktów
 
         Returns:
             Połączone środowisko
-        """
-        # Tworzymy kopię pierwszego środowiska
-        merged_env = env1.copy()
-
-        # Łączymy kanały
-        channels1 = set(env1.get("channels", []))
-        channels2 = set(env2.get("channels", []))
-        merged_env["channels"] = list(channels1.union(channels2))
-
-        # Łączymy zależności conda
-        conda_deps1 = set(CondaSchema.extract_conda_dependencies(env1))
-        conda_deps2 = set(CondaSchema.extract_conda_dependencies(env2))
 
-        # Łączymy zależności pip
-        pip_deps1 = set(CondaSchema.extract_pip_dependencies(env1))
-        pip_deps2 = set(CondaSchema.extract_pip_dependencies(env2))
+        Raises:
+            ValueError: Jeśli nie podano żadnego środowiska
+        """
+        if not environments:
+            raise ValueError("Brak środowisk do połączenia")
 
-        # Tworzymy nową listę zależności
-        merged_deps = list(conda_deps1.union(conda_deps2))
-        merged_pip_deps = list(pip_deps1.union(pip_deps2))
+        # Tworzymy kopię pierwszego środowiska
+        merged_env = dict(environments[0])
+
+        # Łączymy kanały, zachowując ich priorytet
+        if any("channels" in env for env in environments):
+            merged_env["channels"] = list(
+                dict.fromkeys(
+                    channel
+                    for env in environments
+                    for channel in env.get("channels", None) or []
+                )
+            )
+
+        # Grupujemy zależności według nazwy pakietu w jednym przejściu
+        conda_specs: Dict[str, List[str]] = {}
+        pip_specs: Dict[str, List[str]] = {}
+        # Wpisy słownikowe inne niż pip (np. sekcje innych instalatorów)
+        other_entries: List[Dict[str, Any]] = []
+        for env in environments:
+            for dep in CondaSchema.extract_conda_dependencies(env):
+                conda_specs.setdefault(CondaSchema._conda_key(dep), []).append(dep)
+            for dep in CondaSchema.extract_pip_dependencies(env):
+                pip_specs.setdefault(CondaSchema._pip_key(dep), []).append(dep)
+            for dep in env.get("dependencies", None) or []:
+                if isinstance(dep, dict):
+                    entry = {key: value for key, value in dep.items() if key != "pip"}
+                    if entry and entry not in other_entries:
+                        other_entries.append(entry)
+
+        merged_deps: List[Any] = [
+            CondaSchema._merge_conda_specs(specs, warnings)
+            for specs in conda_specs.values()
+        ]
+        merged_pip_deps = [
+            CondaSchema._merge_pip_requirements(specs, warnings)
+            for specs in pip_specs.values()
+        ]
 
         if merged_pip_deps:
             merged_deps.append({"pip": merged_pip_deps})
+        merged_deps.extend(other_entries)
 
         merged_env["dependencies"] = merged_deps
 
         return merged_env
+
+    @staticmethod
+    def _conda_key(spec: str) -> str:
+        """
+        Zwraca klucz grupowania specyfikacji conda.
+
+        Args:
+            spec: Specyfikacja pakietu conda
+
+        Returns:
+            Nazwa pakietu małymi literami (lub sama specyfikacja, jeśli jest
+            nieprawidłowa)
+        """
+        try:
+            return parse_match_spec(spec)[0].lower()
+        except ValueError:
+            return spec.strip()
+
+    @staticmethod
+    def _pip_key(line: str) -> str:
+        """
+        Zwraca klucz grupowania wymagania pip.
+
+        Args:
+            line: Wymaganie pip
+
+        Returns:
+            Znormalizowana nazwa pakietu (lub samo wymaganie, jeśli jest
+            nieprawidłowe)
+        """
+        try:
+            return parse_requirement(line).key
+        except ValueError:
+            return line.strip()
+
+    @staticmethod
+    def _merge_conda_specs(specs: List[str], warnings: Optional[List[str]]) -> str:
+        """
+        Łączy specyfikacje conda tego samego pakietu.
+
+        Args:
+            specs: Specyfikacje w kolejności priorytetu środowisk
+            warnings: Lista, do której dopisywane są opisy konfliktów
+
+        Returns:
+            Połączona specyfikacja
+        """
+        unique = list(dict.fromkeys(spec.strip() for spec in specs))
+        try:
+            parsed = [(spec, *parse_match_spec(spec)) for spec in unique]
+        except ValueError:
+            return unique[0]
+
+        constrained = [item for item in parsed if item[2] or item[3]]
+        if len(unique) == 1 or not constrained:
+            return unique[0]
+
+        name = constrained[0][1]
+        versions = list(dict.fromkeys(item[2] for item in constrained if item[2]))
+        builds = list(dict.fromkeys(item[3] for item in constrained if item[3]))
+
+        try:
+            if len(builds) > 1:
+                raise ValueError("różne buildy")
+            specifier = intersect_specifiers(
+                conda_version_to_pep440(version) for version in versions
+            )
+            if not is_satisfiable(specifier):
+                raise ValueError("ograniczenia się wykluczają")
+            version = (
+                versions[0]
+                if len(versions) == 1
+                else pep440_to_conda_version(specifier)
+            )
+        except ValueError as e:
+            if warnings is not None:
+                warnings.append(
+                    f"Konflikt wersji pakietu {name} ({e}): "
+                    f"{', '.join(item[0] for item in constrained)}; "
+                    f"pozostawiono {constrained[0][0]}"
+                )
+            return constrained[0][0]
+
+        build = builds[0] if builds else ""
+        # Jeśli któraś specyfikacja wyraża już całe przecięcie, zostawiamy ją
+        for spec, _, spec_version, spec_build in constrained:
+            if spec_build == build and (
+                spec_version == version
+                or (spec_version and conda_version_to_pep440(spec_version) == specifier)
+            ):
+                return spec
+
+        # Zachowujemy kanał z pierwszej specyfikacji, która go wskazuje
+        prefix = next(
+            (spec.split("::", 1)[0] + "::" for spec, *_ in constrained if "::" in spec),
+            "",
+        )
+        if build:
+            return f"{prefix}{name} {version or '*'} {build}"
+        if version[:1].isalnum():
+            return f"{prefix}{name} {version}"
+        return f"{prefix}{name}{version}"
+
+    @staticmethod
+    def _merge_pip_requirements(lines: List[str], warnings: Optional[List[str]]) -> str:
+        """
+        Łączy wymagania pip tego samego pakietu.
+
+        Args:
+            lines: Wymagania w kolejności priorytetu środowisk
+            warnings: Lista, do której dopisywane są opisy konfliktów
+
+        Returns:
+            Połączone wymaganie
+        """
+        unique = list(dict.fromkeys(line.strip() for line in lines))
+        if len(unique) == 1:
+            return unique[0]
+        try:
+            requirements = [parse_requirement(line) for line in unique]
+        except ValueError:
+            return unique[0]
+
+        first = requirements[0]
+        urls = list(dict.fromkeys(req.url for req in requirements if req.url))
+        try:
+            if len(urls) > 1:
+                raise ValueError("różne adresy URL")
+            specifier = intersect_specifiers(req.specifier for req in requirements)
+            if not is_satisfiable(specifier):
+                raise ValueError("ograniczenia się wykluczają")
+        except ValueError as e:
+            kept = next(
+                (
+                    line
+                    for line, req in zip(unique, requirements)
+                    if req.url or req.specifier
+                ),
+                unique[0],
+            )
+            if warnings is not None:
+                warnings.append(
+                    f"Konflikt wersji pakietu {first.name} ({e}): "
+                    f"{', '.join(unique)}; pozostawiono {kept}"
+                )
+            return kept
+
+        # Pakiet jest potrzebny, gdy spełniony jest marker któregokolwiek środowiska
+        markers = list(dict.fromkeys(req.marker for req in requirements))
+        if "" in markers:
+            marker = ""
+        elif len(markers) == 1:
+            marker = markers[0]
+        else:
+            marker = " or ".join(f"({marker})" for marker in markers)
+
+        merged = Requirement(
+            first.name,
+            "" if urls else specifier,
+            [extra for req in requirements for extra in req.extras],
+            marker,
+            urls[0] if urls else "",
+        )
+        for line, req in zip(unique, requirements):
+            if req == merged:
+                return line
+        return merged.to_pip()
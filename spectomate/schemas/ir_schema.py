@@ -0,0 +1,288 @@
+"""
+Schemat dla formatu ir - zserializowanej kanonicznej reprezentacji wymagań.
+
+Plik ir zawiera wymagania w postaci z spectomate.core.ir, więc inne narzędzia
+mogą korzystać z wyników parsowania bez ponownego czytania requirements.txt,
+environment.yml czy pyproject.toml. Plik jest zapisywany jako zwarty JSON
+albo, jeśli nazwa kończy się na .msgpack, w formacie msgpack (wymaga pakietu
+msgpack). Przykładowa zawartość:
+
+    {"format":"spectomate-ir","version":1,
+     "fields":["name","specifier","extras","marker","url"],
+     "requirements":[["numpy",">=1.21"],["requests","",["socks"]]]}
+
+Każde wymaganie to lista wartości w kolejności "fields"; puste pola na końcu
+są pomijane. Odczyt nie uruchamia parsera PEP 508, dlatego jest znacznie
+szybszy niż ponowne parsowanie pliku źródłowego.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+
+from spectomate.core.ir import Requirement
+from spectomate.core.utils import write_bytes_if_changed
+
+# Nagłówek i wersja formatu pliku; zmiana układu pól wymaga nowej wersji
+IR_FORMAT = "spectomate-ir"
+IR_VERSION = 1
+
+# Kolejność pól wymagania w pliku
+IR_FIELDS = ("name", "specifier", "extras", "marker", "url")
+
+# Rozszerzenia plików zapisywanych w formacie msgpack
+MSGPACK_SUFFIXES = (".msgpack", ".mpk")
+
+
+def _import_msgpack() -> Any:
+    """
+    Importuje opcjonalny pakiet msgpack.
+
+    Returns:
+        Moduł msgpack
+
+    Raises:
+        ValueError: Jeśli pakiet msgpack nie jest zainstalowany
+    """
+    try:
+        import msgpack
+    except ImportError:
+        raise ValueError(
+            "Format ir w wersji msgpack wymaga pakietu msgpack "
+            "(pip install msgpack) - użyj pliku .json"
+        )
+    return msgpack
+
+
+class IrSchema:
+    """
+    Klasa definiująca schemat dla formatu ir.
+    """
+
+    @staticmethod
+    def to_record(requirement: Requirement) -> List[Any]:
+        """
+        Zamienia wymaganie na zwarty rekord zapisywany w pliku.
+
+        Args:
+            requirement: Wymaganie
+
+        Returns:
+            Lista wartości pól IR_FIELDS bez pustych pól na końcu
+        """
+        record: List[Any] = [
+            requirement.name,
+            requirement.specifier,
+            list(requirement.extras),
+            requirement.marker,
+            requirement.url,
+        ]
+        while len(record) > 1 and not record[-1]:
+            record.pop()
+        return record
+
+    @staticmethod
+    def from_record(record: List[Any]) -> Requirement:
+        """
+        Odtwarza wymaganie z rekordu zapisanego w pliku.
+
+        Args:
+            record: Lista wartości pól IR_FIELDS
+
+        Returns:
+            Wymaganie
+
+        Raises:
+            ValueError: Jeśli rekord jest nieprawidłowy
+        """
+        if (
+            not isinstance(record, list)
+            or not 1 <= len(record) <= len(IR_FIELDS)
+            or not isinstance(record[0], str)
+            or not record[0]
+        ):
+            raise ValueError(f"Nieprawidłowy rekord wymagania w pliku ir: {record!r}")
+        return Requirement(*record)
+
+    @staticmethod
+    def to_document(data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Tworzy dokument zapisywany w pliku na podstawie danych schematu.
+
+        Args:
+            data: Dane w formacie schematu ir
+
+        Returns:
+            Dokument z nagłówkiem, wersją i rekordami wymagań
+        """
+        if "requirements" not in data:
+            raise ValueError("Brak wymaganych zależności w danych")
+
+        return {
+            "format": IR_FORMAT,
+            "version": IR_VERSION,
+            "fields": list(IR_FIELDS),
+            "requirements": [IrSchema.to_record(req) for req in data["requirements"]],
+        }
+
+    @staticmethod
+    def from_document(document: Any) -> Dict[str, Any]:
+        """
+        Odczytuje dane schematu z dokumentu wczytanego z pliku.
+
+        Args:
+            document: Dokument zdekodowany z JSON lub msgpack
+
+        Returns:
+            Dane w formacie schematu ir
+
+        Raises:
+            ValueError: Jeśli dokument nie jest plikiem ir lub ma nieobsługiwaną
+                wersję
+        """
+        if not isinstance(document, dict) or document.get("format") != IR_FORMAT:
+            raise ValueError("To nie jest plik w formacie ir (brak nagłówka)")
+
+        version = document.get("version")
+        if version != IR_VERSION:
+            raise ValueError(
+                f"Nieobsługiwana wersja formatu ir: {version} "
+                f"(obsługiwana: {IR_VERSION})"
+            )
+
+        records = document.get("requirements")
+        if not isinstance(records, list):
+            raise ValueError("Brak listy wymagań w pliku ir")
+
+        from_record = IrSchema.from_record
+        return {"format": "ir", "requirements": [from_record(r) for r in records]}
+
+    @staticmethod
+    def from_requirements(requirements: Iterable[Requirement]) -> Dict[str, Any]:
+        """
+        Tworzy dane schematu z listy wymagań.
+
+        Args:
+            requirements: Wymagania
+
+        Returns:
+            Dane w formacie schematu ir
+        """
+        return {"format": "ir", "requirements": list(requirements)}
+
+    @staticmethod
+    def parse_bytes(content: bytes) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku ir w formacie JSON lub msgpack.
+
+        Format jest rozpoznawany po pierwszym bajcie (dokument JSON zaczyna
+        się od "{", a mapa msgpack od bajtu z zakresu 0x80-0x8f lub 0xde/0xdf).
+
+        Args:
+            content: Zawartość pliku
+
+        Returns:
+            Dane w formacie schematu ir
+
+        Raises:
+            ValueError: Jeśli zawartość nie jest prawidłowym plikiem ir
+        """
+        if content.lstrip()[:1] == b"{":
+            return IrSchema.parse_string(content.decode("utf-8"))
+
+        msgpack = _import_msgpack()
+        try:
+            document = msgpack.unpackb(content, raw=False)
+        except Exception as e:
+            raise ValueError(f"Nieprawidłowy plik ir (msgpack): {e}")
+        return IrSchema.from_document(document)
+
+    @staticmethod
+    def parse_string(content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku ir w formacie JSON.
+
+        Args:
+            content: Zawartość pliku
+
+        Returns:
+            Dane w formacie schematu ir
+
+        Raises:
+            ValueError: Jeśli zawartość nie jest prawidłowym plikiem ir
+        """
+        try:
+            document = json.loads(content)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Nieprawidłowy plik ir (JSON): {e}") from e
+        return IrSchema.from_document(document)
+
+    @staticmethod
+    def parse_file(file_path: Union[str, Path]) -> Dict[str, Any]:
+        """
+        Parsuje plik ir.
+
+        Args:
+            file_path: Ścieżka do pliku ir
+
+        Returns:
+            Dane w formacie schematu ir
+        """
+        file_path = Path(file_path)
+
+        if not file_path.exists():
+            raise FileNotFoundError(f"Plik nie istnieje: {file_path}")
+
+        return IrSchema.parse_bytes(file_path.read_bytes())
+
+    @staticmethod
+    def generate_json(data: Dict[str, Any]) -> str:
+        """
+        Generuje zawartość pliku ir w formacie JSON.
+
+        Args:
+            data: Dane w formacie schematu ir
+
+        Returns:
+            Zwarty dokument JSON zakończony znakiem nowej linii
+        """
+        document = IrSchema.to_document(data)
+        return json.dumps(document, ensure_ascii=False, separators=(",", ":")) + "\n"
+
+    @staticmethod
+    def generate_bytes(data: Dict[str, Any], binary: bool = False) -> bytes:
+        """
+        Generuje zawartość pliku ir.
+
+        Args:
+            data: Dane w formacie schematu ir
+            binary: Czy użyć formatu msgpack zamiast JSON
+
+        Returns:
+            Zawartość pliku
+        """
+        if not binary:
+            return IrSchema.generate_json(data).encode("utf-8")
+        return _import_msgpack().packb(IrSchema.to_document(data), use_bin_type=True)
+
+    @staticmethod
+    def update_file(data: Dict[str, Any], output_path: Union[str, Path]) -> str:
+        """
+        Zapisuje dane do pliku ir, jeśli jego zawartość się zmieniła.
+
+        Pliki z rozszerzeniem .msgpack (lub .mpk) są zapisywane w formacie
+        msgpack, pozostałe jako JSON.
+
+        Args:
+            data: Dane w formacie schematu ir
+            output_path: Ścieżka do pliku wyjściowego
+
+        Returns:
+            WRITE_UPDATED jeśli plik został zapisany, WRITE_UNCHANGED jeśli
+            miał już taką zawartość
+        """
+        output_path = Path(output_path)
+        binary = output_path.suffix.lower() in MSGPACK_SUFFIXES
+        return write_bytes_if_changed(
+            output_path, IrSchema.generate_bytes(data, binary)
+        )
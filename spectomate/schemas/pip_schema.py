@@ -2,9 +2,27 @@
 Schemat dla formatu pip (requirements.txt).
 """
 
+import io
+import locale
 import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, TextIO, Tuple, Union
+
+from spectomate.core.parse_cache import cached_parse
+from spectomate.core.utils import AtomicFileWriter, map_file
+
+# Szybka ścieżka parse_bytes(): linia "nazwa" lub "nazwa<op>wersja", dla
+# której parse_requirement() zwraca dokładnie te grupy; pozostałe niepuste
+# linie trafiają do grupy "other" i są parsowane jak dotąd
+_FAST_LINE = re.compile(
+    rb"""^[ \t]*(?:
+        (?P<name>[A-Za-z0-9_.][A-Za-z0-9_.-]*)
+        (?:[ \t]*(?P<operator>==|>=|<=|!=|~=|<|>)[ \t]*(?P<version>[A-Za-z0-9_.-]+))?
+        [ \t]*\r?$
+        |(?P<other>.+)$
+    )""",
+    re.MULTILINE | re.VERBOSE,
+)
 
 
 class PipSchema:
@@ -12,6 +30,9 @@ class PipSchema:
     Klasa definiująca schemat dla formatu pip (requirements.txt).
     """
 
+    # Wersja parsera (zob. CondaSchema.PARSER_VERSION)
+    PARSER_VERSION = 1
+
     @staticmethod
     def parse_requirement(req_line: str) -> Dict[str, Any]:
         """
@@ -62,6 +83,9 @@ class PipSchema:
         """
         Parsuje plik requirements.txt.
 
+        Wynik może pochodzić z pamięci podręcznej parsowania
+        (zob. spectomate.core.parse_cache).
+
         Args:
             file_path: Ścieżka do pliku requirements.txt
 
@@ -73,58 +97,180 @@ class PipSchema:
         if not file_path.exists():
             raise FileNotFoundError(f"Plik nie istnieje: {file_path}")
 
+        def parse() -> Dict[str, Any]:
+            with map_file(file_path) as buffer:
+                return PipSchema.parse_bytes(buffer)
+
+        return cached_parse(file_path, "pip", PipSchema.PARSER_VERSION, parse)
+
+    @staticmethod
+    def parse_string(content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku requirements.txt.
+
+        Args:
+            content: Zawartość pliku requirements.txt
+
+        Returns:
+            Słownik z listą zależności
+        """
         requirements = []
 
-        with open(file_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if line:  # Pomijamy puste linie
-                    req = PipSchema.parse_requirement(line)
-                    requirements.append(req)
+        for line in content.splitlines():
+            line = line.strip()
+            if line:  # Pomijamy puste linie
+                req = PipSchema.parse_requirement(line)
+                requirements.append(req)
 
         return {"format": "pip", "requirements": requirements}
 
     @staticmethod
-    def generate_requirements_txt(data: Dict[str, Any]) -> str:
+    def parse_bytes(buffer: Any, encoding: Optional[str] = None) -> Dict[str, Any]:
         """
-        Generuje zawartość pliku requirements.txt na podstawie danych.
+        Parsuje zawartość pliku requirements.txt podaną jako bajty.
+
+        Daje ten sam wynik co parse_string(), ale proste linie ("numpy",
+        "numpy>=1.21") są rozpoznawane jednym wyrażeniem regularnym na całym
+        buforze, bez dekodowania i dzielenia na linie. Dekodowane i parsowane
+        przez parse_requirement() są tylko pozostałe linie (grupa "other").
 
         Args:
-            data: Dane w formacie schematu pip
+            buffer: Zawartość pliku (bytes, bytearray lub mmap)
+            encoding: Kodowanie pliku (None - domyślne, jak dla open())
 
         Returns:
-            Zawartość pliku requirements.txt
+            Słownik z listą zależności
         """
-        if "requirements" not in data:
-            raise ValueError("Brak wymaganych zależności w danych")
+        encoding = encoding or locale.getpreferredencoding(False)
+        requirements: List[Dict[str, Any]] = []
+        append = requirements.append
+
+        # findall() zwraca krotki grup bez tworzenia obiektów dopasowań
+        for name, operator, version, other in _FAST_LINE.findall(buffer):
+            if other:
+                # Linia może zawierać separatory, które rozpoznaje splitlines()
+                for line in other.decode(encoding).splitlines():
+                    line = line.strip()
+                    if line:
+                        append(PipSchema.parse_requirement(line))
+            elif operator:
+                append(
+                    {
+                        "type": "package",
+                        "name": name.decode(),
+                        "version_spec": {
+                            "operator": operator.decode(),
+                            "version": version.decode(),
+                        },
+                    }
+                )
+            else:
+                append({"type": "package", "name": name.decode()})
 
-        lines = []
+        return {"format": "pip", "requirements": requirements}
 
-        for req in data["requirements"]:
-            # Obsługa przypadku, gdy req jest stringiem (prosty format zależności)
-            if isinstance(req, str):
-                lines.append(req)
-                continue
+    @staticmethod
+    def extract_requirements(pip_data: Dict[str, Any]) -> List[str]:
+        """
+        Wyodrębnia zależności z danych pip w postaci tekstowej.
 
-            # Obsługa przypadku, gdy req jest słownikiem (rozszerzony format zależności)
-            req_type = req.get("type")
+        Obsługuje zarówno prostą listę "dependencies", jak i listę
+        "requirements" zawierającą stringi lub słowniki z parse_requirement().
 
-            if req_type == "comment":
-                lines.append(req["content"])
+        Args:
+            pip_data: Dane w formacie schematu pip
 
-            elif req_type == "option":
-                lines.append(req["content"])
+        Returns:
+            Lista zależności (bez komentarzy i opcji)
+        """
+        if "dependencies" in pip_data:
+            return list(pip_data["dependencies"])
 
-            elif req_type == "package":
+        dependencies = []
+
+        for req in pip_data.get("requirements", []):
+            if isinstance(req, str):
+                if req and not req.startswith(("#", "-")):
+                    dependencies.append(req)
+            elif req.get("type") == "package":
                 package_line = req["name"]
 
                 if "version_spec" in req:
                     spec = req["version_spec"]
                     package_line += f"{spec['operator']}{spec['version']}"
 
-                lines.append(package_line)
+                dependencies.append(package_line)
 
-        return "\n".join(lines)
+        return dependencies
+
+    @staticmethod
+    def _format_requirement(req: Union[str, Dict[str, Any]]) -> Optional[str]:
+        """
+        Formatuje pojedynczą zależność jako linię pliku requirements.txt.
+
+        Args:
+            req: Zależność w postaci stringa lub słownika z parse_requirement()
+
+        Returns:
+            Linia pliku lub None dla nieobsługiwanych wpisów
+        """
+        # Obsługa przypadku, gdy req jest stringiem (prosty format zależności)
+        if isinstance(req, str):
+            return req
+
+        # Obsługa przypadku, gdy req jest słownikiem (rozszerzony format zależności)
+        req_type = req.get("type")
+
+        if req_type in ("comment", "option"):
+            return req["content"]
+
+        if req_type == "package":
+            package_line = req["name"]
+
+            if "version_spec" in req:
+                spec = req["version_spec"]
+                package_line += f"{spec['operator']}{spec['version']}"
+
+            return package_line
+
+        return None
+
+    @staticmethod
+    def emit_requirements_txt(data: Dict[str, Any], stream: TextIO) -> None:
+        """
+        Zapisuje zawartość pliku requirements.txt do strumienia linia po linii.
+
+        Args:
+            data: Dane w formacie schematu pip
+            stream: Strumień tekstowy, do którego zapisujemy dane
+        """
+        if "requirements" not in data:
+            raise ValueError("Brak wymaganych zależności w danych")
+
+        separator = ""
+        for req in data["requirements"]:
+            line = PipSchema._format_requirement(req)
+            if line is None:
+                continue
+
+            stream.write(separator)
+            stream.write(line)
+            separator = "\n"
+
+    @staticmethod
+    def generate_requirements_txt(data: Dict[str, Any]) -> str:
+        """
+        Generuje zawartość pliku requirements.txt na podstawie danych.
+
+        Args:
+            data: Dane w formacie schematu pip
+
+        Returns:
+            Zawartość pliku requirements.txt
+        """
+        stream = io.StringIO()
+        PipSchema.emit_requirements_txt(data, stream)
+        return stream.getvalue()
 
     @staticmethod
     def write_requirements_txt(
@@ -142,12 +288,30 @@ class PipSchema:
         """
         output_path = Path(output_path)
 
-        # Tworzymy katalogi, jeśli nie istnieją
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        PipSchema.update_requirements_txt(data, output_path)
 
-        content = PipSchema.generate_requirements_txt(data)
+        return output_path
 
-        with open(output_path, "w") as f:
-            f.write(content)
+    @staticmethod
+    def update_requirements_txt(
+        data: Dict[str, Any], output_path: Union[str, Path]
+    ) -> str:
+        """
+        Zapisuje dane do pliku requirements.txt, jeśli jego zawartość się zmieniła.
 
-        return output_path
+        Niezmieniony plik nie jest nadpisywany, a zmieniony jest zapisywany
+        atomowo (przez plik tymczasowy i zmianę nazwy).
+
+        Args:
+            data: Dane w formacie schematu pip
+            output_path: Ścieżka do pliku wyjściowego
+
+        Returns:
+            WRITE_UPDATED jeśli plik został zapisany, WRITE_UNCHANGED jeśli
+            miał już taką zawartość
+        """
+        writer = AtomicFileWriter(output_path)
+        with writer as stream:
+            PipSchema.emit_requirements_txt(data, stream)
+
+        return writer.status
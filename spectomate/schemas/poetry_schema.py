@@ -2,22 +2,47 @@
 Schemat dla formatu poetry (pyproject.toml).
 """
 
+import io
+import json
+import re
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set, Union
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple, Union
 
 import toml
 
+from spectomate.core.parse_cache import cached_parse
+from spectomate.core.poetry_constraints import pep440_to_poetry, poetry_to_pep440
+from spectomate.core.utils import AtomicFileWriter
+
+# Nazwa pakietu (z opcjonalnymi dodatkami) i reszta wymagania pip
+_REQUIREMENT_RE = re.compile(r"^([A-Za-z0-9][A-Za-z0-9._-]*(?:\[[^\]]*\])?)\s*(.*)$")
+
+# Klucze TOML, które można zapisać bez cudzysłowów
+_BARE_KEY = re.compile(r"^[A-Za-z0-9_-]+$")
+
+# Sekcja [build-system] dla projektów poetry
+_BUILD_SYSTEM = {
+    "requires": ["poetry-core>=1.0.0"],
+    "build-backend": "poetry.core.masonry.api",
+}
+
 
 class PoetrySchema:
     """
     Klasa definiująca schemat dla formatu poetry (pyproject.toml).
     """
 
+    # Wersja parsera zapisywana we wpisach pamięci podręcznej parsowania
+    PARSER_VERSION = 1
+
     @staticmethod
     def parse_file(file_path: Union[str, Path]) -> Dict[str, Any]:
         """
         Parsuje plik pyproject.toml.
 
+        Z ustawioną zmienną SPECTOMATE_PARSE_CACHE niezmieniony plik nie jest
+        parsowany ponownie.
+
         Args:
             file_path: Ścieżka do pliku pyproject.toml
 
@@ -29,8 +54,25 @@ class PoetrySchema:
         if not file_path.exists():
             raise FileNotFoundError(f"Plik nie istnieje: {file_path}")
 
+        def parse() -> Dict[str, Any]:
+            with open(file_path, "r", encoding="utf-8") as f:
+                return PoetrySchema.parse_string(f.read())
+
+        return cached_parse(file_path, "poetry", PoetrySchema.PARSER_VERSION, parse)
+
+    @staticmethod
+    def parse_string(content: str) -> Dict[str, Any]:
+        """
+        Parsuje zawartość pliku pyproject.toml.
+
+        Args:
+            content: Zawartość pliku pyproject.toml
+
+        Returns:
+            Słownik z informacjami o projekcie poetry
+        """
         try:
-            pyproject_data = toml.load(file_path)
+            pyproject_data = toml.loads(content)
         except Exception as e:
             raise ValueError(f"Błąd parsowania pliku TOML: {e}")
 
@@ -62,9 +104,58 @@ class PoetrySchema:
 
         return poetry_data
 
+    @staticmethod
+    def format_requirement(
+        name: str, constraint: Any, warnings: Optional[List[str]] = None
+    ) -> str:
+        """
+        Zamienia zależność poetry na wymaganie w formacie pip.
+
+        Ograniczenia wersji Poetry (^, ~, *, wersje rozdzielone spacją) są
+        tłumaczone na specyfikatory PEP 440.
+
+        Args:
+            name: Nazwa pakietu
+            constraint: Ograniczenie wersji lub słownik z opisem zależności
+            warnings: Lista, do której dopisywane są ostrzeżenia o pominiętych
+                ograniczeniach wersji
+
+        Returns:
+            Wymaganie w formacie pip
+        """
+        extras = ""
+        if isinstance(constraint, dict):
+            if "git" in constraint:
+                # Zależność z git
+                git_url = constraint["git"]
+                if "rev" in constraint:
+                    return f"git+{git_url}@{constraint['rev']}#egg={name}"
+                return f"git+{git_url}#egg={name}"
+            if "url" in constraint:
+                # Zależność z URL
+                return f"{name} @ {constraint['url']}"
+            if constraint.get("extras"):
+                extras = f"[{','.join(constraint['extras'])}]"
+            constraint = constraint.get("version", "*")
+
+        if not isinstance(constraint, str):
+            # Nieznany format, zwracamy samą nazwę
+            return name
+
+        try:
+            specifier = poetry_to_pep440(constraint)
+        except ValueError as e:
+            specifier = ""
+            if warnings is not None:
+                warnings.append(f"Pominięto ograniczenie wersji pakietu {name}: {e}")
+
+        return f"{name}{extras}{specifier}"
+
     @staticmethod
     def extract_dependencies(
-        poetry_data: Dict[str, Any], include_dev: bool = False
+        poetry_data: Dict[str, Any],
+        include_dev: bool = False,
+        warnings: Optional[List[str]] = None,
     ) -> List[str]:
         """
         Wyodrębnia zależności z danych poetry.
@@ -72,6 +163,8 @@ class PoetrySchema:
         Args:
             poetry_data: Słownik z informacjami o projekcie poetry
             include_dev: Czy uwzględnić zależności deweloperskie
+            warnings: Lista, do której dopisywane są ostrzeżenia o pominiętych
+                ograniczeniach wersji
 
         Returns:
             Lista zależności w formacie pip
@@ -85,58 +178,145 @@ class PoetrySchema:
             if name.lower() == "python":
                 continue
 
-            if isinstance(constraint, str):
-                # Prosty przypadek: "package = "version""
-                dependencies.append(f"{name}{constraint}")
-            elif isinstance(constraint, dict):
-                # Złożony przypadek: "package = {version = "version", extras = [...]}"
-                if "version" in constraint:
-                    version = constraint["version"]
-                    if "extras" in constraint:
-                        extras = ",".join(constraint["extras"])
-                        dependencies.append(f"{name}[{extras}]{version}")
-                    else:
-                        dependencies.append(f"{name}{version}")
-                elif "git" in constraint:
-                    # Zależność z git
-                    git_url = constraint["git"]
-                    if "rev" in constraint:
-                        rev = constraint["rev"]
-                        dependencies.append(f"git+{git_url}@{rev}#egg={name}")
-                    else:
-                        dependencies.append(f"git+{git_url}#egg={name}")
-                elif "url" in constraint:
-                    # Zależność z URL
-                    url = constraint["url"]
-                    dependencies.append(f"{name} @ {url}")
-            else:
-                # Nieznany format, dodajemy samą nazwę
-                dependencies.append(name)
+            dependencies.append(
+                PoetrySchema.format_requirement(name, constraint, warnings)
+            )
 
         # Pobieramy zależności deweloperskie, jeśli wymagane
         if include_dev:
             # Sprawdzamy, czy używamy starego formatu (dev-dependencies) czy nowego (group.dev.dependencies)
             if "dev-dependencies" in poetry_data:
                 dev_deps = poetry_data.get("dev-dependencies", {})
-                for name, constraint in dev_deps.items():
-                    if isinstance(constraint, str):
-                        dependencies.append(f"{name}{constraint}")
-                    elif isinstance(constraint, dict) and "version" in constraint:
-                        dependencies.append(f"{name}{constraint['version']}")
-                    else:
-                        dependencies.append(name)
             elif "group" in poetry_data and "dev" in poetry_data["group"]:
                 dev_deps = poetry_data["group"]["dev"].get("dependencies", {})
-                for name, constraint in dev_deps.items():
-                    if isinstance(constraint, str):
-                        dependencies.append(f"{name}{constraint}")
-                    elif isinstance(constraint, dict) and "version" in constraint:
-                        dependencies.append(f"{name}{constraint['version']}")
-                    else:
-                        dependencies.append(name)
+            else:
+                dev_deps = {}
+
+            for name, constraint in dev_deps.items():
+                dependencies.append(
+                    PoetrySchema.format_requirement(name, constraint, warnings)
+                )
 
         return dependencies
 
+    @staticmethod
+    def _format_toml_key(key: str) -> str:
+        """
+        Formatuje klucz TOML, w razie potrzeby ujmując go w cudzysłowy.
+
+        Args:
+            key: Klucz
+
+        Returns:
+            Klucz w składni TOML
+        """
+        if _BARE_KEY.match(key):
+            return key
+        return json.dumps(key, ensure_ascii=False)
+
+    @staticmethod
+    def _format_toml_value(value: Any) -> str:
+        """
+        Formatuje wartość TOML w postaci jednoliniowej.
+
+        Słowniki są zapisywane jako tabele inline, a listy jako tablice inline.
+
+        Args:
+            value: Wartość
+
+        Returns:
+            Wartość w składni TOML
+        """
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, str):
+            # Łańcuch JSON jest poprawnym podstawowym łańcuchem TOML
+            return json.dumps(value, ensure_ascii=False)
+        if isinstance(value, int):
+            return str(value)
+        if isinstance(value, (list, tuple)):
+            items = ", ".join(PoetrySchema._format_toml_value(item) for item in value)
+            return f"[{items}]"
+        if isinstance(value, dict):
+            items = ", ".join(
+                f"{PoetrySchema._format_toml_key(str(key))} = "
+                f"{PoetrySchema._format_toml_value(item)}"
+                for key, item in value.items()
+            )
+            return f"{{{items}}}" if items else "{}"
+
+        # Pozostałe typy (liczby zmiennoprzecinkowe, daty) formatuje biblioteka toml
+        return toml.dumps({"value": value}).split("=", 1)[1].strip()
+
+    @staticmethod
+    def _emit_toml_table(
+        name: str,
+        table: Dict[str, Any],
+        stream: TextIO,
+        first: bool = False,
+        skip: Tuple[str, ...] = (),
+    ) -> None:
+        """
+        Zapisuje tabelę TOML wraz z podtabelami do strumienia.
+
+        W tabelach zależności (np. [tool.poetry.dependencies]) słowniki są
+        zapisywane jako tabele inline, tak jak w plikach tworzonych przez Poetry.
+
+        Args:
+            name: Pełna nazwa tabeli, np. "tool.poetry"
+            table: Zawartość tabeli
+            stream: Strumień tekstowy, do którego zapisujemy dane
+            first: Czy jest to pierwsza tabela w pliku
+            skip: Klucze pomijane przy zapisie
+        """
+        inline_tables = name.endswith("dependencies")
+        subtables = []
+        header_written = False
+
+        for key, value in table.items():
+            if key in skip:
+                continue
+
+            if isinstance(value, dict) and not inline_tables:
+                subtables.append((key, value))
+                continue
+
+            if not header_written:
+                stream.write(f"[{name}]\n" if first else f"\n[{name}]\n")
+                header_written = first = True
+
+            stream.write(
+                f"{PoetrySchema._format_toml_key(key)} = "
+                f"{PoetrySchema._format_toml_value(value)}\n"
+            )
+
+        if not table:
+            stream.write(f"[{name}]\n" if first else f"\n[{name}]\n")
+
+        for key, value in subtables:
+            PoetrySchema._emit_toml_table(
+                f"{name}.{PoetrySchema._format_toml_key(key)}", value, stream
+            )
+
+    @staticmethod
+    def emit_pyproject_toml(data: Dict[str, Any], stream: TextIO) -> None:
+        """
+        Zapisuje zawartość pliku pyproject.toml do strumienia tabela po tabeli.
+
+        Zależności są zapisywane pojedynczo, bez budowania całego dokumentu
+        w pamięci.
+
+        Args:
+            data: Dane w formacie schematu poetry
+            stream: Strumień tekstowy, do którego zapisujemy dane
+        """
+        # Pomijamy pole format, które nie jest częścią standardowego pliku
+        # pyproject.toml
+        PoetrySchema._emit_toml_table(
+            "tool.poetry", data, stream, first=True, skip=("format",)
+        )
+        PoetrySchema._emit_toml_table("build-system", _BUILD_SYSTEM, stream)
+
     @staticmethod
     def generate_pyproject_toml(data: Dict[str, Any]) -> str:
         """
@@ -148,24 +328,9 @@ class PoetrySchema:
         Returns:
             Zawartość pliku pyproject.toml
         """
-        # Tworzymy kopię danych, aby nie modyfikować oryginału
-        poetry_data = data.copy()
-
-        # Usuwamy pole format, które nie jest częścią standardowego pliku pyproject.toml
-        if "format" in poetry_data:
-            del poetry_data["format"]
-
-        # Tworzymy strukturę pyproject.toml
-        pyproject = {
-            "tool": {"poetry": poetry_data},
-            "build-system": {
-                "requires": ["poetry-core>=1.0.0"],
-                "build-backend": "poetry.core.masonry.api",
-            },
-        }
-
-        # Konwertujemy dane do TOML
-        return toml.dumps(pyproject)
+        stream = io.StringIO()
+        PoetrySchema.emit_pyproject_toml(data, stream)
+        return stream.getvalue()
 
     @staticmethod
     def write_pyproject_toml(
@@ -183,15 +348,51 @@ class PoetrySchema:
         """
         output_path = Path(output_path)
 
-        # Tworzymy katalogi, jeśli nie istnieją
-        output_path.parent.mkdir(parents=True, exist_ok=True)
+        PoetrySchema.update_pyproject_toml(data, output_path)
+
+        return output_path
+
+    @staticmethod
+    def update_pyproject_toml(
+        data: Dict[str, Any], output_path: Union[str, Path]
+    ) -> str:
+        """
+        Zapisuje dane do pliku pyproject.toml, jeśli jego zawartość się zmieniła.
+
+        Niezmieniony plik nie jest nadpisywany, a zmieniony jest zapisywany
+        atomowo (przez plik tymczasowy i zmianę nazwy).
 
-        content = PoetrySchema.generate_pyproject_toml(data)
+        Args:
+            data: Dane w formacie schematu poetry
+            output_path: Ścieżka do pliku wyjściowego
 
-        with open(output_path, "w") as f:
-            f.write(content)
+        Returns:
+            WRITE_UPDATED jeśli plik został zapisany, WRITE_UNCHANGED jeśli
+            miał już taką zawartość
+        """
+        writer = AtomicFileWriter(output_path)
+        with writer as stream:
+            PoetrySchema.emit_pyproject_toml(data, stream)
 
-        return output_path
+        return writer.status
+
+    @staticmethod
+    def _to_poetry_constraint(specifier: str) -> str:
+        """
+        Tłumaczy specyfikator PEP 440 na ograniczenie Poetry.
+
+        Specyfikator, którego nie da się przetłumaczyć, jest zwracany bez zmian.
+
+        Args:
+            specifier: Specyfikator PEP 440
+
+        Returns:
+            Ograniczenie wersji Poetry
+        """
+        try:
+            return pep440_to_poetry(specifier)
+        except ValueError:
+            return specifier.strip() or "*"
 
     @staticmethod
     def convert_from_pip(
@@ -236,9 +437,11 @@ class PoetrySchema:
                     if "version_spec" in dep:
                         operator = dep["version_spec"]["operator"]
                         version_val = dep["version_spec"]["version"]
-                        poetry_data["dependencies"][
-                            package_name
-                        ] = f"{operator}{version_val}"
+                        poetry_data["dependencies"][package_name] = (
+                            PoetrySchema._to_poetry_constraint(
+                                f"{operator}{version_val}"
+                            )
+                        )
                     else:
                         poetry_data["dependencies"][package_name] = "*"
 
@@ -251,42 +454,7 @@ class PoetrySchema:
                 if dep.startswith("#"):
                     continue
 
-                # Parsujemy zależność
-                if "==" in dep:
-                    name, version_val = dep.split("==", 1)
-                    poetry_data["dependencies"][
-                        name.strip()
-                    ] = f"=={version_val.strip()}"
-                elif ">=" in dep:
-                    name, version_val = dep.split(">=", 1)
-                    poetry_data["dependencies"][
-                        name.strip()
-                    ] = f">={version_val.strip()}"
-                elif "<=" in dep:
-                    name, version_val = dep.split("<=", 1)
-                    poetry_data["dependencies"][
-                        name.strip()
-                    ] = f"<={version_val.strip()}"
-                elif ">" in dep:
-                    name, version_val = dep.split(">", 1)
-                    poetry_data["dependencies"][
-                        name.strip()
-                    ] = f">{version_val.strip()}"
-                elif "<" in dep:
-                    name, version_val = dep.split("<", 1)
-                    poetry_data["dependencies"][
-                        name.strip()
-                    ] = f"<{version_val.strip()}"
-                elif "~=" in dep:
-                    name, version_val = dep.split("~=", 1)
-                    poetry_data["dependencies"][
-                        name.strip()
-                    ] = f"~{version_val.strip()}"
-                elif "@" in dep:
-                    # URL dependency
-                    name, url = dep.split("@", 1)
-                    poetry_data["dependencies"][name.strip()] = {"url": url.strip()}
-                elif dep.startswith("git+"):
+                if dep.startswith("git+"):
                     # Git dependency
                     url = dep[4:]
                     if "#egg=" in url:
@@ -300,8 +468,21 @@ class PoetrySchema:
                     else:
                         # Nieznany format git, dodajemy jako string
                         poetry_data["dependencies"][dep] = "*"
-                else:
-                    # Prosta zależność bez wersji
+                    continue
+
+                # Parsujemy zależność: nazwa i specyfikator wersji PEP 440
+                match = _REQUIREMENT_RE.match(dep.strip())
+                if match is None:
                     poetry_data["dependencies"][dep.strip()] = "*"
+                    continue
+                name, rest = match.group(1), match.group(2).strip()
+
+                if rest.startswith("@"):
+                    # URL dependency
+                    poetry_data["dependencies"][name] = {"url": rest[1:].strip()}
+                else:
+                    poetry_data["dependencies"][name] = (
+                        PoetrySchema._to_poetry_constraint(rest)
+                    )
 
         return poetry_data
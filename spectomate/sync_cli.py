@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Komendy CLI synchronizujące pliki zależności wyprowadzane z pliku głównego.
+"""
+
+import sys
+from pathlib import Path
+
+import click
+
+from spectomate.core.sync import SyncResult, load_sync_config, run_sync
+from spectomate.core.watch import DEFAULT_DEBOUNCE, watch_sync
+
+
+@click.command("sync")
+@click.option(
+    "--config",
+    "-c",
+    "config_file",
+    help="Plik pyproject.toml z sekcją [tool.spectomate.sync]",
+    type=click.Path(dir_okay=False),
+    default="pyproject.toml",
+    show_default=True,
+)
+@click.option("--force", "-f", is_flag=True, help="Regeneruj wszystkie pliki")
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Tylko sprawdź, czy pliki są aktualne (kod wyjścia 1, jeśli nie)",
+)
+def sync_command(config_file: str, force: bool, check: bool):
+    """Regeneruje tylko nieaktualne pliki wyprowadzane z pliku głównego.
+
+    Examples:
+        spectomate sync              # Zaktualizuj nieaktualne pliki
+        spectomate sync --check      # Sprawdź, czy pliki są aktualne (np. w CI)
+        spectomate sync --force      # Zregeneruj wszystkie pliki
+    """
+    try:
+        config = load_sync_config(Path(config_file))
+        result = run_sync(config, force=force, check_only=check)
+    except Exception as e:
+        click.echo(f"Błąd podczas synchronizacji: {e}", err=True)
+        sys.exit(1)
+
+    if check:
+        for target in result.stale:
+            click.echo(f"Plik {target.name} jest nieaktualny")
+        if result.stale:
+            sys.exit(1)
+        click.echo("Wszystkie pliki są aktualne")
+        return
+
+    for target in result.updated:
+        click.echo(f"Zaktualizowano {target.name}")
+    for target in result.unchanged:
+        click.echo(f"Plik {target.name} jest aktualny (bez zmian)")
+    if not result.stale:
+        click.echo("Wszystkie pliki są aktualne")
+
+
+@click.command("watch")
+@click.option(
+    "--config",
+    "-c",
+    "config_file",
+    help="Plik pyproject.toml z sekcją [tool.spectomate.sync]",
+    type=click.Path(dir_okay=False),
+    default="pyproject.toml",
+    show_default=True,
+)
+@click.option(
+    "--debounce",
+    help=(
+        "Czas ciszy (w sekundach) po zmianie pliku, "
+        "po którym uruchamiana jest konwersja"
+    ),
+    type=float,
+    default=DEFAULT_DEBOUNCE,
+    show_default=True,
+)
+@click.option(
+    "--polling",
+    is_flag=True,
+    help="Sprawdzaj pliki okresowo zamiast korzystać z inotify",
+)
+def watch_command(config_file: str, debounce: float, polling: bool):
+    """Obserwuje plik główny i na bieżąco regeneruje pliki wyprowadzane.
+
+    Korzysta z tej samej konfiguracji co spectomate sync.
+
+    Examples:
+        spectomate watch                 # Obserwuj plik z pyproject.toml
+        spectomate watch --polling       # Bez inotify (np. w sieciowym systemie plików)
+    """
+
+    def on_result(result: SyncResult) -> None:
+        for target in result.updated:
+            click.echo(f"Zaktualizowano {target.name}")
+        for target in result.unchanged:
+            click.echo(f"Plik {target.name} jest aktualny (bez zmian)")
+
+    def on_error(error: Exception) -> None:
+        click.echo(f"Błąd podczas synchronizacji: {error}", err=True)
+
+    if not Path(config_file).exists():
+        click.echo(f"Plik nie istnieje: {config_file}", err=True)
+        sys.exit(1)
+
+    click.echo(f"Obserwowanie {config_file} (Ctrl+C kończy)")
+    try:
+        watch_sync(
+            Path(config_file), on_result, on_error, debounce=debounce, polling=polling
+        )
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,131 @@
+"""
+Testy dla asynchronicznego API konwerterów i wyszukiwania pakietów w conda.
+"""
+
+import asyncio
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+import yaml
+
+from spectomate.core import conda_lookup
+from spectomate.core.registry import ConverterRegistry
+
+# Atrapa polecenia conda: "numpy" i "scipy" są dostępne, "hang" się zawiesza,
+# "broken" zwraca błąd sieci, a pozostałe pakiety nie istnieją
+FAKE_CONDA = """#!/bin/sh
+case "$2" in
+  numpy|scipy) sleep 0.2; echo '{"'"$2"'": [{"version": "1.0"}]}' ;;
+  hang) sleep 30 ;;
+  broken) echo '{"exception_name": "CondaHTTPError"}'; exit 1 ;;
+  *) echo '{"exception_name": "PackagesNotFoundError"}'; exit 1 ;;
+esac
+"""
+
+
+class TestAsync:
+    """
+    Testy dla asynchronicznej konwersji z atrapą polecenia conda.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        conda = self.temp_path / "conda"
+        conda.write_text(FAKE_CONDA)
+        conda.chmod(conda.stat().st_mode | stat.S_IEXEC)
+        self.old_path = os.environ["PATH"]
+        os.environ["PATH"] = f"{self.temp_path}{os.pathsep}{self.old_path}"
+        conda_lookup.clear_cache()
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        os.environ["PATH"] = self.old_path
+        conda_lookup.clear_cache()
+        self.temp_dir.cleanup()
+
+    def test_check_packages_async(self) -> None:
+        """Test równoległego wyszukiwania pakietów."""
+        start = time.monotonic()
+        result = asyncio.run(
+            conda_lookup.check_packages_async(["numpy", "scipy", "internal-lib"])
+        )
+
+        assert {name: r.available for name, r in result.items()} == {
+            "numpy": True,
+            "scipy": True,
+            "internal-lib": False,
+        }
+        # Wyszukiwania trwające po 0.2 s nie są wykonywane po kolei
+        assert time.monotonic() - start < 0.6
+        # Wyniki są zapamiętywane wspólnie z wyszukiwaniem synchronicznym
+        assert conda_lookup.search_package("numpy") is True
+
+    def test_timeout_and_errors_not_cached(self) -> None:
+        """Test, że zawieszone i nieudane wyszukiwania nie są zapamiętywane."""
+        start = time.monotonic()
+        result = asyncio.run(
+            conda_lookup.check_packages_async(["hang", "broken"], timeout=0.3)
+        )
+
+        assert result["hang"].reason == conda_lookup.LOOKUP_TIMEOUT
+        assert result["broken"].reason == conda_lookup.LOOKUP_ERROR
+        assert time.monotonic() - start < 5
+        assert conda_lookup._get_cached("hang") is None
+        assert conda_lookup._get_cached("broken") is None
+
+    def test_execute_async(self) -> None:
+        """Test pełnej asynchronicznej konwersji pip -> conda."""
+        source_file = self.temp_path / "requirements.txt"
+        target_file = self.temp_path / "environment.yml"
+        source_file.write_text("numpy>=1.22.0\ninternal-lib==0.1.0\n")
+        converter = ConverterRegistry.get_converter("pip", "conda")(
+            source_file=source_file,
+            target_file=target_file,
+            options={"env_name": "app", "conda_concurrency": 2},
+        )
+
+        result = asyncio.run(converter.execute_async())
+
+        assert result == target_file
+        assert yaml.safe_load(target_file.read_text())["dependencies"] == [
+            "numpy>=1.22.0",
+            "pip",
+            {"pip": ["internal-lib==0.1.0"]},
+        ]
+
+    def test_pipeline_convert_async(self) -> None:
+        """Test asynchronicznej konwersji przez trasę wieloetapową."""
+        converter = ConverterRegistry.get_converter("poetry", "conda")(
+            options={"env_name": "app"}
+        )
+        source_data = converter.parse_source(
+            "[tool.poetry]\nname = 'x'\n\n[tool.poetry.dependencies]\n"
+            "numpy = '>=1.22.0'\ninternal-lib = '==0.1.0'\n"
+        )
+
+        result = asyncio.run(converter.convert_async(source_data))
+
+        assert result["dependencies"] == [
+            "numpy>=1.22.0",
+            "pip",
+            {"pip": ["internal-lib==0.1.0"]},
+        ]
+
+    def test_default_convert_async(self) -> None:
+        """Test domyślnej implementacji convert_async w puli wątków."""
+        converter = ConverterRegistry.get_converter("conda", "pip")()
+        source_data = converter.parse_source("name: x\ndependencies:\n  - numpy\n")
+
+        result = asyncio.run(converter.convert_async(source_data))
+
+        assert result == converter.convert(source_data)
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,126 @@
+"""
+Testy dla wsadowej konwersji NDJSON w pamięci.
+"""
+
+import io
+import json
+import threading
+import time
+
+import pytest
+import yaml
+
+import spectomate.core.batch as batch
+from spectomate.core import conda_lookup
+from spectomate.core.batch import convert_request, run_batch
+from spectomate.core.registry import ConverterRegistry
+
+
+class TestBatch:
+    """
+    Testy dla modułu spectomate.core.batch.
+    """
+
+    def test_convert_request(self) -> None:
+        """Test konwersji pojedynczego żądania z wykrywaniem formatu."""
+        result = convert_request(
+            {
+                "target_format": "pip",
+                "filename": "environment.yml",
+                "content": (
+                    "name: x\ndependencies:\n  - numpy\n  - pip:\n    - requests\n"
+                ),
+            }
+        )
+
+        assert result == {
+            "source_format": "conda",
+            "target_format": "pip",
+            "content": "numpy\nrequests",
+        }
+
+    def test_convert_content_pipeline(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test konwersji w pamięci przez trasę wieloetapową."""
+        monkeypatch.setattr(
+            "spectomate.core.conda_lookup.search_package",
+            lambda name, timeout=None: name == "numpy",
+        )
+        conda_lookup.clear_cache()
+        converter = ConverterRegistry.get_converter("poetry", "conda")(
+            options={"env_name": "app"}
+        )
+
+        content = converter.convert_content(
+            "[tool.poetry]\nname = 'x'\n\n[tool.poetry.dependencies]\n"
+            "numpy = '>=1.22.0'\ninternal-lib = '==0.1.0'\n"
+        )
+
+        assert yaml.safe_load(content)["dependencies"] == [
+            "numpy>=1.22.0",
+            "pip",
+            {"pip": ["internal-lib==0.1.0"]},
+        ]
+
+    def test_invalid_requests(self) -> None:
+        """Test błędów dla niepoprawnych żądań."""
+        with pytest.raises(ValueError):
+            convert_request({"target_format": "pip"})
+        with pytest.raises(ValueError):
+            convert_request({"content": "numpy\n"})
+        with pytest.raises(ValueError):
+            convert_request(
+                {"source_format": "pip", "target_format": "unknown", "content": ""}
+            )
+
+    def test_run_batch(self) -> None:
+        """Test przetwarzania strumienia żądań z wynikami w osobnych wierszach."""
+        requests = [
+            {"id": "a", "source_format": "conda", "target_format": "pip"},
+            {"id": "b", "source_format": "pip", "target_format": "poetry"},
+        ]
+        requests[0]["content"] = "name: x\ndependencies:\n  - numpy\n"
+        requests[1]["content"] = "numpy>=1.22.0\n"
+        requests[1]["options"] = {"project_name": "batch"}
+        input_stream = io.StringIO(
+            "\n".join(json.dumps(r) for r in requests) + "\n\nnot json\n"
+        )
+        output_stream = io.StringIO()
+
+        succeeded, failed = run_batch(input_stream, output_stream, max_workers=2)
+
+        results = {
+            r["id"]: r for r in map(json.loads, output_stream.getvalue().splitlines())
+        }
+        assert (succeeded, failed) == (2, 1)
+        assert results["a"]["content"] == "numpy"
+        assert 'name = "batch"' in results["b"]["content"]
+        assert results[4]["ok"] is False
+
+    def test_bounded_in_flight(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test, że liczba jednocześnie przetwarzanych żądań jest ograniczona."""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def slow_convert(request):  # type: ignore[no-untyped-def]
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.01)
+            with lock:
+                state["active"] -= 1
+            return {"content": request["content"]}
+
+        monkeypatch.setattr(batch, "convert_request", slow_convert)
+        input_stream = io.StringIO(
+            "".join(json.dumps({"content": str(i)}) + "\n" for i in range(20))
+        )
+        output_stream = io.StringIO()
+
+        run_batch(input_stream, output_stream, max_workers=8, max_in_flight=3)
+
+        assert state["peak"] <= 3
+        assert len(output_stream.getvalue().splitlines()) == 20
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
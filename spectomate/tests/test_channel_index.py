@@ -0,0 +1,173 @@
+"""
+Testy dla lokalnego indeksu kanałów conda z filtrem Blooma.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from spectomate.converters.pip_to_conda import PipToCondaConverter
+from spectomate.core import conda_lookup
+from spectomate.core.channel_index import (
+    BloomFilter,
+    build_channel_index,
+    find_repodata_files,
+    get_channel_index,
+)
+
+
+class TestChannelIndex:
+    """
+    Testy dla modułu spectomate.core.channel_index.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.cache_dir = self.temp_path / "cache"
+        self.channel_dir = self.temp_path / "channel"
+        self.channel_dir.mkdir()
+        self.old_cache_home = os.environ.get("XDG_CACHE_HOME")
+        os.environ["XDG_CACHE_HOME"] = str(self.cache_dir)
+        conda_lookup.clear_cache()
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        if self.old_cache_home is None:
+            os.environ.pop("XDG_CACHE_HOME", None)
+        else:
+            os.environ["XDG_CACHE_HOME"] = self.old_cache_home
+        conda_lookup.clear_cache()
+        self.temp_dir.cleanup()
+
+    def write_repodata(self, name: str, packages: List[str]) -> Path:
+        """Zapisuje plik repodata.json z podanymi pakietami."""
+        path = self.channel_dir / name
+        path.write_text(
+            json.dumps(
+                {
+                    "info": {"subdir": "noarch"},
+                    "packages": {
+                        f"{p}-1.0-0.tar.bz2": {"name": p, "version": "1.0"}
+                        for p in packages[::2]
+                    },
+                    "packages.conda": {
+                        f"{p}-1.0-0.conda": {"name": p, "version": "1.0"}
+                        for p in packages[1::2]
+                    },
+                }
+            )
+        )
+        return path
+
+    def test_bloom_filter(self) -> None:
+        """Test braku fałszywie negatywnych odpowiedzi i serializacji filtra."""
+        names = [f"package-{i}" for i in range(1000)]
+        bloom = BloomFilter.for_capacity(len(names), 0.01)
+        for name in names:
+            bloom.add(name)
+
+        restored = BloomFilter.from_bytes(bloom.to_bytes())
+
+        assert all(name in restored for name in names)
+        false_positives = sum(f"internal-{i}" in restored for i in range(1000))
+        assert false_positives < 50
+        with pytest.raises(ValueError):
+            BloomFilter.from_bytes(b"SPBF")
+
+    def test_build_and_search(self) -> None:
+        """Test budowania indeksu i dokładnego wyszukiwania nazw."""
+        packages = ["numpy", "pytorch", "_libgcc_mutex", "zstd", "python", "pip"]
+        self.write_repodata("main.json", packages)
+        self.write_repodata("main.info.json", ["ignored"])
+
+        files = find_repodata_files(str(self.channel_dir))
+        index = build_channel_index(files, self.cache_dir)
+
+        assert [path.name for path in files] == ["main.json"]
+        assert all(index.contains(name) for name in packages)
+        assert index.contains("NumPy")
+        for name in ("internal-lib", "numpy2", "aaa", "zzzz", "pyth", "ignored"):
+            assert not index.contains(name)
+        assert len(list(self.cache_dir.glob("*.bloom"))) == 1
+
+    def test_rebuild_on_change(self) -> None:
+        """Test przebudowania indeksu po zmianie plików repodata."""
+        repodata = self.write_repodata("main.json", ["numpy"])
+        index = get_channel_index(str(self.channel_dir))
+        assert index is not None
+        assert not index.contains("scipy")
+
+        self.write_repodata("main.json", ["numpy", "scipy"])
+        stat = repodata.stat()
+        os.utime(repodata, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+        rebuilt = get_channel_index(str(self.channel_dir))
+        assert rebuilt is not None
+        assert rebuilt.contains("scipy")
+        cache_files = list((self.cache_dir / "spectomate" / "channel-index").iterdir())
+        assert len(cache_files) == 3
+
+    def test_separate_specs(self) -> None:
+        """Test, że indeksy różnych zestawów plików nie usuwają się nawzajem."""
+        main = self.write_repodata("main.json", ["numpy"])
+        forge = self.write_repodata("forge.json", ["scipy"])
+
+        main_index = build_channel_index([main], self.cache_dir)
+        build_channel_index([forge], self.cache_dir)
+
+        assert main_index.names_file.exists()
+        assert len(list(self.cache_dir.glob("*.bloom"))) == 2
+
+    def test_missing_names_file(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test, że usunięta lista nazw oznacza niedostępny indeks."""
+        monkeypatch.setattr(
+            "spectomate.core.conda_lookup.search_package",
+            lambda name, timeout=None: True,
+        )
+        main = self.write_repodata("main.json", ["numpy"])
+        index = build_channel_index([main], self.cache_dir)
+        index.names_file.unlink()
+
+        result = conda_lookup.lookup_package("numpy", channel_index=index)
+
+        assert result.available
+        assert result.detail != "indeks kanałów"
+
+    def test_not_configured(self) -> None:
+        """Test, że bez konfiguracji indeks kanałów nie jest używany."""
+        assert get_channel_index("") is None
+        assert get_channel_index(str(self.temp_path / "missing")) is None
+
+    def test_converter_skips_conda(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test, że konwerter z indeksem kanałów nie uruchamia conda."""
+
+        def fail(name: str, timeout: float = None) -> bool:
+            raise AssertionError(f"Nieoczekiwane wyszukiwanie pakietu {name}")
+
+        monkeypatch.setattr("spectomate.core.conda_lookup.search_package", fail)
+        self.write_repodata("main.json", ["numpy", "pytorch"])
+        converter = PipToCondaConverter(
+            options={"channel_index": [str(self.channel_dir)]}
+        )
+
+        conda_data = converter.convert(
+            converter.parse_source("numpy>=1.22\ntorch\ninternal-lib==0.1\n")
+        )
+
+        assert conda_data["dependencies"] == [
+            "numpy>=1.22",
+            "pytorch",
+            "pip",
+            {"pip": ["internal-lib==0.1"]},
+        ]
+        assert converter.warnings == []
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,132 @@
+"""
+Testy dla wyszukiwania pakietów w conda w puli wątków z wyłącznikiem.
+"""
+
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from spectomate.converters.pip_to_conda import PipToCondaConverter
+from spectomate.core import conda_lookup
+from spectomate.core.conda_lookup import CircuitBreaker, CondaLookupExecutor
+
+# Atrapa polecenia conda: pakiety "pkg*" są dostępne po 0.2 s, "hang*" się
+# zawieszają, "broken*" zwracają błąd sieci, a pozostałe nie istnieją
+FAKE_CONDA = """#!/bin/sh
+case "$2" in
+  pkg*) sleep 0.2; echo '{"'"$2"'": [{"version": "1.0"}]}' ;;
+  hang*) sleep 30 ;;
+  broken*) echo '{"exception_name": "CondaHTTPError"}'; exit 1 ;;
+  *) echo '{"exception_name": "PackagesNotFoundError"}'; exit 1 ;;
+esac
+"""
+
+
+class TestCondaLookup:
+    """
+    Testy dla CondaLookupExecutor i CircuitBreaker z atrapą polecenia conda.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        conda = self.temp_path / "conda"
+        conda.write_text(FAKE_CONDA)
+        conda.chmod(conda.stat().st_mode | stat.S_IEXEC)
+        self.old_path = os.environ["PATH"]
+        os.environ["PATH"] = f"{self.temp_path}{os.pathsep}{self.old_path}"
+        conda_lookup.clear_cache()
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        os.environ["PATH"] = self.old_path
+        conda_lookup.clear_cache()
+        self.temp_dir.cleanup()
+
+    def test_parallel_lookup(self) -> None:
+        """Test równoległego wyszukiwania w ograniczonej puli wątków."""
+        names = ["pkg1", "pkg2", "pkg3", "pkg4", "missing"]
+
+        start = time.monotonic()
+        results = CondaLookupExecutor(max_workers=5).lookup(names)
+
+        assert time.monotonic() - start < 0.6
+        assert list(results) == names
+        assert [r.reason for r in results.values()] == [
+            conda_lookup.LOOKUP_FOUND
+        ] * 4 + [conda_lookup.LOOKUP_NOT_FOUND]
+
+        # Drugie wyszukiwanie korzysta z zapamiętanych wyników
+        start = time.monotonic()
+        assert CondaLookupExecutor().lookup(names)["pkg1"].available
+        assert time.monotonic() - start < 0.1
+
+    def test_timeout(self) -> None:
+        """Test, że zawieszony proces conda jest przerywany po limicie czasu."""
+        start = time.monotonic()
+        result = conda_lookup.lookup_package("hang", timeout=0.3)
+
+        assert time.monotonic() - start < 5
+        assert result.reason == conda_lookup.LOOKUP_TIMEOUT
+        assert not result.available
+        assert conda_lookup._get_cached("hang") is None
+
+    def test_circuit_breaker_trips(self) -> None:
+        """Test otwarcia wyłącznika po serii błędów conda."""
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+        executor = CondaLookupExecutor(max_workers=1, breaker=breaker)
+
+        results = executor.lookup(["broken1", "broken2", "broken3", "pkg1"])
+
+        assert [r.reason for r in results.values()] == [
+            conda_lookup.LOOKUP_ERROR,
+            conda_lookup.LOOKUP_ERROR,
+            conda_lookup.LOOKUP_CIRCUIT_OPEN,
+            conda_lookup.LOOKUP_CIRCUIT_OPEN,
+        ]
+        assert "broken2" in results["pkg1"].detail
+        assert breaker.is_open
+
+    def test_circuit_breaker_half_open(self) -> None:
+        """Test próbnego wyszukiwania po czasie resetu wyłącznika."""
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0.1)
+        conda_lookup.lookup_package("broken", breaker=breaker)
+        assert not breaker.allow()
+
+        time.sleep(0.15)
+        assert breaker.allow()
+        # W trakcie próby kolejne wyszukiwania są odrzucane
+        assert not breaker.allow()
+        breaker.record_failure("broken")
+        assert breaker.is_open
+
+        time.sleep(0.15)
+        result = conda_lookup.lookup_package("pkg1", breaker=breaker)
+        assert result.available
+        assert not breaker.is_open
+
+    def test_converter_reports_reason(self) -> None:
+        """Test, że konwerter zgłasza pakiety, których nie udało się sprawdzić."""
+        converter = PipToCondaConverter(options={"conda_timeout": 0.3})
+
+        target_data = converter.convert(
+            converter.parse_source("pkg1>=1.0\nhang-lib==0.1\n")
+        )
+
+        assert target_data["dependencies"] == [
+            "pkg1>=1.0",
+            "pip",
+            {"pip": ["hang-lib==0.1"]},
+        ]
+        assert converter.conda_lookups["hang-lib"].reason == "timeout"
+        assert len(converter.warnings) == 1
+        assert "hang-lib" in converter.warnings[0]
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
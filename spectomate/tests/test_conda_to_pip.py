@@ -84,8 +84,8 @@ class TestCondaToPipConverter:
         assert len(deps) > 0
 
         # Sprawdzamy, czy zależności conda zostały przekonwertowane
-        assert "python=3.9" in deps
-        assert "numpy=1.22.0" in deps
+        assert "python==3.9.*" in deps
+        assert "numpy==1.22.0.*" in deps
         assert "pandas>=1.4.0" in deps
         assert "matplotlib>=3.5.0" in deps
 
@@ -111,8 +111,8 @@ class TestCondaToPipConverter:
             content = f.read()
 
         # Sprawdzamy, czy wszystkie zależności są w pliku
-        assert "python=3.9" in content
-        assert "numpy=1.22.0" in content
+        assert "python==3.9.*" in content
+        assert "numpy==1.22.0.*" in content
         assert "pandas>=1.4.0" in content
         assert "matplotlib>=3.5.0" in content
         assert "requests>=2.27.0" in content
@@ -134,8 +134,8 @@ class TestCondaToPipConverter:
             content = f.read()
 
         # Sprawdzamy, czy wszystkie zależności są w pliku
-        assert "python=3.9" in content
-        assert "numpy=1.22.0" in content
+        assert "python==3.9.*" in content
+        assert "numpy==1.22.0.*" in content
         assert "pandas>=1.4.0" in content
         assert "matplotlib>=3.5.0" in content
         assert "requests>=2.27.0" in content
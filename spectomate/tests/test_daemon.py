@@ -0,0 +1,244 @@
+"""
+Testy dla demona konwersji i jego klienta.
+"""
+
+import os
+import socket
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from spectomate import __version__
+from spectomate.core import daemon
+from spectomate.core.daemon import (
+    ConversionDaemon,
+    forward_command,
+    get_client_environment,
+    send_request,
+)
+
+
+class TestDaemon:
+    """
+    Testy dla demona konwersji działającego w wątku testu.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.socket_path = str(self.temp_path / "daemon.sock")
+        self.environment_file = self.temp_path / "environment.yml"
+        self.environment_file.write_text(
+            "name: testenv\ndependencies:\n  - numpy>=1.22.0\n"
+        )
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def start_daemon(self, idle_timeout: float = 60) -> threading.Thread:
+        """Uruchamia demona w osobnym wątku i czeka na jego gotowość."""
+        daemon = ConversionDaemon(self.socket_path, idle_timeout)
+        thread = threading.Thread(target=daemon.serve, daemon=True)
+        thread.start()
+
+        deadline = time.monotonic() + 10
+        while send_request({"command": "ping"}, self.socket_path, 1.0) is None:
+            assert time.monotonic() < deadline, "Demon nie wystartował"
+            time.sleep(0.01)
+        return thread
+
+    def stop_daemon(self, thread: threading.Thread) -> None:
+        """Zatrzymuje demona i czeka na zakończenie wątku."""
+        send_request({"command": "shutdown"}, self.socket_path, 5.0)
+        thread.join(timeout=5)
+        assert not thread.is_alive()
+
+    def test_no_daemon(self) -> None:
+        """Test, że bez demona polecenie jest wykonywane lokalnie."""
+        assert send_request({"command": "ping"}, self.socket_path) is None
+        assert forward_command(["convert"], ".", self.socket_path) is None
+
+    def test_forward_convert(self) -> None:
+        """Test wykonania polecenia convert przez demona."""
+        thread = self.start_daemon()
+        try:
+            response = forward_command(
+                ["convert", "-f", "environment.yml", "-o", "pip", "-t", "out.txt"],
+                str(self.temp_path),
+                self.socket_path,
+            )
+            missing = forward_command(
+                ["convert", "-f", "missing.yml", "-o", "pip"],
+                str(self.temp_path),
+                self.socket_path,
+            )
+        finally:
+            self.stop_daemon(thread)
+
+        assert response is not None
+        assert response["exit_code"] == 0
+        assert "out.txt" in response["stdout"]
+        assert (self.temp_path / "out.txt").read_text() == "numpy>=1.22.0"
+        assert missing is not None
+        assert missing["exit_code"] == 2
+        assert "missing.yml" in missing["stderr"]
+        assert not os.path.exists(self.socket_path)
+
+    def test_client_environment(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test przekazywania zmiennych środowiskowych klienta do demona."""
+        requests = []
+        monkeypatch.setattr(
+            daemon,
+            "send_request",
+            lambda request, socket_path=None, timeout=None: requests.append(request),
+        )
+        monkeypatch.setenv("SPECTOMATE_PIN_INDEX", "mirror")
+        monkeypatch.setenv("SPECTOMATE_PARSE_CACHE", "1")
+        monkeypatch.setenv("SPECTOMATE_CHANNEL_INDEX", os.pathsep.join(["a", "/b"]))
+        monkeypatch.setenv("XDG_CACHE_HOME", "/tmp/cache")
+        monkeypatch.setenv("SPECTOMATE_NAME_MAPPING", "mapping.txt")
+        monkeypatch.delenv("XDG_CONFIG_HOME", raising=False)
+        cwd = str(self.temp_path)
+
+        forward_command(["convert", "-f", "latest", "-o", "pip"], cwd)
+
+        assert requests[0]["argv"] == ["convert", "-f", "latest", "-o", "pip"]
+        assert requests[0]["env"] == get_client_environment(cwd)
+        assert requests[0]["env"]["SPECTOMATE_PARSE_CACHE"] == "1"
+        assert requests[0]["env"]["SPECTOMATE_PIN_INDEX"] == os.path.join(cwd, "mirror")
+        assert requests[0]["env"]["SPECTOMATE_CHANNEL_INDEX"] == os.pathsep.join(
+            [os.path.join(cwd, "a"), "/b"]
+        )
+        assert requests[0]["env"]["XDG_CACHE_HOME"] == "/tmp/cache"
+        assert requests[0]["env"]["SPECTOMATE_NAME_MAPPING"] == os.path.join(
+            cwd, "mapping.txt"
+        )
+        assert "XDG_CONFIG_HOME" not in requests[0]["env"]
+
+    def test_unexpected_error(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test, że nieoczekiwany błąd polecenia kończy się odpowiedzią z kodem 1."""
+        from spectomate.cli import cli
+
+        def failing_main(*args, **kwargs):  # type: ignore[no-untyped-def]
+            print("częściowy wynik")
+            raise RuntimeError("awaria")
+
+        def failing_run(*args, **kwargs):  # type: ignore[no-untyped-def]
+            raise RuntimeError("awaria demona")
+
+        thread = self.start_daemon()
+        try:
+            monkeypatch.setattr(cli, "main", failing_main)
+            response = forward_command(
+                ["convert", "-f", "environment.yml"], ".", self.socket_path
+            )
+            monkeypatch.setattr(ConversionDaemon, "_run_cli", failing_run)
+            handler_response = forward_command(
+                ["convert", "-f", "environment.yml"], ".", self.socket_path
+            )
+        finally:
+            self.stop_daemon(thread)
+
+        assert response is not None
+        assert response["exit_code"] == 1
+        assert response["stdout"] == "częściowy wynik\n"
+        assert "RuntimeError: awaria" in response["stderr"]
+        assert handler_response is not None
+        assert handler_response["exit_code"] == 1
+        assert "awaria demona" in handler_response["stderr"]
+
+    def test_shared_socket_directory(self) -> None:
+        """Test, że klient i demon odrzucają katalog gniazda dostępny dla innych."""
+        thread = self.start_daemon()
+        try:
+            os.chmod(self.temp_path, 0o755)
+            assert send_request({"command": "ping"}, self.socket_path, 1.0) is None
+            assert forward_command(["convert"], ".", self.socket_path) is None
+        finally:
+            os.chmod(self.temp_path, 0o700)
+            self.stop_daemon(thread)
+
+        os.chmod(self.temp_path, 0o755)
+        with pytest.raises(RuntimeError, match="0700"):
+            ConversionDaemon(self.socket_path).serve()
+        assert not os.path.exists(self.socket_path)
+
+    def test_invalid_response(self) -> None:
+        """Test, że nieczytelna lub spóźniona odpowiedź oznacza brak demona."""
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(self.socket_path)
+        server.listen()
+        replies = [b"not json\n", b"[1]\n", None]
+
+        def serve() -> None:
+            for reply in replies:
+                connection, _ = server.accept()
+                with connection:
+                    connection.recv(65536)
+                    if reply is None:
+                        time.sleep(0.5)
+                    else:
+                        connection.sendall(reply)
+
+        thread = threading.Thread(target=serve, daemon=True)
+        thread.start()
+        try:
+            assert forward_command(["convert"], ".", self.socket_path) is None
+            assert forward_command(["convert"], ".", self.socket_path) is None
+            assert send_request({"command": "ping"}, self.socket_path, 0.1) is None
+        finally:
+            thread.join(timeout=5)
+            server.close()
+
+    def test_not_forwarded_commands(self) -> None:
+        """Test, że tylko wybrane polecenia są przekazywane do demona."""
+        thread = self.start_daemon()
+        try:
+            assert forward_command(["daemon", "stop"], ".", self.socket_path) is None
+            assert forward_command([], ".", self.socket_path) is None
+        finally:
+            self.stop_daemon(thread)
+
+    def test_version_handshake(self) -> None:
+        """Test, że demon odrzuca żądania klienta w innej wersji."""
+        thread = self.start_daemon()
+        try:
+            response = send_request(
+                {"command": "run", "version": "0.0.0", "argv": ["--version"]},
+                self.socket_path,
+            )
+        finally:
+            self.stop_daemon(thread)
+
+        assert response == {
+            "ok": False,
+            "error": "Niezgodna wersja klienta i demona",
+            "version": __version__,
+        }
+
+    def test_idle_shutdown(self) -> None:
+        """Test zakończenia demona po czasie bezczynności."""
+        thread = self.start_daemon(idle_timeout=0.2)
+
+        thread.join(timeout=5)
+
+        assert not thread.is_alive()
+        assert not os.path.exists(self.socket_path)
+
+    def test_already_running(self) -> None:
+        """Test, że drugi demon na tym samym gnieździe nie wystartuje."""
+        thread = self.start_daemon()
+        try:
+            with pytest.raises(RuntimeError):
+                ConversionDaemon(self.socket_path).serve()
+        finally:
+            self.stop_daemon(thread)
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
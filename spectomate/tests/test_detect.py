@@ -0,0 +1,97 @@
+"""
+Testy dla wykrywania formatu plików z zależnościami.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from spectomate.core.detect import SNIFF_SIZE, detect_format
+from spectomate.core.registry import ConverterRegistry
+
+
+class TestDetectFormat:
+    """
+    Testy dla funkcji detect_format.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_detect_from_filename(self) -> None:
+        """Test wykrywania formatu na podstawie nazwy pliku."""
+        assert detect_format("requirements.txt", content="") == "pip"
+        assert detect_format("dev-requirements.txt", content="") == "pip"
+        assert detect_format("requirements-dev.in", content="") == "pip"
+        assert detect_format("environment.yml", content="") == "conda"
+        assert detect_format("environment-gpu.yaml", content="") == "conda"
+
+    def test_detect_poetry_pyproject(self) -> None:
+        """Test wykrywania pyproject.toml z sekcją [tool.poetry]."""
+        pyproject_file = self.temp_path / "pyproject.toml"
+        pyproject_file.write_text(
+            '[build-system]\nrequires = ["poetry-core"]\n\n'
+            '[tool.poetry]\nname = "demo"\n\n'
+            '[tool.poetry.dependencies]\npython = "^3.9"\n'
+        )
+
+        assert detect_format(pyproject_file) == "poetry"
+
+    def test_detect_conda_content(self) -> None:
+        """Test wykrywania environment.yml o niestandardowej nazwie."""
+        env_file = self.temp_path / "env.yml"
+        env_file.write_text(
+            "name: testenv\nchannels:\n  - conda-forge\n"
+            "dependencies:\n  - numpy=1.22\n"
+        )
+
+        assert detect_format(env_file) == "conda"
+
+    def test_detect_requirements_content(self) -> None:
+        """Test wykrywania requirements.txt po gramatyce linii."""
+        content = "\n".join(
+            [
+                "# Zależności",
+                "-r base.txt",
+                "--index-url https://pypi.org/simple",
+                "numpy==1.22.0",
+                "requests[security]>=2.27.0,<3  # komentarz",
+                'pywin32>=300; sys_platform == "win32"',
+                "mypkg @ https://example.com/mypkg-1.0.whl",
+                "git+https://github.com/org/repo.git#egg=repo",
+            ]
+        )
+
+        assert detect_format("deps.lock", content=content) == "pip"
+        assert detect_format(content=content.encode("utf-8")) == "pip"
+
+    def test_detect_truncated_head(self) -> None:
+        """Test, że ucięta ostatnia linia nie psuje wykrywania."""
+        line = "package-with-a-long-name>=1.0.0\n"
+        content = line * (SNIFF_SIZE // len(line) + 10)
+
+        assert detect_format(content=content) == "pip"
+
+    def test_detect_unknown(self) -> None:
+        """Test, że nierozpoznana zawartość daje None."""
+        assert detect_format("notes.md", content="# Tytuł\n\nJakiś tekst.\n") is None
+        assert detect_format(content="") is None
+
+        with pytest.raises(ValueError):
+            detect_format()
+
+    def test_registry_detect_format(self) -> None:
+        """Test wykrywania formatu przez API rejestru."""
+        assert ConverterRegistry.detect_format(content="numpy==1.22.0\n") == "pip"
+        assert ConverterRegistry.detect_format(content="[tool.pdm]\n") is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
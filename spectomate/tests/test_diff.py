@@ -0,0 +1,113 @@
+"""
+Testy dla porównywania zależności z dwóch plików.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from spectomate.core.diff import ADDED, CHANGED, REMOVED, diff_files, diff_requirements
+from spectomate.core.ir import parse_requirement
+from spectomate.diff_cli import diff_command
+
+
+class TestDiff:
+    """
+    Testy dla modułu spectomate.core.diff.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+        self.requirements_file = self.temp_path / "requirements.txt"
+        self.requirements_file.write_text(
+            "numpy>=1.21,<2.0\n"
+            "requests\n"
+            "flask==2.0\n"
+            "torch; sys_platform == 'linux'\n"
+        )
+        self.environment_file = self.temp_path / "environment.yml"
+        self.environment_file.write_text(
+            "name: test\n"
+            "dependencies:\n"
+            "  - python=3.10\n"
+            "  - numpy<2,>=1.21\n"
+            "  - pip:\n"
+            "    - requests[socks]\n"
+            "    - django\n"
+            "    - torch\n"
+        )
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_diff_requirements(self) -> None:
+        """Test porównania list wymagań."""
+        result = diff_requirements(
+            [parse_requirement(line) for line in ("A==1.0", "b>=1,<2", "c", "d")],
+            [parse_requirement(line) for line in ("a==1.1", "B<2.0,>=1", "d", "e")],
+        )
+
+        assert [(change.name, change.kind) for change in result.changes] == [
+            ("a", CHANGED),
+            ("c", REMOVED),
+            ("e", ADDED),
+        ]
+        assert result.changed[0].fields == ["specifier"]
+        assert str(result.changed[0]) == "~ A==1.0 -> a==1.1"
+        assert result.unchanged == 2
+        assert not diff_requirements([], [])
+
+    def test_diff_files_across_formats(self) -> None:
+        """Test porównania requirements.txt z environment.yml."""
+        result = diff_files(self.requirements_file, self.environment_file)
+
+        assert [str(change) for change in result.changes] == [
+            "+ django",
+            "- flask==2.0",
+            "~ requests -> requests[socks]",
+            '~ torch; sys_platform == "linux" -> torch',
+        ]
+        assert [change.fields for change in result.changed] == [["extras"], ["marker"]]
+        assert result.to_dict()["summary"] == {
+            ADDED: 1,
+            REMOVED: 1,
+            CHANGED: 2,
+            "unchanged": 1,
+        }
+
+    def test_diff_command(self) -> None:
+        """Test komendy spectomate diff."""
+        runner = CliRunner()
+
+        result = runner.invoke(
+            diff_command,
+            [str(self.requirements_file), str(self.environment_file), "--json"],
+        )
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert [change["name"] for change in data["added"]] == ["django"]
+        assert data["changed"][0]["new"] == ["requests[socks]"]
+
+        result = runner.invoke(
+            diff_command,
+            [str(self.requirements_file), str(self.environment_file), "--check"],
+        )
+        assert result.exit_code == 1
+
+        result = runner.invoke(
+            diff_command,
+            [str(self.requirements_file), str(self.requirements_file), "--check"],
+        )
+        assert result.exit_code == 0
+        assert "te same zależności" in result.output
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
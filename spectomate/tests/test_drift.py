@@ -0,0 +1,157 @@
+"""
+Testy dla raportu rozbieżności zależności między projektami.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from spectomate.core import drift
+from spectomate.core.drift import collect_drift, find_manifests
+from spectomate.drift_cli import drift_command
+
+
+class TestDrift:
+    """
+    Testy dla modułu spectomate.core.drift.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.root = Path(self.temp_dir.name)
+        drift.clear_cache()
+
+        self.write("api/requirements.txt", "numpy==1.22.0\nrequests>=2.28\n")
+        self.write(
+            "worker/environment.yml",
+            "name: worker\n"
+            "dependencies:\n"
+            "  - python=3.10\n"
+            "  - numpy==1.22.0\n"
+            "  - pip:\n"
+            "    - requests<2.20\n",
+        )
+        self.write("web/requirements.txt", "NumPy==1.21.0\nclick\n")
+        self.write(
+            "web/pyproject.toml",
+            "[tool.poetry]\n"
+            'name = "web"\n'
+            "[tool.poetry.dependencies]\n"
+            'python = "^3.9"\n'
+            'numpy = "1.22"\n',
+        )
+        self.write("web/.venv/requirements.txt", "numpy==0.1\n")
+        self.write("web/node_modules/pkg/requirements.txt", "numpy==0.2\n")
+        self.write("docs/README.md", "numpy==0.3\n")
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        drift.clear_cache()
+        self.temp_dir.cleanup()
+
+    def write(self, name: str, content: str) -> None:
+        """Zapisuje plik w drzewie testowym."""
+        path = self.root / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+
+    def test_find_manifests(self) -> None:
+        """Test wyszukiwania plików z pominięciem katalogów środowisk."""
+        manifests = find_manifests(self.root)
+
+        assert [
+            (path.relative_to(self.root).as_posix(), format_name)
+            for path, format_name in manifests
+        ] == [
+            ("api/requirements.txt", "pip"),
+            ("web/pyproject.toml", "poetry"),
+            ("web/requirements.txt", "pip"),
+            ("worker/environment.yml", "conda"),
+        ]
+
+    def test_collect_drift(self) -> None:
+        """Test indeksu pakietów, rozbieżnych wersji i sprzecznych ograniczeń."""
+        report = collect_drift(self.root, max_workers=2)
+
+        assert report.projects == ["api", "web", "worker"]
+        assert sorted(report.packages) == ["click", "numpy", "requests"]
+
+        numpy = report.packages["numpy"]
+        assert [usage.file for usage in numpy.usages] == [
+            "api/requirements.txt",
+            "web/pyproject.toml",
+            "web/requirements.txt",
+            "worker/environment.yml",
+        ]
+        # "1.22" z Poetry i "1.22.0" to ta sama wersja
+        assert numpy.pins == {"1.22.0": 3, "1.21.0": 1}
+        assert numpy.most_common_version == "1.22.0"
+        assert [usage.file for usage in numpy.outliers()] == ["web/requirements.txt"]
+
+        assert [package.name for package in report.divergent()] == ["numpy"]
+        assert [package.name for package in report.conflicting()] == [
+            "numpy",
+            "requests",
+        ]
+        assert report.has_drift()
+
+        data = report.to_dict()
+        assert data["most_common_versions"] == {"numpy": "1.22.0"}
+        assert data["packages"]["click"]["usages"] == [
+            {"project": "web", "file": "web/requirements.txt", "requirement": "click"}
+        ]
+
+    def test_marker_split_pins(self) -> None:
+        """Test, że przypięcia z wykluczającymi się markerami nie są rozbieżne."""
+        self.write(
+            "legacy/requirements.txt",
+            'scipy==1.7.3; python_version < "3.8"\n'
+            'scipy==1.10.0; python_version >= "3.8"\n',
+        )
+        self.write("tools/requirements.txt", "scipy>=1.5\n")
+
+        scipy = collect_drift(self.root).packages["scipy"]
+
+        assert scipy.pins == {"1.10.0": 1, "1.7.3": 1}
+        assert not scipy.is_divergent
+        assert not scipy.is_conflicting
+        assert scipy.outliers() == []
+
+        # Ograniczenie bez markera dotyczy każdego środowiska
+        self.write("tools/requirements.txt", "scipy<1.8\n")
+        drift.clear_cache()
+
+        scipy = collect_drift(self.root).packages["scipy"]
+
+        assert scipy.is_conflicting
+        assert not scipy.is_divergent
+
+    def test_invalid_manifest(self) -> None:
+        """Test pominięcia pliku, którego nie da się wczytać."""
+        self.write("broken/environment.yml", "dependencies: [\n")
+
+        report = collect_drift(self.root)
+
+        assert "broken/environment.yml" in report.errors
+        assert "broken" not in report.projects
+
+    def test_drift_command(self) -> None:
+        """Test komendy spectomate drift."""
+        runner = CliRunner()
+
+        result = runner.invoke(drift_command, [str(self.root), "--check"])
+        assert result.exit_code == 1
+        assert "numpy: 1.22.0 (3), 1.21.0 (1); najczęstsza 1.22.0" in result.output
+        assert "web/requirements.txt: NumPy==1.21.0" in result.output
+
+        result = runner.invoke(drift_command, [str(self.root / "api"), "--json"])
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.output)["manifests"] == ["requirements.txt"]
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,96 @@
+"""
+Testy dla kanonicznej reprezentacji wymagań.
+"""
+
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from spectomate.core.ir import (
+    Requirement,
+    load_requirements,
+    parse_requirement,
+    parse_requirements_txt,
+)
+
+
+class TestRequirementIR:
+    """
+    Testy dla modułu spectomate.core.ir.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_parse_requirement(self) -> None:
+        """Test parsowania wymagań pip do postaci kanonicznej."""
+        requirement = parse_requirement(
+            "Requests[socks,security] <3, >=2.27 ; python_version >= '3.8'"
+        )
+
+        assert requirement.name == "Requests"
+        assert requirement.key == "requests"
+        assert requirement.specifier == "<3,>=2.27"
+        assert requirement.extras == ("security", "socks")
+        assert requirement.marker == 'python_version >= "3.8"'
+        assert requirement == Requirement(
+            "requests", "<3,>=2.27", ("socks", "security"), 'python_version >= "3.8"'
+        )
+
+        vcs = parse_requirement("git+https://example.com/repo.git@v1#egg=mylib")
+        assert vcs.name == "mylib"
+        assert vcs.to_pip() == "mylib @ git+https://example.com/repo.git@v1"
+
+        with pytest.raises(ValueError):
+            parse_requirement("numpy>=>1")
+
+    def test_parse_requirements_txt(self) -> None:
+        """Test parsowania pliku requirements.txt z pominięciem opcji."""
+        warnings = []
+
+        requirements = parse_requirements_txt(
+            "# komentarz\n-r base.txt\nnumpy==1.22.0  # przypięte\n\nbad line!\n",
+            warnings,
+        )
+
+        assert [str(req) for req in requirements] == ["numpy==1.22.0"]
+        assert len(warnings) == 1
+        assert "linię 5" in warnings[0]
+
+    def test_load_requirements(self) -> None:
+        """Test wczytywania wymagań z plików w różnych formatach."""
+        environment_file = self.temp_path / "environment.yml"
+        environment_file.write_text(
+            "name: test\n"
+            "dependencies:\n"
+            "  - python=3.10\n"
+            "  - numpy=1.22\n"
+            "  - pip\n"
+            "  - pip:\n"
+            "    - requests>=2.27\n"
+        )
+        pyproject_file = self.temp_path / "pyproject.toml"
+        pyproject_file.write_text(
+            "[tool.poetry]\n"
+            'name = "test"\n'
+            "[tool.poetry.dependencies]\n"
+            'python = "^3.9"\n'
+            'click = "^8.0"\n'
+        )
+
+        conda = load_requirements(environment_file, options={"map_names": False})
+        poetry = load_requirements(pyproject_file)
+
+        assert [str(req) for req in conda] == ["numpy==1.22.*", "requests>=2.27"]
+        assert [str(req) for req in poetry] == ["click<9.0,>=8.0"]
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,145 @@
+"""
+Testy dla formatu ir (zserializowanej kanonicznej reprezentacji wymagań).
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from spectomate.core.detect import detect_format
+from spectomate.core.ir import load_requirements, parse_requirement, write_requirements
+from spectomate.core.registry import ConverterRegistry
+from spectomate.schemas.ir_schema import IR_FORMAT, IR_VERSION, IrSchema
+
+
+class TestIrFormat:
+    """
+    Testy dla schematu i konwerterów formatu ir.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+        self.requirements = [
+            parse_requirement(line)
+            for line in (
+                "numpy>=1.21,<2",
+                "requests[socks]>=2; python_version >= '3.8'",
+                "foo @ https://example.com/foo-1.0.whl",
+            )
+        ]
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_round_trip(self) -> None:
+        """Test zapisu i odczytu wymagań w formacie ir."""
+        content = IrSchema.generate_json(IrSchema.from_requirements(self.requirements))
+        document = json.loads(content)
+
+        assert document["format"] == IR_FORMAT
+        assert document["version"] == IR_VERSION
+        assert document["requirements"][0] == ["numpy", "<2,>=1.21"]
+        assert document["requirements"][2] == [
+            "foo",
+            "",
+            [],
+            "",
+            "https://example.com/foo-1.0.whl",
+        ]
+        assert IrSchema.parse_string(content)["requirements"] == self.requirements
+
+    def test_invalid_documents(self) -> None:
+        """Test odrzucania plików spoza formatu ir i nieznanych wersji."""
+        with pytest.raises(ValueError, match="brak nagłówka"):
+            IrSchema.parse_string('{"requirements": []}')
+        with pytest.raises(ValueError, match="wersja"):
+            IrSchema.parse_string(
+                json.dumps({"format": IR_FORMAT, "version": 99, "requirements": []})
+            )
+        with pytest.raises(ValueError, match="rekord"):
+            IrSchema.parse_string(
+                json.dumps(
+                    {"format": IR_FORMAT, "version": IR_VERSION, "requirements": [[]]}
+                )
+            )
+
+    def test_load_and_write_requirements(self) -> None:
+        """Test bezpośredniego zapisu i odczytu przez load/write_requirements."""
+        ir_file = self.temp_path / "deps.ir.json"
+
+        assert write_requirements(self.requirements, "ir", ir_file) == "updated"
+        assert write_requirements(self.requirements, "ir", ir_file) == "unchanged"
+        assert detect_format(ir_file) == "ir"
+        assert load_requirements(ir_file) == self.requirements
+
+    def test_convert_through_registry(self) -> None:
+        """Test konwersji pip -> ir -> pip i poetry -> ir przez rejestr."""
+        requirements_file = self.temp_path / "requirements.txt"
+        requirements_file.write_text(
+            "\n".join(req.to_pip() for req in self.requirements) + "\n-r other.txt\n"
+        )
+        pyproject_file = self.temp_path / "pyproject.toml"
+        pyproject_file.write_text(
+            "[tool.poetry]\n"
+            'name = "demo"\n'
+            'version = "0.1.0"\n'
+            "\n"
+            "[tool.poetry.dependencies]\n"
+            'python = "^3.9"\n'
+            'requests = "^2.28"\n'
+        )
+        ir_file = self.temp_path / "requirements.ir.json"
+
+        converter_class = ConverterRegistry.get_converter("pip", "ir")
+        converter = converter_class(source_file=requirements_file, target_file=ir_file)
+        converter.execute()
+        assert load_requirements(ir_file) == self.requirements
+
+        output_file = self.temp_path / "requirements-out.txt"
+        converter_class = ConverterRegistry.get_converter("ir", "pip")
+        converter_class(source_file=ir_file, target_file=output_file).execute()
+        assert output_file.read_text().splitlines() == [
+            req.to_pip() for req in self.requirements
+        ]
+
+        converter_class = ConverterRegistry.get_converter("poetry", "ir")
+        assert converter_class is not None
+        converter_class(source_file=pyproject_file, target_file=ir_file).execute()
+        assert [req.to_pip() for req in load_requirements(ir_file)] == [
+            "requests<3.0,>=2.28"
+        ]
+
+    def test_warning_line_numbers(self) -> None:
+        """Test, że ostrzeżenia podają numery linii pliku źródłowego."""
+        converter_class = ConverterRegistry.get_converter("pip", "ir")
+        converter = converter_class()
+
+        converter.convert(
+            converter.parse_source(
+                "# zależności\n-e .\nnumpy\n\nrequests\nbad requirement!\n"
+            )
+        )
+
+        assert len(converter.warnings) == 1
+        assert converter.warnings[0].startswith("Pominięto linię 6:")
+
+    def test_msgpack(self) -> None:
+        """Test zapisu i odczytu w formacie msgpack (opcjonalny pakiet)."""
+        pytest.importorskip("msgpack")
+        ir_file = self.temp_path / "deps.ir.msgpack"
+
+        write_requirements(self.requirements, "ir", ir_file)
+
+        assert ir_file.read_bytes()[:1] != b"{"
+        assert detect_format(ir_file) == "ir"
+        assert load_requirements(ir_file) == self.requirements
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,100 @@
+"""
+Testy dla tłumaczenia specyfikacji conda na PEP 508/440.
+"""
+
+import pytest
+
+from spectomate.converters.conda_to_pip import CondaToPipConverter
+from spectomate.core import match_spec
+from spectomate.core.match_spec import (
+    conda_version_to_pep440,
+    match_spec_to_pep508,
+    parse_match_spec,
+    pep440_to_conda_version,
+)
+
+
+class TestMatchSpec:
+    """
+    Testy dla modułu spectomate.core.match_spec.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        match_spec.clear_cache()
+
+    def test_parse_match_spec(self) -> None:
+        """Test podziału specyfikacji na nazwę, wersję i build."""
+        assert parse_match_spec("numpy") == ("numpy", "", "")
+        assert parse_match_spec("conda-forge::numpy>=1.22") == ("numpy", ">=1.22", "")
+        assert parse_match_spec("numpy=1.22") == ("numpy", "1.22.*", "")
+        assert parse_match_spec("foo=1.0=py39h_0") == ("foo", "1.0", "py39h_0")
+        assert parse_match_spec("foo 1.0 py39h_0") == ("foo", "1.0", "py39h_0")
+        assert parse_match_spec("scipy >= 1.7, <2") == ("scipy", ">=1.7,<2", "")
+        assert parse_match_spec("foo[version='>=1.0,<2', build=py39*]") == (
+            "foo",
+            ">=1.0,<2",
+            "py39*",
+        )
+        with pytest.raises(ValueError):
+            parse_match_spec("==1.0")
+
+    def test_conda_version_to_pep440(self) -> None:
+        """Test tłumaczenia specyfikacji wersji."""
+        assert conda_version_to_pep440("1.22.*") == "==1.22.*"
+        assert conda_version_to_pep440("1.22.0") == "==1.22.0"
+        assert conda_version_to_pep440("==1.22.0") == "==1.22.0"
+        assert conda_version_to_pep440(">=1.7,<2") == ">=1.7,<2"
+        assert conda_version_to_pep440(">=1.2.*") == ">=1.2"
+        assert conda_version_to_pep440("!=1.3.*") == "!=1.3.*"
+        assert conda_version_to_pep440("*") == ""
+        with pytest.raises(ValueError):
+            conda_version_to_pep440("1.7|1.8")
+        with pytest.raises(ValueError):
+            conda_version_to_pep440(">=abc def")
+
+    def test_pep440_to_conda_version(self) -> None:
+        """Test tłumaczenia specyfikatora PEP 440 na wersję conda."""
+        assert pep440_to_conda_version("==1.22.*,>=1.21") == ">=1.21,1.22.*"
+        assert pep440_to_conda_version("==1.22.0") == "==1.22.0"
+        assert pep440_to_conda_version("") == ""
+        with pytest.raises(ValueError):
+            pep440_to_conda_version("===1.0")
+
+    def test_match_spec_to_pep508(self) -> None:
+        """Test pełnego tłumaczenia specyfikacji pakietu."""
+        assert match_spec_to_pep508("numpy=1.22") == ("numpy", "==1.22.*")
+        assert match_spec_to_pep508("conda-forge::numpy 1.22.0 py39h_0") == (
+            "numpy",
+            "==1.22.0",
+        )
+        assert match_spec_to_pep508("pandas") == ("pandas", "")
+        assert match_spec_to_pep508.cache_info().currsize == 3
+
+    def test_converter(self) -> None:
+        """Test konwertera conda -> pip z tłumaczeniem wersji."""
+        converter = CondaToPipConverter(options={"map_names": False})
+
+        pip_data = converter.convert(
+            {
+                "dependencies": [
+                    "numpy=1.22",
+                    "scipy>=1.7,<2",
+                    "foo=1.0=py39h_0",
+                    "bar 1.7|1.8",
+                ]
+            }
+        )
+
+        assert pip_data["requirements"] == [
+            "bar",
+            "foo==1.0",
+            "numpy==1.22.*",
+            "scipy>=1.7,<2",
+        ]
+        assert len(converter.warnings) == 1
+        assert "bar" in converter.warnings[0]
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
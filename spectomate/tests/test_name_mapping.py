@@ -0,0 +1,130 @@
+"""
+Testy dla mapowania nazw pakietów pip <-> conda.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from spectomate.converters.conda_to_pip import CondaToPipConverter
+from spectomate.converters.pip_to_conda import PipToCondaConverter
+from spectomate.core import conda_lookup, name_mapping
+from spectomate.core.name_mapping import (
+    MappingIndex,
+    NameMapper,
+    compile_mapping,
+    get_name_mapper,
+    parse_mapping,
+)
+
+
+class TestNameMapping:
+    """
+    Testy dla modułu spectomate.core.name_mapping.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.old_overrides = os.environ.get(name_mapping.OVERRIDES_ENV_VAR)
+        os.environ[name_mapping.OVERRIDES_ENV_VAR] = str(
+            self.temp_path / "name_mapping.txt"
+        )
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        if self.old_overrides is None:
+            os.environ.pop(name_mapping.OVERRIDES_ENV_VAR, None)
+        else:
+            os.environ[name_mapping.OVERRIDES_ENV_VAR] = self.old_overrides
+        self.temp_dir.cleanup()
+
+    def test_index_lookup(self) -> None:
+        """Test wyszukiwania w obu kierunkach w skompilowanym indeksie."""
+        pairs = parse_mapping(
+            [
+                "# komentarz",
+                "torch pytorch",
+                "opencv-python opencv  # pierwszy wpis dla opencv",
+                "opencv-python-headless opencv",
+                "",
+            ]
+        )
+        index_file = self.temp_path / "mapping.idx"
+        index_file.write_bytes(compile_mapping(pairs))
+
+        index = MappingIndex.open(index_file)
+
+        assert len(index) == 3
+        assert index.to_conda("Torch") == "pytorch"
+        assert index.to_conda("opencv_python.headless") == "opencv"
+        assert index.to_conda("numpy") is None
+        assert index.to_pip("pytorch") == "torch"
+        assert index.to_pip("opencv") == "opencv-python"
+        assert index.to_pip("torch") is None
+
+    def test_invalid_input(self) -> None:
+        """Test błędów dla niepoprawnego pliku mapowań i indeksu."""
+        with pytest.raises(ValueError):
+            parse_mapping(["torch"])
+        with pytest.raises(ValueError):
+            MappingIndex(b"XXXX" + bytes(32))
+
+    def test_bundled_index_up_to_date(self) -> None:
+        """Test, że wbudowany indeks odpowiada wbudowanemu zbiorowi mapowań."""
+        with open(name_mapping.DEFAULT_SOURCE_FILE, encoding="utf-8") as f:
+            expected = compile_mapping(parse_mapping(f))
+
+        assert name_mapping.DEFAULT_INDEX_FILE.read_bytes() == expected
+
+    def test_overrides(self) -> None:
+        """Test własnych mapowań użytkownika nałożonych na indeks."""
+        assert get_name_mapper().to_conda("torch") == "pytorch"
+
+        overrides_file = self.temp_path / "name_mapping.txt"
+        overrides_file.write_text("torch torch-custom\ninternal-lib internal\n")
+
+        mapper = get_name_mapper()
+        assert mapper.to_conda("torch") == "torch-custom"
+        assert mapper.to_conda("Internal_Lib") == "internal"
+        assert mapper.to_pip("internal") == "internal-lib"
+        # Wpisy bez własnego mapowania nadal pochodzą z indeksu
+        assert mapper.to_pip("pytorch") == "torch"
+        assert NameMapper().to_conda("PyYAML") == "pyyaml"
+
+    def test_converters(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test tłumaczenia nazw w konwerterach pip -> conda i conda -> pip."""
+        monkeypatch.setattr(
+            "spectomate.core.conda_lookup.search_package",
+            lambda name, timeout=None: name in ("pytorch", "pyyaml"),
+        )
+        conda_lookup.clear_cache()
+        converter = PipToCondaConverter()
+
+        conda_data = converter.convert(
+            converter.parse_source("torch>=2.0\nPyYAML==6.0\ninternal-lib\n")
+        )
+
+        assert conda_data["dependencies"] == [
+            "pytorch>=2.0",
+            "pyyaml==6.0",
+            "pip",
+            {"pip": ["internal-lib"]},
+        ]
+
+        pip_data = CondaToPipConverter().convert(
+            {"dependencies": ["pytorch>=2.0", "conda-forge::py-xgboost", "numpy"]}
+        )
+        assert pip_data["requirements"] == ["numpy", "torch>=2.0", "xgboost"]
+
+        unmapped = CondaToPipConverter(options={"map_names": False}).convert(
+            {"dependencies": ["pytorch>=2.0"]}
+        )
+        assert unmapped["requirements"] == ["pytorch>=2.0"]
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,129 @@
+"""
+Testy dla pamięci podręcznej sparsowanych plików z zależnościami.
+"""
+
+import os
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from spectomate.core import parse_cache
+from spectomate.core.parse_cache import PARSE_CACHE_ENV_VAR, cached_parse, clear_cache
+from spectomate.schemas.conda_schema import CondaSchema
+
+
+def _make_old(path: Path) -> None:
+    """Cofa czas modyfikacji pliku, aby wpis mógł zostać zapisany."""
+    old = time.time() - 60
+    os.utime(path, (old, old))
+
+
+class TestParseCache:
+    """
+    Testy dla modułu spectomate.core.parse_cache.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.cache_dir = self.temp_path / "cache"
+
+        self.source_file = self.temp_path / "environment.yml"
+        self.source_file.write_text(
+            "name: test\nchannels:\n  - conda-forge\ndependencies:\n  - numpy>=1.21\n"
+        )
+        _make_old(self.source_file)
+        self.calls = 0
+
+        self.old_env = os.environ.pop(PARSE_CACHE_ENV_VAR, None)
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        os.environ.pop(PARSE_CACHE_ENV_VAR, None)
+        if self.old_env is not None:
+            os.environ[PARSE_CACHE_ENV_VAR] = self.old_env
+        self.temp_dir.cleanup()
+
+    def _parse(self, parser_version: int = 1) -> dict:
+        """Parsuje plik źródłowy przez pamięć podręczną, licząc wywołania parsera."""
+
+        def parse() -> dict:
+            self.calls += 1
+            return CondaSchema.parse_string(self.source_file.read_text())
+
+        return cached_parse(
+            self.source_file, "conda", parser_version, parse, self.cache_dir
+        )
+
+    def test_hit_and_miss(self) -> None:
+        """Test ponownego użycia wpisu dla niezmienionego pliku."""
+        first = self._parse()
+        second = self._parse()
+
+        assert self.calls == 1
+        assert first == second
+        assert first is not second
+        assert len(list(self.cache_dir.glob("conda-*.bin"))) == 1
+
+    def test_invalidation(self) -> None:
+        """Test unieważniania wpisu po zmianie pliku lub wersji parsera."""
+        self._parse()
+
+        self.source_file.write_text(
+            self.source_file.read_text() + "  - requests\n", encoding="utf-8"
+        )
+        _make_old(self.source_file)
+        data = self._parse()
+        assert self.calls == 2
+        assert "requests" in data["dependencies"]
+
+        self._parse(parser_version=2)
+        assert self.calls == 3
+
+    def test_racy_and_corrupt_entries(self) -> None:
+        """Test pomijania świeżo zmienionych plików i uszkodzonych wpisów."""
+        os.utime(self.source_file)
+        self._parse()
+        self._parse()
+        assert self.calls == 2
+        assert not self.cache_dir.exists()
+
+        _make_old(self.source_file)
+        self._parse()
+        entry = next(self.cache_dir.glob("*.bin"))
+        entry.write_bytes(entry.read_bytes()[:-3])
+        self._parse()
+        assert self.calls == 4
+
+    def test_unmarshallable_data(self) -> None:
+        """Test pomijania danych, których nie da się zapisać (np. obiektów)."""
+        data = cached_parse(
+            self.source_file, "conda", 1, lambda: {"value": object()}, self.cache_dir
+        )
+
+        assert "value" in data
+        assert not list(self.cache_dir.glob("*.bin"))
+
+    def test_schema_opt_in(self) -> None:
+        """Test włączania pamięci podręcznej schematów zmienną środowiskową."""
+        CondaSchema.parse_file(self.source_file)
+        assert not self.cache_dir.exists()
+
+        os.environ[PARSE_CACHE_ENV_VAR] = str(self.cache_dir)
+        assert parse_cache.get_configured_cache_dir() == self.cache_dir
+        first = CondaSchema.parse_file(self.source_file)
+        assert CondaSchema.parse_file(self.source_file) == first
+        assert len(list(self.cache_dir.glob("conda-*.bin"))) == 1
+
+        assert clear_cache() == 1
+        assert not list(self.cache_dir.glob("*.bin"))
+
+        os.environ[PARSE_CACHE_ENV_VAR] = "0"
+        assert parse_cache.get_configured_cache_dir() is None
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,195 @@
+"""
+Testy dla przypinania wymagań do najnowszych wersji z lokalnej kopii indeksu.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+import pytest
+from click.testing import CliRunner
+
+from spectomate.cli import cli
+from spectomate.core import pinning
+from spectomate.core.ir import parse_requirement
+from spectomate.core.pinning import (
+    VersionIndex,
+    build_version_index,
+    get_version_index,
+    pin_latest,
+)
+
+
+class TestPinning:
+    """
+    Testy dla modułu spectomate.core.pinning.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.env_patch = mock.patch.dict(
+            os.environ, {"XDG_CACHE_HOME": str(self.temp_path / "cache")}
+        )
+        self.env_patch.start()
+        pinning.clear_cache()
+
+        self.index_file = self.temp_path / "index.json"
+        self.index_file.write_text(
+            json.dumps(
+                {
+                    "packages": {
+                        "NumPy": {"1.21.0": {}, "1.22.4": {}, "1.26.4": {}},
+                        "requests": {
+                            "2.28.0": {},
+                            "2.31.0": {},
+                            "2.32.0": {"yanked": True},
+                            "3.0.0b1": {},
+                        },
+                        "click": {"8.1.7": {}},
+                    }
+                }
+            )
+        )
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.env_patch.stop()
+        pinning.clear_cache()
+        self.temp_dir.cleanup()
+
+    def test_version_index(self) -> None:
+        """Test wyszukiwania najnowszych wersji w indeksie wersji."""
+        index = VersionIndex.from_package_index(self.index_file)
+
+        assert len(index) == 3
+        assert "numpy" in index
+        assert index.versions("requests") == ("2.28.0", "2.31.0", "3.0.0b1")
+        assert index.latest("numpy") == "1.26.4"
+        assert index.latest("NumPy", "<1.23") == "1.22.4"
+        assert index.latest("requests") == "2.31.0"
+        assert index.latest("requests", prereleases=True) == "3.0.0b1"
+        assert index.latest("numpy", ">=2") is None
+        assert index.latest("missing") is None
+        assert index.latest_many([("numpy", ""), ("click", ">=8")]) == {
+            ("numpy", ""): "1.26.4",
+            ("click", ">=8"): "8.1.7",
+        }
+
+        assert VersionIndex.from_json(index.to_json()).versions("numpy") == (
+            "1.21.0",
+            "1.22.4",
+            "1.26.4",
+        )
+
+    def test_pin_latest(self) -> None:
+        """Test przypinania wymagań z zachowaniem dodatków i markerów."""
+        index = VersionIndex.from_package_index(self.index_file)
+        warnings = []
+
+        pinned = pin_latest(
+            [
+                parse_requirement(line)
+                for line in (
+                    "numpy>=1.21,<1.23",
+                    "requests[socks]; python_version >= '3.8'",
+                    "click==8.0.0",
+                    "numpy==1.21.*",
+                    "internal-lib>=1.0",
+                    "numpy>=3",
+                )
+            ],
+            index,
+            warnings=warnings,
+        )
+
+        assert [str(req) for req in pinned] == [
+            "numpy==1.22.4",
+            'requests[socks]==2.31.0; python_version >= "3.8"',
+            "click==8.0.0",
+            "numpy==1.21.0",
+            "internal-lib>=1.0",
+            "numpy>=3",
+        ]
+        assert len(warnings) == 2
+        assert "internal-lib" in warnings[0]
+        assert "'>=3'" in warnings[1]
+
+    def test_build_version_index_cache(self) -> None:
+        """Test zapisu indeksu wersji i przebudowy po zmianie kopii indeksu."""
+        cache_dir = self.temp_path / "cache" / "spectomate" / "version-index"
+
+        build_version_index(self.index_file)
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+        with mock.patch.object(
+            VersionIndex, "from_package_index", side_effect=AssertionError
+        ):
+            assert build_version_index(self.index_file).latest("click") == "8.1.7"
+
+        self.index_file.write_text(json.dumps({"click": {"8.2.0": {}}}))
+        index = build_version_index(self.index_file)
+
+        assert index.latest("click") == "8.2.0"
+        assert len(list(cache_dir.glob("*.json"))) == 1
+
+    def test_simple_directory(self) -> None:
+        """Test budowania indeksu wersji z katalogu simple API."""
+        project_dir = self.temp_path / "simple" / "six"
+        project_dir.mkdir(parents=True)
+        (project_dir / "index.html").write_text(
+            '<a href="six-1.15.0.tar.gz">six-1.15.0.tar.gz</a>\n'
+            '<a href="six-1.16.0-py2.py3-none-any.whl">six-1.16.0</a>\n'
+        )
+
+        index = get_version_index(self.temp_path / "simple")
+
+        assert index is not None
+        assert index.versions("six") == ("1.15.0", "1.16.0")
+        assert get_version_index(self.temp_path / "simple") is index
+        with mock.patch.dict(os.environ, {"SPECTOMATE_PIN_INDEX": ""}):
+            assert get_version_index() is None
+
+    def test_convert_pin_latest(self) -> None:
+        """Test komendy convert z opcją --pin latest."""
+        requirements_file = self.temp_path / "requirements.txt"
+        requirements_file.write_text("numpy<1.23\nrequests>=2.0\n")
+        output_file = self.temp_path / "requirements.lock"
+
+        result = CliRunner().invoke(
+            cli,
+            [
+                "convert",
+                "-f",
+                str(requirements_file),
+                "-o",
+                "pip",
+                "-t",
+                str(output_file),
+                "--pin",
+                "latest",
+                "--pin-index",
+                str(self.index_file),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert output_file.read_text().splitlines() == [
+            "numpy==1.22.4",
+            "requests==2.31.0",
+        ]
+
+        result = CliRunner().invoke(
+            cli,
+            ["convert", "-f", str(requirements_file), "-o", "pip"]
+            + ["-t", str(output_file), "--pin", "latest"],
+            env={"SPECTOMATE_PIN_INDEX": ""},
+        )
+        assert result.exit_code == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
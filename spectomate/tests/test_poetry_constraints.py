@@ -0,0 +1,95 @@
+"""
+Testy dla tłumaczenia ograniczeń wersji Poetry na PEP 440 i odwrotnie.
+"""
+
+import pytest
+
+from spectomate.core import poetry_constraints
+from spectomate.core.poetry_constraints import pep440_to_poetry, poetry_to_pep440
+from spectomate.schemas.poetry_schema import PoetrySchema
+
+
+class TestPoetryConstraints:
+    """
+    Testy dla modułu spectomate.core.poetry_constraints.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        poetry_constraints.clear_cache()
+
+    def test_poetry_to_pep440(self) -> None:
+        """Test tłumaczenia ograniczeń Poetry na PEP 440."""
+        assert poetry_to_pep440("*") == ""
+        assert poetry_to_pep440("1.2.3") == "==1.2.3"
+        assert poetry_to_pep440("1.2.*") == "==1.2.*"
+        assert poetry_to_pep440("^1.2.3") == ">=1.2.3,<2.0.0"
+        assert poetry_to_pep440("^0.2.3") == ">=0.2.3,<0.3.0"
+        assert poetry_to_pep440("^0.0.3") == ">=0.0.3,<0.0.4"
+        assert poetry_to_pep440("^0") == ">=0,<1"
+        assert poetry_to_pep440("~1.2.3") == ">=1.2.3,<1.3.0"
+        assert poetry_to_pep440("~1") == ">=1,<2"
+        assert poetry_to_pep440(">=1.2 <1.5") == ">=1.2,<1.5"
+        assert poetry_to_pep440(">= 1.2, < 1.5") == ">=1.2,<1.5"
+        assert poetry_to_pep440("==1.22.0") == "==1.22.0"
+        with pytest.raises(ValueError):
+            poetry_to_pep440("^1.0 || ^2.0")
+        with pytest.raises(ValueError):
+            poetry_to_pep440("^abc")
+
+    def test_pep440_to_poetry(self) -> None:
+        """Test tłumaczenia specyfikatorów PEP 440 na ograniczenia Poetry."""
+        assert pep440_to_poetry("") == "*"
+        assert pep440_to_poetry("~=1.2") == "^1.2"
+        assert pep440_to_poetry("~=1.2.3") == "~1.2.3"
+        # Zakresów bez odpowiednika w składni Poetry nie zmieniamy
+        assert pep440_to_poetry("~=0.2") == "~=0.2"
+        assert pep440_to_poetry("~=1.2.3.4") == "~=1.2.3.4"
+        assert pep440_to_poetry(">=1.0, <2.0") == ">=1.0,<2.0"
+        with pytest.raises(ValueError):
+            pep440_to_poetry("^1.0")
+
+    def test_memoized_and_interned(self) -> None:
+        """Test zapamiętywania i internowania wyników."""
+        first = poetry_to_pep440("^1" + ".2")
+        second = poetry_to_pep440("^1.2")
+
+        assert first is second
+        assert poetry_to_pep440.cache_info().hits == 1
+
+    def test_schema(self) -> None:
+        """Test tłumaczenia ograniczeń w schemacie poetry."""
+        warnings = []
+        poetry_data = {
+            "dependencies": {
+                "python": "^3.9",
+                "numpy": "^1.22",
+                "requests": {"version": "~2.27", "extras": ["socks"]},
+                "click": "*",
+                "legacy": "^1.0 || ^2.0",
+            },
+        }
+
+        deps = PoetrySchema.extract_dependencies(poetry_data, warnings=warnings)
+
+        assert deps == [
+            "numpy>=1.22,<2.0",
+            "requests[socks]>=2.27,<2.28",
+            "click",
+            "legacy",
+        ]
+        assert len(warnings) == 1
+        assert "legacy" in warnings[0]
+
+        poetry_data = PoetrySchema.convert_from_pip(
+            {"requirements": ["attrs~=21.4", "rich ~= 12.5.1", "numpy>=1.22,<2"]}
+        )
+        assert poetry_data["dependencies"] == {
+            "attrs": "^21.4",
+            "rich": "~12.5.1",
+            "numpy": ">=1.22,<2",
+        }
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
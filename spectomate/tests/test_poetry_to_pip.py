@@ -1,3 +1,99 @@
 """
-test_poetry_to_pip.py
+Testy dla konwertera z formatu poetry do formatu pip.
 """
+
+import tempfile
+from pathlib import Path
+
+import pytest
+import toml
+
+from spectomate.converters.poetry_to_pip import PoetryToPipConverter
+
+
+class TestPoetryToPipConverter:
+    """
+    Testy dla konwertera z formatu poetry do formatu pip.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        # Tworzymy tymczasowy katalog na pliki testowe
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+        # Tworzymy przykładowy plik pyproject.toml
+        self.pyproject_file = self.temp_path / "pyproject.toml"
+        pyproject = {
+            "tool": {
+                "poetry": {
+                    "name": "testproject",
+                    "version": "1.0.0",
+                    "dependencies": {
+                        "python": ">=3.8",
+                        "numpy": "==1.22.0",
+                        "requests": {"version": ">=2.27.0", "extras": ["socks"]},
+                    },
+                    "dev-dependencies": {"pytest": ">=7.0.0"},
+                }
+            }
+        }
+        with open(self.pyproject_file, "w") as f:
+            toml.dump(pyproject, f)
+
+        # Ścieżka do pliku wyjściowego
+        self.output_file = self.temp_path / "requirements.txt"
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_read_source(self) -> None:
+        """Test odczytu pliku pyproject.toml."""
+        converter = PoetryToPipConverter(source_file=self.pyproject_file)
+        source_data = converter.read_source()
+
+        assert source_data["format"] == "poetry"
+        assert source_data["name"] == "testproject"
+        assert "numpy" in source_data["dependencies"]
+
+    def test_convert(self) -> None:
+        """Test konwersji danych z formatu poetry do formatu pip."""
+        converter = PoetryToPipConverter(source_file=self.pyproject_file)
+
+        source_data = converter.read_source()
+        target_data = converter.convert(source_data)
+
+        assert target_data["format"] == "pip"
+        deps = target_data["requirements"]
+        assert "numpy==1.22.0" in deps
+        assert "requests[socks]>=2.27.0" in deps
+        assert not any(dep.startswith("python") for dep in deps)
+        assert not any(dep.startswith("pytest") for dep in deps)
+
+    def test_convert_include_dev(self) -> None:
+        """Test konwersji z zależnościami deweloperskimi."""
+        converter = PoetryToPipConverter(
+            source_file=self.pyproject_file, options={"include_dev": True}
+        )
+
+        target_data = converter.convert(converter.read_source())
+
+        assert "pytest>=7.0.0" in target_data["requirements"]
+
+    def test_execute(self) -> None:
+        """Test pełnego procesu konwersji."""
+        converter = PoetryToPipConverter(
+            source_file=self.pyproject_file, target_file=self.output_file
+        )
+
+        result_path = converter.execute()
+
+        assert result_path == self.output_file
+        content = self.output_file.read_text()
+        assert "numpy==1.22.0" in content
+        assert "requests[socks]>=2.27.0" in content
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,273 @@
+"""
+Testy dla rejestru konwerterów i tras wieloetapowych.
+"""
+
+import tempfile
+from pathlib import Path
+from typing import Type
+
+import pytest
+import toml
+import yaml
+
+from spectomate.converters.conda_to_pip import CondaToPipConverter
+from spectomate.converters.pip_to_conda import PipToCondaConverter
+from spectomate.converters.pip_to_poetry import PipToPoetryConverter
+from spectomate.converters.poetry_to_pip import PoetryToPipConverter
+from spectomate.core import conda_lookup
+from spectomate.core.base_converter import BaseConverter
+from spectomate.core.ir import load_requirements
+from spectomate.core.pipeline import ConverterPipeline
+from spectomate.core.registry import ConverterRegistry
+from spectomate.schemas.poetry_schema import PoetrySchema
+
+
+class TestConverterRegistry:
+    """
+    Testy dla wyznaczania tras w ConverterRegistry.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_direct_converter(self) -> None:
+        """Test, że bezpośredni konwerter ma pierwszeństwo przed trasą."""
+        assert ConverterRegistry.get_converter("pip", "conda") is PipToCondaConverter
+        assert ConverterRegistry.get_converter("conda", "pip") is CondaToPipConverter
+
+    def test_find_route(self) -> None:
+        """Test wyznaczania trasy wieloetapowej."""
+        route = ConverterRegistry.find_route("poetry", "conda")
+
+        assert route == [PoetryToPipConverter, PipToCondaConverter]
+        assert ConverterRegistry.find_route("pip", "pip") is None
+        assert ConverterRegistry.find_route("pip", "unknown") is None
+
+    def test_find_route_tie(self) -> None:
+        """Test trasy, gdy dwie drogi mają ten sam koszt i liczbę etapów."""
+
+        def make_converter(source: str, target: str) -> Type[BaseConverter]:
+            return type(
+                f"{source}To{target}",
+                (BaseConverter,),
+                {
+                    "get_source_format": staticmethod(lambda: source),
+                    "get_target_format": staticmethod(lambda: target),
+                    "read_source": lambda self: {},
+                    "convert": lambda self, source_data=None: {},
+                    "write_target": lambda self, target_data=None: Path(),
+                },
+            )
+
+        edges = [("ta", "tb"), ("ta", "tc"), ("tb", "td"), ("tc", "td")]
+        converters = [make_converter(source, target) for source, target in edges]
+        try:
+            for converter_class in converters:
+                ConverterRegistry.register(converter_class)
+
+            # Przy remisie wygrywa trasa znaleziona wcześniej
+            route = ConverterRegistry.find_route("ta", "td")
+            assert route == [converters[0], converters[2]]
+        finally:
+            for edge in edges:
+                ConverterRegistry._converters.pop(edge, None)
+            ConverterRegistry._pipelines.clear()
+
+    def test_pipeline_is_cached(self) -> None:
+        """Test, że skompilowana trasa jest przechowywana w pamięci podręcznej."""
+        pipeline = ConverterRegistry.get_converter("conda", "poetry")
+
+        assert pipeline is not None
+        assert issubclass(pipeline, ConverterPipeline)
+        assert pipeline.stages == (CondaToPipConverter, PipToPoetryConverter)
+        assert pipeline.get_source_format() == "conda"
+        assert pipeline.get_target_format() == "poetry"
+        assert ConverterRegistry.get_converter("conda", "poetry") is pipeline
+        assert ConverterRegistry.has_converter("conda", "poetry")
+
+    def test_pipeline_without_stages(self) -> None:
+        """Test formatów potoku bez etapów."""
+        with pytest.raises(ValueError):
+            ConverterPipeline.get_source_format()
+        with pytest.raises(ValueError):
+            ConverterPipeline.get_target_format()
+
+    def test_convert_content_default(self) -> None:
+        """Test konwersji w pamięci dla konwertera obsługującego tylko pliki."""
+
+        class UpperConverter(BaseConverter):
+            @staticmethod
+            def get_source_format() -> str:
+                return "pip"
+
+            @staticmethod
+            def get_target_format() -> str:
+                return "upper"
+
+            def read_source(self) -> dict:
+                assert self.source_file is not None
+                return {"text": self.source_file.read_text(encoding="utf-8")}
+
+            def convert(self, source_data=None) -> dict:
+                return {"text": (source_data or {})["text"].upper()}
+
+            def write_target(self, target_data=None) -> Path:
+                assert self.target_file is not None
+                self.target_file.write_text(target_data["text"], encoding="utf-8")
+                self.write_status = "written"
+                return self.target_file
+
+        target_file = self.temp_path / "out.txt"
+        converter = UpperConverter(target_file=target_file)
+
+        assert converter.convert_content("numpy>=1.20\n") == "NUMPY>=1.20\n"
+        assert converter.source_file is None
+        assert converter.target_file == target_file
+        assert converter.write_status is None
+        assert not target_file.exists()
+
+    def test_pipeline_execute(self) -> None:
+        """Test pełnej konwersji conda -> pip -> poetry."""
+        environment_file = self.temp_path / "environment.yml"
+        with open(environment_file, "w") as f:
+            yaml.dump(
+                {
+                    "name": "testenv",
+                    "dependencies": ["numpy>=1.22.0", {"pip": ["requests>=2.27.0"]}],
+                },
+                f,
+            )
+        output_file = self.temp_path / "pyproject.toml"
+
+        pipeline = ConverterRegistry.get_converter("conda", "poetry")
+        converter = pipeline(
+            source_file=environment_file,
+            target_file=output_file,
+            options={"project_name": "testproject"},
+        )
+        result_path = converter.execute()
+
+        assert result_path == output_file
+        poetry_data = toml.load(output_file)["tool"]["poetry"]
+        assert poetry_data["name"] == "testproject"
+        assert poetry_data["dependencies"]["numpy"] == ">=1.22.0"
+        assert poetry_data["dependencies"]["requests"] == ">=2.27.0"
+
+    def test_pipeline_poetry_to_conda(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test trasy poetry -> pip -> conda z domyślną ścieżką docelową."""
+        monkeypatch.setattr(
+            "spectomate.core.conda_lookup.search_package",
+            lambda name, timeout=None: name == "numpy",
+        )
+        conda_lookup.clear_cache()
+        pyproject_file = self.temp_path / "pyproject.toml"
+        with open(pyproject_file, "w") as f:
+            toml.dump(
+                {
+                    "tool": {
+                        "poetry": {
+                            "name": "testproject",
+                            "dependencies": {
+                                "numpy": ">=1.22.0",
+                                "internal-lib": "==0.1.0",
+                            },
+                        }
+                    }
+                },
+                f,
+            )
+
+        pipeline = ConverterRegistry.get_converter("poetry", "conda")
+        result_path = pipeline(source_file=pyproject_file).execute()
+
+        assert result_path == self.temp_path / "environment.yml"
+        with open(result_path) as f:
+            conda_env = yaml.safe_load(f)
+        assert "numpy>=1.22.0" in conda_env["dependencies"]
+        assert {"pip": ["internal-lib==0.1.0"]} in conda_env["dependencies"]
+
+    def test_convert_many(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test konwersji do kilku formatów z jednokrotnym parsowaniem źródła."""
+        monkeypatch.setattr(
+            "spectomate.core.conda_lookup.search_package",
+            lambda name, timeout=None: True,
+        )
+        conda_lookup.clear_cache()
+        calls = {"parse": 0, "extract": 0}
+        parse_file = PoetrySchema.parse_file
+        extract_dependencies = PoetrySchema.extract_dependencies
+
+        def counting_parse(*args, **kwargs):  # type: ignore[no-untyped-def]
+            calls["parse"] += 1
+            return parse_file(*args, **kwargs)
+
+        def counting_extract(*args, **kwargs):  # type: ignore[no-untyped-def]
+            calls["extract"] += 1
+            return extract_dependencies(*args, **kwargs)
+
+        monkeypatch.setattr(PoetrySchema, "parse_file", counting_parse)
+        monkeypatch.setattr(PoetrySchema, "extract_dependencies", counting_extract)
+
+        pyproject_file = self.temp_path / "pyproject.toml"
+        with open(pyproject_file, "w") as f:
+            toml.dump({"tool": {"poetry": {"dependencies": {"numpy": ">=1.22.0"}}}}, f)
+        requirements_file = self.temp_path / "requirements.txt"
+        environment_file = self.temp_path / "environment.yml"
+
+        converters = ConverterRegistry.convert_many(
+            "poetry",
+            pyproject_file,
+            [("pip", requirements_file), ("conda", environment_file)],
+        )
+
+        assert [c.target_file for c in converters] == [
+            requirements_file,
+            environment_file,
+        ]
+        assert [c.write_status for c in converters] == ["updated", "updated"]
+        assert calls == {"parse": 1, "extract": 1}
+        assert requirements_file.read_text() == "numpy>=1.22.0"
+        with open(environment_file) as f:
+            assert "numpy>=1.22.0" in yaml.safe_load(f)["dependencies"]
+
+    def test_convert_many_source_representations(self) -> None:
+        """Test, że każda trasa dostaje źródło w oczekiwanej reprezentacji."""
+        requirements_file = self.temp_path / "requirements.txt"
+        requirements_file.write_text(
+            "requests[socks]==2.31.0; python_version >= '3.8'\n"
+        )
+        pyproject_file = self.temp_path / "pyproject.toml"
+        ir_file = self.temp_path / "requirements.ir.json"
+
+        ConverterRegistry.convert_many(
+            "pip", requirements_file, [("poetry", pyproject_file), ("ir", ir_file)]
+        )
+
+        (requirement,) = load_requirements(ir_file)
+        assert requirement.specifier == "==2.31.0"
+        assert requirement.extras == ("socks",)
+        assert requirement.marker == 'python_version >= "3.8"'
+        assert "requests" in toml.load(pyproject_file)["tool"]["poetry"]["dependencies"]
+
+    def test_convert_many_duplicate_target(self) -> None:
+        """Test, że ten sam plik docelowy nie może być użyty dwukrotnie."""
+        requirements_file = self.temp_path / "requirements.txt"
+        requirements_file.write_text("numpy==1.22.0\n")
+        output_file = self.temp_path / "out.toml"
+
+        with pytest.raises(ValueError):
+            ConverterRegistry.convert_many(
+                "pip",
+                requirements_file,
+                [("poetry", output_file), ("poetry", output_file)],
+            )
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
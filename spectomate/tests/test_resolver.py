@@ -0,0 +1,233 @@
+"""
+Testy dla rozwiązywania zależności na podstawie lokalnej kopii indeksu.
+"""
+
+import json
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Any, Dict
+
+import pytest
+from click.testing import CliRunner
+
+from spectomate.core.ir import parse_requirement
+from spectomate.core.resolver import PackageIndex, ResolutionError, resolve
+from spectomate.lock_cli import lock_command
+
+
+class TestResolver:
+    """
+    Testy dla modułu spectomate.core.resolver.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def write_index(self, packages: Dict[str, Any]) -> PackageIndex:
+        """Zapisuje indeks JSON i otwiera go."""
+        index_file = self.temp_path / "index.json"
+        index_file.write_text(json.dumps({"packages": packages}))
+        return PackageIndex.open(index_file)
+
+    def resolve(self, index: PackageIndex, *lines: str, **kwargs: Any):
+        """Rozwiązuje wymagania podane jako wiersze requirements.txt."""
+        return resolve([parse_requirement(line) for line in lines], index, **kwargs)
+
+    def test_newest_versions(self) -> None:
+        """Test wyboru najnowszych wersji z pominięciem wycofanych i pre-release."""
+        index = self.write_index(
+            {
+                "App": {
+                    "1.0": {"requires_dist": ["lib>=1.0"]},
+                    "1.10": {"requires_dist": ["lib>=1.2", "Typing_Extensions"]},
+                    "1.9": {},
+                },
+                "lib": {
+                    "1.2": {},
+                    "1.3": {"yanked": True},
+                    "2.0rc1": {},
+                },
+                "typing-extensions": {"4.0": {}},
+            }
+        )
+
+        assert self.resolve(index, "app") == {
+            "app": "1.10",
+            "lib": "1.2",
+            "typing-extensions": "4.0",
+        }
+        assert self.resolve(index, "app", prereleases=True)["lib"] == "2.0rc1"
+        assert self.resolve(index, "lib==1.3") == {"lib": "1.3"}
+
+    def test_backtracking(self) -> None:
+        """Test wycofania się z wersji prowadzącej do konfliktu."""
+        index = self.write_index(
+            {
+                "a": {
+                    "2.0": {"requires_dist": ["b>=2", "c"]},
+                    "1.0": {"requires_dist": ["b>=1", "c"]},
+                },
+                "b": {"1.0": {}, "2.0": {}},
+                "c": {
+                    "2.0": {"requires_dist": ["b<2"]},
+                    "1.0": {"requires_dist": ["b<3"]},
+                },
+            }
+        )
+
+        assert self.resolve(index, "a") == {"a": "2.0", "b": "2.0", "c": "1.0"}
+        assert self.resolve(index, "a", "c>=2") == {
+            "a": "1.0",
+            "b": "1.0",
+            "c": "2.0",
+        }
+
+    def test_backjumping_keeps_solutions(self) -> None:
+        """Test, że powrót do wcześniejszej decyzji nie pomija rozwiązań."""
+        index = self.write_index(
+            {
+                "p0": {
+                    "1": {"requires_dist": ["p1<1"]},
+                    "2": {"requires_dist": ["p3<2"]},
+                    "3": {"requires_dist": ["p2>=1"]},
+                },
+                "p1": {
+                    "1": {"requires_dist": ["p2>=1"]},
+                    "2": {"requires_dist": ["p2>=1", "p3==3"]},
+                    "3": {},
+                },
+                "p2": {
+                    "1": {},
+                    "2": {"requires_dist": ["p1<1"]},
+                    "3": {"requires_dist": ["p0>=1", "p3>=1"]},
+                },
+                "p3": {"1": {"requires_dist": ["p1<1"]}},
+            }
+        )
+
+        assert self.resolve(index, "p1", "p0") == {"p0": "3", "p1": "3", "p2": "1"}
+
+    def test_markers_and_extras(self) -> None:
+        """Test markerów środowiskowych, dodatków i wymagań wersji Pythona."""
+        index = self.write_index(
+            {
+                "app": {
+                    "2.0": {"requires_python": ">=3.12"},
+                    "1.0": {
+                        "requires_dist": [
+                            "backport; python_version < '3.9'",
+                            "socks-lib; extra == 'socks'",
+                        ]
+                    },
+                },
+                "backport": {"1.0": {}},
+                "socks-lib": {"1.0": {}},
+            }
+        )
+
+        assert self.resolve(index, "app", python_version="3.8.10") == {
+            "app": "1.0",
+            "backport": "1.0",
+        }
+        assert self.resolve(index, "app[socks]", python_version="3.10") == {
+            "app": "1.0",
+            "socks-lib": "1.0",
+        }
+        assert self.resolve(index, "app", python_version="3.12") == {"app": "2.0"}
+
+    def test_conflicts(self) -> None:
+        """Test błędów dla wymagań, których nie da się spełnić."""
+        index = self.write_index(
+            {
+                "a": {"1.0": {"requires_dist": ["b<1"]}},
+                "b": {"1.0": {}},
+            }
+        )
+
+        with pytest.raises(ResolutionError, match="b: brak wersji"):
+            self.resolve(index, "a")
+        with pytest.raises(ResolutionError, match="pakietu nie ma w indeksie"):
+            self.resolve(index, "missing")
+
+    def test_simple_directory(self) -> None:
+        """Test indeksu w układzie simple API z metadanymi PEP 658 i plikami wheel."""
+        simple_dir = self.temp_path / "simple"
+        files_dir = self.temp_path / "files"
+        (simple_dir / "app").mkdir(parents=True)
+        (simple_dir / "lib").mkdir()
+        files_dir.mkdir()
+
+        (simple_dir / "app" / "index.html").write_text(
+            "<html><body>\n"
+            '<a href="../../files/app-1.0.tar.gz#sha256=00">app-1.0.tar.gz</a>\n'
+            '<a href="../../files/app-1.1-py3-none-any.whl" '
+            'data-core-metadata="sha256=00" data-requires-python="&gt;=3.8">'
+            "app-1.1-py3-none-any.whl</a>\n"
+            "</body></html>\n"
+        )
+        (files_dir / "app-1.1-py3-none-any.whl.metadata").write_text(
+            "Metadata-Version: 2.1\nName: app\nVersion: 1.1\nRequires-Dist: lib>=2\n"
+        )
+        (simple_dir / "lib" / "index.html").write_text(
+            '<a href="../../files/lib-2.0-py3-none-any.whl">lib-2.0</a>\n'
+        )
+        with zipfile.ZipFile(files_dir / "lib-2.0-py3-none-any.whl", "w") as wheel:
+            wheel.writestr(
+                "lib-2.0.dist-info/METADATA",
+                "Metadata-Version: 2.1\nName: lib\nVersion: 2.0\n"
+                "Requires-Dist: app; extra == 'cli'\n",
+            )
+
+        index = PackageIndex.open(simple_dir)
+        warnings = []
+
+        assert index.versions("App") == ["1.1", "1.0"]
+        assert self.resolve(index, "app", python_version="3.10") == {
+            "app": "1.1",
+            "lib": "2.0",
+        }
+        assert self.resolve(index, "app", python_version="3.7", warnings=warnings) == {
+            "app": "1.0"
+        }
+        assert "app==1.0" in warnings[0]
+
+    def test_lock_command(self) -> None:
+        """Test komendy spectomate lock."""
+        self.write_index(
+            {
+                "numpy": {"1.21.0": {}, "1.22.4": {}, "2.0.0": {}},
+                "pandas": {"1.4.0": {"requires_dist": ["numpy>=1.21"]}},
+            }
+        )
+        requirements_file = self.temp_path / "requirements.txt"
+        requirements_file.write_text("pandas\nnumpy<2\n")
+        output_file = self.temp_path / "requirements.lock"
+
+        result = CliRunner().invoke(
+            lock_command,
+            [
+                "-f",
+                str(requirements_file),
+                "--index",
+                str(self.temp_path / "index.json"),
+                "-t",
+                str(output_file),
+            ],
+        )
+
+        assert result.exit_code == 0, result.output
+        assert output_file.read_text().splitlines() == [
+            "numpy==1.22.4",
+            "pandas==1.4.0",
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,290 @@
+"""
+Testy dla schematów formatów pip, conda i poetry.
+"""
+
+import io
+import mmap
+import tempfile
+from pathlib import Path
+
+import pytest
+import toml
+import yaml
+
+from spectomate.converters.pip_to_conda import PipToCondaConverter
+from spectomate.core.utils import MMAP_MIN_SIZE, AtomicFileWriter, map_file
+from spectomate.schemas.conda_schema import CondaSchema
+from spectomate.schemas.pip_schema import PipSchema
+from spectomate.schemas.poetry_schema import PoetrySchema
+
+
+class TestSchemaEmitters:
+    """
+    Testy dla strumieniowego zapisu plików przez schematy.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_emit_requirements_txt(self) -> None:
+        """Test strumieniowego zapisu requirements.txt."""
+        data = {
+            "format": "pip",
+            "requirements": [
+                {"type": "comment", "content": "# Zależności"},
+                {"type": "option", "content": "--index-url https://example.com"},
+                {
+                    "type": "package",
+                    "name": "numpy",
+                    "version_spec": {"operator": "==", "version": "1.22.0"},
+                },
+                "requests>=2.27.0",
+            ],
+        }
+        stream = io.StringIO()
+
+        PipSchema.emit_requirements_txt(data, stream)
+
+        assert stream.getvalue() == (
+            "# Zależności\n--index-url https://example.com\n"
+            "numpy==1.22.0\nrequests>=2.27.0"
+        )
+        assert PipSchema.generate_requirements_txt(data) == stream.getvalue()
+
+    def test_emit_environment_yml_matches_yaml(self) -> None:
+        """Test, że strumieniowy zapis daje ten sam dokument co yaml.dump."""
+        data = {
+            "name": "testenv",
+            "channels": ["conda-forge", "defaults"],
+            "dependencies": [
+                "python=3.9",
+                "conda-forge::numpy>=1.22",
+                "yes",
+                "1.0",
+                "weird: value",
+                "pip",
+                {"pip": ["requests>=2.27.0", "-e .", "null"]},
+            ],
+            "variables": {"MY_VAR": "1"},
+        }
+        stream = io.StringIO()
+
+        CondaSchema.emit_environment_yml(dict(data, format="conda"), stream)
+
+        assert stream.getvalue() == yaml.dump(
+            data, default_flow_style=False, sort_keys=False
+        )
+        assert yaml.safe_load(stream.getvalue()) == data
+
+    def test_emit_pyproject_toml(self) -> None:
+        """Test strumieniowego zapisu pyproject.toml."""
+        data = {
+            "name": "testproject",
+            "version": "1.0.0",
+            "authors": ["Jan Kowalski <jan@example.com>"],
+            "dependencies": {
+                "python": "^3.9",
+                "requests": {"version": ">=2.27.0", "extras": ["socks"]},
+                "my.package": '"quoted"',
+            },
+            "group": {"dev": {"dependencies": {"pytest": "*"}}},
+            "format": "poetry",
+        }
+        stream = io.StringIO()
+
+        PoetrySchema.emit_pyproject_toml(data, stream)
+        content = stream.getvalue()
+
+        assert 'requests = {version = ">=2.27.0", extras = ["socks"]}' in content
+        pyproject = toml.loads(content)
+        expected = dict(data)
+        del expected["format"]
+        assert pyproject["tool"]["poetry"] == expected
+        assert pyproject["build-system"]["build-backend"] == "poetry.core.masonry.api"
+
+    def test_update_large_environment(self) -> None:
+        """Test zapisu dużego środowiska przez zapis atomowy."""
+        data = {
+            "name": "big",
+            "dependencies": [f"package{i}>=1.{i}" for i in range(5000)],
+        }
+        output_file = self.temp_path / "environment.yml"
+
+        assert CondaSchema.update_environment_yml(data, output_file) == "updated"
+        assert CondaSchema.update_environment_yml(data, output_file) == "unchanged"
+        with open(output_file) as f:
+            assert yaml.safe_load(f) == data
+
+    def test_atomic_writer_error(self) -> None:
+        """Test, że błąd podczas zapisu nie zmienia pliku docelowego."""
+        output_file = self.temp_path / "requirements.txt"
+        output_file.write_text("numpy==1.22.0")
+
+        with pytest.raises(RuntimeError):
+            with AtomicFileWriter(output_file) as stream:
+                stream.write("broken")
+                raise RuntimeError("błąd")
+
+        assert output_file.read_text() == "numpy==1.22.0"
+        assert [p.name for p in self.temp_path.iterdir()] == ["requirements.txt"]
+
+
+class TestBytesParsing:
+    """
+    Testy dla parsowania plików requirements.txt z bufora bajtów.
+    """
+
+    CONTENT = (
+        "# Zależności\r\n"
+        "numpy>=1.21\n"
+        "  requests == 2.28.0  # http\n"
+        "--index-url https://example.com\n"
+        "\n"
+        "pandas\rscipy<2\n"
+        "requests[socks]>=2; python_version >= '3.8'\n"
+        "zażółć==1.0\x0c\n"
+        "-e .\n"
+        "torch~=2.0"
+    )
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_parse_bytes_matches_parse_string(self) -> None:
+        """Test, że parse_bytes daje ten sam wynik co parse_string."""
+        buffer = self.CONTENT.encode("utf-8")
+        text = self.CONTENT.replace("\r\n", "\n").replace("\r", "\n")
+
+        assert PipSchema.parse_bytes(buffer, "utf-8") == PipSchema.parse_string(text)
+
+    def test_converter_buffer_matches_text_mode(self) -> None:
+        """Test, że odczyt z bufora odpowiada odczytowi w trybie tekstowym."""
+        buffer = self.CONTENT.encode("utf-8")
+        with io.TextIOWrapper(io.BytesIO(buffer), encoding="utf-8") as stream:
+            expected = PipToCondaConverter._parse_lines(stream)
+
+        assert PipToCondaConverter._parse_buffer(buffer, "utf-8") == expected
+        assert expected["dependencies"][:3] == [
+            "numpy>=1.21",
+            "requests == 2.28.0",
+            "pandas",
+        ]
+
+    def test_large_file_is_mapped(self) -> None:
+        """Test parsowania dużego pliku przez mmap."""
+        lines = [f"package{i}>=1.{i}" for i in range(MMAP_MIN_SIZE // 16)]
+        requirements_file = self.temp_path / "requirements.txt"
+        requirements_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        with map_file(requirements_file) as buffer:
+            assert isinstance(buffer, mmap.mmap)
+
+        data = PipSchema.parse_file(requirements_file)
+        assert len(data["requirements"]) == len(lines)
+        assert (
+            data["requirements"][-1]["version_spec"]["version"]
+            == lines[-1].split(">=")[1]
+        )
+
+        converter = PipToCondaConverter(source_file=requirements_file)
+        assert converter.read_source()["dependencies"] == lines
+
+
+class TestCondaMerge:
+    """
+    Testy dla łączenia środowisk conda.
+    """
+
+    def test_merge_environments(self) -> None:
+        """Test łączenia wielu środowisk z przecięciem ograniczeń wersji."""
+        warnings = []
+        merged = CondaSchema.merge_environments(
+            {
+                "name": "base",
+                "channels": ["conda-forge", "defaults"],
+                "dependencies": [
+                    "python=3.10",
+                    "numpy>=1.21",
+                    "pandas=1.5",
+                    {"pip": ["requests>=2.0", "torch; sys_platform == 'linux'"]},
+                ],
+            },
+            {
+                "name": "team-a",
+                "channels": ["pytorch", "conda-forge"],
+                "dependencies": [
+                    "python=3.10",
+                    "numpy<1.23",
+                    "pandas=1.4",
+                    "scipy",
+                    {"pip": ["Requests<3", "torch; sys_platform == 'darwin'"]},
+                ],
+            },
+            {"name": "team-b", "dependencies": ["NumPy=1.22", "scipy 1.10.* py310_0"]},
+            warnings=warnings,
+        )
+
+        assert merged["name"] == "base"
+        assert merged["channels"] == ["conda-forge", "defaults", "pytorch"]
+        assert merged["dependencies"] == [
+            "python=3.10",
+            "numpy<1.23,>=1.21,1.22.*",
+            "pandas=1.5",
+            "scipy 1.10.* py310_0",
+            {
+                "pip": [
+                    "requests<3,>=2.0",
+                    'torch; (sys_platform == "linux") or (sys_platform == "darwin")',
+                ]
+            },
+        ]
+        assert len(warnings) == 1
+        assert "pandas=1.5, pandas=1.4" in warnings[0]
+
+    def test_merge_redundant_and_extra_entries(self) -> None:
+        """Test pomijania zbędnych warunków i zachowania innych wpisów."""
+        merged = CondaSchema.merge_environments(
+            {"dependencies": ["scipy=1.7=py39h_0", {"mamba": ["extra-tool"]}]},
+            {"dependencies": ["scipy=1.7", {"pip": ["requests"]}]},
+        )
+
+        assert "channels" not in merged
+        assert merged["dependencies"] == [
+            "scipy=1.7=py39h_0",
+            {"pip": ["requests"]},
+            {"mamba": ["extra-tool"]},
+        ]
+
+    def test_merge_many_environments(self) -> None:
+        """Test łączenia setek środowisk ze wspólnymi pakietami."""
+        environments = [
+            {
+                "channels": ["defaults"],
+                "dependencies": [f"pkg{i % 50}>=1.{i % 7}", f"team{i}"],
+            }
+            for i in range(300)
+        ]
+
+        merged = CondaSchema.merge_environments(*environments)
+
+        assert len(merged["dependencies"]) == 350
+        # pkg0 występuje w środowiskach 0, 50, ..., 250 z ograniczeniami >=1.0 ... >=1.5
+        assert merged["dependencies"][:2] == ["pkg0>=1.5", "team0"]
+        with pytest.raises(ValueError):
+            CondaSchema.merge_environments()
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
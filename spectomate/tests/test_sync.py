@@ -0,0 +1,208 @@
+"""
+Testy dla synchronizacji plików wyprowadzanych z pliku głównego.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+import toml
+from click.testing import CliRunner
+
+from spectomate.core.sync import load_sync_config, run_sync
+from spectomate.schemas.pip_schema import PipSchema
+from spectomate.sync_cli import sync_command
+
+
+class TestSync:
+    """
+    Testy dla komendy sync i modułu spectomate.core.sync.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+        self.environment_file = self.temp_path / "environment.yml"
+        self.environment_file.write_text(
+            "name: testenv\ndependencies:\n  - numpy>=1.22.0\n"
+        )
+        self.requirements_file = self.temp_path / "requirements.txt"
+        self.pyproject_file = self.temp_path / "pyproject.toml"
+        self.config_file = self.temp_path / "spectomate.toml"
+        self.write_config({"project_name": "testproject"})
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def write_config(self, poetry_options: dict) -> None:
+        """Zapisuje konfigurację synchronizacji."""
+        with open(self.config_file, "w") as f:
+            toml.dump(
+                {
+                    "tool": {
+                        "spectomate": {
+                            "sync": {
+                                "source": "environment.yml",
+                                "targets": [
+                                    {"file": "requirements.txt", "format": "pip"},
+                                    {
+                                        "file": "pyproject.toml",
+                                        "format": "poetry",
+                                        "options": poetry_options,
+                                    },
+                                ],
+                            }
+                        }
+                    }
+                },
+                f,
+            )
+
+    def sync(self, **kwargs):  # type: ignore[no-untyped-def]
+        """Uruchamia synchronizację z bieżącą konfiguracją."""
+        return run_sync(load_sync_config(self.config_file), **kwargs)
+
+    def test_load_config(self) -> None:
+        """Test odczytu konfiguracji synchronizacji."""
+        config = load_sync_config(self.config_file)
+
+        assert config.source == self.environment_file
+        assert config.source_format is None
+        assert config.state_file == self.temp_path / ".spectomate-sync.json"
+        assert [t.name for t in config.targets] == [
+            "requirements.txt",
+            "pyproject.toml",
+        ]
+        assert config.targets[1].options == {"project_name": "testproject"}
+
+    def test_missing_section(self) -> None:
+        """Test błędu dla pliku bez sekcji [tool.spectomate.sync]."""
+        self.config_file.write_text('[tool.poetry]\nname = "x"\n')
+
+        with pytest.raises(ValueError):
+            load_sync_config(self.config_file)
+
+    def test_first_run_and_fresh(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test, że druga synchronizacja niczego nie konwertuje."""
+        result = self.sync()
+
+        assert [t.name for t in result.updated] == [
+            "requirements.txt",
+            "pyproject.toml",
+        ]
+        assert self.requirements_file.read_text() == "numpy>=1.22.0"
+        assert toml.load(self.pyproject_file)["tool"]["poetry"]["name"] == (
+            "testproject"
+        )
+        state = json.loads((self.temp_path / ".spectomate-sync.json").read_text())
+        assert set(state["targets"]) == {"requirements.txt", "pyproject.toml"}
+
+        def fail(*args, **kwargs):  # type: ignore[no-untyped-def]
+            raise AssertionError("Plik nie powinien być ponownie parsowany")
+
+        monkeypatch.setattr(PipSchema, "extract_requirements", fail)
+        result = self.sync()
+
+        assert result.stale == []
+        assert len(result.fresh) == 2
+
+    def test_source_change(self) -> None:
+        """Test, że zmiana pliku głównego unieważnia wszystkie cele."""
+        self.sync()
+        self.environment_file.write_text(
+            "name: testenv\ndependencies:\n  - numpy>=1.23.0\n"
+        )
+
+        result = self.sync()
+
+        assert len(result.updated) == 2
+        assert self.requirements_file.read_text() == "numpy>=1.23.0"
+
+    def test_same_size_edit_in_same_tick(self) -> None:
+        """Test, że zmiana tuż po synchronizacji nie jest ukryta przez mtime."""
+        self.sync()
+        stat = self.requirements_file.stat()
+        self.requirements_file.write_text("numpy>=1.22.9")
+        os.utime(self.requirements_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        result = self.sync(check_only=True)
+
+        assert [t.name for t in result.stale] == ["requirements.txt"]
+
+    def test_old_file_hash_is_cached(self) -> None:
+        """Test, że skrót pliku zmienionego dawno temu jest zapamiętywany."""
+        self.sync()
+        for path in (self.environment_file, self.requirements_file):
+            os.utime(path, ns=(0, 0))
+        self.sync()
+        stat = self.requirements_file.stat()
+        self.requirements_file.write_text("numpy>=1.22.9")
+        os.utime(self.requirements_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # Zapamiętany skrót jest używany bez ponownego odczytu pliku
+        assert self.sync(check_only=True).stale == []
+
+    def test_target_edited_or_removed(self) -> None:
+        """Test, że ręczna zmiana lub usunięcie celu powoduje jego regenerację."""
+        self.sync()
+        self.requirements_file.write_text("numpy==1.0.0")
+        self.pyproject_file.unlink()
+
+        result = self.sync()
+
+        assert [t.name for t in result.updated] == [
+            "requirements.txt",
+            "pyproject.toml",
+        ]
+        assert self.requirements_file.read_text() == "numpy>=1.22.0"
+        assert self.pyproject_file.exists()
+
+    def test_options_change(self) -> None:
+        """Test, że zmiana opcji konwersji unieważnia tylko dany cel."""
+        self.sync()
+        self.write_config({"project_name": "renamed"})
+
+        result = self.sync()
+
+        assert [t.name for t in result.fresh] == ["requirements.txt"]
+        assert [t.name for t in result.updated] == ["pyproject.toml"]
+        assert toml.load(self.pyproject_file)["tool"]["poetry"]["name"] == "renamed"
+
+    def test_force(self) -> None:
+        """Test wymuszonej regeneracji niezmienionych plików."""
+        self.sync()
+
+        result = self.sync(force=True)
+
+        assert result.updated == []
+        assert len(result.unchanged) == 2
+
+    def test_cli_check(self) -> None:
+        """Test trybu --check, który niczego nie zapisuje."""
+        runner = CliRunner()
+
+        result = runner.invoke(
+            sync_command, ["--config", str(self.config_file), "--check"]
+        )
+        assert result.exit_code == 1
+        assert "requirements.txt" in result.output
+        assert not self.requirements_file.exists()
+        assert not (self.temp_path / ".spectomate-sync.json").exists()
+
+        result = runner.invoke(sync_command, ["--config", str(self.config_file)])
+        assert result.exit_code == 0
+        assert "Zaktualizowano requirements.txt" in result.output
+
+        result = runner.invoke(
+            sync_command, ["--config", str(self.config_file), "--check"]
+        )
+        assert result.exit_code == 0
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,105 @@
+"""
+Testy dla funkcji pomocniczych Spectomate.
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from spectomate.converters.conda_to_pip import CondaToPipConverter
+from spectomate.core.utils import (
+    WRITE_UNCHANGED,
+    WRITE_UPDATED,
+    file_content_matches,
+    write_text_if_changed,
+)
+from spectomate.schemas.pip_schema import PipSchema
+
+
+class TestWriteTextIfChanged:
+    """
+    Testy dla zapisu plików z pominięciem niezmienionej zawartości.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.output_file = self.temp_path / "out" / "requirements.txt"
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_write_new_file(self) -> None:
+        """Test zapisu nowego pliku wraz z katalogami."""
+        status = write_text_if_changed(self.output_file, "numpy==1.22.0\n")
+
+        assert status == WRITE_UPDATED
+        assert self.output_file.read_text() == "numpy==1.22.0\n"
+        assert os.listdir(self.output_file.parent) == ["requirements.txt"]
+
+    def test_skip_unchanged(self) -> None:
+        """Test, że niezmieniony plik nie jest nadpisywany."""
+        write_text_if_changed(self.output_file, "numpy==1.22.0\n")
+        os.utime(self.output_file, ns=(1_000_000_000, 1_000_000_000))
+
+        status = write_text_if_changed(self.output_file, "numpy==1.22.0\n")
+
+        assert status == WRITE_UNCHANGED
+        assert self.output_file.stat().st_mtime_ns == 1_000_000_000
+
+    def test_update_changed(self) -> None:
+        """Test zapisu zmienionej zawartości z zachowaniem uprawnień."""
+        write_text_if_changed(self.output_file, "numpy==1.22.0\n")
+        os.chmod(self.output_file, 0o640)
+
+        # Ta sama długość, inna zawartość - decyduje skrót
+        status = write_text_if_changed(self.output_file, "numpy==1.23.0\n")
+
+        assert status == WRITE_UPDATED
+        assert self.output_file.read_text() == "numpy==1.23.0\n"
+        assert self.output_file.stat().st_mode & 0o777 == 0o640
+        assert os.listdir(self.output_file.parent) == ["requirements.txt"]
+
+    def test_file_content_matches(self) -> None:
+        """Test porównywania zawartości pliku."""
+        assert not file_content_matches(self.output_file, b"")
+
+        write_text_if_changed(self.output_file, "abc")
+
+        assert file_content_matches(self.output_file, b"abc")
+        assert not file_content_matches(self.output_file, b"abd")
+        assert not file_content_matches(self.output_file, b"abcd")
+
+    def test_schema_update_status(self) -> None:
+        """Test statusu zwracanego przez zapis schematu."""
+        data = {"format": "pip", "requirements": ["numpy==1.22.0"]}
+
+        assert PipSchema.update_requirements_txt(data, self.output_file) == "updated"
+        assert PipSchema.update_requirements_txt(data, self.output_file) == "unchanged"
+        assert (
+            PipSchema.write_requirements_txt(data, self.output_file) == self.output_file
+        )
+
+    def test_converter_write_status(self) -> None:
+        """Test statusu zapisu raportowanego przez konwerter."""
+        environment_file = self.temp_path / "environment.yml"
+        environment_file.write_text("name: testenv\ndependencies:\n  - numpy\n")
+
+        converter = CondaToPipConverter(
+            source_file=environment_file, target_file=self.output_file
+        )
+        assert converter.write_status is None
+
+        converter.execute()
+        assert converter.write_status == WRITE_UPDATED
+
+        converter.execute()
+        assert converter.write_status == WRITE_UNCHANGED
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
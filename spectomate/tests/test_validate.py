@@ -0,0 +1,160 @@
+"""
+Testy dla sprawdzania plików z zależnościami bez zapisywania wyników.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from spectomate.cli import convert
+from spectomate.core.validate import ERROR, WARNING, validate_file, validate_files
+from spectomate.validate_cli import validate_command
+
+
+class TestValidate:
+    """
+    Testy dla modułu spectomate.core.validate.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+
+        self.requirements_file = self.temp_path / "requirements.txt"
+        self.requirements_file.write_text("numpy>=1.21\nrequests\n")
+        self.broken_requirements_file = self.temp_path / "requirements-dev.txt"
+        self.broken_requirements_file.write_text(
+            "numpy>=1.21\n" "requests>=>2\n" "\n" "NumPy<2\n"
+        )
+        self.environment_file = self.temp_path / "environment.yml"
+        self.environment_file.write_text(
+            "name: test\n"
+            "dependencies:\n"
+            "  - python=3.10\n"
+            "  - numpy>=>1\n"
+            "  - pip:\n"
+            "    - flask==2.0\n"
+        )
+        self.pyproject_file = self.temp_path / "pyproject.toml"
+        self.pyproject_file.write_text(
+            "[tool.poetry]\n"
+            'name = "demo"\n'
+            'version = "0.1.0"\n'
+            "\n"
+            "[tool.poetry.dependencies]\n"
+            'python = "^3.9"\n'
+            'requests = "^2.28"\n'
+        )
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def test_valid_file(self) -> None:
+        """Test poprawnego pliku requirements.txt."""
+        result = validate_file(self.requirements_file)
+
+        assert result.ok
+        assert result.source_format == "pip"
+        assert result.issues == []
+
+    def test_pip_errors_with_line_numbers(self) -> None:
+        """Test błędów i ostrzeżeń z numerami linii w requirements.txt."""
+        result = validate_file(self.broken_requirements_file)
+
+        assert not result.ok
+        assert [(issue.line, issue.severity) for issue in result.issues] == [
+            (2, ERROR),
+            (4, WARNING),
+        ]
+        assert result.format_issues()[0].startswith(
+            f"{self.broken_requirements_file}:2: error:"
+        )
+
+    def test_conda_errors_with_line_numbers(self) -> None:
+        """Test błędnej specyfikacji pakietu w environment.yml."""
+        result = validate_file(self.environment_file)
+
+        assert result.source_format == "conda"
+        assert [issue.line for issue in result.errors] == [4]
+
+    def test_yaml_syntax_error(self) -> None:
+        """Test błędu składni YAML."""
+        self.environment_file.write_text("name: test\ndependencies:\n  - [numpy\n")
+
+        result = validate_file(self.environment_file, "conda")
+
+        assert not result.ok
+        assert result.errors[0].line is not None
+
+    def test_poetry_and_conversion(self) -> None:
+        """Test pliku Poetry i konwersji do innego formatu w pamięci."""
+        result = validate_file(self.pyproject_file, target_formats=["pip"])
+
+        assert result.ok, result.format_issues()
+        assert result.source_format == "poetry"
+        assert result.checked_formats == ["pip"]
+        assert not (self.temp_path / "requirements.txt.new").exists()
+
+        self.pyproject_file.write_text(
+            self.pyproject_file.read_text() + 'bad = "abc~~"\n'
+        )
+        result = validate_file(self.pyproject_file)
+        assert [issue.line for issue in result.errors] == [8]
+
+    def test_validate_files(self) -> None:
+        """Test równoległego sprawdzania wielu plików."""
+        results = validate_files(
+            [self.requirements_file, self.broken_requirements_file], max_workers=2
+        )
+
+        assert [result.ok for result in results] == [True, False]
+
+    def test_validate_command(self) -> None:
+        """Test komendy spectomate validate."""
+        runner = CliRunner()
+
+        result = runner.invoke(validate_command, [str(self.requirements_file)])
+        assert result.exit_code == 0, result.output
+        assert "OK" in result.output
+
+        result = runner.invoke(
+            validate_command,
+            [str(self.requirements_file), str(self.broken_requirements_file), "--json"],
+        )
+        assert result.exit_code == 1
+        data = json.loads(result.output)
+        assert [item["ok"] for item in data] == [True, False]
+
+    def test_convert_dry_run(self) -> None:
+        """Test opcji --dry-run komendy convert."""
+        output_file = self.temp_path / "requirements-out.txt"
+        runner = CliRunner()
+
+        result = runner.invoke(
+            convert,
+            [
+                "-f",
+                str(self.pyproject_file),
+                "-o",
+                "pip",
+                "-t",
+                str(output_file),
+                "--dry-run",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert not output_file.exists()
+
+        result = runner.invoke(
+            convert, ["-f", str(self.broken_requirements_file), "--dry-run"]
+        )
+        assert result.exit_code == 1
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
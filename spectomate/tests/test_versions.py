@@ -0,0 +1,144 @@
+"""
+Testy dla porównywania i wybierania wersji PEP 440.
+"""
+
+import itertools
+
+import pytest
+from packaging.version import Version
+
+from spectomate.converters.conda_to_pip import CondaToPipConverter
+from spectomate.core import versions
+from spectomate.core.versions import (
+    filter_versions,
+    intersect_specifiers,
+    is_satisfiable,
+    max_satisfying,
+    sort_versions,
+    try_version_key,
+    version_key,
+)
+
+
+class TestVersions:
+    """
+    Testy dla modułu spectomate.core.versions.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        versions.clear_cache()
+
+    def test_version_key_order(self) -> None:
+        """Test zgodności kluczy sortowania z porównywaniem wersji PEP 440."""
+        samples = [
+            "0.9",
+            "1.0.dev1",
+            "1.0a1.dev2",
+            "1.0a1",
+            "1.0b2",
+            "1.0rc1",
+            "1.0rc1.post1",
+            "1.0",
+            "1.0.0",
+            "1.0+abc",
+            "1.0+abc.5",
+            "1.0+5",
+            "1.0.post0",
+            "1.0.post1.dev1",
+            "1.0.post1",
+            "1.9",
+            "1.10",
+            "1!0.1",
+        ]
+
+        for first, second in itertools.product(samples, samples):
+            assert (version_key(first) < version_key(second)) == (
+                Version(first) < Version(second)
+            )
+            assert (version_key(first) == version_key(second)) == (
+                Version(first) == Version(second)
+            )
+
+        assert version_key("1.10") is version_key("1.10")
+        assert try_version_key("not a version") is None
+        with pytest.raises(ValueError):
+            version_key("not a version")
+
+    def test_sort_versions(self) -> None:
+        """Test sortowania wersji."""
+        assert sort_versions(["1.10", "1.9", "1.10rc1", "invalid"]) == [
+            "1.9",
+            "1.10rc1",
+            "1.10",
+        ]
+        assert sort_versions(["1.9", "2.0", "1.10"], reverse=True) == [
+            "2.0",
+            "1.10",
+            "1.9",
+        ]
+
+    def test_filter_and_max_satisfying(self) -> None:
+        """Test wybierania wersji spełniających specyfikator."""
+        available = ["1.9", "1.10", "2.0", "2.0", "2.1rc1", "invalid"]
+
+        assert filter_versions(available, ">=1.10") == ["1.10", "2.0", "2.0"]
+        assert filter_versions(available, ">=2.1rc1") == ["2.1rc1"]
+        assert filter_versions(available, ">=2", prereleases=True) == [
+            "2.0",
+            "2.0",
+            "2.1rc1",
+        ]
+        assert max_satisfying(available, "<2") == "1.10"
+        assert max_satisfying(available) == "2.0"
+        assert max_satisfying(["2.1rc1"]) == "2.1rc1"
+        assert max_satisfying(available, ">3") is None
+        with pytest.raises(ValueError):
+            filter_versions(available, ">=>1")
+
+    def test_intersect_and_satisfiable(self) -> None:
+        """Test łączenia specyfikatorów i wykrywania sprzeczności."""
+        assert intersect_specifiers(["<2,>=1", ">=1", "", "!=1.5"]) == "!=1.5,<2,>=1"
+        assert (
+            intersect_specifiers([">=1.0", ">1.2", ">=1.2", "<=2", "<2"]) == "<2,>1.2"
+        )
+        assert intersect_specifiers(["==1.7", "==1.7.*", "<2"]) == "==1.7"
+        assert intersect_specifiers(["==1.*", "==1.7.*"]) == "==1.7.*"
+        assert intersect_specifiers(["==1.7", "==1.8.*"]) == "==1.7,==1.8.*"
+
+        assert is_satisfiable("")
+        assert is_satisfiable(">=1.21,<1.23")
+        assert is_satisfiable(">=1,<=1")
+        assert is_satisfiable("==1.22.*,>=1.22.3")
+        assert is_satisfiable("~=1.4,<1.9")
+        assert not is_satisfiable(">1,<=1")
+        assert not is_satisfiable("==1.21.*,==1.22.*")
+        assert not is_satisfiable("==1.22.*,>=1.23")
+        assert not is_satisfiable("~=1.4.2,>=1.5")
+        assert not is_satisfiable("==1.2,!=1.2")
+
+    def test_conda_to_pip_order(self) -> None:
+        """Test sortowania wymagań według nazwy i wersji w konwerterze."""
+        converter = CondaToPipConverter(options={"map_names": False})
+
+        pip_data = converter.convert(
+            {
+                "dependencies": [
+                    "numpy==1.10",
+                    "numpy==1.9",
+                    "Pillow",
+                    {"pip": ["pandas>=1.4"]},
+                ]
+            }
+        )
+
+        assert pip_data["requirements"] == [
+            "numpy==1.9",
+            "numpy==1.10",
+            "pandas>=1.4",
+            "Pillow",
+        ]
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
@@ -0,0 +1,141 @@
+"""
+Testy dla obserwowania plików i trybu watch.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import pytest
+import toml
+
+from spectomate.core.watch import (
+    InotifyWatcher,
+    PollingWatcher,
+    create_watcher,
+    watch,
+    watch_sync,
+)
+
+
+class TestWatch:
+    """
+    Testy dla obserwatorów plików i funkcji watch_sync.
+    """
+
+    def setup_method(self) -> None:
+        """Przygotowanie środowiska testowego."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.temp_path = Path(self.temp_dir.name)
+        self.source_file = self.temp_path / "environment.yml"
+        self.source_file.write_text("name: testenv\ndependencies:\n  - numpy\n")
+
+    def teardown_method(self) -> None:
+        """Czyszczenie po testach."""
+        self.temp_dir.cleanup()
+
+    def replace_source(self, content: str) -> None:
+        """Zapisuje plik źródłowy tak jak edytor - przez plik tymczasowy."""
+        temp_file = self.temp_path / ".environment.yml.swp"
+        temp_file.write_text(content)
+        os.replace(temp_file, self.source_file)
+
+    def test_polling_watcher(self) -> None:
+        """Test wykrywania zmian przez okresowe sprawdzanie plików."""
+        watcher = PollingWatcher([self.source_file], interval=0.01)
+
+        assert watcher.wait(timeout=0.05) == set()
+
+        self.replace_source("name: changed\n")
+        assert watcher.wait(timeout=1) == {self.source_file}
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="tylko Linux")
+    def test_inotify_watcher(self) -> None:
+        """Test wykrywania podmiany pliku przez inotify."""
+        other_file = self.temp_path / "other.txt"
+
+        with InotifyWatcher([self.source_file]) as watcher:
+            other_file.write_text("x")
+            assert watcher.wait(timeout=0.05) == set()
+
+            self.replace_source("name: changed\n")
+            assert watcher.wait(timeout=1) == {self.source_file}
+
+    def test_debounce(self) -> None:
+        """Test łączenia serii zapisów w jedno wywołanie."""
+        calls = []
+        stop_event = threading.Event()
+
+        def callback(changed: set) -> bool:
+            calls.append(changed)
+            stop_event.set()
+            return True
+
+        def edit() -> None:
+            for index in range(5):
+                self.replace_source(f"name: env{index}\n")
+                time.sleep(0.01)
+
+        editor = threading.Thread(target=edit)
+        with create_watcher([self.source_file]) as watcher:
+            editor.start()
+            watch(watcher, callback, debounce=0.2, stop_event=stop_event)
+        editor.join()
+
+        assert calls == [{self.source_file}]
+
+    def test_watch_sync(self) -> None:
+        """Test regeneracji pliku wyprowadzanego po zmianie pliku głównego."""
+        config_file = self.temp_path / "spectomate.toml"
+        with open(config_file, "w") as f:
+            toml.dump(
+                {
+                    "tool": {
+                        "spectomate": {
+                            "sync": {
+                                "source": "environment.yml",
+                                "source-format": "conda",
+                                "targets": [
+                                    {"file": "requirements.txt", "format": "pip"}
+                                ],
+                            }
+                        }
+                    }
+                },
+                f,
+            )
+        requirements_file = self.temp_path / "requirements.txt"
+        results = []
+        errors = []
+        stop_event = threading.Event()
+
+        thread = threading.Thread(
+            target=watch_sync,
+            args=(config_file, results.append, errors.append),
+            kwargs={"debounce": 0.05, "stop_event": stop_event},
+        )
+        thread.start()
+        try:
+            deadline = time.monotonic() + 5
+            while not results and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert requirements_file.read_text() == "numpy"
+
+            self.replace_source("name: testenv\ndependencies:\n  - scipy\n")
+            while len(results) < 2 and time.monotonic() < deadline:
+                time.sleep(0.01)
+        finally:
+            stop_event.set()
+            thread.join(timeout=5)
+
+        assert errors == []
+        assert not thread.is_alive()
+        assert [t.name for t in results[1].updated] == ["requirements.txt"]
+        assert requirements_file.read_text() == "scipy"
+
+
+if __name__ == "__main__":
+    pytest.main(["-xvs", __file__])
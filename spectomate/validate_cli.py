@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Komenda CLI sprawdzająca pliki z zależnościami bez zapisywania wyników.
+"""
+
+import json
+import sys
+from typing import Optional, Tuple
+
+import click
+
+from spectomate.core.utils import get_available_formats
+
+
+def echo_validation_results(results, as_json: bool = False) -> bool:
+    """
+    Wypisuje wyniki sprawdzenia plików.
+
+    Args:
+        results: Wyniki validate_file()/validate_files()
+        as_json: Czy wypisać wyniki w formacie JSON
+
+    Returns:
+        True, jeśli żaden plik nie zawiera błędów
+    """
+    if as_json:
+        click.echo(
+            json.dumps(
+                [result.to_dict() for result in results], indent=2, ensure_ascii=False
+            )
+        )
+    else:
+        for result in results:
+            for line in result.format_issues():
+                click.echo(line, err=True)
+            if result.ok:
+                checked = ""
+                if result.checked_formats:
+                    checked = f" (konwersja do: {', '.join(result.checked_formats)})"
+                click.echo(f"{result.file}: OK{checked}")
+
+    return all(result.ok for result in results)
+
+
+@click.command("validate")
+@click.argument(
+    "files",
+    nargs=-1,
+    required=True,
+    type=click.Path(exists=True, file_okay=True, dir_okay=False, readable=True),
+)
+@click.option(
+    "--input-format",
+    "-i",
+    help="Format wszystkich plików (auto - wykrycie dla każdego pliku)",
+    type=click.Choice(sorted(get_available_formats("input")) + ["auto"]),
+    default="auto",
+    show_default=True,
+)
+@click.option(
+    "--to",
+    "target_formats",
+    help="Sprawdź też konwersję do formatu (można podać wielokrotnie)",
+    type=click.Choice(sorted(get_available_formats("output"))),
+    multiple=True,
+)
+@click.option(
+    "--jobs",
+    "-j",
+    help="Liczba równolegle sprawdzanych plików",
+    type=click.IntRange(min=1),
+    default=None,
+)
+@click.option("--dev", is_flag=True, help="Uwzględnij zależności deweloperskie")
+@click.option("--json", "as_json", is_flag=True, help="Wypisz wyniki w formacie JSON")
+def validate_command(
+    files: Tuple[str, ...],
+    input_format: str,
+    target_formats: Tuple[str, ...],
+    jobs: Optional[int],
+    dev: bool,
+    as_json: bool,
+):
+    """Sprawdza, czy pliki z zależnościami są poprawne, niczego nie zapisując.
+
+    Błędy są wypisywane z numerami linii, a kod wyjścia 1 oznacza, że
+    przynajmniej jeden plik zawiera błędy.
+
+    Examples:
+        spectomate validate requirements.txt environment.yml
+        spectomate validate pyproject.toml --to pip --to conda
+    """
+    from spectomate.core.validate import validate_files
+
+    results = validate_files(
+        files,
+        None if input_format == "auto" else input_format,
+        target_formats,
+        options={"include_dev": dev},
+        max_workers=jobs,
+    )
+
+    if not echo_validation_results(results, as_json):
+        sys.exit(1)
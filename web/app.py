@@ -41,9 +41,17 @@ def convert():
     source_content = data.get('source_content')
     options = data.get('options', {})
     
-    if not all([source_format, target_format, source_content]):
+    if not all([target_format, source_content]):
         return jsonify({"error": "Missing required parameters"}), 400
     
+    # Detect the source format from the content when it is not given explicitly
+    if not source_format or source_format == 'auto':
+        source_format = ConverterRegistry.detect_format(
+            data.get('source_filename'), source_content
+        )
+        if not source_format:
+            return jsonify({"error": "Could not detect the source format"}), 400
+    
     try:
         # Create temporary files for source and target
         with tempfile.NamedTemporaryFile(delete=False, suffix=get_file_extension(source_format)) as source_file: